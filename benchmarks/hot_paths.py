@@ -0,0 +1,251 @@
+"""
+Benchmark of labeling hot paths on synthetic image folders, runs under the offscreen Qt platform (no display needed).
+
+    python benchmarks/hot_paths.py --sizes 1000 10000 --json results.json
+    python benchmarks/hot_paths.py --sizes 1000000 --steps 500 --only get_img_paths open generate_csv
+
+Synthetic folders contain hard links to a few template images (jpg/png in small, medium and large resolution),
+so even 1M-file folders are created quickly and take almost no disk space.
+Timings are in ms: per-call statistics for repeated operations (set_image, show_next_image, set_label),
+total time for one-shot operations (get_img_paths, open, generate_csv, export_xlsx).
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PySide2.QtGui import QImage
+from PySide2.QtWidgets import QApplication, QDialog
+
+import main
+from core.files import get_img_paths
+from core.session import LabelSession
+
+BENCHMARKS = ['get_img_paths', 'set_image', 'show_next_image', 'set_label_csv', 'set_label_copy', 'set_label_move',
+              'open', 'generate_csv', 'export_xlsx']
+
+# (format, width, height) of template images
+TEMPLATES = [('jpg', 640, 480), ('png', 640, 480), ('jpg', 1920, 1080), ('png', 1920, 1080), ('jpg', 4000, 3000)]
+
+LABELS = ['cat', 'dog', 'bird', 'fish']
+
+
+def make_templates(folder):
+    """
+    Writes template images with smooth gradients and noise (compresses like a photo, not like a flat color)
+    :return: list with paths of templates
+    """
+    rng = np.random.default_rng(0)
+    paths = []
+
+    for i, (file_format, width, height) in enumerate(TEMPLATES):
+        y, x = np.mgrid[0:height, 0:width]
+        pixels = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+        pixels = np.clip(pixels + rng.integers(-20, 20, pixels.shape), 0, 255).astype(np.uint8)
+        data = pixels.tobytes()
+
+        image = QImage(data, width, height, 3 * width, QImage.Format_RGB888)
+        path = os.path.join(folder, f'template_{i}.{file_format}')
+        if not image.save(path):
+            raise OSError(f'Cannot write template image: {path}')
+        paths.append(path)
+
+    return paths
+
+
+def make_dataset(folder, num_images, templates):
+    """
+    Creates folder with num_images hard links to templates (or copies if the file system doesn't support links)
+    """
+    os.makedirs(folder)
+    for i in range(num_images):
+        template = templates[i % len(templates)]
+        dst = os.path.join(folder, f'img_{i:07d}.{template.rsplit(".", 1)[1]}')
+        try:
+            os.link(template, dst)
+        except OSError:
+            shutil.copy(template, dst)
+
+
+def stats(times_ms):
+    times_ms = sorted(times_ms)
+    return {
+        'n': len(times_ms),
+        'total_ms': round(sum(times_ms), 3),
+        'median_ms': round(statistics.median(times_ms), 3),
+        'p95_ms': round(times_ms[min(len(times_ms) - 1, int(len(times_ms) * 0.95))], 3),
+        'max_ms': round(times_ms[-1], 3),
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def shown(app, widget):
+    """
+    Waits until the image requested by navigation is read in background and painted
+    """
+    while widget.render_task is not None:
+        app.processEvents()
+    widget.repaint()
+
+
+def new_window(app, session):
+    window = main.Main_Window()
+    window.labeler_widget = main.Labeler_Widget(window, session)
+    window.setCentralWidget(window.labeler_widget)
+    window.show()
+    app.processEvents()
+    return window
+
+
+def close_window(app, window):
+    window.close_labeler(final_export=False)
+    window.deleteLater()
+    app.processEvents()
+
+
+def bench_set_label(app, folder, mode, steps):
+    session = LabelSession(LABELS, folder, get_img_paths(folder), mode)
+    window = new_window(app, session)
+    widget = window.labeler_widget
+    widget.show_next_checkbox.setChecked(False)
+
+    times = []
+    for i in range(min(steps, len(session.img_paths))):
+        widget.counter = i
+        times.append(timed(widget.set_label, LABELS[i % len(LABELS)]))
+
+    close_window(app, window)
+    return stats(times)
+
+
+def run_size(app, work_folder, num_images, templates, steps, only):
+    """
+    :return: {benchmark: statistics} for one folder size
+    """
+    results = {}
+    selected = lambda name: not only or name in only
+
+    folder = os.path.join(work_folder, f'dataset_{num_images}')
+    make_dataset(folder, num_images, templates)
+
+    img_paths = []
+    results['get_img_paths'] = stats([timed(lambda: img_paths.extend(get_img_paths(folder)))])
+
+    session = LabelSession(LABELS, folder, list(img_paths), 'csv')
+    window = new_window(app, session)
+    widget = window.labeler_widget
+
+    if selected('set_image'):
+        sample = img_paths[:min(steps, len(img_paths))]
+        results['set_image'] = stats([timed(lambda: (widget.set_image(path), shown(app, widget))) for path in sample])
+
+    if selected('show_next_image'):
+        widget.counter = 0
+        # paint after every step, so the time includes reading and drawing of the new image
+        results['show_next_image'] = stats([timed(lambda: (widget.show_next_image(), shown(app, widget)))
+                                            for _ in range(min(steps, len(img_paths) - 1))])
+
+    if selected('generate_csv') or selected('export_xlsx') or selected('open'):
+        # every 3rd image is labeled, so exports and open have realistic content
+        for i, img_name in enumerate(session.img_names()[::3]):
+            session.assigned_labels[img_name] = [LABELS[i % len(LABELS)]]
+
+        def generate_csv():
+            widget.generate_csv('benchmark')
+            widget.export_slot.wait()
+            app.processEvents()
+
+        results['generate_csv'] = stats([timed(generate_csv)])
+
+    csv_path = os.path.join(session.output_folder(), 'benchmark.csv')
+
+    if selected('export_xlsx'):
+        results['export_xlsx'] = stats([timed(session.export, 'benchmark', ['xlsx'])])
+
+    if selected('open'):
+        # open branch of Main_Window.process, with the dialog already filled in
+        window.open_dialog = main.Open_Dialog(window)
+        window.open_dialog.selected_folder_label.setText(folder)
+        window.open_dialog.selected_csv_label.setText(csv_path)
+        window.open_dialog.img_paths = img_paths
+        window.open_dialog.exec = lambda: QDialog.Accepted
+        results['open'] = stats([timed(lambda: (window.action_open.trigger(), app.processEvents()))])
+
+    close_window(app, window)
+
+    for mode in ('csv', 'copy', 'move'):
+        if selected(f'set_label_{mode}'):
+            # copy/move change the folder, so every mode gets a fresh one
+            mode_folder = os.path.join(work_folder, f'dataset_{num_images}_{mode}')
+            make_dataset(mode_folder, num_images, templates)
+            results[f'set_label_{mode}'] = bench_set_label(app, mode_folder, mode, steps)
+            shutil.rmtree(mode_folder)
+
+    shutil.rmtree(folder)
+    return {name: result for name, result in results.items() if selected(name)}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(__file__), check=True,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description='Benchmark of labeling hot paths on synthetic image folders')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='number of images in synthetic folders (default: 1000 10000)')
+    parser.add_argument('--steps', type=int, default=200,
+                        help='calls of repeated operations (set_image, show_next_image, set_label), default: 200')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, help='run only these benchmarks')
+    parser.add_argument('--work-folder', help='folder for synthetic datasets (default: temporary folder)')
+    parser.add_argument('--json', help='write results into this file')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    work_folder = tempfile.mkdtemp(prefix='labeler-bench-', dir=args.work_folder)
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'steps': args.steps,
+        'results': {},
+    }
+
+    try:
+        templates = make_templates(work_folder)
+        for num_images in args.sizes:
+            results = run_size(app, work_folder, num_images, templates, args.steps, args.only)
+            report['results'][str(num_images)] = results
+
+            print(f'{num_images} images')
+            for name, result in results.items():
+                print(f'  {name:<16} median {result["median_ms"]:10.3f} ms   p95 {result["p95_ms"]:10.3f} ms   '
+                      f'total {result["total_ms"]:10.1f} ms   n={result["n"]}')
+    finally:
+        shutil.rmtree(work_folder, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main_benchmark()
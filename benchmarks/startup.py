@@ -0,0 +1,129 @@
+"""
+Cold-start benchmark of the GUI: every run starts a new interpreter (offscreen Qt platform, no display needed).
+
+    python benchmarks/startup.py --runs 20
+    git worktree add /tmp/labeler-old <older commit>
+    python benchmarks/startup.py --compare /tmp/labeler-old --json startup.json
+    python benchmarks/startup.py --stages interpreter session    # without Qt
+
+Stages (median wall time of the whole process, ms):
+    interpreter   python -c pass
+    session       import core.session (headless scripts and cli, no Qt needed)
+    import        import main
+    window        import main, create QApplication and Main_Window, show it and process pending events
+Modules which are deferred until first use are listed if they were imported during startup.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules which shouldn't be imported before they are needed
+DEFERRED_MODULES = ['numpy', 'xlsxwriter', 'asyncio', 'core.client', 'core.server', 'rc.resource']
+
+STAGES = {
+    'interpreter': 'pass',
+    'session': 'import core.session',
+    'import': 'import main',
+    'window': '''
+import main
+app = main.QApplication([])
+window = main.Main_Window()
+window.show()
+app.processEvents()
+''',
+}
+
+REPORT_MODULES = '''
+import json, sys
+print(json.dumps([m for m in {modules} if m in sys.modules]))
+'''
+
+
+def run_stage(code, repo_folder):
+    """
+    :return: wall time of the process (ms), its stdout, and the last line of its stderr if it failed (else None)
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    # bytecode has to be cached like in normal use, otherwise every run compiles the modules
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', code], cwd=repo_folder, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    error = None
+    if result.returncode != 0:
+        error = (result.stderr.strip().splitlines() or [f'exit code {result.returncode}'])[-1]
+    return (time.perf_counter() - start) * 1000, result.stdout, error
+
+
+def benchmark(repo_folder, runs, stages=tuple(STAGES)):
+    """
+    :return: {stage: {"median_ms", "min_ms"} or {"missing": error}} (stage fails e.g. in an older version
+        without the imported module) and list of deferred modules imported by the last stage which runs
+    """
+    results = {}
+    for stage in stages:
+        # first run warms up file system cache and writes bytecode of dependencies
+        _, _, error = run_stage(STAGES[stage], repo_folder)
+        if error is not None:
+            results[stage] = {'missing': error}
+            continue
+        times = [run_stage(STAGES[stage], repo_folder)[0] for _ in range(runs)]
+        results[stage] = {'median_ms': round(statistics.median(times), 1), 'min_ms': round(min(times), 1)}
+
+    measured = [stage for stage in stages if 'missing' not in results[stage]]
+    if not measured:
+        return results, []
+    _, stdout, _ = run_stage(STAGES[measured[-1]] + REPORT_MODULES.format(modules=DEFERRED_MODULES), repo_folder)
+    return results, json.loads(stdout.strip().splitlines()[-1])
+
+
+def print_results(name, results, loaded_modules):
+    print(name)
+    for stage, times in results.items():
+        if 'missing' in times:
+            print(f'  {stage:<12}  missing ({times["missing"]})')
+        else:
+            print(f'  {stage:<12} {times["median_ms"]:8.1f} ms  (min {times["min_ms"]:.1f} ms)')
+    print(f'  deferred modules imported at startup: {", ".join(loaded_modules) or "none"}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-start benchmark of the annotation tool')
+    parser.add_argument('--runs', type=int, default=10, help='runs of every stage (default: 10)')
+    parser.add_argument('--compare', help='another checkout of the repository, e.g. older commit in git worktree')
+    parser.add_argument('--json', help='write results into this file')
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES),
+                        help='stages to run (default: all, window and import need PySide2)')
+    args = parser.parse_args()
+
+    report = {}
+    for name, folder in [('current', REPO_FOLDER), ('compare', args.compare)]:
+        if folder is None:
+            continue
+        results, loaded_modules = benchmark(folder, args.runs, args.stages)
+        report[name] = {'folder': folder, 'stages': results, 'deferred_modules_loaded': loaded_modules}
+        print_results(f'{name}: {folder}', results, loaded_modules)
+
+    if 'compare' in report:
+        report['speedup'] = {}
+        for stage in args.stages:
+            before, after = report['compare']['stages'][stage], report['current']['stages'][stage]
+            if 'missing' in before or 'missing' in after:
+                continue
+            before, after = before['median_ms'], after['median_ms']
+            report['speedup'][stage] = round(before / after, 2)
+            print(f'{stage}: {before:.1f} ms -> {after:.1f} ms ({before - after:.1f} ms saved)')
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
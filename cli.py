@@ -0,0 +1,205 @@
+"""
+Command line interface of the annotation tool, it doesn't need Qt or display.
+
+    python cli.py scan data/images
+    python cli.py label data/images --labels cat dog --rules rules.txt --glob "*_dog_*=dog" --formats csv jsonl.gz
+    python cli.py label data/images --from data/images/output/assigned_classes.csv --mode copy
+    python cli.py convert data/images/output/assigned_classes.csv data/export --formats npy lists --packed
+    python cli.py serve data/images --labels cat dog --port 8765
+"""
+import argparse
+import os
+import sys
+
+from core.export import export_labels, export_sharded, exporter_class_of, load_labels
+from core.files import get_img_paths
+from core.rules import match_rules, parse_rules
+from core.server import Annotation_Server
+from core.session import FILE_OPS_WORKERS, LabelSession
+
+
+def scan(args):
+    """
+    Prints number of images in folder (and writes their filenames into output file)
+    """
+    img_paths = get_img_paths(args.folder, tuple(args.extensions))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf8') as f:
+            for img_path in img_paths:
+                f.write(os.path.basename(img_path) + '\n')
+
+    print(f'{len(img_paths)} images in {args.folder}')
+
+
+def check_formats(formats):
+    """
+    :raises ValueError: if some export format is unknown, before any work is done
+    """
+    for file_format in formats:
+        exporter_class_of(file_format)
+
+
+def label(args):
+    """
+    Assigns labels from existing labels file and/or rules to all images in folder,
+    copies/moves/links images into label folders according to mode and exports the labels.
+    Images which already are in label folders (from an earlier run) keep their labels and aren't copied/moved again
+    """
+    check_formats(args.formats)
+
+    rules = []
+    if args.rules:
+        with open(args.rules, encoding='utf8') as f:
+            rules.extend(parse_rules(f))
+    for glob_rule in args.glob:
+        pattern, _, rule_label = glob_rule.rpartition('=')
+        if not pattern:
+            raise ValueError(f'Invalid --glob rule (expected PATTERN=LABEL): {glob_rule}')
+        rules.append((pattern, rule_label))
+
+    # labels of the session: from existing labels file, --labels and rules (in this order)
+    labels = []
+    seed_labels = {}
+    if args.from_file:
+        labels, _, seed_labels = load_labels(args.from_file, args.labels)
+    labels = list(dict.fromkeys(labels + args.labels + [rule_label for _, rule_label in rules]))
+    if not labels:
+        raise ValueError('No labels given, use --labels, --rules, --glob or --from')
+
+    session = LabelSession(labels, args.folder, get_img_paths(args.folder, tuple(args.extensions)), args.mode)
+    in_label_folders = session.load_label_folders(tuple(args.extensions))
+    if in_label_folders:
+        print(f'{in_label_folders} images already in label folders')
+    img_names = session.img_names()
+
+    # group images by label, so every label is assigned (and images are copied/moved) in one batch
+    matches = {label_name: [] for label_name in labels}
+    existing = set(img_names)
+    for img_name, img_labels in seed_labels.items():
+        if img_name in existing:
+            for img_label in img_labels:
+                matches[img_label].append(img_name)
+    for rule_label, rule_matches in match_rules(img_names, rules, args.processes).items():
+        matches[rule_label].extend(rule_matches)
+
+    for batch_label, batch_names in matches.items():
+        changed = session.assign_many(batch_names, batch_label, workers=args.workers)
+        print(f'{batch_label}: {changed} images')
+
+    print(f'{len(session.assigned_labels)} of {len(img_names)} images labeled')
+
+    if args.shards:
+        manifest_path = session.export_sharded(args.name, args.formats[0], args.shards, args.processes,
+                                               packed=args.packed)
+        print(f'labels saved to: {manifest_path}')
+    else:
+        for saved_path in session.export(args.name, args.formats, packed=args.packed):
+            print(f'labels saved to: {saved_path}')
+
+
+def convert(args):
+    """
+    Converts exported labels into other formats
+    """
+    check_formats(args.formats)
+
+    labels, img_names, assigned_labels = load_labels(args.input, args.labels or None)
+
+    if args.shards:
+        saved_paths = [export_sharded(args.output_folder, args.name, labels, img_names, assigned_labels,
+                                      args.formats[0], args.shards, args.processes, packed=args.packed)]
+    else:
+        saved_paths = export_labels(args.output_folder, args.name, labels, img_names, assigned_labels, args.formats,
+                                    packed=args.packed)
+
+    for saved_path in saved_paths:
+        print(f'labels saved to: {saved_path}')
+
+
+def serve(args):
+    """
+    Serves images of folder to annotators over HTTP (see core.server), until Ctrl+C or SIGTERM
+    """
+    img_paths = get_img_paths(args.folder, tuple(args.extensions))
+    if args.from_file:
+        session = LabelSession.open(args.folder, args.from_file, img_paths, args.mode)
+    elif args.labels:
+        session = LabelSession(args.labels, args.folder, img_paths, args.mode)
+    else:
+        raise ValueError('No labels given, use --labels or --from')
+
+    print(f'serving {len(img_paths)} images on http://{args.host}:{args.port}, '
+          f'labels are saved to {session.output_folder()}')
+    Annotation_Server(session, args.host, args.port).run()
+
+
+def add_export_arguments(parser, default_name):
+    parser.add_argument('--name', default=default_name, help='name of generated files (without extension)')
+    parser.add_argument('--formats', nargs='+', default=['csv'],
+                        help='export formats, e.g. csv xlsx npy jsonl.gz lists (default: csv)')
+    parser.add_argument('--packed', action='store_true', help='bit-pack npy label matrix')
+    parser.add_argument('--shards', type=int, default=0,
+                        help='export in this many shards in parallel (only the first format is used)')
+    parser.add_argument('--processes', type=int, default=None, help='number of worker processes (default: cores)')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Image annotation tool without GUI')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scan_parser = subparsers.add_parser('scan', help='count images in folder')
+    scan_parser.add_argument('folder')
+    scan_parser.add_argument('--output', help='write image filenames into this file')
+    scan_parser.set_defaults(func=scan)
+
+    label_parser = subparsers.add_parser('label', help='assign labels in bulk and export them')
+    label_parser.add_argument('folder')
+    label_parser.add_argument('--labels', nargs='+', default=[], help='label names')
+    label_parser.add_argument('--from', dest='from_file',
+                              help='assign labels from exported file (csv, jsonl, npy or sharded export manifest)')
+    label_parser.add_argument('--rules', help='rules file with "<glob pattern> <label>" lines')
+    label_parser.add_argument('--glob', action='append', default=[], metavar='PATTERN=LABEL',
+                              help='assign LABEL to images matching glob PATTERN (can be repeated)')
+    label_parser.add_argument('--mode', choices=['csv', 'copy', 'move', 'link'], default='csv',
+                              help='copy/move/link labeled images into label folders (default: csv, only export)')
+    label_parser.add_argument('--workers', type=int, default=FILE_OPS_WORKERS,
+                              help='number of threads which copy/move/link images')
+    add_export_arguments(label_parser, 'assigned_classes')
+    label_parser.set_defaults(func=label)
+
+    convert_parser = subparsers.add_parser('convert', help='convert exported labels into other formats')
+    convert_parser.add_argument('input', help='exported labels (csv, jsonl, npy or sharded export manifest)')
+    convert_parser.add_argument('output_folder')
+    convert_parser.add_argument('--labels', nargs='+', default=[], help='label names (for jsonl without label header line)')
+    add_export_arguments(convert_parser, 'assigned_classes')
+    convert_parser.set_defaults(func=convert)
+
+    serve_parser = subparsers.add_parser('serve', help='let more annotators label folder over local network')
+    serve_parser.add_argument('folder')
+    serve_parser.add_argument('--labels', nargs='+', default=[], help='label names')
+    serve_parser.add_argument('--from', dest='from_file', help='continue labeling from exported file')
+    serve_parser.add_argument('--mode', choices=['csv', 'copy', 'move', 'link'], default='csv',
+                              help='copy/move/link labeled images into label folders (default: csv, only export)')
+    serve_parser.add_argument('--host', default='127.0.0.1',
+                              help='address to listen on (default: this machine only, 0.0.0.0 for all interfaces)')
+    serve_parser.add_argument('--port', type=int, default=8765)
+    serve_parser.set_defaults(func=serve)
+
+    for subparser in (scan_parser, label_parser, serve_parser):
+        subparser.add_argument('--extensions', nargs='+', default=['.jpg', '.png', '.jpeg'],
+                               help='image file endings (default: .jpg .png .jpeg)')
+
+    args = parser.parse_args(argv)
+
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import heapq
+
+UNCERTAINTY_MEASURES = ('entropy', 'margin')
+
+
+def uncertainty(scores, measure='entropy'):
+    """
+    Uncertainty of multi-label scores (every label is a separate yes/no decision), higher is more uncertain
+    :param scores: array (num_images, num_labels) with scores 0-1
+    :param measure: entropy (sum of binary entropies of all labels),
+        or margin (1 - distance of the least certain label from 0.5, scaled to 0-1)
+    :return: array (num_images) with uncertainties
+    """
+    import numpy as np
+
+    scores = np.clip(np.asarray(scores, np.float64), 1e-7, 1 - 1e-7)
+
+    if measure == 'entropy':
+        return -(scores * np.log2(scores) + (1 - scores) * np.log2(1 - scores)).sum(axis=1)
+    if measure == 'margin':
+        return 1 - np.abs(2 * scores - 1).min(axis=1)
+
+    raise ValueError(f'Unknown uncertainty measure: {measure}')
+
+
+class Uncertainty_Queue:
+    """
+    Unlabeled images ordered by uncertainty of model scores, the most uncertain first.
+    Max-heap with lazy deletion: labeled images and outdated entries are skipped when they get to the top,
+    so label changes and new scores are O(log n) updates instead of re-sorting the queue
+    """
+
+    def __init__(self, scores, is_labeled, measure='entropy'):
+        """
+        :param scores: {img_name: [score of every label]}, images with None scores (unreadable) are skipped
+        :param is_labeled: callable(img_name), labeled images are never returned
+        :param measure: see uncertainty
+        """
+        self.is_labeled = is_labeled
+        self.measure = measure
+        self.current = {}  # {img_name: uncertainty}, heap entries with another value are outdated
+        self.heap = []
+        self.queued = set()  # images with a valid heap entry
+
+        img_names = [img_name for img_name, img_scores in scores.items() if img_scores is not None]
+        if img_names:
+            values = uncertainty([scores[img_name] for img_name in img_names], measure)
+            self.current = dict(zip(img_names, values.tolist()))
+            self.heap = [(-value, img_name) for img_name, value in self.current.items()]
+            heapq.heapify(self.heap)
+            self.queued = set(img_names)
+
+    def __len__(self):
+        """
+        :return: number of entries, including the ones which will be skipped
+        """
+        return len(self.heap)
+
+    def update(self, img_name, scores=None):
+        """
+        Puts image back into the queue (e.g. its labels were removed), with new scores if they are given
+        """
+        if scores is not None:
+            self.current[img_name] = float(uncertainty([scores], self.measure)[0])
+            # entry with the old uncertainty is outdated now
+            self.queued.discard(img_name)
+
+        if img_name in self.current and img_name not in self.queued and not self.is_labeled(img_name):
+            heapq.heappush(self.heap, (-self.current[img_name], img_name))
+            self.queued.add(img_name)
+
+    def pop(self):
+        """
+        :return: filename of the most uncertain unlabeled image, or None if there is none
+        """
+        while self.heap:
+            value, img_name = heapq.heappop(self.heap)
+            if self.current.get(img_name) != -value or img_name not in self.queued:
+                continue
+
+            self.queued.discard(img_name)
+            if not self.is_labeled(img_name):
+                return img_name
+
+        return None
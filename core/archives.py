@@ -0,0 +1,204 @@
+"""
+Images in ZIP and uncompressed TAR archives are read without extracting them.
+Path of archive member is <archive path>/<member name> (e.g. data/shard_0.tar/cats/img1.jpg),
+so os.path.basename of it is the filename of the member, like for images in folders
+(images are identified by filename, get_img_paths rejects members with the same filename).
+
+Index of members (offset and size of each one) is built once and cached in hidden file next to the archive,
+archives are memory-mapped, so stored (uncompressed) members are returned as memoryview without copying.
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar')
+
+# version of index cache files, cache with another version is rebuilt
+INDEX_VERSION = 1
+
+# ZIP local file header: signature, ..., filename length (offset 26) and extra field length (offset 28)
+ZIP_LOCAL_HEADER = struct.Struct('<I22xHH')
+ZIP_LOCAL_HEADER_SIGNATURE = 0x04034b50
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+_archives = {}  # {archive path: Archive}, archives stay open until the process ends
+_archives_lock = threading.Lock()
+
+
+def is_archive(path):
+    return path.lower().endswith(ARCHIVE_EXTENSIONS) and os.path.isfile(path)
+
+
+def split_archive_path(path):
+    """
+    :return: (archive path, member name) if path points into an archive, otherwise None
+    """
+    lowered = path.lower()
+    for extension in ARCHIVE_EXTENSIONS:
+        for separator in {os.sep, '/'}:
+            i = lowered.find(extension + separator)
+            if i == -1:
+                continue
+
+            archive_path = path[:i + len(extension)]
+            if archive_path in _archives or os.path.isfile(archive_path):
+                return archive_path, path[i + len(extension) + 1:].replace(os.sep, '/')
+
+    return None
+
+
+def index_cache_path(archive_path):
+    folder, filename = os.path.split(archive_path)
+    return os.path.join(folder, f'.{filename}.index.json')
+
+
+class Archive:
+    """
+    Memory-mapped archive with index of its members, can be read from more threads at once
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.is_zip = path.lower().endswith('.zip')
+        self.members = self.load_index()  # {member name: (offset, size, compressed size, compression method)}
+        self.data_offsets = {}  # {member name: offset of data}, ZIP members get it from their local header
+        self.mmap = None
+        self.lock = threading.Lock()
+
+    def load_index(self):
+        """
+        :return: members from index cache, or from the archive if the cache is missing or outdated
+        """
+        stat = os.stat(self.path)
+        version = [INDEX_VERSION, stat.st_size, stat.st_mtime_ns]
+        cache_path = index_cache_path(self.path)
+
+        try:
+            with open(cache_path, encoding='utf8') as f:
+                cache = json.load(f)
+            if cache['version'] == version:
+                return {name: tuple(member) for name, member in cache['members'].items()}
+        except (OSError, ValueError, KeyError):
+            pass
+
+        members = self.zip_index() if self.is_zip else self.tar_index()
+
+        # folder with the archive can be read-only, then the index is built every time
+        try:
+            from core.export import tmp_file_path
+
+            tmp_path = tmp_file_path(cache_path)
+            with open(tmp_path, 'w', encoding='utf8') as f:
+                json.dump({'version': version, 'members': members}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+        return members
+
+    def zip_index(self):
+        import zipfile
+
+        with zipfile.ZipFile(self.path) as archive:
+            return {info.filename: (info.header_offset, info.file_size, info.compress_size, info.compress_type)
+                    for info in archive.infolist() if not info.is_dir()}
+
+    def tar_index(self):
+        import tarfile
+
+        # 'r:' opens only uncompressed tar, members of compressed one can't be read without reading all before them
+        with tarfile.open(self.path, 'r:') as archive:
+            return {info.name: (info.offset_data, info.size, info.size, ZIP_STORED)
+                    for info in archive if info.isfile()}
+
+    def data(self):
+        with self.lock:
+            if self.mmap is None:
+                with open(self.path, 'rb') as f:
+                    self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return self.mmap
+
+    def data_offset(self, name, offset):
+        if not self.is_zip:
+            return offset
+
+        data_offset = self.data_offsets.get(name)
+        if data_offset is None:
+            signature, name_length, extra_length = ZIP_LOCAL_HEADER.unpack_from(self.data(), offset)
+            if signature != ZIP_LOCAL_HEADER_SIGNATURE:
+                raise ValueError(f'Corrupted archive {self.path}: {name}')
+            data_offset = offset + ZIP_LOCAL_HEADER.size + name_length + extra_length
+            self.data_offsets[name] = data_offset
+
+        return data_offset
+
+    def member_range(self, name):
+        """
+        :return: offset and size of (possibly compressed) data of member in the archive
+        """
+        offset, _, compressed_size, _ = self.members[name]
+        return self.data_offset(name, offset), compressed_size
+
+    def read(self, name):
+        """
+        :return: content of member, memoryview into the mapped archive if it's stored without compression
+        """
+        try:
+            offset, size, compressed_size, method = self.members[name]
+        except KeyError:
+            raise FileNotFoundError(f'{name} not found in {self.path}') from None
+
+        start = self.data_offset(name, offset)
+        data = memoryview(self.data())[start:start + compressed_size]
+
+        if method == ZIP_STORED:
+            return data
+        if method == ZIP_DEFLATED:
+            return zlib.decompress(data, -zlib.MAX_WBITS, size)
+
+        # other compressions (bzip2, lzma) are rare in image archives
+        import zipfile
+
+        with zipfile.ZipFile(self.path) as archive:
+            return archive.read(name)
+
+
+def open_archive(archive_path):
+    """
+    :return: Archive, opened once per process
+    """
+    with _archives_lock:
+        archive = _archives.get(archive_path)
+        if archive is None:
+            archive = _archives[archive_path] = Archive(archive_path)
+        return archive
+
+
+def archive_img_paths(archive_path, extensions):
+    """
+    :return: list with paths of archive members with given file endings
+    """
+    return [os.path.join(archive_path, name) for name in open_archive(archive_path).members
+            if name.lower().endswith(extensions)]
+
+
+def member_range(path):
+    """
+    :param path: path of archive member, see split_archive_path
+    :return: archive path, offset and size of the member's data in it
+    """
+    archive_path, name = split_archive_path(path)
+    return (archive_path,) + open_archive(archive_path).member_range(name)
+
+
+def read_member(path):
+    """
+    :param path: path of archive member, see split_archive_path
+    :return: content of the member as bytes-like object
+    """
+    archive_path, name = split_archive_path(path)
+    return open_archive(archive_path).read(name)
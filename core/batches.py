@@ -0,0 +1,123 @@
+"""
+Work on images in batches in a process pool (pre-labeling, perceptual hashes, similarity features),
+with results cached by file stat so the next run works only on new or changed images.
+"""
+import json
+import os
+
+from core.export import tmp_file_path
+from core.files import file_stat
+
+
+class Cancelled(Exception):
+    """
+    Raised from progress callback of long work (exports, run_batches) to stop it
+    """
+
+
+class Stat_Cache:
+    """
+    Values computed from image files, remembered with size and modification time of the file.
+    Stored as json {absolute path: [size, mtime_ns, value]}, subclasses can store it differently (load, write)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}  # {absolute path: [size, mtime_ns, value]}
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def load(self, path):
+        with open(path, encoding='utf8') as f:
+            self.files = json.load(f)
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf8') as f:
+            json.dump(self.files, f)
+
+    def get(self, img_path):
+        """
+        :return: value if the file didn't change since it was computed, else None
+        """
+        cached = self.files.get(os.path.abspath(img_path))
+        if cached:
+            stat = file_stat(img_path)
+            if cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2]
+        return None
+
+    def put(self, img_path, value):
+        stat = file_stat(img_path)
+        self.files[os.path.abspath(img_path)] = [stat.st_size, stat.st_mtime_ns, value]
+
+    def save(self):
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = tmp_file_path(self.path)
+        self.write(tmp_path)
+        os.replace(tmp_path, self.path)
+
+
+def cached_values(img_paths, cache):
+    """
+    :return: list with cached value (or None) of every image, list with indexes of images which need work
+    """
+    values = [None] * len(img_paths)
+    todo = []
+    for i, img_path in enumerate(img_paths):
+        try:
+            values[i] = cache.get(img_path)
+        except OSError:
+            # missing file is left to the worker, it reports unreadable images itself
+            pass
+        if values[i] is None:
+            todo.append(i)
+    return values, todo
+
+
+def run_batches(img_paths, worker, cache, batch_size, processes=None, progress=None, done=0, total=None,
+                initializer=None, initargs=()):
+    """
+    Runs worker on batches of images in a process pool. Result of every image is put into cache
+    as soon as its batch is finished (None results aren't cached), cache is saved even if the work is stopped
+    :param img_paths: paths of images which need work
+    :param worker: picklable callable(list of paths), returns list with result of every image (runs in worker process)
+    :param cache: Stat_Cache
+    :param processes: number of worker processes (default: number of cores)
+    :param progress: optional callable(done, total) called after every batch, it may raise to stop the work
+        (results of finished batches are still cached)
+    :param done, total: images which didn't need work and number of all images, for progress
+    :return: list with result of every image
+    """
+    # process pool (multiprocessing) is imported when it's needed, not at startup of the app
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    total = len(img_paths) if total is None else total
+    results = [None] * len(img_paths)
+    batches = [list(range(i, min(i + batch_size, len(img_paths)))) for i in range(0, len(img_paths), batch_size)]
+
+    try:
+        if batches:
+            with ProcessPoolExecutor(processes, initializer=initializer, initargs=initargs) as executor:
+                pending = {executor.submit(worker, [img_paths[i] for i in batch]): batch for batch in batches}
+                try:
+                    while pending:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            batch = pending.pop(future)
+                            for i, result in zip(batch, future.result()):
+                                results[i] = result
+                                if result is not None:
+                                    cache.put(img_paths[i], result)
+                            done += len(batch)
+                        if progress is not None:
+                            progress(done, total)
+                except BaseException:
+                    for future in pending:
+                        future.cancel()
+                    raise
+    finally:
+        cache.save()
+
+    return results
@@ -0,0 +1,215 @@
+import json
+import os
+import tempfile
+import threading
+from urllib.error import HTTPError
+from urllib.parse import quote, urlencode
+from urllib.request import Request, urlopen
+
+from core.files import make_folder, read_bytes
+from core.leases import WORK_BATCH_SIZE, LeaseLost
+from core.session import Session_Tools
+
+# seconds to wait for the server
+CLIENT_TIMEOUT = 30
+
+
+class Conflict(Exception):
+    """
+    Labels were changed by somebody else, state holds the current {"img", "labels", "version"}
+    """
+
+    def __init__(self, state):
+        super().__init__(f'labels of {state["img"]} were changed by another annotator')
+        self.state = state
+
+
+class Server_Client:
+    """
+    Thin client of Annotation_Server (see core.server for the endpoints)
+    """
+
+    def __init__(self, url, annotator):
+        self.url = url.rstrip('/')
+        self.annotator = annotator
+
+    def request(self, method, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode('utf8')
+        request = Request(self.url + path, data, {'Content-Type': 'application/json'}, method=method)
+        with urlopen(request, timeout=CLIENT_TIMEOUT) as response:
+            return response.read()
+
+    def get_json(self, path):
+        return json.loads(self.request('GET', path))
+
+    def session_info(self):
+        return self.get_json('/session')
+
+    def next_work(self, size=WORK_BATCH_SIZE):
+        """
+        :return: list with {"img", "labels", "version"} of images leased to this annotator
+        """
+        return self.get_json('/work?' + urlencode({'annotator': self.annotator, 'size': size}))['items']
+
+    def image(self, img_name, max_size=0):
+        query = f'?max_size={max_size}' if max_size else ''
+        return self.request('GET', f'/image/{quote(img_name)}{query}')
+
+    def submit_labels(self, img_name, labels, version):
+        """
+        :return: new {"img", "labels", "version"}
+        :raises Conflict: if the labels were changed since version
+        """
+        try:
+            return json.loads(self.request('POST', f'/labels/{quote(img_name)}',
+                                           {'labels': labels, 'version': version}))
+        except HTTPError as e:
+            if e.code == 409:
+                raise Conflict(json.loads(e.read()))
+            raise
+
+    def export(self, out_filename, formats, packed=False):
+        """
+        :return: paths of files saved on the server
+        """
+        payload = {'out_filename': out_filename, 'formats': list(formats), 'packed': packed}
+        return json.loads(self.request('POST', '/export', payload))['saved_paths']
+
+
+class RemoteLabelSession(Session_Tools):
+    """
+    LabelSession-like view of work leased from Annotation_Server, so Labeler_Widget can act as a client.
+    img_paths grows by one work batch at a time, images are downloaded into cache_folder when they are read
+    (read_image, in background threads of the GUI).
+    Label changes are sent to the server immediately, mode is always 'csv' (server does the file operations)
+    """
+
+    def __init__(self, url, annotator, cache_folder=None, max_size=0):
+        """
+        :param url: server url, e.g. http://192.168.1.10:8765
+        :param annotator: name of the annotator, work is leased to them
+        :param cache_folder: folder for downloaded images, temporary folder by default
+        :param max_size: if given, server sends images downscaled to this size
+        """
+        self.client = Server_Client(url, annotator)
+        self.labels = self.client.session_info()['labels']
+        self.input_folder = cache_folder or tempfile.mkdtemp(prefix='labeler-')
+        self.img_paths = []
+        self.mode = 'csv'
+        self.max_size = max_size
+        self.assigned_labels = {}  # {img_name: [labels]}, only images leased to this client
+        self.versions = {}  # {img_name: version of labels on the server}
+        self.scores = {}  # {img_name: [score of every label] or None if it can't be read}, from prelabel
+        self.duplicates = {}  # {img_name: img_names of its cluster of near duplicates}, from find_duplicates
+        make_folder(self.input_folder)
+
+        self.load_more()
+
+    def load_more(self):
+        """
+        Leases next batch of work from the server
+        :return: True if new images were added to img_paths
+        """
+        known = set(self.versions)
+        items = [item for item in self.client.next_work() if item['img'] not in known]
+
+        for item in items:
+            self.update(item)
+            self.img_paths.append(os.path.join(self.input_folder, item['img']))
+
+        return bool(items)
+
+    def update(self, state):
+        img_name = state['img']
+        self.versions[img_name] = state['version']
+        if state['labels']:
+            self.assigned_labels[img_name] = state['labels']
+        else:
+            self.assigned_labels.pop(img_name, None)
+
+    def img_names(self):
+        return [os.path.basename(img_path) for img_path in self.img_paths]
+
+    def image_path(self, index):
+        """
+        :return: path where the image is downloaded, it doesn't have to exist yet (see read_image)
+        """
+        return self.img_paths[index]
+
+    def local_path(self, index):
+        path = self.img_paths[index]
+        if not os.path.exists(path):
+            self.read_image(path)
+        return path
+
+    def read_image(self, path):
+        """
+        Downloads the image when it's needed for the first time. Blocks until the server responds,
+        so GUI calls it only from background threads (rendering, prefetch)
+        :return: bytes of the image
+        """
+        if os.path.exists(path):
+            return read_bytes(path)
+
+        data = self.client.image(os.path.basename(path), self.max_size)
+        # more threads can download the same image at once
+        part_path = f'{path}.{threading.get_ident()}.part'
+        with open(part_path, 'wb') as f:
+            f.write(data)
+        os.replace(part_path, path)
+        return data
+
+    def labels_of(self, img_name):
+        return self.assigned_labels.get(img_name, [])
+
+    def cache_folder(self):
+        # leased images are downloaded into input_folder, caches are kept next to them
+        return self.input_folder
+
+    def set_label(self, img_name, label):
+        """
+        Toggles label of one image on the server. If another annotator changed the image meanwhile,
+        the toggle is applied to their labels
+        :return: True if the label was assigned, False if it was removed
+        :raises LeaseLost: if another annotator keeps changing the image
+        """
+        for _ in range(2):
+            old_labels = self.labels_of(img_name)
+            added = label not in old_labels
+            new_labels = old_labels + [label] if added else [l for l in old_labels if l != label]
+            try:
+                self.update(self.client.submit_labels(img_name, new_labels, self.versions.get(img_name, 0)))
+                return added
+            except Conflict as e:
+                self.update(e.state)
+
+        raise LeaseLost(f'labels of {img_name} keep being changed by another annotator, try again')
+
+    def assign_many(self, img_names, label, remove=False):
+        """
+        Assigns label to (or removes it from) many images, images which already are in requested state are skipped.
+        The server has no batch endpoint, so every changed image is one request
+        :return: number of changed images
+        """
+        changed = 0
+        for img_name in dict.fromkeys(img_names):
+            if (label in self.labels_of(img_name)) == remove:
+                self.set_label(img_name, label)
+                changed += 1
+        return changed
+
+    def snapshot(self, out_filename, formats=('csv',), **options):
+        """
+        :return: keyword arguments for export_snapshot, export itself is done by the server
+        """
+        return dict(out_filename=out_filename, formats=list(formats), **options)
+
+    def export(self, out_filename, formats=('csv',), progress=None, **options):
+        return self.export_snapshot(progress, **self.snapshot(out_filename, formats, **options))
+
+    def export_snapshot(self, progress=None, out_filename='assigned_classes', formats=('csv',), packed=False):
+        """
+        Asks the server to export labels of all annotators
+        :return: list with paths of files saved on the server
+        """
+        return self.client.export(out_filename, formats, packed)
@@ -0,0 +1,265 @@
+"""
+Near-duplicate detection by perceptual hashes: 64-bit pHash (low frequencies of DCT of 32x32 grayscale image)
+finds candidates, 64-bit dHash (gradients of 9x8 grayscale image) confirms them.
+Images are hashed in a process pool, whole batches at once by NumPy, hashes are cached on disk by file stat.
+Candidates are found by multi-index hashing: pHash is split into max_distance + 1 chunks, and two hashes
+within max_distance bits differ in at most max_distance chunks, so they are equal in at least one of them.
+"""
+import os
+
+from core.batches import Stat_Cache, cached_values, run_batches
+from core.files import image_buffer, read_bytes
+from core.tracing import traced
+
+# images are hashed in batches of this size, every batch in a worker process
+HASH_BATCH_SIZE = 256
+
+# images are near duplicates if their pHashes differ in at most this many bits (and dHashes in DHASH_MAX_DISTANCE)
+DUPLICATE_MAX_DISTANCE = 4
+DHASH_MAX_DISTANCE = 10
+
+
+def gray_pixels(image, width, height):
+    """
+    :param image: QImage
+    :return: grayscale image scaled to width x height, float32 array (height, width)
+    """
+    import numpy as np
+    from PySide2.QtCore import Qt
+    from PySide2.QtGui import QImage
+
+    image = image.convertToFormat(QImage.Format_Grayscale8).scaled(width, height, Qt.IgnoreAspectRatio,
+                                                                    Qt.SmoothTransformation)
+    # rows of QImage are padded to 4 bytes
+    rows = np.frombuffer(image.constBits(), np.uint8, image.bytesPerLine() * height).reshape(height, -1)
+    return rows[:, :width].astype(np.float32)
+
+
+def read_small(img_path):
+    """
+    :return: QImage decoded at (about) 32x32 pixels (JPEG is decoded at reduced size), null if it can't be read
+    """
+    from PySide2.QtCore import QSize
+    from PySide2.QtGui import QImageReader
+
+    buffer = image_buffer(read_bytes(img_path))
+    reader = QImageReader(buffer)
+    reader.setScaledSize(QSize(32, 32))
+    return reader.read()
+
+
+def dct_matrix(size):
+    """
+    :return: orthonormal DCT-II matrix, dct @ x @ dct.T is 2D DCT of x
+    """
+    import numpy as np
+
+    k, i = np.mgrid[0:size, 0:size]
+    matrix = np.sqrt(2 / size) * np.cos(np.pi * (2 * i + 1) * k / (2 * size))
+    matrix[0] /= np.sqrt(2)
+    return matrix.astype(np.float32)
+
+
+def pack_bits(bits):
+    """
+    :param bits: bool array (n, 64)
+    :return: uint64 array (n)
+    """
+    import numpy as np
+
+    return np.packbits(bits, axis=1).view('>u8').ravel().astype(np.uint64)
+
+
+def phashes(pixels):
+    """
+    :param pixels: array (n, 32, 32) with grayscale images
+    :return: uint64 array (n), bit is set if DCT coefficient is above median of the 8x8 lowest frequencies
+    """
+    import numpy as np
+
+    dct = dct_matrix(32)
+    low = (dct @ pixels @ dct.T)[:, :8, :8].reshape(len(pixels), 64)
+    # DC coefficient (average brightness) doesn't take part in the median
+    return pack_bits(low > np.median(low[:, 1:], axis=1, keepdims=True))
+
+
+def dhashes(pixels):
+    """
+    :param pixels: array (n, 8, 9) with grayscale images
+    :return: uint64 array (n), bit is set if pixel is brighter than its left neighbour
+    """
+    return pack_bits((pixels[:, :, 1:] > pixels[:, :, :-1]).reshape(len(pixels), 64))
+
+
+def hash_batch(img_paths):
+    """
+    Hashes images (runs in worker process)
+    :return: list of [phash, dhash] for every image, None for images which can't be read
+    """
+    import numpy as np
+
+    images = []
+    for img_path in img_paths:
+        try:
+            image = read_small(img_path)
+        except (OSError, ValueError):
+            image = None
+        images.append(image if image is not None and not image.isNull() else None)
+
+    readable = [image for image in images if image is not None]
+    if not readable:
+        return [None] * len(img_paths)
+
+    p = phashes(np.stack([gray_pixels(image, 32, 32) for image in readable])).tolist()
+    d = dhashes(np.stack([gray_pixels(image, 9, 8) for image in readable])).tolist()
+
+    hashes = iter(zip(p, d))
+    return [list(next(hashes)) if image is not None else None for image in images]
+
+
+def popcount(values):
+    """
+    :return: number of set bits of every uint64 value
+    """
+    import numpy as np
+
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    table = np.array([bin(i).count('1') for i in range(256)], np.uint8)
+    return table[values.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def near_pairs(hashes, max_distance):
+    """
+    Multi-index hashing: for every chunk, hashes are sorted by the chunk and hashes in runs of equal chunks are compared.
+    Work is proportional to the number of candidate pairs, not to n^2
+    :param hashes: uint64 array without repeated values
+    :return: two index arrays, hashes[a[i]] and hashes[b[i]] differ in at most max_distance bits
+    """
+    import numpy as np
+
+    n = len(hashes)
+    num_chunks = max_distance + 1
+    bounds = [64 * c // num_chunks for c in range(num_chunks + 1)]
+    found_a, found_b = [], []
+
+    for low, high in zip(bounds, bounds[1:]):
+        keys = (hashes >> np.uint64(low)) & np.uint64((1 << (high - low)) - 1)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+
+        # candidates[i] is compared with the element k places after it, while they have the same key
+        candidates = np.arange(n - 1)
+        k = 1
+        while candidates.size:
+            candidates = candidates[candidates + k < n]
+            candidates = candidates[sorted_keys[candidates + k] == sorted_keys[candidates]]
+            a, b = order[candidates], order[candidates + k]
+            close = popcount(hashes[a] ^ hashes[b]) <= max_distance
+            found_a.append(a[close])
+            found_b.append(b[close])
+            k += 1
+
+    if not found_a:
+        return np.zeros(0, np.int64), np.zeros(0, np.int64)
+
+    # pairs equal in more chunks were found more times
+    a, b = np.concatenate(found_a), np.concatenate(found_b)
+    pairs = np.unique(np.minimum(a, b) * n + np.maximum(a, b))
+    return pairs // n, pairs % n
+
+
+def clusters_of_pairs(n, pairs):
+    """
+    :param pairs: iterable of (i, j), indexes 0..n-1
+    :return: list of clusters (sorted lists of indexes) with at least two members, connected by pairs
+    """
+    parent = list(range(n))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        root_i, root_j = root(i), root(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters = {}
+    for i in range(n):
+        clusters.setdefault(root(i), []).append(i)
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
+
+
+def duplicate_clusters(hashes, max_distance=DUPLICATE_MAX_DISTANCE, dhash_max_distance=DHASH_MAX_DISTANCE):
+    """
+    :param hashes: list of [phash, dhash] (or None) for every image
+    :return: list of clusters of near-duplicate images (lists of indexes into hashes)
+    """
+    import numpy as np
+
+    indexes = [i for i, h in enumerate(hashes) if h is not None]
+    if not indexes:
+        return []
+    p = np.array([hashes[i][0] for i in indexes], np.uint64)
+    d = np.array([hashes[i][1] for i in indexes], np.uint64)
+
+    # images with equal pHash are compared once, through their unique hash
+    unique, inverse = np.unique(p, return_inverse=True)
+    a, b = near_pairs(unique, max_distance)
+
+    # pairs of images: every image with the first image of its pHash, and images of near pHashes with each other
+    members = np.argsort(inverse, kind='stable')
+    groups = np.split(members, np.flatnonzero(np.diff(inverse[members])) + 1)
+    first_of = np.array([group[0] for group in groups])
+
+    pair_a = [first_of[inverse]]
+    pair_b = [np.arange(len(inverse))]
+    for x, y in zip(a.tolist(), b.tolist()):
+        pair_a.append(np.repeat(groups[x], len(groups[y])))
+        pair_b.append(np.tile(groups[y], len(groups[x])))
+    pair_a, pair_b = np.concatenate(pair_a), np.concatenate(pair_b)
+
+    # dHash has to be near too
+    close = popcount(d[pair_a] ^ d[pair_b]) <= dhash_max_distance
+    pairs = zip(pair_a[close].tolist(), pair_b[close].tolist())
+    return [[indexes[i] for i in cluster] for cluster in clusters_of_pairs(len(indexes), pairs)]
+
+
+def clusters_by_name(img_paths, clusters):
+    """
+    :param clusters: clusters of indexes into img_paths (see find_duplicates)
+    :return: {img_name: tuple with img_names of its cluster} for every image in a cluster
+    """
+    by_name = {}
+    for cluster in clusters:
+        img_names = tuple(os.path.basename(img_paths[i]) for i in cluster)
+        for img_name in img_names:
+            by_name[img_name] = img_names
+    return by_name
+
+
+@traced()
+def find_duplicates(img_paths, max_distance=DUPLICATE_MAX_DISTANCE, cache_path=None, batch_size=HASH_BATCH_SIZE,
+                    processes=None, progress=None):
+    """
+    Hashes images in a process pool (only new or changed ones if cache_path is given) and finds near duplicates
+    :param img_paths: paths of images
+    :param max_distance: maximal number of different bits of pHashes of near duplicates
+    :param cache_path: json file with cached hashes
+    :param processes: number of worker processes (default: number of cores)
+    :param progress: optional callable(done, total) called after every batch, it may raise to stop hashing
+        (hashes of finished batches are still cached)
+    :return: list of clusters of near-duplicate images (lists of indexes into img_paths)
+    """
+    cache = Stat_Cache(cache_path)
+    hashes, todo = cached_values(img_paths, cache)
+
+    new_hashes = run_batches([img_paths[i] for i in todo], hash_batch, cache, batch_size, processes, progress,
+                             done=len(img_paths) - len(todo), total=len(img_paths))
+    for i, image_hashes in zip(todo, new_hashes):
+        hashes[i] = image_hashes
+
+    return duplicate_clusters(hashes, max_distance)
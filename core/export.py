@@ -0,0 +1,722 @@
+import csv
+import gzip
+import json
+import lzma
+import os
+from array import array
+
+# numpy, xlsxwriter and the process pool are imported by the functions which need them,
+# they take most of the startup time
+
+from core.files import make_folder
+from core.tracing import traced
+
+# maximum number of rows in one xlsx worksheet
+XLSX_MAX_ROWS = 1048576
+
+# export progress is reported (and cancellation checked) after every EXPORT_PROGRESS_STEP rows
+EXPORT_PROGRESS_STEP = 10000
+
+# export_sharded doesn't create shards with less images than this (unless num_shards is given)
+MIN_SHARD_SIZE = 100000
+
+# compression suffixes of text formats, e.g. "csv.gz" or "jsonl.xz"
+COMPRESSIONS = {'gz': gzip.open, 'xz': lzma.open}
+
+
+def tmp_file_path(file_path):
+    """
+    :return: path where file_path is written until the export is complete
+    """
+    folder, filename = os.path.split(file_path)
+    return os.path.join(folder, '.~' + filename)
+
+
+def open_output(file_path, compression=None):
+    """
+    Opens file for binary writing, compressed if compression is one of COMPRESSIONS
+    """
+    if compression is None:
+        return open(file_path, 'wb')
+    return COMPRESSIONS[compression](file_path, 'wb')
+
+
+def csv_field(value):
+    """
+    Formats one csv field the same way as csv.writer with default dialect does (QUOTE_MINIMAL)
+    """
+    value = str(value)
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class Xlsx_Sheet_Writer:
+    """
+    Appends rows to workbook, rows that don't fit into one worksheet continue on the next one
+    """
+
+    def __init__(self, workbook, header):
+        self.workbook = workbook
+        self.header = header
+        self.worksheet = None
+        self.r = XLSX_MAX_ROWS
+
+    def write_row(self, row):
+        if self.r == XLSX_MAX_ROWS:
+            self.worksheet = self.workbook.add_worksheet()
+            self.worksheet.write_row(0, 0, self.header)
+            self.r = 1
+
+        self.worksheet.write_row(self.r, 0, row)
+        self.r += 1
+
+    def close(self):
+        if self.worksheet is None:
+            self.workbook.add_worksheet().write_row(0, 0, self.header)
+        self.workbook.close()
+
+
+def npy_file_paths(npy_file_path):
+    """
+    :return: paths of all files generated by Npy_Exporter
+    """
+    base_path = npy_file_path[:-4]
+    return [npy_file_path, base_path + '_names.npy', base_path + '.json']
+
+
+def load_npy_labels(npy_file_path):
+    """
+    Loads labels saved by Npy_Exporter
+    :param npy_file_path: path to .npy label matrix
+    :return: list with label names, list with filenames of all images (sorted) and dict {img_name: [labels]}
+    """
+    import numpy as np
+
+    base_path = npy_file_path[:-4]
+    with open(base_path + '.json') as f:
+        meta = json.load(f)
+    labels = meta['labels']
+
+    matrix = np.load(npy_file_path, mmap_mode='r')
+    names = np.load(base_path + '_names.npy', mmap_mode='r')
+    if meta['packed']:
+        matrix = np.unpackbits(matrix, axis=1, count=len(labels))
+
+    img_names = [name.decode('utf8') for name in names.tolist()]
+    assigned_labels = {}
+    rows, cols = np.nonzero(matrix)
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        assigned_labels.setdefault(img_names[row], []).append(labels[col])
+
+    return labels, img_names, assigned_labels
+
+
+def open_input(file_path):
+    """
+    Opens text file for reading, decompressed if it ends with one of COMPRESSIONS (e.g. "labels.csv.gz")
+    """
+    compression = file_path.rpartition('.')[2]
+    if compression in COMPRESSIONS:
+        return COMPRESSIONS[compression](file_path, 'rt', newline='', encoding='utf8')
+    return open(file_path, newline='', encoding='utf8')
+
+
+def load_csv_labels(csv_file_path):
+    """
+    Loads labels saved by Csv_Exporter
+    :param csv_file_path: path to csv file (optionally compressed)
+    :return: list with label names, list with filenames of all images and dict {img_name: [labels]}
+    """
+    img_names = []
+    assigned_labels = {}
+
+    with open_input(csv_file_path) as csvfile:
+        reader = csv.reader(csvfile, delimiter=',')
+        firstrow = next(reader)
+        labels = firstrow[1:]
+
+        for row in reader:
+            img_name = row[0]
+            label_digits = row[1:]
+            img_names.append(img_name)
+            img_labels = [labels[i] for i, label_digit in enumerate(label_digits) if label_digit == "1"]
+            if img_labels:
+                assigned_labels[img_name] = img_labels
+
+    return labels, img_names, assigned_labels
+
+
+def load_jsonl_labels(jsonl_file_path, labels=None):
+    """
+    Loads labels saved by Jsonl_Exporter. Label names are taken from the header line, files without it
+    (written by older versions) get labels given as parameter, followed by labels found in the file
+    :param jsonl_file_path: path to jsonl file (optionally compressed)
+    :param labels: optional list with label names
+    :return: list with label names, list with filenames of all images and dict {img_name: [labels]}
+    """
+    labels = dict.fromkeys(labels or ())
+    img_names = []
+    assigned_labels = {}
+
+    with open_input(jsonl_file_path) as f:
+        for line in f:
+            item = json.loads(line)
+            if 'img' not in item:
+                labels = dict.fromkeys(item['labels'])
+                continue
+            img_names.append(item['img'])
+            if item['labels']:
+                assigned_labels[item['img']] = item['labels']
+                labels.update(dict.fromkeys(item['labels']))
+
+    return list(labels), img_names, assigned_labels
+
+
+class Incremental_Csv_Writer:
+    """
+    Remembers where each row of csv file generated by Csv_Exporter is stored,
+    so following exports only rewrite rows of images whose labels changed (O(changes) instead of O(images)).
+    Every row has the same width for the whole session (image filename + one digit per label),
+    so changed rows are patched in place. Whole file is written again if it was changed outside of the app,
+    the labels or images differ, or the previous export didn't finish.
+    """
+
+    def __init__(self):
+        self.dirty = set()
+        self.header = None
+        self.row_of = {}  # {img_name: row index}
+        self.img_names = []  # filenames of the rows, in order of the file
+        self.digit_offsets = array('q')  # byte offset of the first one-hot digit of each row
+        self.file_stat = None  # (size, mtime) of csv file after the last export
+
+    def mark_dirty(self, img_name):
+        self.dirty.add(img_name)
+
+    def take_dirty(self):
+        """
+        :return: filenames marked dirty since the last call. Dirty set is cleared
+        """
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def can_patch(self, csv_file_path, header, img_names):
+        # rows of reordered images would be patched with labels of other images
+        if self.file_stat is None or header != self.header or img_names != self.img_names:
+            return False
+        try:
+            st = os.stat(csv_file_path)
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) == self.file_stat
+
+    def patch(self, csv_file_path, labels, img_names, assigned_labels, dirty):
+        """
+        Rewrites one-hot labels of dirty rows in place
+        :return: False if the file can't be patched and has to be written again
+        """
+        if not self.can_patch(csv_file_path, ['img'] + labels, img_names):
+            return False
+
+        # file is in unknown state until patching is finished
+        self.file_stat = None
+        label_to_int = dict((c, i) for i, c in enumerate(labels))
+        rows = sorted((self.row_of[img_name], img_name) for img_name in dirty if img_name in self.row_of)
+
+        with open(csv_file_path, 'r+b') as f:
+            for row, img_name in rows:
+                labels_one_hot = ['0'] * len(labels)
+                for label in assigned_labels.get(img_name, ()):
+                    labels_one_hot[label_to_int[label]] = '1'
+                f.seek(self.digit_offsets[row])
+                f.write(','.join(labels_one_hot).encode('utf8'))
+
+        self.written(csv_file_path)
+        return True
+
+    def start(self, header):
+        """
+        Forgets offsets of the previous file, a new one is being written
+        """
+        self.file_stat = None
+        self.header = list(header)
+        self.row_of = {}
+        self.img_names = []
+        self.digit_offsets = array('q')
+
+    def add_row(self, img_name, digit_offset):
+        self.row_of[img_name] = len(self.digit_offsets)
+        self.img_names.append(img_name)
+        self.digit_offsets.append(digit_offset)
+
+    def written(self, csv_file_path):
+        """
+        Remembers state of csv file after successful export, so the next export can patch it
+        """
+        st = os.stat(csv_file_path)
+        self.file_stat = (st.st_size, st.st_mtime_ns)
+
+
+class Exporter:
+    """
+    Base class of streaming exporters.
+    export_labels creates one exporter per requested format and feeds all of them during single pass over the labels:
+    open(), write() for every image, close(). Files are written under temporary names (see tmp_file_path),
+    commit() renames them when the export is complete and abort() removes them.
+    """
+    # file extension of generated file
+    extension = ''
+    # text formats can be compressed, e.g. "csv.gz"
+    compressible = False
+
+    def __init__(self, out_path, labels, num_images, compression=None, **options):
+        """
+        :param out_path: path of generated file without extension
+        :param labels: list with label names
+        :param num_images: number of images which will be written
+        :param compression: None or one of COMPRESSIONS
+        :param options: format specific options, options of other formats are ignored
+        """
+        self.labels = labels
+        self.num_images = num_images
+        self.compression = compression
+        self.file = None
+
+        self.file_path = out_path + '.' + self.extension
+        if compression is not None:
+            self.file_path += '.' + compression
+        # all files generated by the exporter
+        self.file_paths = [self.file_path]
+
+    def open(self):
+        self.file = open_output(tmp_file_path(self.file_path), self.compression)
+
+    def write(self, img_name, img_labels, labels_one_hot):
+        """
+        :param img_name: image filename
+        :param img_labels: labels assigned to the image
+        :param labels_one_hot: list with one digit (0/1) per label
+        """
+        raise NotImplementedError
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def commit(self):
+        for file_path in self.file_paths:
+            os.replace(tmp_file_path(file_path), file_path)
+
+    def abort(self):
+        try:
+            self.close()
+        finally:
+            for file_path in self.file_paths:
+                if os.path.exists(tmp_file_path(file_path)):
+                    os.remove(tmp_file_path(file_path))
+
+
+class Csv_Exporter(Exporter):
+    """
+    img,label1,label2,...
+    img1.jpg,0,1,...
+    Output is the same as from csv.writer. Uncompressed file can be patched later by Incremental_Csv_Writer
+    """
+    extension = 'csv'
+    compressible = True
+
+    def __init__(self, out_path, labels, num_images, compression=None, csv_writer=None, **options):
+        super().__init__(out_path, labels, num_images, compression)
+        # offsets are only known in uncompressed file
+        self.csv_writer = csv_writer if compression is None else None
+        self.pos = 0
+
+    def open(self):
+        super().open()
+        header = ['img'] + self.labels
+        if self.csv_writer is not None:
+            self.csv_writer.start(header)
+
+        line = (','.join(csv_field(c) for c in header) + '\r\n').encode('utf8')
+        self.file.write(line)
+        self.pos = len(line)
+
+    def write(self, img_name, img_labels, labels_one_hot):
+        name = (csv_field(img_name) + ',').encode('utf8')
+        line = name + (','.join(map(str, labels_one_hot)) + '\r\n').encode('ascii')
+        if self.csv_writer is not None:
+            self.csv_writer.add_row(img_name, self.pos + len(name))
+        self.file.write(line)
+        self.pos += len(line)
+
+    def commit(self):
+        super().commit()
+        if self.csv_writer is not None:
+            self.csv_writer.written(self.file_path)
+
+
+class Jsonl_Exporter(Exporter):
+    """
+    One json object per line: {"img": "img1.jpg", "labels": ["label2"]},
+    after header line {"labels": ["label1", "label2"]} with all label names of the session
+    """
+    extension = 'jsonl'
+    compressible = True
+
+    def open(self):
+        super().open()
+        self.file.write((json.dumps({'labels': list(self.labels)}, ensure_ascii=False) + '\n').encode('utf8'))
+
+    def write(self, img_name, img_labels, labels_one_hot):
+        line = json.dumps({'img': img_name, 'labels': list(img_labels)}, ensure_ascii=False) + '\n'
+        self.file.write(line.encode('utf8'))
+
+
+class Label_Lists_Exporter(Exporter):
+    """
+    Folder <name>_lists with one <label>.txt file per label, listing filenames of images with this label
+    """
+    extension = 'txt'
+    compressible = True
+
+    def __init__(self, out_path, labels, num_images, compression=None, **options):
+        super().__init__(out_path, labels, num_images, compression)
+        self.folder = out_path + '_lists'
+        self.file_path = self.folder
+        self.file_paths = [os.path.join(self.folder, label) + self.file_path_suffix() for label in labels]
+        self.files = {}
+
+    def file_path_suffix(self):
+        return '.txt' if self.compression is None else '.txt.' + self.compression
+
+    def open(self):
+        make_folder(self.folder)
+        for label, file_path in zip(self.labels, self.file_paths):
+            self.files[label] = open_output(tmp_file_path(file_path), self.compression)
+
+    def write(self, img_name, img_labels, labels_one_hot):
+        line = (img_name + '\n').encode('utf8')
+        for label in img_labels:
+            self.files[label].write(line)
+
+    def close(self):
+        while self.files:
+            self.files.popitem()[1].close()
+
+    def abort(self):
+        super().abort()
+        # remove the folder if it was created by this export
+        try:
+            os.rmdir(self.folder)
+        except OSError:
+            pass
+
+
+class Xlsx_Exporter(Exporter):
+    """
+    Same layout as csv, written in constant_memory mode with numeric cells
+    """
+    extension = 'xlsx'
+
+    def open(self):
+        from xlsxwriter.workbook import Workbook
+
+        workbook = Workbook(tmp_file_path(self.file_path), {'constant_memory': True})
+        self.file = Xlsx_Sheet_Writer(workbook, ['img'] + self.labels)
+
+    def write(self, img_name, img_labels, labels_one_hot):
+        self.file.write_row([img_name] + labels_one_hot)
+
+
+class Npy_Exporter(Exporter):
+    """
+    Memory-mappable numpy files, they can be loaded with np.load(path, mmap_mode='r'):
+    - <name>.npy: uint8 label matrix with one row per image and one column per label.
+      If packed option is set, columns are bit-packed with np.packbits(axis=1)
+    - <name>_names.npy: sorted utf8 image names (row index). Row i of the matrix belongs to image i of the index,
+      so an image can be looked up with np.searchsorted(names, img_name.encode('utf8'))
+    - <name>.json: label names and format information
+    """
+    extension = 'npy'
+
+    def __init__(self, out_path, labels, num_images, compression=None, packed=False, **options):
+        super().__init__(out_path, labels, num_images, compression)
+        self.packed = packed
+        self.file_paths = npy_file_paths(self.file_path)
+        self.names = []
+        self.matrix = None
+
+    def open(self):
+        import numpy as np
+
+        self.names = []
+        self.matrix = np.zeros((self.num_images, len(self.labels)), dtype=np.uint8)
+
+    def write(self, img_name, img_labels, labels_one_hot):
+        row = len(self.names)
+        self.names.append(img_name.encode('utf8'))
+        if img_labels:
+            self.matrix[row] = labels_one_hot
+
+    def abort(self):
+        # nothing is saved until close
+        self.matrix = None
+        super().abort()
+
+    def close(self):
+        if self.matrix is None:
+            return
+
+        import numpy as np
+
+        names = np.array(self.names, dtype=bytes)
+        order = np.argsort(names, kind='stable')
+        matrix = self.matrix[:len(self.names)][order]
+        self.matrix = None
+
+        if self.packed:
+            matrix = np.packbits(matrix, axis=1)
+
+        npy_path, names_path, json_path = [tmp_file_path(file_path) for file_path in self.file_paths]
+        np.save(npy_path, matrix)
+        np.save(names_path, names[order])
+        with open(json_path, 'w') as f:
+            json.dump({'labels': self.labels, 'packed': self.packed, 'num_images': len(names)}, f)
+
+
+# {format name: exporter class}. Compressed variants are selected with suffix, e.g. "jsonl.gz"
+EXPORTERS = {}
+
+
+def register_exporter(name, exporter_class):
+    """
+    Makes export format available to export_labels
+    :param name: format name, used in formats parameter of export_labels
+    :param exporter_class: subclass of Exporter
+    """
+    EXPORTERS[name] = exporter_class
+
+
+register_exporter('csv', Csv_Exporter)
+register_exporter('jsonl', Jsonl_Exporter)
+register_exporter('lists', Label_Lists_Exporter)
+register_exporter('xlsx', Xlsx_Exporter)
+register_exporter('npy', Npy_Exporter)
+
+
+def exporter_class_of(file_format):
+    """
+    :param file_format: name from EXPORTERS, optionally with compression suffix (e.g. "csv.gz")
+    :return: exporter class and compression (or None)
+    :raises ValueError: if the format isn't registered or can't be compressed this way
+    """
+    name, _, compression = file_format.partition('.')
+    exporter_class = EXPORTERS.get(name)
+
+    if exporter_class is None or compression and (not exporter_class.compressible or compression not in COMPRESSIONS):
+        raise ValueError(f'Unknown export format: {file_format}')
+
+    return exporter_class, compression or None
+
+
+def create_exporter(file_format, out_path, labels, num_images, **options):
+    """
+    :param file_format: name from EXPORTERS, optionally with compression suffix (e.g. "csv.gz")
+    :return: Exporter instance
+    """
+    exporter_class, compression = exporter_class_of(file_format)
+    return exporter_class(out_path, labels, num_images, compression=compression, **options)
+
+
+@traced()
+def export_labels(path_to_save, out_filename, labels, img_names, assigned_labels, formats=('csv',), progress=None,
+                  csv_writer=None, dirty=(), **options):
+    """
+    Saves assigned labels in all requested formats during single pass over the images.
+    Every file is written under temporary name first and renamed when all of them are complete,
+    so cancelled or failed export never leaves half-written files behind.
+    :param path_to_save: output folder
+    :param out_filename: name of files to be generated (without extension)
+    :param labels: list with label names
+    :param img_names: list with filenames of all images in dataset
+    :param assigned_labels: dict {img_name: [labels]}
+    :param formats: formats to generate, names from EXPORTERS (e.g. csv, xlsx, npy, jsonl.gz, lists)
+    :param progress: optional callable(done, total), called every EXPORT_PROGRESS_STEP rows.
+        It may raise (e.g. core.batches.Cancelled) to stop the export
+    :param csv_writer: optional Incremental_Csv_Writer. If given, csv file is only patched with rows in dirty
+        whenever possible
+    :param dirty: filenames of images whose labels changed since the last export with csv_writer
+    :param options: format specific options, e.g. packed=True for npy
+    :return: list with paths of saved files (one per format)
+    """
+    make_folder(path_to_save)
+    out_path = os.path.join(path_to_save, out_filename)
+    saved_paths = {}
+
+    # patching takes O(changes), it is done before anything can cancel the export so dirty rows don't get lost
+    if 'csv' in formats and csv_writer is not None:
+        if csv_writer.patch(out_path + '.csv', labels, img_names, assigned_labels, dirty):
+            saved_paths['csv'] = out_path + '.csv'
+
+    exporters = {file_format: create_exporter(file_format, out_path, labels, len(img_names), csv_writer=csv_writer,
+                                              **options)
+                 for file_format in formats if file_format not in saved_paths}
+
+    if exporters:
+        label_to_int = dict((c, i) for i, c in enumerate(labels))
+        total = len(img_names)
+
+        try:
+            if progress is not None:
+                progress(0, total)
+
+            for exporter in exporters.values():
+                exporter.open()
+
+            for i, img_name in enumerate(img_names, start=1):
+                img_labels = assigned_labels.get(img_name, ())
+                labels_one_hot = [0] * len(labels)
+                for label in img_labels:
+                    labels_one_hot[label_to_int[label]] = 1
+
+                for exporter in exporters.values():
+                    exporter.write(img_name, img_labels, labels_one_hot)
+
+                if progress is not None and i % EXPORT_PROGRESS_STEP == 0:
+                    progress(i, total)
+
+            for exporter in exporters.values():
+                exporter.close()
+        except BaseException:
+            for exporter in exporters.values():
+                exporter.abort()
+            raise
+
+        for file_format, exporter in exporters.items():
+            exporter.commit()
+            saved_paths[file_format] = exporter.file_path
+
+        if progress is not None:
+            progress(total, total)
+
+    return [saved_paths[file_format] for file_format in formats]
+
+
+def export_shard(path_to_save, shard_name, labels, img_names, assigned_labels, file_format, options):
+    """
+    Exports one shard of sharded export, runs in worker process of export_sharded
+    :return: path of saved shard file
+    """
+    return export_labels(path_to_save, shard_name, labels, img_names, assigned_labels, [file_format], **options)[0]
+
+
+@traced()
+def export_sharded(path_to_save, out_filename, labels, img_names, assigned_labels, file_format='csv', num_shards=None,
+                   processes=None, progress=None, **options):
+    """
+    Splits images into contiguous shards and exports every shard in separate process, so export time scales
+    with number of cores. Shards are tied together with <out_filename>.manifest.json, which is written
+    only after all shards are complete:
+    {"labels": [...], "format": "csv", "num_images": N,
+     "shards": [{"path": "<out_filename>-00000-of-00004.csv", "start": 0, "stop": 250000}, ...]}
+    Shard paths are relative to the manifest folder, so the readers can load the shards in parallel too.
+    :param path_to_save: output folder
+    :param out_filename: name of the manifest and prefix of the shard files
+    :param labels: list with label names
+    :param img_names: list with filenames of all images in dataset
+    :param assigned_labels: dict {img_name: [labels]}
+    :param file_format: format of shard files, name from EXPORTERS (e.g. csv, npy, jsonl.gz)
+    :param num_shards: number of shards, by default one per core but at least MIN_SHARD_SIZE images per shard
+    :param processes: number of worker processes, by default number of cores
+    :param progress: optional callable(done, total), called when a shard is complete.
+        It may raise (e.g. core.batches.Cancelled) to stop the export, shards which haven't started yet are cancelled
+    :param options: format specific options, e.g. packed=True for npy
+    :return: path of the manifest
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    make_folder(path_to_save)
+    total = len(img_names)
+    if num_shards is None:
+        num_shards = min(os.cpu_count() or 1, -(-total // MIN_SHARD_SIZE))
+    num_shards = max(1, min(num_shards, total))
+
+    bounds = [total * i // num_shards for i in range(num_shards + 1)]
+    shards = []
+
+    with ProcessPoolExecutor(processes) as executor:
+        try:
+            futures = {}
+            for i in range(num_shards):
+                start, stop = bounds[i], bounds[i + 1]
+                shard_names = img_names[start:stop]
+                # send only labels of the shard to the worker
+                shard_labels = {n: assigned_labels[n] for n in shard_names if n in assigned_labels}
+                shard_name = f'{out_filename}-{i:05d}-of-{num_shards:05d}'
+                future = executor.submit(export_shard, path_to_save, shard_name, labels, shard_names, shard_labels,
+                                         file_format, options)
+                futures[future] = (start, stop)
+
+            done = 0
+            if progress is not None:
+                progress(done, total)
+
+            for future in as_completed(futures):
+                start, stop = futures[future]
+                shards.append({'path': os.path.relpath(future.result(), path_to_save), 'start': start, 'stop': stop})
+                done += stop - start
+                if progress is not None:
+                    progress(done, total)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    shards.sort(key=lambda shard: shard['start'])
+    manifest_path = os.path.join(path_to_save, out_filename) + '.manifest.json'
+    with open(tmp_file_path(manifest_path), 'w') as f:
+        json.dump({'labels': labels, 'format': file_format, 'num_images': total, 'shards': shards}, f, indent=1)
+    os.replace(tmp_file_path(manifest_path), manifest_path)
+
+    return manifest_path
+
+
+def load_manifest_labels(manifest_path):
+    """
+    Loads labels saved by export_sharded, shards can be in any format supported by load_labels
+    :param manifest_path: path to .manifest.json file
+    :return: list with label names, list with filenames of all images and dict {img_name: [labels]}
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    folder = os.path.dirname(manifest_path)
+    img_names = []
+    assigned_labels = {}
+    for shard in manifest['shards']:
+        _, shard_names, shard_labels = load_labels(os.path.join(folder, shard['path']), manifest['labels'])
+        img_names.extend(shard_names)
+        assigned_labels.update(shard_labels)
+
+    return manifest['labels'], img_names, assigned_labels
+
+
+@traced()
+def load_labels(file_path, labels=None):
+    """
+    Loads labels from csv, jsonl (both optionally compressed), npy or sharded export manifest
+    :param labels: label names for files which don't store them (jsonl written by older versions)
+    :return: list with label names, list with filenames of all images and dict {img_name: [labels]}
+    """
+    name = file_path.lower()
+    if name.rpartition('.')[2] in COMPRESSIONS:
+        name = name.rpartition('.')[0]
+
+    if name.endswith('.npy'):
+        return load_npy_labels(file_path)
+    if name.endswith('.manifest.json'):
+        return load_manifest_labels(file_path)
+    if name.endswith('.jsonl'):
+        return load_jsonl_labels(file_path, labels)
+    return load_csv_labels(file_path)
@@ -0,0 +1,108 @@
+import os
+
+from core.archives import archive_img_paths, is_archive, read_member, split_archive_path
+from core.tracing import traced
+
+@traced()
+def get_img_paths(dir, extensions=('.jpg', '.png', '.jpeg')):
+    '''
+    :param dir: folder with files, or ZIP/TAR archive (see core.archives)
+    :param extensions: tuple with file endings. e.g. ('.jpg', '.png'). Files with these endings will be added to img_paths
+    :return: list of all filenames, images inside archives in the folder are included too
+    :raises ValueError: if images in archives have the same filename as another image (images are identified
+        by filename, so they would share labels)
+    '''
+    if is_archive(dir):
+        return check_unique_names(archive_img_paths(dir, extensions))
+
+    img_paths = []
+    has_archives = False
+
+    for filename in os.listdir(dir):
+        if filename.lower().endswith(extensions):
+            img_paths.append(os.path.join(dir, filename))
+        elif is_archive(os.path.join(dir, filename)):
+            img_paths.extend(archive_img_paths(os.path.join(dir, filename), extensions))
+            has_archives = True
+
+    # filenames in one folder are unique, members of archives (in their subfolders) can repeat them
+    return check_unique_names(img_paths) if has_archives else img_paths
+
+
+def check_unique_names(img_paths):
+    '''
+    :return: img_paths
+    :raises ValueError: if two images have the same filename
+    '''
+    seen = {}
+    for img_path in img_paths:
+        img_name = os.path.basename(img_path)
+        if img_name in seen:
+            raise ValueError(f'Images {seen[img_name]} and {img_path} have the same filename {img_name}, '
+                             f'images are identified by filename so they would share labels. Rename one of them')
+        seen[img_name] = img_path
+    return img_paths
+
+
+def read_bytes(path):
+    """
+    :param path: path of file or archive member
+    :return: content of the file as bytes-like object: bytes read by one read call,
+        memoryview into the mapped archive for members stored without compression (see core.archives)
+    """
+    if split_archive_path(path) is not None:
+        return read_member(path)
+
+    # Qt can't decode from mapped memory without copying it into bytes first (see image_buffer),
+    # so mapping a single file would cost the same copy as reading it, plus page faults
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def image_buffer(data):
+    """
+    :param data: content of image file, bytes-like object (see read_bytes)
+    :return: QBuffer open for reading, for QImageReader. Qt reads bytes in place (buffer keeps a reference
+        to them), memoryview of archive member is copied into bytes once because PySide2 wraps only bytes
+    """
+    from PySide2.QtCore import QBuffer, QByteArray
+
+    data = bytes(data)  # no copy if data already is bytes
+    buffer = QBuffer()
+    buffer.setData(QByteArray.fromRawData(data))
+    buffer.raw_data = data
+    buffer.open(QBuffer.ReadOnly)
+    return buffer
+
+
+def file_stat(path):
+    """
+    :return: os.stat of the file, members of archive get stat of the archive
+    """
+    archive_member = split_archive_path(path)
+    return os.stat(path if archive_member is None else archive_member[0])
+
+
+def make_folder(directory):
+    """
+    Make folder if it doesn't already exist
+    :param directory: The folder destination path
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+
+def link_file(src, dst):
+    """
+    Hard links file into dst folder (or to dst path).
+    Falls back to symbolic link when hard link isn't possible, e.g. dst is on another device
+    :param src: path of existing file
+    :param dst: folder or path of the link
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        os.symlink(os.path.abspath(src), dst)
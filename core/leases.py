@@ -0,0 +1,215 @@
+import os
+import sqlite3
+import time
+
+from core.session import FILE_OPS_WORKERS, LabelSession
+
+# how long an annotator owns handed out work item before it is given to somebody else (seconds)
+WORK_LEASE_SECONDS = 600
+
+# default number of images in one work batch
+WORK_BATCH_SIZE = 50
+
+# name of lease database, it's stored in the shared image folder
+LEASE_DB_NAME = '.labeler_leases.sqlite'
+
+# seconds to wait while another annotator holds the database lock
+LEASE_DB_TIMEOUT = 30
+
+
+class LeaseLost(Exception):
+    """
+    Image isn't leased to this annotator (anymore), so it can't be labeled by them
+    """
+
+
+class Lease_Store:
+    """
+    Leases of images stored in SQLite database on the share, so annotators which label the same folder
+    from different machines never work on the same image.
+    Every write runs in an immediate transaction, so two annotators can't lease the same image.
+    Database uses the default rollback journal, WAL doesn't work on network file systems.
+    """
+
+    def __init__(self, db_path, annotator, lease_seconds=WORK_LEASE_SECONDS):
+        """
+        :param db_path: path of the database, it's created if it doesn't exist
+        :param annotator: name of this annotator, it has to be unique
+        :param lease_seconds: lease which isn't renewed for this long can be given to somebody else
+        """
+        self.annotator = annotator
+        self.lease_seconds = lease_seconds
+        self.connection = sqlite3.connect(db_path, timeout=LEASE_DB_TIMEOUT, isolation_level=None,
+                                          check_same_thread=False)
+        with self.transaction() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS work (img_name TEXT PRIMARY KEY, position INTEGER, owner TEXT, '
+                       'expiry REAL, done INTEGER NOT NULL DEFAULT 0)')
+            db.execute('CREATE INDEX IF NOT EXISTS work_todo ON work (done, position)')
+
+    def transaction(self):
+        return Transaction(self.connection)
+
+    def add_images(self, img_names, labeled=()):
+        """
+        Adds images which aren't in the database yet. Labeled images are never leased
+        """
+        labeled = set(labeled)
+        with self.transaction() as db:
+            start = db.execute('SELECT COALESCE(MAX(position) + 1, 0) FROM work').fetchone()[0]
+            db.executemany('INSERT OR IGNORE INTO work (img_name, position, done) VALUES (?, ?, ?)',
+                           ((img_name, start + i, int(img_name in labeled)) for i, img_name in enumerate(img_names)))
+
+    def acquire(self, size=WORK_BATCH_SIZE):
+        """
+        Leases unlabeled images: the ones which this annotator already owns, then free or expired ones
+        :return: list with filenames of leased images, in order of positions
+        """
+        now = time.time()
+        with self.transaction() as db:
+            img_names = [row[0] for row in db.execute(
+                'SELECT img_name FROM work WHERE done = 0 AND (owner = ? OR owner IS NULL OR expiry < ?) '
+                'ORDER BY owner = ? DESC, position LIMIT ?', (self.annotator, now, self.annotator, size))]
+            db.executemany('UPDATE work SET owner = ?, expiry = ? WHERE img_name = ?',
+                           ((self.annotator, now + self.lease_seconds, img_name) for img_name in img_names))
+
+        return img_names
+
+    def renew(self):
+        """
+        Extends all leases of this annotator which didn't expire yet
+        :return: number of renewed leases
+        """
+        now = time.time()
+        with self.transaction() as db:
+            return db.execute('UPDATE work SET expiry = ? WHERE owner = ? AND expiry >= ?',
+                              (now + self.lease_seconds, self.annotator, now)).rowcount
+
+    def claim(self, img_name):
+        """
+        Makes sure the image is leased to this annotator right before it's changed:
+        renews the lease, or takes the image again if the lease expired and nobody else took it
+        :raises LeaseLost: if the image is leased to somebody else
+        """
+        now = time.time()
+        with self.transaction() as db:
+            changed = db.execute('UPDATE work SET owner = ?, expiry = ? WHERE img_name = ? '
+                                 'AND (owner = ? OR owner IS NULL OR expiry < ?)',
+                                 (self.annotator, now + self.lease_seconds, img_name, self.annotator, now)).rowcount
+        if not changed:
+            raise LeaseLost(f'{img_name} is labeled by another annotator')
+
+    def set_done(self, img_names, done=True):
+        """
+        Labeled images are done, they stay owned by this annotator, so they can be corrected later
+        """
+        with self.transaction() as db:
+            db.executemany('UPDATE work SET done = ? WHERE img_name = ? AND owner = ?',
+                           ((int(done), img_name, self.annotator) for img_name in img_names))
+
+    def release(self):
+        """
+        Gives unlabeled images of this annotator back, e.g. when they stop labeling
+        """
+        with self.transaction() as db:
+            db.execute('UPDATE work SET owner = NULL, expiry = NULL WHERE owner = ? AND done = 0', (self.annotator,))
+
+    def close(self):
+        self.connection.close()
+
+
+class Transaction:
+    """
+    BEGIN IMMEDIATE ... COMMIT block, the database is locked for writing during the whole block
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        self.connection.execute('BEGIN IMMEDIATE')
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.connection.execute('COMMIT' if exc_type is None else 'ROLLBACK')
+
+
+class LeasedLabelSession(LabelSession):
+    """
+    LabelSession of one annotator which labels a folder shared with others (e.g. on network share).
+    img_paths contains only images leased to this annotator, it grows by one batch at a time (load_more).
+    Every label change claims the image first, so two annotators never copy/move the same image.
+    Exported files get annotator's name, so annotators don't overwrite each other's exports.
+    """
+
+    def __init__(self, labels, input_folder, img_paths, mode='csv', annotator='', db_path=None,
+                 batch_size=WORK_BATCH_SIZE, assigned_labels=None):
+        """
+        :param img_paths: paths of all images in the folder, only leased ones are labeled
+        :param annotator: unique name of the annotator
+        :param db_path: lease database, by default LEASE_DB_NAME in input_folder
+        :param batch_size: number of images leased at once
+        :param assigned_labels: labels assigned before, e.g. loaded from exported file
+        """
+        super().__init__(labels, input_folder, [], mode)
+        self.annotator = annotator
+        self.batch_size = batch_size
+        self.all_img_paths = {os.path.basename(img_path): img_path for img_path in img_paths}
+        self.leases = Lease_Store(db_path or os.path.join(input_folder, LEASE_DB_NAME), annotator)
+        self.last_renewal = time.time()
+
+        labeled = set()
+        for img_name, img_labels in (assigned_labels or {}).items():
+            if img_name in self.all_img_paths:
+                self.assigned_labels[img_name] = img_labels
+                labeled.add(img_name)
+        self.leases.add_images(self.all_img_paths, labeled)
+
+        self.load_more()
+
+    def load_more(self):
+        """
+        Leases next batch of unlabeled images
+        :return: True if new images were added to img_paths
+        """
+        # leased images which are still unlabeled come first, so ask for one batch more than them
+        # (labeled images aren't leased again, counting them would grow every batch)
+        known = set(self.img_names())
+        unlabeled = sum(1 for img_name in known if img_name not in self.assigned_labels)
+        new_names = [n for n in self.leases.acquire(unlabeled + self.batch_size) if n not in known]
+        self.img_paths.extend(self.all_img_paths[img_name] for img_name in new_names)
+        return bool(new_names)
+
+    def renew(self):
+        """
+        Renews leases if a quarter of lease time passed since the last renewal
+        """
+        if time.time() - self.last_renewal > self.leases.lease_seconds / 4:
+            self.leases.renew()
+            self.last_renewal = time.time()
+
+    def set_label(self, img_name, label):
+        self.leases.claim(img_name)
+        self.renew()
+        added = super().set_label(img_name, label)
+        self.leases.set_done([img_name], bool(self.labels_of(img_name)))
+        return added
+
+    def assign_many(self, img_names, label, remove=False, workers=FILE_OPS_WORKERS):
+        """
+        Assigns label to (or removes it from) images leased to this annotator, other images are skipped
+        """
+        owned = set(self.img_names())
+        img_names = [img_name for img_name in img_names if img_name in owned]
+        for img_name in img_names:
+            self.leases.claim(img_name)
+
+        changed = super().assign_many(img_names, label, remove, workers)
+        self.leases.set_done([n for n in img_names if self.labels_of(n)])
+        self.leases.set_done([n for n in img_names if not self.labels_of(n)], False)
+        return changed
+
+    def snapshot(self, out_filename, formats=('csv',), **options):
+        return super().snapshot(f'{out_filename}_{self.annotator}', formats, **options)
+
+    def export_sharded(self, out_filename, *args, **kwargs):
+        return super().export_sharded(f'{out_filename}_{self.annotator}', *args, **kwargs)
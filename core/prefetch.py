@@ -0,0 +1,148 @@
+"""
+Encoded tier of the image cache: raw bytes of images around the shown one (a few MB per photo, instead of
+~100 MB of decoded 24 MP image), read in background in direction of navigation.
+Decoded tier (scaled images of a few nearest images) is kept by Labeler_Widget, it's decoded from these bytes.
+"""
+import threading
+from collections import OrderedDict, deque
+
+from core.files import read_bytes
+
+# memory used by encoded images (bytes)
+ENCODED_CACHE_BYTES = 1024 ** 3
+
+# images read ahead in direction of navigation, and behind it (for going back)
+ENCODED_AHEAD = 128
+ENCODED_BEHIND = 8
+
+
+class Byte_Cache:
+    """
+    LRU cache of encoded images limited by total size in bytes, can be used from more threads
+    """
+
+    def __init__(self, max_bytes=ENCODED_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.items = OrderedDict()  # {path: bytes}
+        self.lock = threading.Lock()
+
+    def __contains__(self, path):
+        return path in self.items
+
+    def get(self, path):
+        with self.lock:
+            data = self.items.get(path)
+            if data is not None:
+                self.items.move_to_end(path)
+            return data
+
+    def touch(self, paths):
+        """
+        Marks cached paths as used, the last one as the most recently used
+        """
+        with self.lock:
+            for path in paths:
+                if path in self.items:
+                    self.items.move_to_end(path)
+
+    def put(self, path, data, protected=()):
+        """
+        Adds data, least recently used items are evicted if the cache is full, but never the protected ones
+        :return: False if the data doesn't fit without evicting protected items (then it isn't added)
+        """
+        with self.lock:
+            if path in self.items:
+                return True
+
+            evicted = []
+            size = self.size + len(data)
+            for cached_path, cached_data in self.items.items():
+                if size <= self.max_bytes:
+                    break
+                if cached_path not in protected:
+                    evicted.append(cached_path)
+                    size -= len(cached_data)
+
+            if size > self.max_bytes:
+                return False
+
+            for cached_path in evicted:
+                del self.items[cached_path]
+            self.items[path] = data
+            self.size = size
+            return True
+
+
+class Byte_Prefetcher:
+    """
+    Reads images into Byte_Cache in a background thread, nearest first.
+    Every update replaces the pending work, so after fast navigation only the images around the shown one are read
+    """
+
+    def __init__(self, cache, read=read_bytes):
+        """
+        :param read: callable(path), returns bytes of the image (e.g. session.read_image)
+        """
+        self.cache = cache
+        self.read = read
+        self.pending = deque()
+        self.window = []  # paths of the last update, nearest first
+        self.condition = threading.Condition()
+        self.thread = None
+        self.closed = False
+
+    def __len__(self):
+        """
+        :return: number of images waiting to be read
+        """
+        return len(self.pending)
+
+    def update(self, paths):
+        """
+        :param paths: paths of images which will be probably shown soon, nearest first
+        """
+        if self.closed:
+            return
+
+        # cached images of the window are evicted after the others, the nearest last
+        self.cache.touch(reversed(paths))
+
+        with self.condition:
+            self.window = list(paths)
+            self.pending = deque(path for path in paths if path not in self.cache)
+
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='prefetch', daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+
+                path = self.pending.popleft()
+                window = self.window
+
+            if path in self.cache:
+                continue
+            try:
+                data = bytes(self.read(path))
+            except (OSError, ValueError):
+                continue
+
+            # images nearer than this one mustn't be evicted for it, if it doesn't fit the cache is full
+            protected = set(window[:window.index(path)]) if path in window else set(window)
+            if not self.cache.put(path, data, protected):
+                with self.condition:
+                    if self.window is window:
+                        self.pending.clear()
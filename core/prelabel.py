@@ -0,0 +1,210 @@
+import hashlib
+import importlib
+import json
+import os
+
+from core.batches import Stat_Cache, cached_values, run_batches
+from core.files import image_buffer, read_bytes
+from core.tracing import traced
+
+# images are scored in batches of this size, every batch in a worker process
+PRELABEL_BATCH_SIZE = 64
+
+# labels with at least this score are suggested
+SUGGESTION_THRESHOLD = 0.5
+
+# scorer of the worker process, see init_worker
+_worker = {}
+
+
+class Linear_Model:
+    """
+    NumPy model stored in .npz file: scores = sigmoid(pixels @ weights + bias), where pixels are grayscale
+    pixels of the image scaled to size x size (values 0-1).
+    Arrays in the file: weights (size*size, num_labels), bias (num_labels), size (scalar),
+    labels (optional, label names of the columns, columns are matched to session labels by name)
+    """
+
+    def __init__(self, model_path, labels):
+        import numpy as np
+
+        with np.load(model_path) as model:
+            self.size = int(model['size'])
+            weights = model['weights'].astype(np.float32)
+            bias = model['bias'].astype(np.float32)
+            model_labels = [str(label) for label in model['labels']] if 'labels' in model else list(labels)
+
+        # reorder columns into order of session labels, labels unknown to the model always get score 0
+        self.weights = np.zeros((weights.shape[0], len(labels)), np.float32)
+        self.bias = np.zeros(len(labels), np.float32)
+        self.known = np.array([label in model_labels for label in labels])
+        for i, label in enumerate(labels):
+            if self.known[i]:
+                self.weights[:, i] = weights[:, model_labels.index(label)]
+                self.bias[i] = bias[model_labels.index(label)]
+
+    def __call__(self, img_paths, labels):
+        import numpy as np
+
+        pixels = np.stack([image_pixels(img_path, self.size) for img_path in img_paths])
+        scores = 1 / (1 + np.exp(-(pixels.reshape(len(img_paths), -1) @ self.weights + self.bias)))
+        return scores * self.known
+
+
+def image_pixels(img_path, size):
+    """
+    :return: grayscale image scaled to size x size, float32 array with values 0-1
+    """
+    import numpy as np
+    from PySide2.QtCore import Qt
+    from PySide2.QtGui import QImage, QImageReader
+
+    buffer = image_buffer(read_bytes(img_path))
+    image = QImageReader(buffer).read()
+    if image.isNull():
+        raise ValueError(f'Cannot read image: {img_path}')
+
+    image = image.convertToFormat(QImage.Format_Grayscale8).scaled(size, size, Qt.IgnoreAspectRatio,
+                                                                    Qt.SmoothTransformation)
+    # rows of QImage are padded to 4 bytes
+    rows = np.frombuffer(image.constBits(), np.uint8, image.bytesPerLine() * size).reshape(size, -1)
+    return rows[:, :size].astype(np.float32) / 255
+
+
+def load_scorer(scorer, labels):
+    """
+    :param scorer: path to .npz model (see Linear_Model), or "module:function" where
+        function(img_paths, labels) returns array (len(img_paths), len(labels)) with scores 0-1
+    :return: callable(img_paths, labels)
+    """
+    if scorer.endswith('.npz'):
+        return Linear_Model(scorer, labels)
+
+    module_name, _, function_name = scorer.partition(':')
+    if not function_name:
+        raise ValueError(f'Invalid scorer (expected "module:function" or .npz model): {scorer}')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def scorer_key(scorer, labels):
+    """
+    :return: id of scorer and labels, scores of different scorers (or changed model file) are cached separately
+    """
+    version = os.stat(scorer).st_mtime_ns if scorer.endswith('.npz') else ''
+    return f'{scorer}|{version}|{",".join(labels)}'
+
+
+def content_hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def init_worker(scorer, labels, known_hashes):
+    _worker['score'] = load_scorer(scorer, labels)
+    _worker['labels'] = labels
+    _worker['known_hashes'] = known_hashes
+
+
+def score_images(img_paths):
+    """
+    :return: list with scores of every image, scored all at once. If the batch fails, images are scored
+        one by one and images which can't be scored (missing, corrupt) get None
+    """
+    import numpy as np
+
+    try:
+        return [[round(float(score), 4) for score in row]
+                for row in np.asarray(_worker['score'](img_paths, _worker['labels']), np.float32)]
+    except (OSError, ValueError):
+        if len(img_paths) == 1:
+            return [None]
+        return [score_images([img_path])[0] for img_path in img_paths]
+
+
+def score_batch(img_paths):
+    """
+    Hashes images and scores those whose content hash isn't cached yet (runs in worker process)
+    :return: list of (content hash, scores or None if they are cached) for every image,
+        None for images which can't be read or scored
+    """
+    hashes = []
+    for img_path in img_paths:
+        try:
+            hashes.append(content_hash(read_bytes(img_path)))
+        except (OSError, ValueError):
+            hashes.append(None)
+
+    new = [i for i, h in enumerate(hashes) if h is not None and h not in _worker['known_hashes']]
+    results = [(h, None) if h is not None else None for h in hashes]
+    if new:
+        for i, scores in zip(new, score_images([img_paths[i] for i in new])):
+            results[i] = (hashes[i], scores) if scores is not None else None
+
+    return results
+
+
+class Score_Cache(Stat_Cache):
+    """
+    Scores cached by content hash of the image (json file), so rerun scores only new or changed images.
+    Content hash of a file is remembered with its size and modification time, unchanged files aren't read again
+    """
+
+    def __init__(self, path, key):
+        """
+        :param key: id of scorer and labels (see scorer_key)
+        """
+        self.scorers = {}  # {scorer key: {content hash: scores}}
+        super().__init__(path)
+        self.scores = self.scorers.setdefault(key, {})  # {content hash: scores} of this scorer, updated in place
+
+    def load(self, path):
+        with open(path, encoding='utf8') as f:
+            data = json.load(f)
+        self.files, self.scorers = data['files'], data['scorers']
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf8') as f:
+            json.dump({'files': self.files, 'scorers': self.scorers}, f)
+
+    def put(self, img_path, result):
+        """
+        :param result: content hash and scores of the image (None if the same content was scored before)
+        """
+        file_hash, scores = result
+        super().put(img_path, file_hash)
+        if scores is not None:
+            self.scores[file_hash] = scores
+
+
+@traced()
+def prelabel(img_paths, labels, scorer, cache_path=None, batch_size=PRELABEL_BATCH_SIZE, processes=None,
+             progress=None):
+    """
+    Scores images by scorer in a process pool, in batches. Scores are cached by content hash of the image,
+    so only new or changed images are scored again
+    :param img_paths: paths of images
+    :param labels: list with label names, scores are in this order
+    :param scorer: see load_scorer
+    :param cache_path: json file with cached scores
+    :param processes: number of worker processes (default: number of cores)
+    :param progress: optional callable(done, total) called after every batch, it may raise to stop scoring
+        (scores of finished batches are still cached)
+    :return: {img_name: [score of every label], or None if the image can't be read or scored}
+    """
+    labels = list(labels)
+    cache = Score_Cache(cache_path, scorer_key(scorer, labels))
+    file_hashes, _ = cached_values(img_paths, cache)
+
+    results = {}
+    todo = []
+    for img_path, file_hash in zip(img_paths, file_hashes):
+        if file_hash in cache.scores:
+            results[os.path.basename(img_path)] = cache.scores[file_hash]
+        else:
+            todo.append(img_path)
+
+    scored = run_batches(todo, score_batch, cache, batch_size, processes, progress, done=len(results),
+                         total=len(img_paths), initializer=init_worker, initargs=(scorer, labels, set(cache.scores)))
+    for img_path, result in zip(todo, scored):
+        results[os.path.basename(img_path)] = cache.scores[result[0]] if result is not None else None
+
+    return results
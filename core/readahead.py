@@ -0,0 +1,158 @@
+"""
+Read-ahead of images which will be shown next, for datasets on cold storage (HDD arrays, NFS),
+where the first read of a file takes most of the time of image switching.
+Only the page cache of the OS is warmed, no decoded images are kept in memory.
+
+Settings are read from environment variable LABELER_READAHEAD=<count>[:read], e.g. 64:read.
+count is the number of next images (0 disables read-ahead), with :read the files are also read
+by a low-priority thread (some network file systems ignore posix_fadvise).
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict, deque
+
+from core.archives import member_range, split_archive_path
+
+# number of next images warmed by default
+READAHEAD_COUNT = 32
+
+# files are read in chunks of this size when they are read into page cache
+READ_CHUNK_BYTES = 1024 * 1024
+
+
+def read_ahead_settings():
+    """
+    :return: count and read_files, see LABELER_READAHEAD
+    """
+    count, _, mode = os.environ.get('LABELER_READAHEAD', '').partition(':')
+    try:
+        count = int(count) if count else READAHEAD_COUNT
+    except ValueError:
+        count = READAHEAD_COUNT
+    return count, mode == 'read'
+
+
+def file_range(path):
+    """
+    :return: path of file where the image is stored, offset and size of the image in it (0 is the whole file)
+    """
+    if split_archive_path(path) is not None:
+        return member_range(path)
+    return path, 0, 0
+
+
+def advise(path):
+    """
+    Asks OS to start reading the image into page cache, returns immediately
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    file_path, offset, size = file_range(path)
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, offset, size, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def read_into_cache(path):
+    """
+    Reads the image (and throws the data away), so that it's in page cache when it's shown
+    """
+    file_path, offset, size = file_range(path)
+    buffer = bytearray(READ_CHUNK_BYTES)
+
+    with open(file_path, 'rb', buffering=0) as f:
+        f.seek(offset)
+        remaining = size or float('inf')
+        while remaining > 0:
+            num_read = f.readinto(buffer)
+            if not num_read:
+                break
+            remaining -= num_read
+
+
+def lower_thread_priority():
+    # on Linux, threads have their own niceness
+    if sys.platform.startswith('linux'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except OSError:
+            pass
+
+
+class Read_Ahead:
+    """
+    Warms page cache with next images in a background thread: hints (posix_fadvise WILLNEED) for all of them
+    first, then optionally reads them one by one. Every update replaces the pending work, so after fast
+    navigation only the images around the shown one are warmed
+    """
+
+    def __init__(self, count=READAHEAD_COUNT, read_files=False):
+        self.count = count
+        self.read_files = read_files
+        self.to_advise = deque()
+        self.to_read = deque()
+        self.warmed = OrderedDict()  # recently warmed paths, they aren't warmed again
+        self.condition = threading.Condition()
+        self.thread = None
+        self.closed = False
+
+    def __len__(self):
+        """
+        :return: number of images waiting to be warmed
+        """
+        return len(self.to_advise) + len(self.to_read)
+
+    def update(self, paths):
+        """
+        :param paths: paths of images which will be shown next, nearest first
+        """
+        if self.count <= 0 or self.closed:
+            return
+
+        with self.condition:
+            new = [path for path in paths[:self.count] if path not in self.warmed]
+            self.to_advise = deque(new)
+            self.to_read = deque(new) if self.read_files else deque()
+
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='read-ahead', daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def run(self):
+        lower_thread_priority()
+
+        while True:
+            with self.condition:
+                while not self.to_advise and not self.to_read and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+
+                if self.to_advise:
+                    path, warm = self.to_advise.popleft(), advise
+                    done = not self.read_files
+                else:
+                    path, warm = self.to_read.popleft(), read_into_cache
+                    done = True
+
+            try:
+                warm(path)
+            except (OSError, KeyError, ValueError):
+                # missing file (e.g. moved meanwhile) is simply not warmed
+                continue
+
+            if done:
+                with self.condition:
+                    self.warmed[path] = None
+                    while len(self.warmed) > 4 * self.count:
+                        self.warmed.popitem(last=False)
@@ -0,0 +1,78 @@
+import fnmatch
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# filenames are matched in chunks of this size, every chunk in a worker process
+RULES_CHUNK_SIZE = 100000
+
+
+def parse_rules(lines):
+    """
+    Parses labeling rules, one rule per line: "<glob pattern> <label>". Empty lines and lines starting with '#'
+    are skipped. Pattern is matched against image filename, label is the last word on the line. e.g.
+        cat_*.jpg   cat
+        *_dog_*     dog
+    :param lines: iterable of lines, e.g. opened rules file
+    :return: list of (pattern, label)
+    """
+    rules = []
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        parts = line.rsplit(None, 1)
+        if len(parts) != 2:
+            raise ValueError(f'Invalid rule (expected "<pattern> <label>"): {line}')
+        rules.append((parts[0], parts[1]))
+
+    return rules
+
+
+def compile_rules(rules):
+    """
+    :return: list of (label, regex) with one regex matching all patterns of the label
+    """
+    patterns = {}
+    for pattern, label in rules:
+        patterns.setdefault(label, []).append(fnmatch.translate(pattern))
+
+    return [(label, '|'.join(label_patterns)) for label, label_patterns in patterns.items()]
+
+
+def match_chunk(img_names, compiled_rules):
+    """
+    Matches filenames against compiled rules, runs in worker process of match_rules
+    :return: dict {label: [img_names]}
+    """
+    matches = {}
+    for label, regex in compiled_rules:
+        match = re.compile(regex).match
+        matches[label] = [img_name for img_name in img_names if match(img_name)]
+
+    return matches
+
+
+def match_rules(img_names, rules, processes=None):
+    """
+    Finds images matching labeling rules. Large lists of filenames are matched in parallel in a process pool
+    :param img_names: list with filenames
+    :param rules: list of (glob pattern, label), see parse_rules
+    :param processes: number of worker processes, by default number of cores
+    :return: dict {label: [img_names]}, filenames are in order of img_names
+    """
+    compiled_rules = compile_rules(rules)
+
+    if len(img_names) <= RULES_CHUNK_SIZE:
+        return match_chunk(img_names, compiled_rules)
+
+    chunks = [img_names[i:i + RULES_CHUNK_SIZE] for i in range(0, len(img_names), RULES_CHUNK_SIZE)]
+    matches = {label: [] for label, _ in compiled_rules}
+
+    with ProcessPoolExecutor(processes) as executor:
+        for chunk_matches in executor.map(match_chunk, chunks, [compiled_rules] * len(chunks)):
+            for label, label_matches in chunk_matches.items():
+                matches[label].extend(label_matches)
+
+    return matches
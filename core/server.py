@@ -0,0 +1,393 @@
+import asyncio
+import json
+import mimetypes
+import os
+import signal
+import time
+from collections import OrderedDict, deque
+from functools import partial
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from core.export import export_labels, exporter_class_of
+from core.files import image_buffer, read_bytes
+from core.leases import WORK_BATCH_SIZE, WORK_LEASE_SECONDS
+
+# labels are exported (incremental csv) this often, and when the server stops (seconds)
+AUTOSAVE_SECONDS = 30
+
+# memory used by cached downscaled images (bytes)
+IMAGE_CACHE_BYTES = 256 * 1024 * 1024
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 409: 'Conflict',
+               500: 'Internal Server Error'}
+
+
+class HTTP_Error(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def scale_image(data, max_size):
+    """
+    Downscales encoded image so that its longer side is max_size. Qt is only needed for downscaling,
+    without it (or for images which are small already) the original bytes are returned
+    :return: image bytes and content type, or (data, None) if the image wasn't changed
+    """
+    try:
+        from PySide2.QtCore import QBuffer, Qt
+        from PySide2.QtGui import QImageReader
+    except ImportError:
+        return data, None
+
+    image = QImageReader(image_buffer(data)).read()
+    if image.isNull() or max(image.width(), image.height()) <= max_size:
+        return data, None
+
+    image = image.scaled(max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    buffer = QBuffer()
+    buffer.open(QBuffer.WriteOnly)
+    image.save(buffer, 'JPEG', 90)
+    return bytes(buffer.data()), 'image/jpeg'
+
+
+class Image_Cache:
+    """
+    LRU cache of encoded (downscaled) images, limited by total size in bytes
+    """
+
+    def __init__(self, max_bytes=IMAGE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.items = OrderedDict()  # {key: (data, content_type)}
+
+    def get(self, key):
+        item = self.items.get(key)
+        if item is not None:
+            self.items.move_to_end(key)
+        return item
+
+    def put(self, key, item):
+        if key in self.items:
+            self.size -= len(self.items.pop(key)[0])
+        self.items[key] = item
+        self.size += len(item[0])
+
+        while self.size > self.max_bytes and self.items:
+            self.size -= len(self.items.popitem(last=False)[1][0])
+
+
+class Work_Queue:
+    """
+    Hands out unlabeled images to annotators in batches.
+    Handed out image is leased to its annotator for WORK_LEASE_SECONDS, then it can be given to somebody else
+    """
+
+    def __init__(self, img_names, is_labeled, lease_seconds=WORK_LEASE_SECONDS):
+        """
+        :param img_names: filenames of all images in order in which they should be labeled
+        :param is_labeled: callable(img_name), labeled images are never handed out
+        """
+        self.pending = deque(img_names)
+        self.is_labeled = is_labeled
+        self.lease_seconds = lease_seconds
+        self.leases = {}  # {img_name: (annotator, expiry)}
+
+    def next_batch(self, annotator, size=WORK_BATCH_SIZE):
+        """
+        :return: filenames leased to annotator: unlabeled images which they already own (their leases are renewed),
+            then size new ones. Images which the annotator skipped don't take places of new ones,
+            otherwise who skips a whole batch would never get new work
+        """
+        now = time.monotonic()
+        owned = []
+
+        for img_name, (owner, expiry) in list(self.leases.items()):
+            if self.is_labeled(img_name):
+                del self.leases[img_name]
+            elif expiry < now:
+                # expired lease, image goes back to the front of the queue
+                del self.leases[img_name]
+                self.pending.appendleft(img_name)
+            elif owner == annotator:
+                owned.append(img_name)
+
+        new = []
+        while self.pending and len(new) < size:
+            img_name = self.pending.popleft()
+            if not self.is_labeled(img_name) and img_name not in self.leases:
+                new.append(img_name)
+
+        batch = owned + new
+        for img_name in batch:
+            self.leases[img_name] = (annotator, now + self.lease_seconds)
+
+        return batch
+
+    def done(self, img_name):
+        self.leases.pop(img_name, None)
+
+
+class Annotation_Server:
+    """
+    Local HTTP server which lets more annotators label one LabelSession at the same time.
+    All requests are handled by one asyncio loop, file operations and image scaling run in a thread pool.
+
+    GET  /session                              {"labels", "num_images", "num_labeled"}
+    GET  /work?annotator=NAME&size=N           {"items": [{"img", "labels", "version"}, ...]}
+    GET  /image/<img_name>?max_size=PIXELS     image bytes (downscaled variants are cached)
+    GET  /labels/<img_name>                    {"img", "labels", "version"}
+    POST /labels/<img_name>  {"labels", "version"}
+         sets labels of the image if version matches the current one, otherwise responds 409 with current state
+    POST /export  {"out_filename", "formats", "packed"}   {"saved_paths": [...]}
+    """
+
+    def __init__(self, session, host='127.0.0.1', port=8765):
+        """
+        :param session: LabelSession shared by all annotators
+        :param host: address to listen on, the server has no authentication, so other machines can connect
+            only if it's set explicitly (e.g. 0.0.0.0 in a trusted network)
+        """
+        self.session = session
+        self.host = host
+        self.port = port
+        self.index_of = {img_name: i for i, img_name in enumerate(session.img_names())}
+        self.versions = {}  # {img_name: number of label changes}
+        self.image_locks = {}  # {img_name: asyncio.Lock}, file operations of one image mustn't overlap
+        self.export_lock = None
+        self.stopped = None  # asyncio.Event, set by stop()
+        self.image_cache = Image_Cache()
+        self.work_queue = Work_Queue(session.img_names(), lambda img_name: img_name in session.assigned_labels)
+
+    def run(self):
+        """
+        Serves until interrupted (Ctrl+C or SIGTERM), labels are exported when the server stops
+        """
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.session.export('assigned_classes_server')
+
+    async def serve(self):
+        self.export_lock = asyncio.Lock()
+        self.stopped = asyncio.Event()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        autosave = asyncio.create_task(self.autosave())
+
+        # SIGTERM (e.g. from systemd or docker stop) ends serving normally, so the final export in run() is done
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGTERM, self.stop)
+        except (NotImplementedError, RuntimeError):
+            # signal handlers can be set only in main thread, and not on Windows
+            pass
+
+        try:
+            async with server:
+                await self.stopped.wait()
+        finally:
+            autosave.cancel()
+            try:
+                loop.remove_signal_handler(signal.SIGTERM)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+    def stop(self):
+        """
+        Stops serve(), has to be called in the loop thread
+        """
+        if self.stopped is not None:
+            self.stopped.set()
+
+    async def autosave(self):
+        while True:
+            await asyncio.sleep(AUTOSAVE_SECONDS)
+            await self.export('assigned_classes_server', ['csv'])
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode('latin1').split()
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                try:
+                    status, content_type, payload = await self.route(method, target, body)
+                except HTTP_Error as e:
+                    status, content_type, payload = e.status, 'application/json', {'error': str(e)}
+                except Exception as e:
+                    status, content_type, payload = 500, 'application/json', {'error': str(e)}
+
+                if content_type == 'application/json':
+                    payload = json.dumps(payload).encode('utf8')
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write((f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}\r\n'
+                              f'Content-Type: {content_type}\r\n'
+                              f'Content-Length: {len(payload)}\r\n'
+                              f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n').encode('latin1'))
+                writer.write(payload)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, target, body):
+        """
+        :return: status, content type and payload (bytes, or object which is sent as json)
+        """
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        resource, _, img_name = url.path.lstrip('/').partition('/')
+        img_name = unquote(img_name)
+
+        if method == 'GET' and resource == 'session':
+            return 200, 'application/json', {'labels': self.session.labels, 'num_images': len(self.index_of),
+                                             'num_labeled': len(self.session.assigned_labels)}
+        if method == 'GET' and resource == 'work':
+            batch = self.work_queue.next_batch(query.get('annotator', ''), int_param(query, 'size', WORK_BATCH_SIZE))
+            return 200, 'application/json', {'items': [self.label_state(img_name) for img_name in batch]}
+        if method == 'GET' and resource == 'image':
+            return (200,) + await self.image(img_name, int_param(query, 'max_size', 0))
+        if method == 'GET' and resource == 'labels':
+            self.check_image(img_name)
+            return 200, 'application/json', self.label_state(img_name)
+        if method == 'POST' and resource == 'labels':
+            request = json_request(body, {'labels': list, 'version': int})
+            return await self.submit_labels(img_name, request['labels'], request['version'])
+        if method == 'POST' and resource == 'export':
+            request = json_request(body)
+            out_filename = request.get('out_filename', 'assigned_classes')
+            formats = request.get('formats', ['csv'])
+            self.check_export(out_filename, formats)
+            options = {'packed': bool(request.get('packed', False))}
+            saved_paths = await self.export(out_filename, formats, **options)
+            return 200, 'application/json', {'saved_paths': saved_paths}
+
+        raise HTTP_Error(404 if resource not in ('session', 'work', 'image', 'labels', 'export') else 405,
+                         f'{method} {url.path} not supported')
+
+    def check_image(self, img_name):
+        if img_name not in self.index_of:
+            raise HTTP_Error(404, f'Unknown image: {img_name}')
+
+    def check_export(self, out_filename, formats):
+        """
+        Files can be exported only into the output folder and only in registered formats
+        """
+        if not isinstance(out_filename, str) or not out_filename or out_filename in ('.', '..') or \
+                os.path.basename(out_filename) != out_filename or '/' in out_filename or '\\' in out_filename:
+            raise HTTP_Error(400, f'Invalid out_filename: {out_filename!r}')
+        if not isinstance(formats, list) or not formats:
+            raise HTTP_Error(400, 'formats must be a non-empty list')
+        for file_format in formats:
+            try:
+                exporter_class_of(str(file_format))
+            except ValueError as e:
+                raise HTTP_Error(400, str(e))
+
+    def label_state(self, img_name):
+        return {'img': img_name, 'labels': self.session.labels_of(img_name), 'version': self.versions.get(img_name, 0)}
+
+    async def image(self, img_name, max_size):
+        """
+        :return: content type and bytes of the image, downscaled if max_size is given
+        """
+        self.check_image(img_name)
+        key = (img_name, max_size)
+        cached = self.image_cache.get(key)
+        if cached is not None:
+            return cached[1], cached[0]
+
+        loop = asyncio.get_running_loop()
+        path = self.session.image_path(self.index_of[img_name])
+        data = await loop.run_in_executor(None, read_file, path)
+        content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+        if max_size:
+            data, scaled_content_type = await loop.run_in_executor(None, scale_image, data, max_size)
+            if scaled_content_type is None:
+                # cache doesn't keep the archive mapped by views of its members
+                data = bytes(data)
+            content_type = scaled_content_type or content_type
+            self.image_cache.put(key, (data, content_type))
+
+        return content_type, data
+
+    async def submit_labels(self, img_name, labels, version):
+        """
+        Sets labels of the image (optimistic concurrency control): if somebody else changed them since
+        the client read version, nothing is changed and 409 with the current state is returned
+        """
+        self.check_image(img_name)
+        unknown = [label for label in labels if label not in self.session.labels]
+        if unknown:
+            raise HTTP_Error(400, f'Unknown labels: {unknown}')
+
+        if version != self.versions.get(img_name, 0):
+            return 409, 'application/json', self.label_state(img_name)
+
+        # label store is updated immediately, so following requests see the new version
+        file_ops = self.session.set_labels(img_name, labels)
+        self.versions[img_name] = version + 1
+        self.work_queue.done(img_name)
+
+        # locks are kept: a request waiting on a removed lock would run beside one holding a new lock
+        async with self.image_locks.setdefault(img_name, asyncio.Lock()):
+            await asyncio.get_running_loop().run_in_executor(None, self.session.run_file_ops, file_ops, 1)
+
+        return 200, 'application/json', self.label_state(img_name)
+
+    async def export(self, out_filename, formats, **options):
+        # snapshot is taken in the loop thread, so no label change can happen in the middle of it
+        async with self.export_lock:
+            snapshot = self.session.snapshot(out_filename, formats, **options)
+            return await asyncio.get_running_loop().run_in_executor(None, partial(export_labels, **snapshot))
+
+
+def json_request(body, required=None):
+    """
+    :param required: {key: type} of values which the request has to contain
+    :return: json object from request body
+    :raises HTTP_Error: 400 if the body isn't json object or a required value is missing
+    """
+    try:
+        request = json.loads(body)
+    except ValueError as e:
+        raise HTTP_Error(400, f'Invalid json: {e}')
+    if not isinstance(request, dict):
+        raise HTTP_Error(400, 'Request has to be json object')
+
+    for key, value_type in (required or {}).items():
+        if not isinstance(request.get(key), value_type) or isinstance(request[key], bool):
+            raise HTTP_Error(400, f'{key} has to be {value_type.__name__}')
+    return request
+
+
+def int_param(query, name, default):
+    try:
+        return int(query.get(name, default))
+    except ValueError:
+        raise HTTP_Error(400, f'{name} has to be a number')
+
+
+def read_file(path):
+    # file is sent as it is read, stored archive member as a view of the mapped archive (without copying it)
+    return read_bytes(path)
@@ -0,0 +1,458 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from core.active import Uncertainty_Queue
+from core.export import Incremental_Csv_Writer, export_labels, export_sharded, load_labels
+from core.archives import split_archive_path
+from core.duplicates import DUPLICATE_MAX_DISTANCE, clusters_by_name, find_duplicates
+from core.files import get_img_paths, link_file, make_folder, read_bytes
+from core.prelabel import SUGGESTION_THRESHOLD, prelabel
+from core.similarity import similarity_order
+from core.tracing import span, traced
+
+# number of threads which copy/move files in LabelSession.assign_many
+FILE_OPS_WORKERS = 8
+
+# scores of pre-labeling models are cached in this file in cache folder of the session
+PRELABEL_CACHE_NAME = '.prelabel_scores.json'
+
+# perceptual hashes of images are cached in this file in cache folder of the session
+DUPLICATE_CACHE_NAME = '.duplicate_hashes.json'
+
+# features for ordering by visual similarity are cached in this file in cache folder of the session
+SIMILARITY_CACHE_NAME = '.similarity_features.npz'
+
+
+class Session_Tools:
+    """
+    Reading of images, pre-labeling, near duplicates and ordering by similarity, shared by LabelSession
+    and RemoteLabelSession. Work runs on this machine on local_path of every image, caches are kept in cache_folder()
+    """
+
+    def upcoming_paths(self, index, count, direction=1):
+        """
+        :param direction: 1 for images after the image with given index, -1 for images before it
+        :return: paths of (at most) count images next to the image with given index, nearest first (for read-ahead)
+        """
+        indexes = range(index + direction, index + direction * (count + 1), direction)
+        return [self.image_path(i) for i in indexes if 0 <= i < len(self.img_paths)]
+
+    def read_image(self, path):
+        """
+        :param path: path from image_path
+        :return: content of the image as bytes-like object (see read_bytes), GUI calls it in background threads
+        """
+        return read_bytes(path)
+
+    def local_path(self, index):
+        """
+        :return: path of image file on this machine (RemoteLabelSession downloads the image first)
+        """
+        return self.image_path(index)
+
+    def cache_folder(self):
+        raise NotImplementedError
+
+    def cache_path(self, cache_name):
+        return os.path.join(self.cache_folder(), cache_name)
+
+    def suggested_labels(self, img_name, threshold=SUGGESTION_THRESHOLD):
+        """
+        :return: labels which the pre-labeling model suggests for the image
+        """
+        scores = self.scores.get(img_name) or ()
+        return [label for label, score in zip(self.labels, scores) if score >= threshold]
+
+    def prelabel(self, scorer, processes=None, progress=None):
+        """
+        Scores all images by model (see core.prelabel.prelabel), scores are cached in cache folder
+        :param scorer: path to .npz model or "module:function"
+        :return: number of scored images, images which can't be read get None scores
+        """
+        img_paths = [self.local_path(i) for i in range(len(self.img_paths))]
+        scores = prelabel(img_paths, self.labels, scorer, self.cache_path(PRELABEL_CACHE_NAME),
+                          processes=processes, progress=progress)
+        self.scores.update(scores)
+        return sum(1 for img_scores in scores.values() if img_scores is not None)
+
+    def uncertainty_queue(self, measure='entropy'):
+        """
+        :return: Uncertainty_Queue with scored unlabeled images, the most uncertain first (see prelabel)
+        """
+        return Uncertainty_Queue(self.scores, lambda img_name: img_name in self.assigned_labels, measure)
+
+    def find_duplicates(self, max_distance=DUPLICATE_MAX_DISTANCE, processes=None, progress=None):
+        """
+        Finds clusters of near-duplicate images (see core.duplicates.find_duplicates), hashes are cached in cache folder
+        :return: number of images which have a near duplicate
+        """
+        img_paths = [self.local_path(i) for i in range(len(self.img_paths))]
+        clusters = find_duplicates(img_paths, max_distance, self.cache_path(DUPLICATE_CACHE_NAME),
+                                   processes=processes, progress=progress)
+        self.duplicates = clusters_by_name(img_paths, clusters)
+        return len(self.duplicates)
+
+    def duplicates_of(self, img_name):
+        """
+        :return: list with names of near duplicates of the image (without the image itself)
+        """
+        return [name for name in self.duplicates.get(img_name, ()) if name != img_name]
+
+    def has_labeled_duplicate(self, img_name):
+        return any(name in self.assigned_labels for name in self.duplicates_of(img_name))
+
+    def similarity_order(self, start=0, processes=None, progress=None):
+        """
+        Orders images from start on by visual similarity (see core.similarity), features are cached in cache folder
+        :return: list with img_paths[start:] in the new order, img_paths[start] stays first
+        """
+        img_paths = [self.local_path(i) for i in range(start, len(self.img_paths))]
+        order = similarity_order(img_paths, self.cache_path(SIMILARITY_CACHE_NAME),
+                                 processes=processes, progress=progress)
+        return [self.img_paths[start + i] for i in order]
+
+    def order_by_similarity(self, start=0, processes=None, progress=None):
+        """
+        Reorders img_paths from start on, so that visually similar images follow each other
+        """
+        self.reorder(start, self.similarity_order(start, processes, progress))
+
+    def reorder(self, start, img_paths):
+        """
+        Replaces img_paths from start on with the same images in another order
+        """
+        self.img_paths[start:start + len(img_paths)] = img_paths
+
+
+class LabelSession(Session_Tools):
+    """
+    State and logic of one labeling session, without any GUI:
+    images, labels, assigned labels, copy/move of images into label folders and export.
+    Labeler_Widget is a GUI around LabelSession, scripts can use it directly on headless machines.
+
+    Images are identified by filename (img_name), as in exported files.
+    Label lists in assigned_labels are never modified in place (they are replaced),
+    so a shallow copy of assigned_labels is a consistent snapshot.
+    """
+
+    def __init__(self, labels, input_folder, img_paths, mode='csv'):
+        """
+        :param labels: list with label names
+        :param input_folder: folder with images, label folders are created inside it in copy/move/link mode
+        :param img_paths: list with paths of images to label (see get_img_paths)
+        :param mode: one of: csv (only assign labels), copy (copy images to label folders),
+            move (move images to label folders), link (hard/symbolic link images into label folders)
+        """
+        self.labels = list(labels)
+        self.input_folder = input_folder
+        self.img_paths = img_paths
+        self.mode = mode
+        self.assigned_labels = {}  # {img_name: [labels]}
+        self.scores = {}  # {img_name: [score of every label] or None if it can't be read}, from prelabel
+        self.duplicates = {}  # {img_name: img_names of its cluster of near duplicates}, from find_duplicates
+        self.csv_writers = {}  # {out_filename: Incremental_Csv_Writer}
+
+        # create label folders
+        if mode in ('copy', 'move', 'link'):
+            if any(split_archive_path(img_path) is not None for img_path in img_paths):
+                raise ValueError('Images in archives can be labeled only in csv mode')
+            for label in self.labels:
+                make_folder(os.path.join(self.input_folder, label))
+
+    @classmethod
+    def open(cls, input_folder, labels_path, img_paths=None, mode='csv'):
+        """
+        Reopens session from exported labels (csv, jsonl, npy or sharded export manifest, see load_labels)
+        :param input_folder: folder with images
+        :param labels_path: path to exported labels
+        :param img_paths: list with paths of images, by default all images in input_folder
+        :param mode: one of: csv, copy, move, link. Only images assigned after opening are copied/moved/linked
+        """
+        labels, _, assigned_labels = load_labels(labels_path)
+        if img_paths is None:
+            img_paths = get_img_paths(input_folder)
+
+        session = cls(labels, input_folder, img_paths, mode)
+
+        # keep only labels of images which are in the session
+        img_names = set(session.img_names())
+        for img_name, img_labels in assigned_labels.items():
+            if img_name in img_names:
+                session.assigned_labels[img_name] = img_labels
+
+        return session
+
+    def load_label_folders(self, extensions=('.jpg', '.png', '.jpeg')):
+        """
+        Assigns labels of images which already are in label folders (e.g. from an earlier copy/move/link run),
+        so they aren't copied/moved/linked again. Images moved out of input_folder are added to img_paths
+        :param extensions: tuple with file endings of images
+        :return: number of images with labels from label folders
+        """
+        if self.mode not in ('copy', 'move', 'link'):
+            return 0
+
+        img_names = set(self.img_names())
+        seeded = set()
+        for label in self.labels:
+            label_folder = os.path.join(self.input_folder, label)
+            for img_name in sorted(os.listdir(label_folder)):
+                if not img_name.lower().endswith(extensions):
+                    continue
+                if img_name not in img_names:
+                    # only moved images are stored just in label folders
+                    if self.mode != 'move':
+                        continue
+                    self.img_paths.append(os.path.join(self.input_folder, img_name))
+                    img_names.add(img_name)
+                if label not in self.labels_of(img_name):
+                    self.mark_dirty(img_name)
+                    self.assigned_labels[img_name] = self.labels_of(img_name) + [label]
+                seeded.add(img_name)
+
+        return len(seeded)
+
+    def img_names(self):
+        """
+        :return: list with filenames of all images, in order of img_paths
+        """
+        return [os.path.basename(img_path) for img_path in self.img_paths]
+
+    def image_path(self, index):
+        """
+        :param index: index of image in img_paths
+        :return: path where the image is stored now.
+            In 'move' mode labeled image was moved from '.../input_folder' to '.../input_folder/label'
+        """
+        path = self.img_paths[index]
+        img_name = os.path.basename(path)
+
+        if self.mode == 'move' and img_name in self.assigned_labels:
+            path = os.path.join(self.input_folder, self.assigned_labels[img_name][0], img_name)
+
+        return path
+
+    def labels_of(self, img_name):
+        return self.assigned_labels.get(img_name, [])
+
+    @traced('LabelSession.set_label')
+    def set_label(self, img_name, label):
+        """
+        Toggles label of one image: assigns the label, or removes it if it's already assigned.
+        Image is copied/moved between label folders according to mode.
+        :return: True if the label was assigned, False if it was removed
+        """
+        if label in self.labels_of(img_name):
+            self.run_file_ops([self.remove_label(img_name, label)])
+            return False
+
+        self.run_file_ops([self.add_label(img_name, label)])
+        return True
+
+    def set_labels(self, img_name, labels):
+        """
+        Replaces all labels of one image. Label store is updated immediately, file operations are returned
+        :return: list with file operations, they depend on each other, so run them by run_file_ops(file_ops, 1)
+        """
+        old_labels = self.labels_of(img_name)
+        file_ops = [self.remove_label(img_name, label) for label in old_labels if label not in labels]
+        file_ops += [self.add_label(img_name, label) for label in labels if label not in old_labels]
+        return file_ops
+
+    def load_more(self):
+        """
+        Local session has all images from the start, sessions backed by a server load the next batch of work
+        :return: True if new images were added to img_paths
+        """
+        return False
+
+    def assign_many(self, img_names, label, remove=False, workers=FILE_OPS_WORKERS):
+        """
+        Assigns label to (or removes it from) many images at once.
+        Images which already are in requested state are skipped. Label store is updated first,
+        then all copy/move operations run as one batch in a thread pool.
+        :param img_names: filenames of images
+        :param label: label name
+        :param remove: if True, label is removed instead of assigned
+        :param workers: number of threads which copy/move the images
+        :return: number of changed images
+        """
+        if label not in self.labels:
+            raise ValueError(f'Unknown label: {label}')
+
+        file_ops = []
+        for img_name in dict.fromkeys(img_names):
+            if (label in self.labels_of(img_name)) == remove:
+                file_ops.append(self.remove_label(img_name, label) if remove else self.add_label(img_name, label))
+
+        self.run_file_ops(file_ops, workers)
+        return len(file_ops)
+
+    def add_label(self, img_name, label):
+        """
+        Adds label to assigned_labels
+        :return: file operation (function, src, dst) which puts the image into the label folder, or None
+        """
+        self.mark_dirty(img_name)
+        old_labels = self.labels_of(img_name)
+        self.assigned_labels[img_name] = old_labels + [label]
+
+        copy_to = os.path.join(self.input_folder, label)
+
+        if self.mode == 'copy':
+            # the image is stored in input_folder, so it can be copied from there (differs from 'move' option)
+            return shutil.copy, os.path.join(self.input_folder, img_name), copy_to
+
+        elif self.mode == 'move':
+            if not old_labels:
+                return shutil.move, os.path.join(self.input_folder, img_name), copy_to
+
+            # the image isn't stored in input_folder anymore, copy it from the folder of its first label
+            return shutil.copy, os.path.join(self.input_folder, old_labels[0], img_name), copy_to
+
+        elif self.mode == 'link':
+            return link_file, os.path.join(self.input_folder, img_name), copy_to
+
+        return None
+
+    def remove_label(self, img_name, label):
+        """
+        Removes label from assigned_labels
+        :return: file operation (function, src, dst) which removes the image from the label folder, or None
+        """
+        self.mark_dirty(img_name)
+        new_labels = [l for l in self.labels_of(img_name) if l != label]
+
+        # remove key from dictionary if no labels are assigned to this image
+        if new_labels:
+            self.assigned_labels[img_name] = new_labels
+        else:
+            self.assigned_labels.pop(img_name, None)
+
+        labeled_path = os.path.join(self.input_folder, label, img_name)
+
+        if self.mode == 'copy' or self.mode == 'link':
+            return os.remove, labeled_path, None
+
+        elif self.mode == 'move':
+            # this was the last label, so move the image back to input folder.
+            # Don't remove it, because it is not saved anywhere else
+            if not new_labels:
+                return shutil.move, labeled_path, self.input_folder
+
+            # the image is stored in another label folder too, so it can be removed from this one
+            return os.remove, labeled_path, None
+
+        return None
+
+    @staticmethod
+    def run_file_ops(file_ops, workers=FILE_OPS_WORKERS):
+        """
+        Runs file operations returned by add_label/remove_label. More operations run in a thread pool,
+        so they have to belong to different images
+        """
+        file_ops = [op for op in file_ops if op is not None]
+
+        def run(op):
+            function, src, dst = op
+            with span(f'file_op.{function.__name__}'):
+                if dst is None:
+                    function(src)
+                else:
+                    function(src, dst)
+
+        if len(file_ops) == 1:
+            run(file_ops[0])
+        elif file_ops:
+            with ThreadPoolExecutor(workers) as executor:
+                # list() re-raises the first failed operation
+                list(executor.map(run, file_ops))
+
+    def query(self, label=None, labeled=None):
+        """
+        :param label: if given, only images with this label are returned
+        :param labeled: if True/False, only images with some/no labels are returned
+        :return: list with filenames of matching images, in order of img_paths
+        """
+        img_names = self.img_names()
+
+        if label is not None:
+            img_names = [n for n in img_names if label in self.assigned_labels.get(n, ())]
+        if labeled is not None:
+            img_names = [n for n in img_names if (n in self.assigned_labels) == labeled]
+
+        return img_names
+
+    def reorder(self, start, img_paths):
+        """
+        Replaces img_paths from start on with the same images in another order.
+        Incremental csv exports remember the old order of rows, so their files are written again by the next export
+        """
+        super().reorder(start, img_paths)
+        self.csv_writers.clear()
+
+    def mark_dirty(self, img_name):
+        """
+        Row of this image has to be rewritten by the next incremental csv export
+        """
+        for csv_writer in self.csv_writers.values():
+            csv_writer.mark_dirty(img_name)
+
+    def output_folder(self):
+        return os.path.join(self.input_folder, 'output')
+
+    def cache_folder(self):
+        return self.output_folder()
+
+    def snapshot(self, out_filename, formats=('csv',), **options):
+        """
+        Takes consistent copy of label state, so it can be exported in another thread while labeling continues
+        :param out_filename: name of files to be generated (without extension)
+        :param formats: formats to generate, names from EXPORTERS
+        :param options: format specific options, e.g. packed=True for npy
+        :return: keyword arguments for export_labels
+        """
+        csv_writer = None
+        dirty = ()
+        if 'csv' in formats:
+            if out_filename not in self.csv_writers:
+                self.csv_writers[out_filename] = Incremental_Csv_Writer()
+            csv_writer = self.csv_writers[out_filename]
+            dirty = csv_writer.take_dirty()
+
+        return dict(
+            path_to_save=self.output_folder(),
+            out_filename=out_filename,
+            labels=list(self.labels),
+            img_names=self.img_names(),
+            assigned_labels=dict(self.assigned_labels),
+            formats=list(formats),
+            csv_writer=csv_writer,
+            dirty=dirty,
+            **options,
+        )
+
+    def export(self, out_filename, formats=('csv',), progress=None, **options):
+        """
+        Saves assigned labels into input_folder/output in all requested formats (see export_labels)
+        :return: list with paths of saved files
+        """
+        return export_labels(**self.snapshot(out_filename, formats, **options), progress=progress)
+
+    @staticmethod
+    def export_snapshot(progress=None, **snapshot):
+        """
+        Exports snapshot taken by snapshot(), safe to run in another thread
+        :return: list with paths of saved files
+        """
+        return export_labels(**snapshot, progress=progress)
+
+    def export_sharded(self, out_filename, file_format='csv', num_shards=None, processes=None, progress=None,
+                       **options):
+        """
+        Saves assigned labels into input_folder/output as shards written in parallel (see export_sharded)
+        :return: path of the manifest
+        """
+        return export_sharded(self.output_folder(), out_filename, self.labels, self.img_names(),
+                              dict(self.assigned_labels), file_format, num_shards, processes, progress, **options)
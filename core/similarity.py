@@ -0,0 +1,203 @@
+"""
+Ordering of images by visual similarity, so that similar images come in runs while labeling.
+Every image gets a compact feature vector (colour histogram and tiny grayscale thumbnail), computed in a process pool
+and cached on disk by file stat. Features are projected to 2D by PCA and sorted along a Hilbert curve,
+then every window of the curve is ordered by a greedy nearest-neighbour chain over the full features.
+Work is O(n log n + n * window), so it scales to millions of images.
+"""
+from core.batches import Stat_Cache, cached_values, run_batches
+from core.duplicates import gray_pixels, read_small
+from core.tracing import traced
+
+# images get features in batches of this size, every batch in a worker process
+FEATURE_BATCH_SIZE = 256
+
+# colour histogram has HISTOGRAM_BINS ** 3 bins, grayscale thumbnail has THUMBNAIL_SIDE ** 2 pixels
+HISTOGRAM_BINS = 4
+THUMBNAIL_SIDE = 6
+NUM_FEATURES = HISTOGRAM_BINS ** 3 + THUMBNAIL_SIDE ** 2
+
+# images ordered by one greedy nearest-neighbour chain (cost of a window grows with its square)
+CHAIN_WINDOW = 256
+
+# Hilbert curve has 2 ** CURVE_BITS cells per side
+CURVE_BITS = 16
+
+# PCA is fitted on a sample of this many images
+PCA_SAMPLE_SIZE = 20000
+
+
+def image_features(image):
+    """
+    :param image: QImage
+    :return: float32 array (NUM_FEATURES), square root of colour histogram and grayscale thumbnail,
+        both parts have euclidean norm at most 1
+    """
+    import numpy as np
+    from PySide2.QtCore import Qt
+    from PySide2.QtGui import QImage
+
+    rgb = image.convertToFormat(QImage.Format_RGB888).scaled(32, 32, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    rows = np.frombuffer(rgb.constBits(), np.uint8, rgb.bytesPerLine() * 32).reshape(32, -1)
+    bins = rows[:, :32 * 3].reshape(32 * 32, 3) // (256 // HISTOGRAM_BINS)
+    codes = (bins[:, 0].astype(np.int32) * HISTOGRAM_BINS + bins[:, 1]) * HISTOGRAM_BINS + bins[:, 2]
+    histogram = np.bincount(codes, minlength=HISTOGRAM_BINS ** 3) / len(codes)
+
+    thumbnail = gray_pixels(image, THUMBNAIL_SIDE, THUMBNAIL_SIDE).ravel() / (255 * THUMBNAIL_SIDE)
+    return np.concatenate([np.sqrt(histogram), thumbnail]).astype(np.float32)
+
+
+def feature_batch(img_paths):
+    """
+    Computes features of images (runs in worker process)
+    :return: list with float32 array for every image, None for images which can't be read
+    """
+    features = []
+    for img_path in img_paths:
+        try:
+            image = read_small(img_path)
+        except (OSError, ValueError):
+            image = None
+        features.append(image_features(image) if image is not None and not image.isNull() else None)
+    return features
+
+
+def hilbert_index(x, y, bits=CURVE_BITS):
+    """
+    :param x, y: int64 arrays with coordinates 0..2**bits-1
+    :return: int64 array, position of every point on Hilbert curve
+    """
+    import numpy as np
+
+    side = 1 << bits
+    x, y = x.copy(), y.copy()
+    d = np.zeros(len(x), np.int64)
+    s = side // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+
+        # rotate the quadrant, so the curve inside it has the same orientation as the whole curve
+        flip = ~ry & rx
+        x[flip] = side - 1 - x[flip]
+        y[flip] = side - 1 - y[flip]
+        swap = ~ry
+        x[swap], y[swap] = y[swap], x[swap]
+        s //= 2
+    return d
+
+
+def curve_order(features, bits=CURVE_BITS, sample_size=PCA_SAMPLE_SIZE):
+    """
+    :param features: float32 array (n, NUM_FEATURES)
+    :return: indexes of features sorted along Hilbert curve over the first two principal components
+    """
+    import numpy as np
+
+    n = len(features)
+    if n < 3:
+        return np.arange(n)
+
+    centered = features - features.mean(axis=0)
+    sample = centered if n <= sample_size else centered[np.random.default_rng(0).choice(n, sample_size, False)]
+    _, _, components = np.linalg.svd(sample, full_matrices=False)
+    projected = centered @ components[:2].T
+
+    # ranks spread the points evenly over the curve, even if most of them are in one dense cluster
+    cells = (1 << bits) - 1
+    x = np.argsort(np.argsort(projected[:, 0], kind='stable')) * cells // max(n - 1, 1)
+    y = np.argsort(np.argsort(projected[:, 1], kind='stable')) * cells // max(n - 1, 1)
+    return np.argsort(hilbert_index(x.astype(np.int64), y.astype(np.int64), bits), kind='stable')
+
+
+def chain_order(features, order, window=CHAIN_WINDOW):
+    """
+    Reorders every window of order by greedy nearest-neighbour chain, the chain continues from window to window
+    :param order: indexes of features, the first one stays first
+    :return: indexes of features
+    """
+    import numpy as np
+
+    result = []
+    for begin in range(0, len(order), window):
+        block = np.asarray(order[begin:begin + window])
+        block_features = features[block]
+        squared = (block_features ** 2).sum(axis=1)
+        distances = squared[:, None] + squared[None, :] - 2 * block_features @ block_features.T
+
+        if result:
+            last = features[result[-1]]
+            current = int(np.argmin(((block_features - last) ** 2).sum(axis=1)))
+        else:
+            current = 0
+
+        visited = np.zeros(len(block), bool)
+        for _ in range(len(block)):
+            visited[current] = True
+            result.append(int(block[current]))
+            remaining = np.where(visited, np.inf, distances[current])
+            current = int(np.argmin(remaining))
+
+    return result
+
+
+class Feature_Cache(Stat_Cache):
+    """
+    Features of images, stored in npz file (arrays paths, stats and features) instead of json
+    """
+
+    def load(self, path):
+        import numpy as np
+
+        with np.load(path) as cache:
+            if cache['features'].shape[1:] == (NUM_FEATURES,):
+                for img_path, (size, mtime_ns), features in zip(cache['paths'], cache['stats'], cache['features']):
+                    self.files[str(img_path)] = [int(size), int(mtime_ns), features]
+
+    def write(self, path):
+        import numpy as np
+
+        paths = list(self.files)
+        stats = np.array([self.files[path][:2] for path in paths], np.int64).reshape(-1, 2)
+        features = np.array([self.files[path][2] for path in paths], np.float32).reshape(-1, NUM_FEATURES)
+        with open(path, 'wb') as f:
+            np.savez(f, paths=np.array(paths, str), stats=stats, features=features)
+
+
+@traced()
+def similarity_order(img_paths, cache_path=None, batch_size=FEATURE_BATCH_SIZE, processes=None, progress=None):
+    """
+    Computes features of images in a process pool (only new or changed ones if cache_path is given)
+    and orders the images so that visually similar ones follow each other
+    :param img_paths: paths of images, the first one stays first (if it can be read)
+    :param cache_path: npz file with cached features
+    :param processes: number of worker processes (default: number of cores)
+    :param progress: optional callable(done, total) called after every batch, it may raise to stop
+        (features of finished batches are still cached)
+    :return: list with indexes of img_paths in the new order, images which can't be read are at the end
+    """
+    import numpy as np
+
+    cache = Feature_Cache(cache_path)
+    features, todo = cached_values(img_paths, cache)
+
+    new_features = run_batches([img_paths[i] for i in todo], feature_batch, cache, batch_size, processes, progress,
+                               done=len(img_paths) - len(todo), total=len(img_paths))
+    for i, image_features in zip(todo, new_features):
+        features[i] = image_features
+
+    readable = [i for i, image_features in enumerate(features) if image_features is not None]
+    unreadable = [i for i, image_features in enumerate(features) if image_features is None]
+    if not readable:
+        return unreadable
+
+    matrix = np.array([features[i] for i in readable], np.float32)
+    order = curve_order(matrix)
+
+    # the curve is walked from the first image on, images before it on the curve come after the end of the curve
+    if readable[0] == 0:
+        first = int(np.flatnonzero(order == 0)[0])
+        order = np.concatenate([order[first:], order[:first]])
+
+    return [readable[i] for i in chain_order(matrix, order)] + unreadable
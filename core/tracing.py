@@ -0,0 +1,187 @@
+"""
+Timing spans of hot paths (image switching, labeling, file operations, scans, exports).
+Tracing is enabled by environment variable LABELER_TRACE (1, or path of the report) before the app starts.
+When it's disabled, traced() returns the function unchanged and span() returns a shared no-op context,
+so instrumented code runs as if it wasn't instrumented.
+
+Report (JSON with count/total/p50/p95/p99/max of every span, in ms) is written when the app exits,
+together with Chrome trace (<report>.trace.json, open it in chrome://tracing or https://ui.perfetto.dev).
+"""
+import atexit
+import json
+import os
+import threading
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+from time import perf_counter_ns
+
+# trace events kept for Chrome trace, histograms keep all durations
+MAX_TRACE_EVENTS = 1000000
+
+DEFAULT_REPORT_PATH = 'labeler_trace.json'
+
+# number of latest durations in Rolling_Window
+ROLLING_WINDOW_SIZE = 200
+
+_NO_SPAN = nullcontext()
+
+
+def percentile(sorted_values, q):
+    """
+    :param sorted_values: sorted list
+    :param q: 0-100
+    :return: nearest-rank percentile
+    """
+    if not sorted_values:
+        return 0
+    index = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Tracer:
+    """
+    Collects durations of spans (histograms) and trace events (Chrome trace)
+    """
+
+    def __init__(self):
+        self.start_ns = perf_counter_ns()
+        self.durations = {}  # {span name: [duration ns]}
+        self.events = []  # (span name, start ns, duration ns, thread id)
+        self.lock = threading.Lock()
+
+    def record(self, name, start_ns, end_ns):
+        duration = end_ns - start_ns
+        with self.lock:
+            self.durations.setdefault(name, []).append(duration)
+            if len(self.events) < MAX_TRACE_EVENTS:
+                self.events.append((name, start_ns, duration, threading.get_ident()))
+
+    def histograms(self):
+        """
+        :return: {span name: {"count", "total_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}
+        """
+        with self.lock:
+            durations = {name: sorted(values) for name, values in self.durations.items()}
+
+        return {
+            name: {
+                'count': len(values),
+                'total_ms': round(sum(values) / 1e6, 3),
+                'p50_ms': round(percentile(values, 50) / 1e6, 3),
+                'p95_ms': round(percentile(values, 95) / 1e6, 3),
+                'p99_ms': round(percentile(values, 99) / 1e6, 3),
+                'max_ms': round(values[-1] / 1e6, 3),
+            }
+            for name, values in sorted(durations.items())
+        }
+
+    def chrome_trace(self):
+        with self.lock:
+            events = list(self.events)
+
+        pid = os.getpid()
+        return {'traceEvents': [
+            {'name': name, 'ph': 'X', 'ts': (start - self.start_ns) / 1000, 'dur': duration / 1000,
+             'pid': pid, 'tid': tid}
+            for name, start, duration, tid in events
+        ]}
+
+    def dump(self, report_path):
+        """
+        Writes report with histograms into report_path and Chrome trace next to it
+        :return: paths of written files
+        """
+        trace_path = os.path.splitext(report_path)[0] + '.trace.json'
+
+        with open(report_path, 'w') as f:
+            json.dump(self.histograms(), f, indent=2)
+        with open(trace_path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+        return [report_path, trace_path]
+
+
+class Rolling_Window:
+    """
+    Latest durations of one operation, for live percentiles (independent of LABELER_TRACE)
+    """
+
+    def __init__(self, size=ROLLING_WINDOW_SIZE):
+        self.values = deque(maxlen=size)
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, duration_ms):
+        self.values.append(duration_ms)
+
+    def percentiles(self, *qs):
+        """
+        :return: list with percentile of every q (0-100)
+        """
+        values = sorted(self.values)
+        return [percentile(values, q) for q in qs]
+
+
+def create_tracer():
+    setting = os.environ.get('LABELER_TRACE', '')
+    if setting in ('', '0'):
+        return None, None
+
+    report_path = setting if setting.endswith('.json') else DEFAULT_REPORT_PATH
+    return Tracer(), os.path.abspath(report_path)
+
+
+# None if tracing is disabled
+TRACER, REPORT_PATH = create_tracer()
+
+if TRACER is not None:
+    atexit.register(TRACER.dump, REPORT_PATH)
+
+
+def traced(name=None):
+    """
+    Decorator which records every call of the function as a span (function's qualified name by default)
+    """
+    def decorator(function):
+        if TRACER is None:
+            return function
+
+        span_name = name or function.__qualname__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                TRACER.record(span_name, start, perf_counter_ns())
+
+        return wrapper
+
+    return decorator
+
+
+class Span:
+    def __init__(self, name):
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        TRACER.record(self.name, self.start, perf_counter_ns())
+
+
+def span(name):
+    """
+    Context manager which records the block as a span:
+        with span('decode'):
+            ...
+    """
+    if TRACER is None:
+        return _NO_SPAN
+    return Span(name)
@@ -1,47 +1,71 @@
-import csv
 import os
-import shutil
 import sys
+import threading
+from collections import OrderedDict
+from time import perf_counter_ns
 
-# import numpy as np
 from PySide2 import QtWidgets
-from PySide2.QtCore import Qt
-from PySide2.QtGui import QIcon, QPixmap, QIntValidator, QKeySequence
+from PySide2.QtCore import Qt, QEvent, QObject, QResource, QRunnable, QSize, QThread, QThreadPool, QTimer, Signal
+from PySide2.QtGui import QIcon, QImage, QImageReader, QPixmap, QIntValidator, QKeySequence
 from PySide2.QtWidgets import QApplication, QDial, QDialog, QMainWindow, QMessageBox, QStatusBar, QWidget, QLabel, QCheckBox, QFileDialog, QDesktopWidget, QLineEdit, \
-    QRadioButton, QShortcut, QScrollArea, QVBoxLayout, QGroupBox, QFormLayout, QPushButton
-from xlsxwriter.workbook import Workbook
+    QRadioButton, QShortcut, QScrollArea, QVBoxLayout, QGroupBox, QFormLayout, QPushButton, QInputDialog, QListWidgetItem
 
 from ui.main_window import Ui_main_window
 from ui.labeler_widget import Ui_labeler_widget
 from ui.new_dialog import Ui_new_dialog
+from ui.grid_dialog import Ui_grid_dialog
 from ui.open_dialog import Ui_open_dialog
 from functools import partial
 
-from rc import resource
+from core.archives import split_archive_path
+from core.batches import Cancelled
+from core.files import get_img_paths, image_buffer, read_bytes
+from core.leases import LeaseLost, LeasedLabelSession
+from core.prefetch import ENCODED_AHEAD, ENCODED_BEHIND, Byte_Cache, Byte_Prefetcher
+from core.readahead import Read_Ahead, read_ahead_settings
+from core.session import LabelSession
+from core.tracing import REPORT_PATH, TRACER, Rolling_Window, span
 
-def get_img_paths(dir, extensions=('.jpg', '.png', '.jpeg')):
-    '''
-    :param dir: folder with files
-    :param extensions: tuple with file endings. e.g. ('.jpg', '.png'). Files with these endings will be added to img_paths
-    :return: list of all filenames
-    '''
+# how long closing the app waits for running export before it is cancelled (ms)
+CLOSE_EXPORT_WAIT_MS = 2000
 
-    img_paths = []
+# smooth-scaled pixmaps of recently shown images (one per image, image box size and device pixel ratio)
+RENDER_CACHE_SIZE = 32
 
-    for filename in os.listdir(dir):
-        if filename.lower().endswith(extensions):
-            img_paths.append(os.path.join(dir, filename))
+# shown image is rescaled this long after the last resize of image box (ms)
+RESCALE_DEBOUNCE_MS = 150
 
-    return img_paths
+# threads reading images, at most one of them works on an obsolete image when navigation is fast
+RENDER_THREADS = 2
 
+# nearest images in direction of navigation which are decoded in advance (decoded tier of image cache)
+DECODE_AHEAD = 3
 
-def make_folder(directory):
+# previous image stays shown this long while the next one is being read, then the image box is cleared (ms)
+LOADING_PLACEHOLDER_MS = 100
+
+# images in one page of Grid_Dialog, and size of their thumbnails (pixels)
+GRID_PAGE_SIZE = 100
+THUMBNAIL_SIZE = 128
+
+# latency HUD is refreshed this often (ms)
+HUD_REFRESH_MS = 500
+
+# items of duplicates_combo: what Next and labeling do with near duplicates found by "Duplicates"
+SHOW_DUPLICATES, SKIP_DUPLICATES, PROPAGATE_TO_DUPLICATES = range(3)
+
+HUD_STYLE = 'background-color: rgba(0, 0, 0, 160); color: white; font-family: monospace; padding: 3px'
+
+# icons compiled by: pyside2-rcc -binary rc/resource.qrc -o rc/resource.rcc
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rc', 'resource.rcc')
+
+
+def load_resources():
     """
-    Make folder if it doesn't already exist
-    :param directory: The folder destination path
+    Registers icons from RESOURCE_FILE. Qt memory-maps the file, so nothing is read until an icon is drawn
     """
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    if not QResource.registerResource(RESOURCE_FILE):
+        print(f'cannot load resources: {RESOURCE_FILE}')
 
 
 class New_Dialog(Ui_new_dialog, QDialog):
@@ -54,6 +78,7 @@ class New_Dialog(Ui_new_dialog, QDialog):
         self.mode = 'csv'
         self.label_values = []
         self.img_paths = []
+        self.annotator = ''  # not empty if the folder is shared with other annotators
 
         # UI update
         self.numLabelsInput.setValidator(QIntValidator(self.numLabelsInput))
@@ -119,10 +144,19 @@ class New_Dialog(Ui_new_dialog, QDialog):
             if item_field.text().strip() == '':
                 return False, 'All label fields has to be filled.'
 
-        self.img_paths = get_img_paths(self.selected_folder)
+        if self.shared_checkbox.isChecked() and self.annotator_input.text().strip() == '':
+            return False, 'Your name has to be filled when the folder is shared.'
+
+        try:
+            self.img_paths = get_img_paths(self.selected_folder)
+        except ValueError as e:
+            return False, str(e)
         if len(self.img_paths) == 0:
             return False, 'Input folder has no photos.'
 
+        if self.mode != 'csv' and any(split_archive_path(img_path) is not None for img_path in self.img_paths):
+            return False, 'Images in archives (.zip, .tar) can be labeled only in "csv" mode.'
+
         return True, 'Form ok'
 
     def continue_app(self):
@@ -137,6 +171,7 @@ class New_Dialog(Ui_new_dialog, QDialog):
                 item_field = self.scroll_area_widget.layout().itemAt(i, QFormLayout.FieldRole).widget()
                 self.label_values.append(item_field.text().strip())
 
+            self.annotator = self.annotator_input.text().strip() if self.shared_checkbox.isChecked() else ''
             self.accept()
         else:
             QMessageBox.warning(self, "Warning", message)
@@ -158,7 +193,7 @@ class Open_Dialog(Ui_open_dialog, QDialog):
         self.selected_folder_label.setText(folder_path)
 
     def pick_csv_file(self):
-        csv_path, _ = QFileDialog.getOpenFileName(self, "Select csv", filter="csv files (*.csv)", options=QFileDialog.DontUseNativeDialog)
+        csv_path, _ = QFileDialog.getOpenFileName(self, "Select csv", filter="label files (*.csv *.csv.gz *.csv.xz *.jsonl *.jsonl.gz *.jsonl.xz *.npy *.manifest.json)", options=QFileDialog.DontUseNativeDialog)
         self.selected_csv_label.setText(csv_path)
 
     def check_validity(self):
@@ -171,7 +206,10 @@ class Open_Dialog(Ui_open_dialog, QDialog):
         if self.selected_csv_label.text() == '':
             return False, "Empty csv path."
 
-        self.img_paths = get_img_paths(self.selected_folder_label.text())
+        try:
+            self.img_paths = get_img_paths(self.selected_folder_label.text())
+        except ValueError as e:
+            return False, str(e)
         if len(self.img_paths) == 0:
             return False, "The folder has no photo."
 
@@ -189,8 +227,294 @@ class Open_Dialog(Ui_open_dialog, QDialog):
         else:
             QMessageBox.warning(self, "Warning", message)
 
+class Background_Worker(QThread):
+    """
+    Runs long work (export, pre-labeling, search for duplicates, ordering) in background thread,
+    so UI doesn't freeze. Work gets progress callback, which raises Cancelled after cancel()
+    """
+    progress = Signal(int, int)
+    done = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, work, name):
+        """
+        :param work: callable(progress=callable(done, total)), its result is emitted by done
+        :param name: name of the work in status messages, e.g. "export"
+        """
+        super().__init__()
+        self.work = work
+        self.name = name
+        self.cancelled = False
+
+    def run(self):
+        try:
+            result = self.work(progress=self.report_progress)
+        except Cancelled:
+            self.failed.emit(f'{self.name} cancelled')
+        except Exception as e:
+            self.failed.emit(f'{self.name} failed: {e}')
+        else:
+            self.done.emit(result)
+
+    def report_progress(self, done, total):
+        if self.cancelled:
+            raise Cancelled()
+        self.progress.emit(done, total)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Worker_Slot:
+    """
+    One kind of background work started by a button (export, pre-labeling, ...): at most one Background_Worker
+    runs at a time and clicking the button while it runs cancels it.
+    Signals of replaced (cancelled) workers can still be queued, so everything but the current worker is ignored
+    """
+
+    def __init__(self, button, statusbar, name, progress_message, make_work, done, cancel_text='Cancel'):
+        """
+        :param button: QPushButton which starts the work, its text is restored when the work ends
+        :param statusbar: status bar for progress and errors
+        :param name: name of the work in status messages, e.g. "export"
+        :param progress_message: progress message with {done} and {total} fields
+        :param make_work: callable() which returns work for Background_Worker, or None if the user cancelled a dialog
+        :param done: callable(result) called in GUI thread when the work is complete
+        :param cancel_text: text of the button while the work runs
+        """
+        self.button = button
+        self.text = button.text()
+        self.statusbar = statusbar
+        self.name = name
+        self.progress_message = progress_message
+        self.make_work = make_work
+        self.done = done
+        self.cancel_text = cancel_text
+        self.worker: Background_Worker = None
+        button.clicked.connect(self.clicked)
+
+    def is_running(self):
+        return self.worker is not None and self.worker.isRunning()
+
+    def clicked(self):
+        if self.is_running():
+            self.worker.cancel()
+            return
+
+        work = self.make_work()
+        if work is not None:
+            self.start(work)
+
+    def start(self, work):
+        """
+        Starts work in new worker, running one is cancelled first
+        """
+        self.cancel()
+
+        worker = self.worker = Background_Worker(work, self.name)
+        worker.progress.connect(partial(self.show_progress, worker))
+        worker.done.connect(partial(self.worker_done, worker))
+        worker.failed.connect(partial(self.worker_failed, worker))
+        worker.start()
+
+        self.button.setText(self.cancel_text)
+
+    def wait(self, msecs=None):
+        """
+        Waits until running work ends
+        :return: False if it is still running after msecs
+        """
+        if self.worker is None:
+            return True
+        return self.worker.wait() if msecs is None else self.worker.wait(msecs)
+
+    def cancel(self):
+        """
+        Cancels running work and waits until the worker stops
+        """
+        if self.worker is not None:
+            worker, self.worker = self.worker, None
+            worker.cancel()
+            worker.wait()
+            self.button.setText(self.text)
+
+    def show_progress(self, worker, done, total):
+        if worker is self.worker:
+            self.statusbar.showMessage(self.progress_message.format(done=done, total=total))
+
+    def worker_done(self, worker, result):
+        if worker is self.worker:
+            self.button.setText(self.text)
+            self.done(result)
+
+    def worker_failed(self, worker, message):
+        if worker is self.worker:
+            self.button.setText(self.text)
+            self.statusbar.showMessage(message, 5000)
+
+
+class Render_Signals(QObject):
+    done = Signal(object, QImage)
+
+
+class Render_Task(QRunnable):
+    """
+    Reads image already scaled to image box (JPEG is decoded at reduced size), runs in QThreadPool
+    because QPixmap can't be used outside GUI thread and QImage can.
+    Cancelled task which didn't start yet does nothing, running one doesn't emit its result
+    """
+
+    def __init__(self, key, data=None, read=read_bytes):
+        """
+        :param key: render key (path, width, height, device pixel ratio), see Labeler_Widget.render_key
+        :param data: bytes of the image if they were read already (prefetched), otherwise they are read by read
+        :param read: callable(path), returns bytes of the image (session.read_image, it can download the image)
+        """
+        super().__init__()
+        self.key = key
+        self.data = data
+        self.read = read
+        self.cancelled = False
+        self.signals = Render_Signals()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        if self.cancelled:
+            return
+
+        # the whole file (read by one call, or archive member) is handed to the decoder from memory,
+        # instead of the small buffered reads of Qt's file engine
+        path = self.key[0]
+        try:
+            buffer = image_buffer(self.data if self.data is not None else self.read(path))
+        except (OSError, ValueError):
+            self.signals.done.emit(self.key, QImage())
+            return
+        finally:
+            # prefetched bytes are referenced by the buffer now
+            self.data = None
+
+        reader = QImageReader(buffer, os.path.splitext(path)[1][1:].lower().encode())
+
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(render_size(self.key), Qt.KeepAspectRatio))
+        image = reader.read()
+
+        if not self.cancelled:
+            self.signals.done.emit(self.key, image)
+
+
+def render_size(key):
+    """
+    :return: size of image box in device pixels
+    """
+    _, width, height, ratio = key
+    return QSize(round(width * ratio), round(height * ratio))
+
+
+class Grid_Dialog(Ui_grid_dialog, QDialog):
+    """
+    Page of thumbnails, label is assigned to (or removed from) all selected images in one batch
+    """
+
+    def __init__(self, parent):
+        """
+        :param parent: Labeler_Widget, its session is labeled and its cache of encoded images is used
+        """
+        super().__init__(parent)
+        self.setupUi(self)
+
+        self.labeler: Labeler_Widget = parent
+        self.session = parent.session
+        self.start = 0
+        self.items = {}  # {path: QListWidgetItem} of images in the shown page
+        self.thumbnail_pool = QThreadPool(self)
+        self.thumbnail_pool.setMaxThreadCount(RENDER_THREADS)
+
+        self.grid_list.setGridSize(QSize(THUMBNAIL_SIZE + 24, THUMBNAIL_SIZE + 44))
+        self.label_combo.addItems(self.session.labels)
+
+        self.assign_btn.clicked.connect(partial(self.apply_label, False))
+        self.remove_btn.clicked.connect(partial(self.apply_label, True))
+        self.prev_page_btn.clicked.connect(lambda: self.show_page(self.start - GRID_PAGE_SIZE))
+        self.next_page_btn.clicked.connect(lambda: self.show_page(self.start + GRID_PAGE_SIZE))
+
+    def show_page(self, start):
+        """
+        Shows thumbnails of GRID_PAGE_SIZE images from index start, they are read in background
+        """
+        if not 0 <= start < len(self.session.img_paths):
+            return
+
+        self.start = start
+        self.thumbnail_pool.clear()
+        self.grid_list.clear()
+        self.items = {}
+
+        ratio = self.devicePixelRatioF()
+        end = min(start + GRID_PAGE_SIZE, len(self.session.img_paths))
+        for index in range(start, end):
+            path = self.session.image_path(index)
+            img_name = os.path.basename(path)
+
+            item = QListWidgetItem(self.item_text(img_name))
+            item.setData(Qt.UserRole, img_name)
+            self.grid_list.addItem(item)
+            self.items[path] = item
+
+            task = Render_Task((path, THUMBNAIL_SIZE, THUMBNAIL_SIZE, ratio), self.labeler.byte_cache.get(path),
+                               self.session.read_image)
+            task.signals.done.connect(self.thumbnail_done)
+            self.thumbnail_pool.start(task)
+
+        self.page_label.setText(f'images {start + 1}-{end} of {len(self.session.img_paths)}')
+
+    def item_text(self, img_name):
+        return '\n'.join([img_name] + self.session.labels_of(img_name))
+
+    def thumbnail_done(self, key, image):
+        item = self.items.get(key[0])
+        if item is not None and not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(key[3])
+            item.setIcon(QIcon(pixmap))
+
+    def apply_label(self, remove):
+        """
+        Assigns label selected in label_combo to all selected images (or removes it from them)
+        """
+        items = self.grid_list.selectedItems()
+        if not items:
+            return
+
+        label = self.label_combo.currentText()
+        img_names = [item.data(Qt.UserRole) for item in items]
+
+        try:
+            with span('Grid_Dialog.apply_label'):
+                changed = self.session.assign_many(img_names, label, remove)
+        except (LeaseLost, OSError, ValueError) as e:
+            QMessageBox.warning(self, 'Warning', str(e))
+            changed = None
+
+        # labels could be changed partly even if it failed
+        for item in items:
+            item.setText(self.item_text(item.data(Qt.UserRole)))
+        self.labeler.labels_changed(img_names)
+
+        if changed is not None:
+            action = 'removed from' if remove else 'assigned to'
+            self.labeler.parent.statusbar.showMessage(f'{label} {action} {changed} images', 5000)
+
+
 class Labeler_Widget(Ui_labeler_widget, QWidget):
-    def __init__(self, parent, labels, input_folder, img_paths, mode):
+    def __init__(self, parent, session):
+        """
+        :param session: LabelSession with all labeling state, the widget only shows it
+        """
         super().__init__(parent)
         self.setupUi(self)
 
@@ -198,19 +522,44 @@ class Labeler_Widget(Ui_labeler_widget, QWidget):
 
         # state variables
         self.counter = 0
-        self.input_folder = input_folder
-        self.img_paths = img_paths
-        self.labels = labels
-        self.assigned_labels = {}
-        self.mode = mode
+        self.session: LabelSession = session
+        self.input_folder = session.input_folder
+        self.img_paths = session.img_paths
+        self.labels = session.labels
+        self.assigned_labels = session.assigned_labels
+        self.mode = session.mode
+        self.uncertainty_queue = None  # created on first use, see next_uncertain_image
+        self.visited = []  # indexes of images shown in "most uncertain first" mode, for "Prev Image"
+        self.index_of = {}  # {img_name: index in img_paths}
+
+        # latency HUD: keypress (or click) to painted image, and labeling (ms)
+        self.switch_latency = Rolling_Window()
+        self.label_latency = Rolling_Window()
+        self.switch_started = None  # perf_counter_ns of navigation which hasn't set image yet
+        self.paint_started = None  # perf_counter_ns of navigation whose image waits to be painted
+
+        # image is scaled once per image box size instead of on every repaint
+        self.render_cache = OrderedDict()  # {render key: smooth-scaled QPixmap}, see render_key
+        self.shown_path = None
+        # images are read in background, only the latest requested one (latest wins when a key is held down)
+        self.render_task: Render_Task = None
+        self.render_pool = QThreadPool(self)
+        self.render_pool.setMaxThreadCount(RENDER_THREADS)
+        # two-tier image cache: encoded bytes of many images around the shown one (core.prefetch),
+        # decoded images of a few next ones (render_cache), both follow direction of navigation
+        self.direction = 1
+        self.byte_cache = Byte_Cache()
+        self.prefetcher = Byte_Prefetcher(self.byte_cache, self.session.read_image)
+        self.destroyed.connect(self.prefetcher.close)
+        self.decode_tasks = {}  # {render key: Render_Task} of images decoded in advance
+        self.grid_dialog: Grid_Dialog = None  # created on first use
+        # page cache of the OS is warmed with next images (cold storage), see core.readahead
+        self.read_ahead = Read_Ahead(*read_ahead_settings())
+        self.destroyed.connect(self.read_ahead.close)
 
         # initialize list to save all label buttons
         self.label_buttons = []
 
-        # create label folders
-        if mode == 'copy' or mode == 'move':
-            self.create_label_folders(labels, self.input_folder)
-
         # init UI
         self.init_ui()
 
@@ -218,8 +567,19 @@ class Labeler_Widget(Ui_labeler_widget, QWidget):
         
         self.init_buttons()
 
+        # shown image is rescaled when resizing of image box stops
+        self.rescale_timer = QTimer(self)
+        self.rescale_timer.setSingleShot(True)
+        self.rescale_timer.setInterval(RESCALE_DEBOUNCE_MS)
+        self.rescale_timer.timeout.connect(self.rescale_image)
+        self.loading_timer = QTimer(self)
+        self.loading_timer.setSingleShot(True)
+        self.loading_timer.setInterval(LOADING_PLACEHOLDER_MS)
+        self.loading_timer.timeout.connect(self.image_box.clear)
+        self.image_box.installEventFilter(self)
+
         # show image
-        self.set_image(self.img_paths[0])
+        self.set_image(self.session.image_path(0))
 
         # image name
         self.img_name_label.setText(self.img_paths[self.counter])
@@ -227,6 +587,15 @@ class Labeler_Widget(Ui_labeler_widget, QWidget):
         # progress bar
         self.progress_bar.setText(f'image 1 of {len(self.img_paths)}')
 
+        # latency HUD in the top-left corner of the image, refreshed only while it's shown
+        self.hud_label = QLabel(self.image_box)
+        self.hud_label.setStyleSheet(HUD_STYLE)
+        self.hud_label.move(4, 4)
+        self.hud_label.hide()
+        self.hud_timer = QTimer(self)
+        self.hud_timer.setInterval(HUD_REFRESH_MS)
+        self.hud_timer.timeout.connect(self.update_hud)
+
     def init_buttons(self):
 
         self.prev_im_btn.clicked.connect(self.show_prev_image)
@@ -239,8 +608,33 @@ class Labeler_Widget(Ui_labeler_widget, QWidget):
         next_im_kbs = QShortcut(QKeySequence("n"), self)
         next_im_kbs.activated.connect(self.show_next_image)
 
+        # accept labels suggested by pre-labeling model
+        accept_kbs = QShortcut(QKeySequence("a"), self)
+        accept_kbs.activated.connect(self.accept_suggestions)
+
+        # long work runs in background, its button cancels it
+        statusbar = self.parent.statusbar
+        self.prelabel_slot = Worker_Slot(self.prelabel_btn, statusbar, 'pre-labeling',
+                                         'pre-labeling: {done} of {total} images', self.prelabel_work,
+                                         self.prelabel_done)
+        self.duplicates_slot = Worker_Slot(self.duplicates_btn, statusbar, 'search for duplicates',
+                                           'hashing images: {done} of {total}', lambda: self.session.find_duplicates,
+                                           self.duplicates_done)
+        self.similarity_slot = Worker_Slot(self.similarity_btn, statusbar, 'ordering',
+                                           'ordering by similarity: {done} of {total} images', self.similarity_work,
+                                           self.similarity_done)
+
+        # label many images at once in grid of thumbnails
+        self.grid_btn.clicked.connect(self.open_grid)
+        grid_kbs = QShortcut(QKeySequence("g"), self)
+        grid_kbs.activated.connect(self.open_grid)
+        self.uncertain_first_checkbox.toggled.connect(lambda checked: self.visited.clear())
+        self.latency_hud_checkbox.toggled.connect(self.toggle_hud)
+
         # Add "generate csv file" button
-        self.generate_csv_btn.clicked.connect(partial(self.generate_csv, 'assigned_classes'))
+        self.export_slot = Worker_Slot(self.generate_csv_btn, statusbar, 'export',
+                                       'exporting labels: {done} of {total} rows',
+                                       partial(self.export_work, 'assigned_classes'), self.export_done, 'Cancel export')
 
         # Create button for each label
         x_shift = 0  # variable that helps to compute x-coordinate of button in UI
@@ -267,196 +661,439 @@ class Labeler_Widget(Ui_labeler_widget, QWidget):
 
     def set_label(self, label):
         """
-        Sets the label for just loaded image
+        Sets the label for just loaded image (or removes it if it's already set)
         :param label: selected label
         """
-        # get image filename from path (./data/images/img1.jpg → img1.jpg)
-        img_path = self.img_paths[self.counter]
-        img_name = os.path.split(img_path)[-1]
-
-        # if the img has some label already
-        if img_name in self.assigned_labels.keys():
-
-            # label is already there = means tht user want's to remove label
-            if label in self.assigned_labels[img_name]:
-                self.assigned_labels[img_name].remove(label)
-
-                # remove key from dictionary if no labels are assigned to this image
-                if len(self.assigned_labels[img_name]) == 0:
-                    self.assigned_labels.pop(img_name, None)
-
-                # remove image from appropriate folder
-                if self.mode == 'copy':
-                    os.remove(os.path.join(self.input_folder, label, img_name))
-
-                elif self.mode == 'move':
-                    # label was in assigned labels, so I want to remove it from label folder,
-                    # but this was the last label, so move the image to input folder.
-                    # Don't remove it, because it it not save anywehre else
-                    if img_name not in self.assigned_labels.keys():
-                        shutil.move(os.path.join(self.input_folder, label, img_name), self.input_folder)
-                    else:
-                        # label was in assigned labels and the image is store in another label folder,
-                        # so I want to remove it from current label folder
-                        os.remove(os.path.join(self.input_folder, label, img_name))
-
-            # label is not there yet. But the image has some labels already
-            else:
-                self.assigned_labels[img_name].append(label)
+        with span('Labeler_Widget.set_label'):
+            # get image filename from path (./data/images/img1.jpg → img1.jpg)
+            img_name = os.path.split(self.img_paths[self.counter])[-1]
 
-                # path to copy/move images
-                copy_to = os.path.join(self.input_folder, label)
+            try:
+                started = perf_counter_ns()
+                added = self.session.set_label(img_name, label)
+                self.label_latency.add((perf_counter_ns() - started) / 1e6)
+                if self.uncertainty_queue is not None:
+                    # image goes back to the queue if its last label was removed
+                    self.uncertainty_queue.update(img_name)
+
+                duplicates = self.session.duplicates_of(img_name)
+                if duplicates and self.duplicates_combo.currentIndex() == PROPAGATE_TO_DUPLICATES:
+                    self.session.assign_many(duplicates, label, remove=not added)
+                    self.labels_changed(duplicates)
+            except LeaseLost as e:
+                self.parent.statusbar.showMessage(str(e), 5000)
+                return
+            except OSError as e:
+                # remote session lost connection to the server
+                self.parent.statusbar.showMessage(f'label was not saved: {e}', 5000)
+                return
+
+            # load next image
+            if self.show_next_checkbox.isChecked():
+                self.show_next_image()
+            else:
+                self.set_button_color(img_name)
 
-                # copy/move the image into appropriate label folder
-                if self.mode == 'copy':
-                    # the image is stored in input_folder, so i can copy it from there (differs from 'move' option)
-                    shutil.copy(img_path, copy_to)
+    def open_grid(self):
+        """
+        Shows grid of thumbnails, starting with the page which contains the shown image
+        """
+        if self.grid_dialog is None:
+            self.grid_dialog = Grid_Dialog(self)
 
-                elif self.mode == 'move':
-                    # the image doesn't have to be stored in input_folder anymore.
-                    # get the path where the image is stored
-                    copy_from = os.path.join(self.input_folder, self.assigned_labels[img_name][0], img_name)
-                    shutil.copy(copy_from, copy_to)
+        self.grid_dialog.show_page(self.counter - self.counter % GRID_PAGE_SIZE)
+        self.grid_dialog.show()
+        self.grid_dialog.raise_()
+        self.grid_dialog.activateWindow()
 
-        else:
-            # Image has no labels yet. Set new label and copy/move
+    def labels_changed(self, img_names):
+        """
+        Updates the widget after labels of images were changed outside of it (e.g. in Grid_Dialog)
+        """
+        if self.uncertainty_queue is not None:
+            for img_name in img_names:
+                self.uncertainty_queue.update(img_name)
+        self.set_button_color(os.path.split(self.img_paths[self.counter])[-1])
 
-            self.assigned_labels[img_name] = [label]
-            # move copy images to appropriate directories
-            copy_to = os.path.join(self.input_folder, label)
+    def accept_suggestions(self):
+        """
+        Assigns labels suggested by pre-labeling model to just loaded image (keeps already assigned ones)
+        """
+        img_name = os.path.split(self.img_paths[self.counter])[-1]
 
-            if self.mode == 'copy':
-                shutil.copy(img_path, copy_to)
-            elif self.mode == 'move':
-                shutil.move(img_path, copy_to)
+        try:
+            for label in self.session.suggested_labels(img_name):
+                if label not in self.session.labels_of(img_name):
+                    self.session.set_label(img_name, label)
+        except (LeaseLost, OSError) as e:
+            self.parent.statusbar.showMessage(str(e), 5000)
+            return
 
-        # load next image
         if self.show_next_checkbox.isChecked():
             self.show_next_image()
         else:
             self.set_button_color(img_name)
 
-    def show_next_image(self):
+    def prelabel_work(self):
         """
-        loads and shows next image in dataset
+        Asks for pre-labeling model
+        :return: work which scores all images, or None if no model was selected
         """
-        if self.counter < len(self.img_paths) - 1:
-            self.counter += 1
+        scorer, _ = QFileDialog.getOpenFileName(self, "Select pre-labeling model", filter="NumPy model (*.npz)",
+                                                options=QFileDialog.DontUseNativeDialog)
+        if not scorer:
+            # scoring function can be given as "module:function" too
+            scorer, ok = QInputDialog.getText(self, 'Pre-label', 'Scoring function (module:function):')
+            if not ok or not scorer:
+                return None
 
-            path = self.img_paths[self.counter]
-            filename = os.path.split(path)[-1]
+        return partial(self.session.prelabel, scorer)
 
-            # If we have already assigned label to this image and mode is 'move', change the input path.
-            # The reason is that the image was moved from '.../input_folder' to '.../input_folder/label'
-            if self.mode == 'move' and filename in self.assigned_labels.keys():
-                path = os.path.join(self.input_folder, self.assigned_labels[filename][0], filename)
+    def prelabel_done(self, num_scored):
+        self.uncertainty_queue = None
+        self.parent.statusbar.showMessage(f'{num_scored} images pre-labeled, press A to accept suggestion', 5000)
+        self.set_button_color(os.path.split(self.img_paths[self.counter])[-1])
 
-            self.set_image(path)
-            self.img_name_label.setText(path)
-            self.progress_bar.setText(f'image {self.counter + 1} of {len(self.img_paths)}')
-            self.set_button_color(filename)
-            # self.csv_generated_message.setText('')
+    def duplicates_done(self, num_duplicates):
+        self.parent.statusbar.showMessage(f'{num_duplicates} images have near duplicates', 5000)
 
+    def similarity_work(self):
+        """
+        :return: work which orders images from the shown one on by visual similarity, its result is (start, ordered)
+        """
+        start = self.counter
 
-        # change button color if this is last image in dataset
-        elif self.counter == len(self.img_paths) - 1:
-            path = self.img_paths[self.counter]
-            self.set_button_color(os.path.split(path)[-1])
+        def work(progress):
+            return start, self.session.similarity_order(start, progress=progress)
 
-    def show_prev_image(self):
+        return work
+
+    def similarity_done(self, result):
+        start, ordered = result
+
+        # images were not reordered while the worker ran, so the shown image can be found again after it
+        shown = os.path.split(self.img_paths[self.counter])[-1]
+        self.session.reorder(start, ordered)
+        self.index_of = {}
+        self.visited.clear()
+        self.show_image(self.image_index(shown))
+
+        self.parent.statusbar.showMessage(f'{len(ordered)} images ordered by similarity', 5000)
+
+    def show_next_image(self):
         """
-        loads and shows previous image in dataset
+        loads and shows next image in dataset
         """
-        if self.counter > 0:
-            self.counter -= 1
+        with span('Labeler_Widget.show_next_image'):
+            self.start_switch_timing()
+            self.direction = 1
 
-            if self.counter < len(self.img_paths):
-                path = self.img_paths[self.counter]
-                filename = os.path.split(path)[-1]
+            # most uncertain unlabeled image first, once the images are scored by pre-labeling model
+            if self.uncertain_first_checkbox.isChecked() and self.session.scores:
+                img_name = self.next_uncertain_image()
+                if img_name is not None:
+                    self.visited.append(self.counter)
+                    self.show_image(self.image_index(img_name))
+                    return
+
+            # session backed by a server gets the next batch of work when the current one is done
+            if self.counter == len(self.img_paths) - 1:
+                self.session.load_more()
+
+            if self.counter < len(self.img_paths) - 1:
+                self.counter += 1
+
+                # near duplicates of labeled images are passed over
+                if self.duplicates_combo.currentIndex() == SKIP_DUPLICATES:
+                    while self.counter < len(self.img_paths) - 1 and \
+                            self.session.has_labeled_duplicate(os.path.split(self.img_paths[self.counter])[-1]):
+                        self.counter += 1
 
-                # If we have already assigned label to this image and mode is 'move', change the input path.
-                # The reason is that the image was moved from '.../input_folder' to '.../input_folder/label'
-                if self.mode == 'move' and filename in self.assigned_labels.keys():
-                    path = os.path.join(self.input_folder, self.assigned_labels[filename][0], filename)
+                filename = os.path.split(self.img_paths[self.counter])[-1]
+
+                # in 'move' mode labeled image is stored in label folder
+                path = self.session.image_path(self.counter)
 
                 self.set_image(path)
                 self.img_name_label.setText(path)
                 self.progress_bar.setText(f'image {self.counter + 1} of {len(self.img_paths)}')
-
                 self.set_button_color(filename)
                 # self.csv_generated_message.setText('')
 
-    def set_image(self, path):
+
+            # change button color if this is last image in dataset
+            elif self.counter == len(self.img_paths) - 1:
+                path = self.img_paths[self.counter]
+                self.set_button_color(os.path.split(path)[-1])
+
+    def show_prev_image(self):
         """
-        displays the image in GUI
-        :param path: relative path to the image that should be show
+        loads and shows previous image in dataset
         """
+        with span('Labeler_Widget.show_prev_image'):
+            self.start_switch_timing()
+            self.direction = -1
 
-        pixmap = QPixmap(path)
-        self.image_box.setPixmap(pixmap)
+            if self.uncertain_first_checkbox.isChecked() and self.visited:
+                self.show_image(self.visited.pop())
+                return
 
-    def generate_csv(self, out_filename):
+            if self.counter > 0:
+                self.counter -= 1
+
+                if self.counter < len(self.img_paths):
+                    filename = os.path.split(self.img_paths[self.counter])[-1]
+
+                    # in 'move' mode labeled image is stored in label folder
+                    path = self.session.image_path(self.counter)
+
+                    self.set_image(path)
+                    self.img_name_label.setText(path)
+                    self.progress_bar.setText(f'image {self.counter + 1} of {len(self.img_paths)}')
+
+                    self.set_button_color(filename)
+                    # self.csv_generated_message.setText('')
+
+    def show_image(self, index):
         """
-        Generates and saves csv file with assigned labels.
-        Assigned label is represented as one-hot vector.
-        :param out_filename: name of csv file to be generated
+        loads and shows image with given index in dataset
         """
-        path_to_save = os.path.join(self.input_folder, 'output')
-        make_folder(path_to_save)
-        csv_file_path = os.path.join(path_to_save, out_filename) + '.csv'
+        self.counter = index
+        filename = os.path.split(self.img_paths[index])[-1]
 
-        with open(csv_file_path, "w", newline='') as csv_file:
-            writer = csv.writer(csv_file, delimiter=',')
+        # in 'move' mode labeled image is stored in label folder
+        path = self.session.image_path(index)
 
-            # write header
-            writer.writerow(['img'] + self.labels)
+        self.set_image(path)
+        self.img_name_label.setText(path)
+        self.progress_bar.setText(f'image {index + 1} of {len(self.img_paths)}')
+        self.set_button_color(filename)
 
-            # write one-hot labels
-            for img_path in self.img_paths:
-                img_name = os.path.basename(img_path)
-                if img_name in self.assigned_labels:
-                    labels_one_hot = self.labels_to_zero_one(self.assigned_labels[img_name])
-                    writer.writerow([img_name] + list(labels_one_hot))
-                else:
-                    labels_one_hot = self.labels_to_zero_one([])
-                    writer.writerow([img_name] + list(labels_one_hot))
-                    
+    def next_uncertain_image(self):
+        """
+        :return: filename of the most uncertain unlabeled image (other than the shown one), or None
+        """
+        if self.uncertainty_queue is None:
+            self.uncertainty_queue = self.session.uncertainty_queue()
 
-            # for img_name, labels in self.assigned_labels.items():
-            #     labels_one_hot = self.labels_to_zero_one(labels)
-            #     writer.writerow([img_name] + list(labels_one_hot))
+        current = os.path.split(self.img_paths[self.counter])[-1]
+        img_name = self.uncertainty_queue.pop()
+        if img_name == current:
+            img_name = self.uncertainty_queue.pop()
+            self.uncertainty_queue.update(current)
 
-        message = f'csv saved to: {csv_file_path}'
-        # QStatusBar.showMessage(self, )
-        self.parent.statusbar.showMessage(message, 5000)
-        # self.csv_generated_message.setText(message)
-        # print(message)
+        if self.duplicates_combo.currentIndex() == SKIP_DUPLICATES:
+            while img_name is not None and self.session.has_labeled_duplicate(img_name):
+                img_name = self.uncertainty_queue.pop()
 
-        if self.generate_xlsx_checkbox.isChecked():
-            try:
-                self.csv_to_xlsx(csv_file_path)
-            except:
-                print('Generating xlsx file failed.')
+        return img_name
+
+    def image_index(self, img_name):
+        # img_paths of sessions backed by a server grow, so the index is rebuilt when needed
+        if len(self.index_of) != len(self.img_paths):
+            self.index_of = {name: i for i, name in enumerate(self.session.img_names())}
+        return self.index_of[img_name]
 
-    def csv_to_xlsx(self, csv_file_path):
+    def set_image(self, path):
         """
-        converts csv file to xlsx file
-        :param csv_file_path: path to csv file which we want to convert to lsx
+        displays the image in GUI, images which aren't cached are read in background
+        :param path: relative path to the image that should be show
+        """
+        with span('Labeler_Widget.set_image'):
+            self.shown_path = path
+            if not self.render(self.render_key(path)):
+                self.loading_timer.start()
+            self.read_ahead.update(self.session.upcoming_paths(self.counter, self.read_ahead.count))
+            self.prefetch()
+
+    def render_key(self, path):
+        """
+        :return: (path, width, height, device pixel ratio) of image rendered into image box
         """
-        workbook = Workbook(csv_file_path[:-4] + '.xlsx')
-        worksheet = workbook.add_worksheet()
+        size = self.image_box.contentsRect().size()
+        return path, size.width(), size.height(), self.image_box.devicePixelRatioF()
 
-        with open(csv_file_path, 'rt', encoding='utf8') as f:
-            reader = csv.reader(f)
-            for r, row in enumerate(reader):
-                for c, col in enumerate(row):
-                    worksheet.write(r, c, col)
+    def render(self, key):
+        """
+        Shows cached pixmap, or starts reading the image in background and cancels reading of obsolete one
+        :return: True if the image is shown already
+        """
+        if self.render_task is not None and self.render_task.key != key:
+            self.render_task.cancel()
+            self.render_pool.tryTake(self.render_task)
+            self.render_task = None
+
+        pixmap = self.render_cache.get(key)
+        if pixmap is not None:
+            self.render_cache.move_to_end(key)
+            self.show_pixmap(pixmap)
+            return True
+
+        if self.render_task is None:
+            task = self.decode_tasks.pop(key, None)
+            if task is None:
+                task = Render_Task(key, self.byte_cache.get(key[0]), self.session.read_image)
+                task.signals.done.connect(self.render_done)
+                self.render_pool.start(task)
+            elif self.render_pool.tryTake(task):
+                # image which was going to be decoded in advance is needed now, before other waiting ones
+                self.render_pool.start(task)
+            self.render_task = task
+        return False
+
+    def prefetch(self):
+        """
+        Promotes images in direction of navigation: many of them are read into encoded tier, the nearest ones
+        are decoded. Decoding of images which aren't near anymore is cancelled
+        """
+        ahead = self.session.upcoming_paths(self.counter, ENCODED_AHEAD, self.direction)
+        behind = self.session.upcoming_paths(self.counter, ENCODED_BEHIND, -self.direction)
+        self.prefetcher.update(ahead + behind)
+
+        keys = [self.render_key(path) for path in ahead[:DECODE_AHEAD]]
+        for key in list(self.decode_tasks):
+            if key not in keys:
+                task = self.decode_tasks.pop(key)
+                task.cancel()
+                self.render_pool.tryTake(task)
+
+        for key in keys:
+            if key in self.render_cache or key in self.decode_tasks:
+                continue
+            if self.render_task is not None and self.render_task.key == key:
+                continue
+
+            task = Render_Task(key, self.byte_cache.get(key[0]), self.session.read_image)
+            task.signals.done.connect(self.render_done)
+            self.decode_tasks[key] = task
+            # shown image (priority 0) is decoded before the ones which are decoded in advance
+            self.render_pool.start(task, -1)
+
+    def render_done(self, key, image):
+        if self.render_task is not None and self.render_task.key == key:
+            self.render_task = None
+        self.decode_tasks.pop(key, None)
+
+        pixmap = QPixmap()
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(key[3])
+            self.render_cache[key] = pixmap
+            while len(self.render_cache) > RENDER_CACHE_SIZE:
+                self.render_cache.popitem(last=False)
+
+        if key == self.render_key(self.shown_path):
+            self.show_pixmap(pixmap)
+
+    def show_pixmap(self, pixmap):
+        self.loading_timer.stop()
+        self.image_box.setPixmap(pixmap)
 
-        workbook.close()
+        # navigation is timed until the new image is painted
+        self.paint_started, self.switch_started = self.switch_started, None
+
+    def rescale_image(self):
+        """
+        Renders shown image for the current size of image box (until then, the old pixmap is shown unscaled)
+        """
+        self.render(self.render_key(self.shown_path))
+
+    def start_switch_timing(self):
+        if self.hud_timer.isActive():
+            self.switch_started = perf_counter_ns()
+
+    def eventFilter(self, watched, event):
+        # installed on image_box
+        if watched is self.image_box:
+            if event.type() == QEvent.Resize:
+                self.rescale_timer.start()
+            elif event.type() == QEvent.Paint and self.paint_started is not None:
+                # zero timer fires after the paint event is handled and the window is flushed
+                QTimer.singleShot(0, self.image_painted)
+        return super().eventFilter(watched, event)
+
+    def image_painted(self):
+        if self.paint_started is not None:
+            self.switch_latency.add((perf_counter_ns() - self.paint_started) / 1e6)
+            self.paint_started = None
+
+    def toggle_hud(self, checked):
+        self.switch_started = self.paint_started = None
+        if checked:
+            self.update_hud()
+            self.hud_label.show()
+            self.hud_label.raise_()
+            self.hud_timer.start()
+        else:
+            self.hud_timer.stop()
+            self.hud_label.hide()
+
+    def update_hud(self):
+        next_p50, next_p99 = self.switch_latency.percentiles(50, 99)
+        label_p50, label_p99 = self.label_latency.percentiles(50, 99)
+        self.hud_label.setText(f'next image  p50 {next_p50:7.1f}  p99 {next_p99:7.1f} ms\n'
+                               f'label       p50 {label_p50:7.1f}  p99 {label_p99:7.1f} ms\n'
+                               f'prefetch queue {self.prefetch_queue_depth()}  pending I/O {self.pending_io_ops()}')
+        self.hud_label.adjustSize()
+
+    def prefetch_queue_depth(self):
+        """
+        :return: number of images waiting to be read ahead into page cache, read into memory or decoded
+        """
+        return len(self.read_ahead) + len(self.prefetcher) + len(self.decode_tasks)
+
+    def pending_io_ops(self):
+        """
+        :return: number of running background file operations (exports, pre-labeling, hashing, ordering, image reads)
+        """
+        slots = [self.export_slot, self.prelabel_slot, self.duplicates_slot, self.similarity_slot]
+        running = sum(1 for slot in slots if slot.is_running())
+        return running + self.render_pool.activeThreadCount()
+
+    def generate_csv(self, out_filename):
+        """
+        Generates and saves csv file with assigned labels (and xlsx/npy files if the checkboxes are checked)
+        in background worker. Assigned label is represented as one-hot vector.
+        Progress is shown in status bar, running export can be cancelled with the same button.
+        :param out_filename: name of csv file to be generated
+        """
+        # only one export at a time, previous one works with older labels anyway
+        self.export_slot.start(self.export_work(out_filename))
+
+    def export_work(self, out_filename):
+        """
+        :return: work which exports snapshot of the labels taken now
+        """
+        return partial(self.session.export_snapshot, **self.export_snapshot(out_filename))
+
+    def export_snapshot(self, out_filename):
+        """
+        Takes consistent copy of label state, so it can be exported while user continues labeling
+        :param out_filename: name of files to be generated (without extension)
+        :return: keyword arguments for session.export_snapshot
+        """
+        formats = ['csv']
+        if self.generate_xlsx_checkbox.isChecked():
+            formats.append('xlsx')
+        if self.generate_npy_checkbox.isChecked():
+            formats.append('npy')
+
+        # all formats are written during one pass over the labels
+        compression = '.gz' if self.compress_checkbox.isChecked() else ''
+        if self.generate_jsonl_checkbox.isChecked():
+            formats.append('jsonl' + compression)
+        if self.generate_lists_checkbox.isChecked():
+            formats.append('lists' + compression)
+
+        return self.session.snapshot(out_filename, formats, packed=self.pack_npy_checkbox.isChecked())
+
+    def export_done(self, saved_paths):
+        self.parent.statusbar.showMessage(f'csv saved to: {saved_paths[0]}', 5000)
 
     def set_button_color(self, filename):
         """
-        changes color of button which corresponds to selected label
+        changes color of button which corresponds to selected label,
+        labels suggested by pre-labeling model (and not assigned yet) have yellow border
         :filename filename of loaded image:
         """
 
@@ -464,103 +1101,148 @@ class Labeler_Widget(Ui_labeler_widget, QWidget):
             assigned_labels = self.assigned_labels[filename]
         else:
             assigned_labels = []
+        suggested_labels = self.session.suggested_labels(filename)
 
         for button in self.label_buttons:
             if button.text() in assigned_labels:
                 button.setStyleSheet('background-color: #4CAF50')
+            elif button.text() in suggested_labels:
+                button.setStyleSheet('border: 2px solid #FFC107')
             else:
                 button.setStyleSheet('')
 
-    def closeEvent(self, event):
+    def close_session(self, final_export=True):
         """
-        This function is executed when the app is closed.
-        It automatically generates csv file in case the user forgot to do that
+        This function is executed when the app is closed or another session is opened.
+        It stops background work and automatically generates csv file in case the user forgot to do that
+        :param final_export: False to only stop background work
         """
-        print("closing the App..")
-        self.generate_csv('assigned_classes_automatically_generated')
-
-    def labels_to_zero_one(self, labels):
-        """
-        Convert number to one-hot vector
-        :param number: number which represents for example class index
-        :param num_classes: number of classes in dataset so I know how long the vector should be
-        :return:
-        """
-
-        # create mapping from label name to its index for better efficiency {label : int}
-        label_to_int = dict((c, i) for i, c in enumerate(self.labels))
-
-        # initialize array to save selected labels
-        zero_one_arr = [0]* len(self.labels)
-        for label in labels:
-            zero_one_arr[label_to_int[label]] = 1
-
-        return zero_one_arr
-
-    @staticmethod
-    def create_label_folders(labels, folder):
-        for label in labels:
-            make_folder(os.path.join(folder, label))
+        # give running export a moment to finish, otherwise cancel it. Final export below contains newer labels anyway
+        if final_export:
+            self.export_slot.wait(CLOSE_EXPORT_WAIT_MS)
+        for slot in (self.export_slot, self.prelabel_slot, self.duplicates_slot, self.similarity_slot):
+            slot.cancel()
+        self.read_ahead.close()
+        self.prefetcher.close()
 
+        if final_export:
+            # final flush runs in non-daemon thread, so the window closes immediately
+            # and the interpreter waits for the files to be written before it exits
+            snapshot = self.export_snapshot('assigned_classes_automatically_generated')
+            threading.Thread(target=self.session.export_snapshot, kwargs=snapshot, name='final-export').start()
 
 
 class Main_Window(Ui_main_window, QMainWindow):
     def __init__(self) -> None:
         super().__init__()
         self.setupUi(self)
+        load_resources()
         self.setWindowIcon(QIcon(":/icons/icon.png"))
-        
-        self.new_dialog = New_Dialog(self)
-        self.open_dialog = Open_Dialog(self)
+
+        # dialogs are created when they are opened for the first time
+        self.new_dialog: New_Dialog = None
+        self.open_dialog: Open_Dialog = None
         self.labeler_widget: Labeler_Widget = None
 
         self.assigned_labels = {}
 
         self.action_new.triggered.connect(self.process)
         self.action_open.triggered.connect(self.process)
+        self.action_connect.triggered.connect(self.process)
         self.action_about.triggered.connect(self.process)
 
+        # timing report is available when the app runs with LABELER_TRACE (see core.tracing)
+        self.action_save_trace.setVisible(TRACER is not None)
+        self.action_save_trace.triggered.connect(self.process)
+
+    def close_labeler(self, final_export=True):
+        """
+        Stops background work of the current labeler widget, exports its labels and deletes it
+        (before a new session is opened or when the app is closed)
+        :param final_export: see Labeler_Widget.close_session
+        """
+        if self.labeler_widget is None:
+            return
+        self.labeler_widget.close_session(final_export)
+        self.labeler_widget.deleteLater()
+        self.labeler_widget = None
+
+    def closeEvent(self, event):
+        """
+        Labeler widget is a child of the window, so Qt doesn't send it its own close event when the app is closed
+        """
+        print("closing the App..")
+        self.close_labeler()
+        super().closeEvent(event)
+
     def process(self):
         if self.sender() == self.action_new:
+            if self.new_dialog is None:
+                self.new_dialog = New_Dialog(self)
             ret = self.new_dialog.exec()
             if ret == QDialog.Accepted:
-                if self.labeler_widget is not None:
-                    self.labeler_widget.deleteLater()
-                self.labeler_widget = Labeler_Widget(self, self.new_dialog.label_values, self.new_dialog.selected_folder, self.new_dialog.img_paths, self.new_dialog.mode)
+                if self.new_dialog.annotator:
+                    # images are leased in batches, so annotators sharing the folder never label the same image
+                    session = LeasedLabelSession(self.new_dialog.label_values, self.new_dialog.selected_folder, self.new_dialog.img_paths, self.new_dialog.mode, self.new_dialog.annotator)
+                    if not session.img_paths:
+                        QMessageBox.information(self, 'New', 'Other annotators have already taken all images')
+                        return
+                else:
+                    session = LabelSession(self.new_dialog.label_values, self.new_dialog.selected_folder, self.new_dialog.img_paths, self.new_dialog.mode)
+
+                self.close_labeler()
+                self.labeler_widget = Labeler_Widget(self, session)
                 self.setCentralWidget(self.labeler_widget)
 
         elif self.sender() == self.action_open:
+            if self.open_dialog is None:
+                self.open_dialog = Open_Dialog(self)
             ret = self.open_dialog.exec()
             if ret == QDialog.Accepted:
                 selected_folder = self.open_dialog.selected_folder_label.text()
                 selected_csv = self.open_dialog.selected_csv_label.text()
 
-                with open(selected_csv) as csvfile:
-                    reader = csv.reader(csvfile, delimiter=',')
-                    firstrow = next(reader)
-                    labels = firstrow[1:]
-
-                    if self.labeler_widget is not None:
-                        self.labeler_widget.deleteLater()
-                    self.labeler_widget = Labeler_Widget(self, labels, selected_folder, self.open_dialog.img_paths, 'csv')
-
-                    for row in reader:
-                        img_name = row[0]
-                        label_digits = row[1:]
-                        image_path = os.path.join(selected_folder, img_name)
-
-                        if image_path in self.labeler_widget.img_paths:
-                            for i, label_digit in enumerate(label_digits):
-                                if label_digit == "1":
-                                    if img_name not in self.labeler_widget.assigned_labels:
-                                        self.labeler_widget.assigned_labels[img_name] = [labels[i]]
-                                    else:
-                                        self.labeler_widget.assigned_labels[img_name].append(labels[i])
+                # session can be reopened from csv, npy or sharded export manifest
+                session = LabelSession.open(selected_folder, selected_csv, self.open_dialog.img_paths)
+
+                self.close_labeler()
+                self.labeler_widget = Labeler_Widget(self, session)
                 self.setCentralWidget(self.labeler_widget)
                 firstFileName = os.path.split(self.labeler_widget.img_paths[0])[-1]
                 self.labeler_widget.set_button_color(firstFileName)
 
 
+        elif self.sender() == self.action_connect:
+            url, ok = QInputDialog.getText(self, 'Connect to server', 'Server url:', text='http://localhost:8765')
+            if not ok or not url:
+                return
+            annotator, ok = QInputDialog.getText(self, 'Connect to server', 'Your name:')
+            if not ok or not annotator:
+                return
+
+            # client (and asyncio server module) is only needed when connecting
+            from core.client import RemoteLabelSession
+
+            try:
+                session = RemoteLabelSession(url, annotator)
+            except (OSError, ValueError) as e:
+                QMessageBox.warning(self, 'Warning', f'Cannot connect to {url}: {e}')
+                return
+            if not session.img_paths:
+                QMessageBox.information(self, 'Connect to server', 'There are no unlabeled images left')
+                return
+
+            self.close_labeler()
+            self.labeler_widget = Labeler_Widget(self, session)
+            self.setCentralWidget(self.labeler_widget)
+            self.labeler_widget.set_button_color(session.img_names()[0])
+
+        elif self.sender() == self.action_save_trace:
+            report_path, _ = QFileDialog.getSaveFileName(self, "Save timing report", REPORT_PATH, filter="JSON (*.json)", options=QFileDialog.DontUseNativeDialog)
+            if report_path:
+                saved_paths = TRACER.dump(report_path)
+                self.statusbar.showMessage(f'timing report saved to: {", ".join(saved_paths)}', 5000)
+
         elif self.sender() == self.action_about:
             QMessageBox.information(self, "About", "<h3>Khiem Tran</h3><br/><p>Image annotation tool</p>")
 
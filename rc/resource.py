@@ -1,1770 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 5.15.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide2 import QtCore
-
-qt_resource_data = b"\
-\x00\x00l,\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x12\x00\x00\x0b\x12\
-\x01\xd2\xdd~\xfc\x00\x00 \x00IDATx\xda\xed\
-}\x09\x9c\x15\xc5\xb5\xfe]g\xb9w\xee,w6\x98\
-\x01\x97\xc8S\xb3\xc7h\xfe\xc9K\x94h\xd4D\x94\xb8\
-\xbe\x17c\x16y\x88(\x1a7T\x88\x88\x0b\x8b\x82\x10\
-\x15#\x8aDe\xd0 \x9b\x88\x22\xe0\x82\x88\x06d\x13\
-M\x8c\x12E1f\x11\xc1g\x0c\x18\xf3\x92\x17\x13`\
-\xf8\x9f\xaf\xa9\xba\xd4\xed\xe9\xa5\xba\xbbN\x83<\xfa\xf7\
-\xab\xdf\x9d\xb9\xb7\xbb\xab\xab\xea\x9c\xafOU\x9d\xef\x9c\
-Db7\x1c\x7f\xfb\xdb\xdf\x92\xb2\xc4Q\xdf_\xff\xfa\
-\xd7$\xca\x87\x1f~\x98\x8c\xbb\x8dq\xd5\xf7\xc1\x07\x1f\
-$e\xd9\x1b\xc7p\xcb\x96-IY\xf6\xc61T\xdb\
-\xb7y\xf3\xe6dbo=~\xff\xfb\xdf\xa7\xff\xf0\x87\
-?X\x05\x7f\xa3\xac_\xbf\x9e\xad\xc1\xbf\xfd\xedoS\
-o\xbd\xf5VZ\x94\x0c\x0a\xd5\x97\xe2\xaa\x8f\xda\x95T\
-\xdb\x86Bu\xb2\xd5\x87\xb6\xc8v\xfd\xeew\xbf\xb3\xca\
-\x9bo\xbe\x99\xe6\xaa\xef\x8d7\xdeHR\x1d\xf6\xf6\xa5\
-9e\x86\xc60-\xdb&\x0b\x9e\x83Sf\xd0F\xb5\
-p\xca(\xc6\xd0\xde>\xce1t=>\xfa\xe8\xa3\xe4\
-?\xfe\xf1\x8f\xe4\xdf\xff\xfew\x96\xc6\xfe\xfa\xd7\xbf\xce\
-\xbe\xfc\xf2\xcb\x15(\xbf\xf9\xcdo\xd2\xaf\xbc\xf2\x8a\xf5\
-?>_z\xe9%\xe3u\xd2\xbd3\xb2\xbe\xb5k\xd7\
-f\xa8\xfe\x0aY~\xf9\xcb_\xa6\x19\xda\x97R\xea\xcb\
-\xa2\xc8\xff\xf1,\xa6\xebC\x1b\xd46\xa1\x8d\xd4\x8f\x15\
-(\xbf\xfa\xd5\xaf\x8c\xd7\x871\x92c&\xda\x98\x96\x7f\
-cl9d\x86\xea\xcc\x8a\xf6@N\xd2\xf2o\x94\x17\
-^x\x81[f\xd2\xea\x18b|9\xc6P\x8e\x19\xfa\
-\x10E\xb6\x8fc\x0c\xa5\x9e\xbb\xfe\xf8?\xff\xf3?\xc9\
-\xbf\xfc\xe5/F\xcd\x90\xa5K\x97&\x9f{\xee\xb9\xca\
-\x15+VT\xa3\xacZ\xb5\xcaR\xbe\xe7\x9f\x7f>I\
-\xffW\x89\xef\xab\x96-[\x962Xg\x05\xdd/\x87\
-BuW\xe0\xbb\x95+W\xa6\xe8\xffj\xf9\xfd/~\
-\xf1\x0bc\x1dLudd\xfb\xa8T\xca\xef\xf1\xb7\xfc\
-\x1e\xcfd\xaa><\xbbl\x07\xda\x84\xb6\x89\xe7(\xb5\
-\xdbd}\x18\x1b\xd9\x8e\xe5\xcb\x97\x97\xc6\x10\x9f\xf4\x7f\
-\x0e\x85\xea\xaez\xe6\x99g\x8c\xc8\x0d\xeeC\xcf_%\
-\xdbB\xf5\xa6\x1d\xc6\xb0\xfa\xd9g\x9f5*3\xb2-\
-T\x9f\xd5wk\xd6\xac\xb1d\x94\xda\x86\xf6\x19\x95\x19\
-u\x0c\xd1w\xd4\x97I\x14\xfc\xcd1\x86r:\x8c\x17\
-\xbc'\x08\xfc\xf9\xcf\x7fN\xbd\xfb\xee\xbb\xe9\x8d\x1b7\
-F\xee\xdc\x85\x0b\x17&\x9f|\xf2\xc9\x1c\x95\x9a'\x9e\
-x\xa2\xe6\xa9\xa7\x9e*\xeb\xc0E\x8b\x16\xa5\xe8\xfb\xfc\
-c\x8f=V\x83B\xe7G\xae\x93\xeeS%\xefG\xf7\
-\xae\xf2\xaa\x8fJ\xd6@}Y\xb4\x0d\x85\xee\x9fS\x95\
-\x80\xda\x9b\xa4\xefsJ}U&\xeaS\xda\x97G\x9b\
-\xd4\xdf\xd1f\x93\xf5aL\x94\xfb\xd5\xd0X\x96\xf5\x19\
-\xfe\x97\xbf=\xfe\xf8\xe39\x8cyT\x99\xc1}\xdc\xea\
-C{\xe9\xf7\xd2\x18.X\xb0\x80Uf\x1c\xc60k\
-x\x0cs\xa8\xc3\xa9>j'Je\xd4\xfa\xfe\xfb\xbf\
-\xff;\xf9\xfe\xfb\xef\xa7\xb6l\xd9\x92\x02\x08x\x9e\xfc\
-\xde{\xef%7l\xd8\x80yz\x86\xe6C\xa1\x11o\
-\xce\x9c9\xc9\x87\x1f~8?w\xee\xdcZ\x94y\xf3\
-\xe69v\x1c}\x9f\xa6\xdf\x0b\xe2\xbc\xc2C\x0f=\x14\
-\xda<\xa7\xeb\xabe}\x8f<\xf2H\xb5[}T\x07\
-\xea\xa9Ey\xf0\xc1\x07C\x0f(]\x9fU\xea\xcb\xcf\
-\x9f?\xbfK\xe7\xe2;\xfc&\xcf\xc33F\xe8\xd3\xac\
-r\x9f\x02\xda\xe2t\x1e\xf5{5\x9d[+Ju\x84\
-\xf6\xa9c\xe35\x86\xa5\xe7\xc2\x98c\xec\xc3\xd47{\
-\xf6\xec$\xd5\x99\x97cC\xfd\x96u\x19\xe74\xd5Q\
-\x10\xedc\x97\x19\xfb\x18b\xdc\xc3\xd6\x07yC\xdb\xf0\
-\xech+\xdd\xb7K_\xe1;\xaa\xc7\xea\x07\xea\xcf\x02\
-\x95\xd0@\xfe\xfb\xdf\xff\xde\xd2\xe7M\x9b6\xa5\x01\x02\
-\xda\x8bYo\xbe\xf9fv\xdd\xbau\xd6\x5c6h\xa5\
-\xf7\xdf\x7f\x7fr\xda\xb4i5\x0f<\xf0@\x1d\xca\xcc\
-\x993=\xefA\xbf\xa7\xe9\xbcZq~-]\x1fx\
-@\x7f\xfe\xf3\x9f\xe7\xa8\xd4\xa1\xd0=<\x85\x9e~O\
-\xd3y\xb5\xf2\xfc\xfb\xee\xbb\xaf\x22D}\x15\xb2}\xd3\
-\xa7O\xaf\x81\xf0z\x096\x9dW\xea\x0f\xea\x9b\x5c\xd0\
-\xfa\xf0\x8c\xf2y\xf1\xech\x83O\x1bsTO=\x0a\
-\xfa&D\xfb\xd41\xd1\x19\xc3\xach\x1b\x9e\xaf\x86\x9e\
-7\x19\xb0}I\x1a\xf7\x1ae\x0c+4\xc6\x10\xf5\xd5\
-\xe39\xf1\xbcA\xdb\x88>\x92\xed\x9b1cF\xb5\x1f\
-8a\x0cE\xfbB\xc9\x0c\xaeQ\xc6\xa4@u\xba\xf6\
-\x11~\x932C}[;k\xd6\xac\xc0@\xfe\xfa\xeb\
-\xafC\x8f3\x04\x02\x99\xb7\xdf~;M\x96\xbd\xfe\x98\
-\x90\xf2\xa7^y\xe5\x15,\x98U\xd2|\xbd\x82\xe6&\
-Z\x17\xdf}\xf7\xddI*\x85{\xee\xb9\xa7\xfe\xde{\
-\xef\xad\x9f2e\x8aVG\xd1\xf9i\xba\xae\x0e\xd7\xfd\
-\xecg?\xab\xbb\xeb\xae\xbb\xb4\x07\x94\xce\xcf\xd1\xb5\xf5\
-(t}N\xb7>\xd4C\xd74\xa0L\x9e<\xb9\x22\
-@}\x15h\x1b\x9e\x95JAG\xd8\xa9\x1f\xac~\x91\
-\xcf\x89g\xd6\xad\x0f\xcf&\x9f\x13\xcf\x8cg\xd7lc\
-N\xb9N\xbb>\xf4\xbd\x1c\x0bQt\xc7\xb0Bi_\
-\x81\x9e;\xa9\xd9\xbe$\x9d_+\x9f5@}\xd6\x18\
-b,\xa8\xd4\xd1}Xe\xc6>\x86AdF\x1dC\
-\xdc\x03\xf7\xf2\xbb\xa6\xa3\xa3#\x09\xf9\xa2s\xeb\xa7N\
-\x9dZO\x00\xa9=\x86\xbf\xfa\xd5\xaf\xb0h[\xf1\xda\
-k\xafe\x05\x08\x04\xb7\xca\xe8&iR\xfe*,\xfc\
-<\xfb\xec\xb3U\xea\x5c\xc5\xe9\xb8\xf3\xce;\x93\x93&\
-M\xaa\xa5\xcf\xe2\x1dw\xdcQ\xa4\xbf\x03\xcd_\xe8\xba\
-4]\xd7\x80k\xf1\xf9\xd3\x9f\xfe\xd4w@'N\x9c\
-\x98\x17\xe7\x17\xe9\xfa|\xd0\xfa\xe8\xfa\x06*E\x94\xdb\
-n\xbb\xcd\xf7y\xe9\x99*e}tM-)K2\
-\x80b%q\x8dr}>H}\xe8\x13<s\x906\
-\xd25y\xb4\xed\xf6\xdbo/\xd2\xbdt\xeaS\xc7 \
-\xf0\x18\xe2|y-\xd5YG\xf7\xf3\xec\x1f\xea\xf3$\
-\xce\x0b[\x1f\xb5-V\x99\xc1\x18\xd2u\xa5\xe7\xc5\xf8\
-\xf8]\x03\xb9\x922F\xa5.\x88\xcc\x10P%\xe9|\
-\x0b\x1c\x01t\x04\x04\xbe \xb0b\xc5\x8a\xd4\xea\xd5\xab\
-+I\x7f+\xb1\x83A/\xf3\xf0\xeb2\xcb\x96-K\
-?\xf3\xcc39,r-\x5c\xb80G\xf3=\xc7\x9b\
-\xd1 &\xa93\xea\xa8\xb1\xc5[o\xbd\xb5\x91J\xa8\
-\xc5\x8b\x09\x13&\xa4o\xb9\xe5\x96\x22\x95F|\xfe\xe4\
-'?q]\x87\xa0\xdfjn\xbe\xf9\xe6&\x14:\xb7\
-&L}t]\x86\xaeG=M(\xe3\xc7\x8fw}\
-n\xfcF\xe7\xe2\xb9\xd0>\xb45p\xc7\xe2\x1a\xba\xb6\
-\x9e\xee\x81gF\x9d5>\xf55\x89\x82>\x09\xb5&\
-\x83:d\xfb\xbc\xeaC_+}\x1fz\x0cq\x9d\xf2\
-\xdc\xf5\xe3\xc6\x8ds\xec'|Ou\xd6\xcbg\xa3s\
-c\x91\x19\xd9\xbe\xb02\x831D\xbbd\x1b\xfddF\
-i_=\xf5M`\x99!\xa0)\x81$\x80\x80,\x02\
-W\x10\xa0\x97t\x8a^\xd6\xd6n\x0d@\x80,\xf8\xe8\
-;3\x8b\x16-\xca\xcc\x9f?\xdfZ\x0c\xa2\xf9\x08\xe6\
-AI\xdb\x00$\xa93\xad\x81\xa4Am\xba\xe9\xa6\x9b\
-\x22\xad>\xd3\xf5\x99\x1bo\xbc\xb1\x91J\xf3\x0d7\xdc\
-\xd08z\xf4\xe8.\x03J\xdf\x17\xa84\x8bR\x88R\
-\xdf\x981c\xac\xfa\xe4\xfd\xa8\xbe.\xcf\x8f\xef\xf0\x1b\
-\x9d\xd74v\xecXW\xa1\xd69\xe8\xfa$\xdd\xa7\xc1\
-\xeb\xf9e}\xa2\xceF<c\x946\xfa\xf5\x17}\x97\
-\xa1:PO\x13J\xd41\xa4{T)\xf55\x8c\x1a\
-5\xaa\xac\xbf\xf0?\xbe\x97\xe7\xe0\xfc\xa82\xa3<\xbf\
-\xab\xcc@\xa6P\xe8\x9cH2c\x1fC/\x99\x11c\
-\xd8\x80k\xc2\xd6\x07\xe0\xc0K\x07\x96\x1cYIE\xb2\
-\x0a\xf2N\x8b\xa3\x0b\x16,\xc0\xceI\x0d\xbd\xb4\xb1m\
-k\xcew\x81n\x9e%\xe5\xb7\x16]\x08\x81\x0a0M\
-\xc4\x1b4)P\xbe\x09\xcaA\x8d\xad2Q\xdf\x88\x11\
-#2\xd7_\x7f}3\x95\x16|^w\xddu\xa5\x01\
-\xa5\xbfk\xc5\xf7(\xb5\x0c\xf5\xb5\x5c{\xed\xb5\xa5v\
-\xe0o\xaa\xb3\x05\x85~+\xda\x859d}I\xdcK\
-\xd6\x876)\xed\xabR\xda\xd7\x8cg3\xd1F\xd4!\
-\xdbAmR\xeb+k;\xd5gj\x0c\xd5v\x14\xa9\
-\xce\xa4\xe8\xcf\xb2\xb6\x1b\xac/n\x99\xb1\x8fa\x95\xcb\
-\x18\x16qn\xd4\xfa\xc8\x9a\xb0t\x8d^\xb8\x8d\x98N\
-\x10\x10\x94@\x80\xf42={\xf6lk\x97\x02 \x00\
-K a\xfa\xc0\xcawGG\x07\x16x0o\xae#\
-DJ\xd1C\xd5\x03u\x81r\xa4\x18U&\xeb\xbb\xe6\
-\x9ak2W_}u3\x95\x16|^u\xd5U\x19\
-*\xb5\xe2\x7f\x94Z\x93\xf5\xd1\xfd2\xc3\x86\x0dk\xa6\
-\xd2\x8aBuU\xa3\xc8\xff\xa9\x14\x87\x0f\x1f\x9e4\xd8\
-\xbe$\xd5Y\x94\xedA\xdb\xa8\x8e*\xa5}\xcd\xe8\x03\
-\x93m\x14u\xc8\xf6\xd5\xa2O\x95>n\xa1\xf6\x19\x1d\
-C\xdcO\xde\x1b\xfd7t\xe8\xd04>\xa9\xe0\x7f|\
-\xff\xb1\x96\x19\x871\xacB\x91\xed3-3\x00\x01L\
-\x9b0\xcd\xa6)\xb7\x05\x024-H\xdfw\xdf}\xd8\
-\xcd\xa8'\x10p\xdd\x1e6r`\x05\x1cs\x11\xa0\x90\
-|\xeb\x8f\x1c9\xb2\xd9\x14\x8a\xdb\x0f\x12\x98\xcc\x15W\
-\x5c\xd1B\xa5\x9b\xad\xd4q\xd47d\xc8\x10\xab\xbe\xcb\
-/\xbf\xbc\x9bZ\xae\xbc\xf2\xcaF\xfa\xcd\xb8\xfb\xe9\x8f\
-\x7f\xfc\xe3$\xeem\xaf\x0f\xcf\x80g\xe1h#\xfaN\
-\xb4\xa9\xacP_W3\xd5Wmo\x9fhc5\x97\
-\xccP\xdf\xb5\xd8\xdbG\x85Kf\x1c\xc7\x90Kfh\
-\xba\x93\xa4\x825\x88F9%\xc0\xda\xc0\xd4\xa9S\xeb\
-\xfc\xb6\x87\x8d\x1c\x84>U\x84Dx\xeb7\x91\xe27\
-\x93I\x97\xe3\xac\xef\xb2\xcb.\xcb^|\xf1\xc5\xddd\
-\xb9\xf4\xd2K\x1b\xb8\xeb\xbb\xe4\x92KZe}\xf4w\
-3}\x97b\xac/\x85:\xd46\xe2\x198\xdbH\xf5\
-5P\xe9&\x0b\xd5W\xcd\x5c_^m\x1f\xfe\x8fa\
-\x0cK\xed\x8bAf\xca\xc6\x90[f\xc8\xea\xb6@\x00\
-\x0b\xc9d\x094b\xe7\x8d^\xce\xfc\xcaO\xa8\x93\xa4\
-7\x7f=\xde\xfcP~2oZ\xe8-\xd6Hh\xc7\
-\xd6\xd8\x0b/\xbc\xb0\xfe\x82\x0b.\xe8\xae\x94nT\xd8\
-\x14\x84\xee\x9d\x1b4hPw\xb5\xe0;\xce\xfal\xed\
-\xeb\x8e6s\xd5G\xed\xc9R\xe9FutWJ=\
-c\xfbRt\xfff[\xfb\x9a\xe9\x19Xe\xc6\xd6\xbe\
-Vn\x99\xb1\x8f!\xa7\xcc`}\x83\xa6\xdcX\xac\xb5\
-v\x22\x04\x08\xe4\xd9\x95\x1fs~E\xf9k\xc9\xdcj\
-\x85\xb9Ch\xd7\xf4\xa3\x1f\xfd\xc8\xf8\x80\x9ew\xdey\
-\xf5T\xdaP\xce?\xff\xfc\xe2\xc0\x81\x03\xbb\xe1o|\
-\x9e{\xee\xb9\xc6\x07\x94\xee\x9b\x93\xf5Qi\x96\xf5\x89\
-:s\x9c\xf5\x89\xba\x9a\x95\xff\x8d+%\xfa\x8cJ7\
-\xa5O\x9b\x94\xf6r\xd4\x97\xa2\xd2\xac\xd6!\xff\xc6\xf7\
-\xf8\x9d[f\xe8\xb3$3T\xd8e\xc66\x86\xc6e\
-\x06S\x1c\xacU\x91\xe5\xdd2z\xf4\xe8&1\x1dh\
-\xa2\xe9@\xa3\xd3\xee\x80)\xb3\xdfZ|\xc0\x82\x1f\x94\
-_\xaex\x92\xf2W\xc3\xe4\x01\xcaRg\x1b\x1d\xd0\xfe\
-\xfd\xfb7\xfc\xd7\x7f\xfdW;\xca9\xe7\x9cc\x99p\
-\x03\x06\x0c\xc8\xd2\xf7\xdd\xc5\xf7\xf8\xcc\x1a\xac/\xa7\xd4\
-\xd7Bu\xa5l\xf5\xb5\xe3\x1c\x8e\xfaP\x07\xeaB\x9d\
-\xa8[\xf9\xde\x98\xe9\x8a\xbe\x12}f\xdd\x9b\xea\xca\x89\
->\xad\xa7zPW\xa9\x9f\x0d\xd5\x97\xa2{\xb6(}\
-j\xd5\x87O\xa5}\xf8\xdd\x98\xcc\xe0\xf9e[\xa8]\
-\x0d\x12\xf4\xd0\xbf\xe2\xfb8d\xc6>\x86\xc6d\x86t\
--;x\xf0\xe0\xd6!C\x86`!\x17;\x1e\x19u\
-:\x80\xdd\x01\x9a\x0a\x98\x05\x018>`\x9f\x1f\xe6\x06\
-!\x0e*-[\xf0\xa37\x7f5)\x7f\x1b5\xbc\x8d\
-\x1a\xdb\xdc\xaf_\xbf\xc8\x03z\xf6\xd9g7PiG\
-\xa1\xfb5\xd8\x05\x99\xbeo\x13\xbf\xe33\xf2\x80\xfe\xf0\
-\x87?\xccQ\xe9\x81B\xf7+\x13J\xaa?K\xdf\xb7\
-\x89\xdfQg\xce@\xfbr\xb2}h\x83*\x94\xa8\x1b\
-\xcf\xa0\xfc\xde`\xa0}j\x1bz\xd8\xdb\x80>6Y\
-\x1f\xdd\xa3\xac\x0dt\x7f{}\xe8\xefv\xd1\x9f-\xf4\
-\xf9\xb1\x93\x19\xdb\x18\x96\xc9\x8c\x1cC\xa5\x8d\x91e\x86\
-,\x8a,\xa6\xbfx\xe1\xd2\x8b\xb7\x05\x96\x80\xfc\x0d>\
-\x06\xb0\xce\xb18/\x16\x05\xcd\x80\x0e\xbc\x90\xe0\xe1\x87\
-E?\xb1\xe2_\xe5f\x06Q\xa3\xdbD\x83[\xbe\xff\
-\xfd\xef\x87\x1eP\xba\xb6\xf8\x83\x1f\xfc\xa0\x87(E\xa7\
-s\xe8\xfb,\x9d\xd7\xf6\xbd\xef}\xaf\x87\xf8\xccF\xa8\
-/\x8f\xfb\x88{\xb5\xd2\xbdS^\xf5\xe1\xb9pM\x94\
-\xfad\xfbpO(\xa7C})<\x8b\xf2\x5c\xc5\xb0\
-\xf5\xa1o\xe4\xb3\x8b\xe7\xcf\xbb\xf4iQy\xae(\xf5\
-\x95=\xbbG}e\xfd\x8e\xeb8e\x06\xfd\x8c~\x90\
-\xfd\x1e\x83\xcc\xd8\xc70\xb4\xcc\xd0\x8b\x15\xd6\xa15\x95\
-\xa1\x17n\xeb\xa5\x97^\xda\xe5\xd9\xb1E\x88\x175v\
-\x06&O\x9e\xdc\xd0\xd1\xd1\x11\x0d\x04\xe0\xec\x03\xdfu\
-\xec9\x12\xc249y;\xd9\x11\x11\x0d=\xeb\xac\xb3\
-PZ\xbf\xfb\xdd\xef\x06\x1eP\xba\xa6H\xa5\x87(\x9e\
-BHud\xe9\x9c6q.>\xb3!\xea\xcb+\xf5\
-\xb5\xd2=S\x9a\xf5\xa1\xe4#\xd6\xd7\x86{z\xd4\x97\
-\xc23\xe9\xf6\x87K}e\xcfL\xf7\xcc\xfb\xf4i1\
-b}e\xcf\xacQ_Y\xffG\x95\x19<\xff\x1e&\
-3\xf61\xcc\x87\x00\x1bX/\x98\xba\xc0\xca\xeeF\xd6\
-v\xd6k\x9d\x8e\xac\x80:\xec\x0a\x80;\x10\x86yj\
-\x1dS\xa7N\x05C\xab\x809\x05\xf6\x1b\x09\x00\xaa4\
-\xd1\xdf\xea\x9c\xef|\xe7;=\xce<\xf3\xccV*\xda\
-\x03J\xe7\x16q\x9d\xb8\xb6\xa8+\xe0t~\x9b\xb8\xae\
-\x9d\x8a\xf6\x80\xd2\xb9y\xa5>\xadg\xa5s\xd4\xfap\
-]>@\xfbJ\xf5\xe1\x1e:\xc2\x07\x85\xc0\xb3\x05\xed\
-\x17\xd1\xbe\xac\xe8\x93@\xcf\x1af\x1cD}e\xcf\xaa\
-+\xecj\xbf\x88\xeb?62\xa3\x03X\xf61\xc4=\
-\x82\x008\x81\x88e\xb5\x00\x04`\x09\xe8L\xd9\xe1\xa8\
-\x07\xc6\x22<wg\xcf\x9e\x1dl\x8bw\xe6\xcc\x99\xc9\
-\xfb\xee\xbb\x0f\xee\xbe\x0d0'~\xf2\x93\x9f\x04\x22i\
-\x88\x01\xed\xf9\x9f\xff\xf9\x9f=\xff\xe3?\xfe\xa3\x1b}\
-\xfav\x12\x9dS\xc4\xf9\xa2\x04z\xf3`\x00\xa9\x9ev\
-Q\x1f>\xb3\x1a\xf5\xe5e}x\xc6 B\x87\xfa\xe8\
-:\x08NO\xd1\xce|\xc0\xfa\x82\x0a]J\xf4\xa3v\
-\xff\xa0\x0fd\x9f\xa0\x04\x11\xba0\xe3\x811V\x9f1\
-h}8_\x1d\x8f\xbdPf\xecc\x98\xd7\x04p\xcb\
-Zq\x9b*\xba\x1d`\xe6\xd24\x00\xb15\x00\x00\x08\
-\xe6\xa2\xe7\xa8\x07\xb6\x1f]\x80\xc0\x0c\xf5\x02\x00B1\
-\xb4\xec\x9d\xe55\xa0Q\x06\xd2I\xe0\xfd\x064\xc8\xb3\
-\xe9*\x98\xd7\x80\xda\x95_G\xd8\xfc\x14\xcc\xab\x9f\x82\
-<\x9b\x09\x05sx\xb6\xfc>\x99\x89\xd6O\xf2\xd9\x84\
-%\x15j\xbd\x82\xa6\x00\x08\xb2R\x00\x00<\xfa\xe8\xa3\
-\x85\xa7\x9ez\xca[\x97\x9f~\xfa\xe9\xe4\x82\x05\x0br\
-\x0f>\xf8 \x22\xac \xe8A\xa4\xa0\x84:\x9dfb\
- \x83\x0c\xa8\x89\x81\x0c\xa2h&\x94?\x08\x08\x98R\
-~\xdd\xf11\xa5\xfc\xff\x87d\xc6\xb7\xbf\xd4g\xc2\x14\
-%\xcc:\x85<\xa6O\x9f\x9e$}\xae\x01\x00\x90~\
-\xe7W\xadZ\xe5|\xaf\xd5\xabW'\x11\xf4\x83\x00\xa0\
-\x00\x00\xa0\xb9\x83\x91\x88\xa4^\x9dgr u\x06\xd4\
-\xe4@\xea(\x9cI\xe5\xd7\x01\x01\xd3\xca\xef7N\xa6\
-\x95\xff\xff\x90\xcc\xb8\xf6\x9b\xfdY\x82L\x15\xdd\x8e\xb9\
-s\xe7&\xe7\xcf\x9f\x9f[\xbcx1\x00\xa0\xea\x95W\
-^\xd9\xc51\x91\xd9d\xd6\xacYS\xb1t\xe9\xd2\x1c\
-\x00 J\xd0C\xdd\x01\xe5\x18H\xaf\x01\xe5\x18H/\
-\xc5\xe3P~/\x10\xe0R~7\xc5\xe3R\xfe\xffC\
-2\xd3\xa5\xff\x82LI\x82\x1e\x8f=\xf6X\x92,\x00\
-\x04\x09\xa9\xfa\xcdo~S\xf1\xce;\xef\xecl\x0b\xc2\
-\x80\xaf_\xbf>\xf3\xc2\x0b/T\x92\x05\x90{\xfc\xf1\
-\xc7Y\xfc\xa5\x1d\x14\x82e =\x06\x94e =@\
-\x80E\xf9=\x04\xa8'\x972:\x81\x00'\xd8\xfc\x1f\
-\x92\x99\xb21\xe4R~y G\x07\xa2\x04\x01\x006\
-n\xdc\xb8\x938\xb4y\xf3\xe6\x14\x82\x06\x02\x00\x96-\
-[\xc6B?u\x1aP\xce\x81tSJ\xae\x81\xf4\xa8\
-\x8fe }@ \xcf\xdc\xa7\xc5\x98\xeb\xdb\xdbe\xc6\
-\x09\x04X\x99\xa0\xaf\xbd\xf6Z\x86,\x80\x9d\x00\x80X\
-\xe1o\xbc\xf1\x86\x05\x00\xa63\x91\xf8\x09O\x0c\x9d\x9b\
-\x8f\xe3m\xec!\xac\xac\x0a\xe2bu\x14c\x06\x9c\xe2\
->\x991>\x86l2\x83\x94j\xaf\xbe\xfaj\x16y\
-\x02J\x00\xb0n\xdd\xba4\x00\xe0\x17\xbf\xf8\x05\xa6\x00\
-U1\x0cdK\x0c\xe6U\xd9\xfc\x8d\xdb\xbc\xb2\x9b\xab\
-\xdc&\xb2\xc3\x9b\xaa;\xa7R:(\x7fK\x0c&y\
-\xdc2\x93\xa3{\xf7\x14%\x0e\x99)\x9brp\xae\xa9\
-\xe0@*5,\x02\xae]\xbb\xb6\xa2\x04\x00\xc8\x05(\
-\x90!\xab,\x02V3\x0ed\x91ku\xd5g\x01\x89\
-m\x81\xc5i\xc1\x8fsQ\xcee\xd11\xb0\xb3P\x94\
-\x05+\xb7q\xddCe\x062\x0e\x81\xc7\x147%\xfe\
-/\xfb\xfd\x98c\x8e\xa9=\xf1\xc4\x13\x0f\xf8\xf6\xb7\xbf\
-\xbd\xff\xa9\xa7\x9e\xda\x9d\xfeO\x9d~\xfa\xe9\x18\xc76\
-\x01\x08\xa6e\xc6i\xd1\x91ma\x15)\xde\x9e~\xfa\
-\xe9\x1c\xc2\xfc\xc3\x02\xd8\xb0aC\xd7HEK\x96,\
-\xa9P\xb6\x01s\x5c\x03\xe9\xa5\xa8\x1c\xca\xef\xd5\xe9\x1c\
-\xca\xef\xa5\xa8\x1c\xca\xef\xa1\xa8E.\xe5\xd7\x19\xdf\xdd\
-(3R\xe1\xb5\xe4i\xc7\x8e\x1d)d\x17z\xe9\xa5\
-\x97\x90\x8eKm_\xfa\xff\xfd\xbf\xffWy\xc6\x19g\
-\xe0\xed\xdcS\x80A\x96C\xf9\xdd\xfa;\xa8G\xa5\xd3\
-\x81\xd4i\x8f>\xfah\x0d\xfc\x00\xb0\x0b@\x16\x80{\
-\xbf\xcc\x9f?\xbfJ\x00@}TJ\xa1\x8ep\x18v\
-\xb2\xd0q\x221\x06\x02:[}&A@\xd3\xf1\xc8\
-\x18\x08\xe8\xbe\x91\x0c;\xe6h\xcb\x8c4\xd5\xe9o\xf9\
-6K\x09\xc5W\x0fx\xbf}\x86\xcaYT\xae\xa52\
-\x99\xca\x1c*\x8fSy2\x9b\xcd>Q(\x14\x1e\xad\
-\xab\xab\xeb\xa022\x95J\x9dB\xdf\xef\xafZ\x09\x17\
-]tQ\xfa\xa4\x93N\xda\xef\xb4\xd3N\xdbO\xf4\x7f\
-\x86C\xf9\x9d\xfa=\x08\xa7\xc2\xe9@\xca4\x04\x0a\x95\
-\x8e@2\xd3\xb2\xe7\x01\xf2\x00|\x88\x85+0\xab\x1b\
-\xa9)\x10\x08\xe8F\x1a\x19\x04\x82\xec\xf3\x9b\x00\x81\x80\
-\xae\xc7\x91A \xa89j\xc85W\xfb\x1e\xf4ly\
-\xf1V\xeeq\xf2\xc9'\xb7\xf5\xea\xd5KUJD6\
-\xfa\x0e\x95\xa9T\xde\xa2\xb2\x0d/z{I\xa7\xd3;\
-\xaa\xab\xab\xadRUU\xa5\xfe\xf6\x0f*\xbf\xa4r3\
-\x95c$\xa8\x9cw\xdey-}\xfb\xf6=\x80\x80\x00\
-\x84\x9e\x0c\x87\xf2\xdb\xfb_\x00\x00\xe8\xc4\x81e\x06\xd1\
-\x82I\x8f\xeb\x14W`\xfdg\xbe\xef\xbe\xfbr\x0a\x19\
-(P\x06\x15\xc1\xd0\x0a$\x0cQ@ \xcc\xb5Q@\
- \x8c\x93O\x14\x10\x08sm\x14\x10\x08;\x17\x8d\x02\
-\x02a\xae%\xc5\xcfC!\xaf\xb8\xe2\x8af\x92\xd7\x1a\
-R\xe8\xcf\xd1\xd7?\xa5\xb2\xd1A\xe1\xb7S\xf9\x97(\
-[\xe9\xdcm\xa4\xf8V!\xe5\xdf*\xbf\xa7\xd2\xe9p\
-\xedo\xa8\x0c!\x0b\xa1}\xde\xbcy\x05DU\x82E\
-p\xea\xa9\xa7f9\x94_\x1e\x92])\x00\x00\x81\x5c\
-\xb4e\x06)\xd3H\x7f\xeb%\x19\xc8-\xd3\xb2\xe71\
-y\xf2\xe4<b\x8f\x8b\x08\xc0Z\x99T\xc0\xcd\x16\x94\
-\xc70B\x10F\x91\xa3\x00GTFXP\xe0\x08\xa3\
-\xc8Q\x80#\x0c\x8b0\xd2BT\x18E\x0e\x09\x1c%\
-S\xf6\xe0\x83\x0f>\xba\xb6\xb6v.)\xb2\xfa\xa6\xdf\
-&\x14z\xbbPjY\xf0\xe6\xefT\xde\xfc\x9d\x8a\xd2\
-\xab\xe7m\x13\xa0\xa0\x02\xc2\xfbt\xed\x0d_\xf9\xcaW\
-\x0e\x9d2eJ\xdd)\xa7\x9c\xd2\xa3w\xef\xde\x15\x9c\
-/\x1bP\xd4\x11O@\x00@\x0f\x02\x1f\xdfi\xf9\xad\
-\xb7\xde\x9a\xa1\x177\x12\xc26\x00\x00f\xcd\x9a\x15~\
-\xdd\x02\x09%\x05\x004\xab\xd9d\x9c\x0eDe\x91\xb1\
-\x00\xa8\x845\x03\x83\x98\xf2FY}\x01\x19aa\xa7\
-\x0eALy\x13S\x87 ,BS\xac\xbe \xd3\xbf\
-(\xca\x8f\xfe\x1fMJ\xf9\x91\xa2\xd0NJ\xdf\xa9a\
-\xf6\xab\xc5\x0e\x08\x12L\xac\xdf\x93\xc9\xe4\x86\xe6\xe6\xe6\
-\x1f]}\xf5\xd5M\x03\x07\x0el\xf9\xe2\x17\xbfX\xc5\
-9\xddDP\x11D\x16\x12\x00\xd0~\xee\xb9\xe7\xba\x82\
-\xc0\xd8\xb1c\xad\x5c\x97\xb0\xdc\x01\x00\x1d\x1d\x1d\xd1}\
-{\xc6\x8d\x1bW\x03\x00@J)dYq:\x07\xf1\
-\xd8\x80R\x00\x80 A$\x22,\xe6\xb1\xb0\xfa4\x19\
-aQ\x17\x0fu\x16\xf3L.\x1e\xea\xb0\x08M\xb3\xfa\
-t\x16\xf3\xc2(\xbf\x1c\xe7/RyYQ\xec\xad\xa4\
-\xd4x\xb3w\xda\xde\xea;\x02*\xbf\x17\x18\xc8i\x04\
-@`GMM\xcd\xa3_\xfe\xf2\x97?\x83`\xb9\x9f\
-\xff\xfc\xe7\xab8\x17\x9c\x11^\x8ct\xacU\x00@\xdb\
-\xa0A\x83\xba\x80\xc0\xc8\x91#\xad\x1c\x97\xc8\xd1\x09\x00\
-\xb8\xeb\xae\xbb*\x13\xa6\x8eQ\xa3F\x15\x00\x00?\xfe\
-\xf1\x8f[\xedYy\x10\xb9\x16\xe8$\x00\xc0\xd4V\x90\
-\xd7v\x1e+\xab\xcf\x87\x11fj\xfb\xd0k;\x8fc\
-\xfb\xd0\x8bE\xc8\xc5\xea\xf3\xda\xce\x0b\xaa\xfc\xea\xbeu\
-\x7f\xe5\x8d\xfc/\x9bi\xdf\xe9\xa4\xe0!\x95\xdf\x0e\x04\
-\x9d\xea\xf4\x02 \x90\xcb\xe5\xfex\xe0\x81\x07\xf6y\xf0\
-\xc1\x07\x0b*\x08`\xbb\xd0\xf4\x963\x02\xad\x22\x8a2\
-\x00\x00Ax\x11\x8cW\xfe\x86\x94h\xc8\x87\x88\xc4\xa7\
-\x08\x11\xae\x93\xea>\xf0A\x95\xd4\x02\x00\x90\x07\xe0\xe2\
-\x8b/\xb6@\x00\xb1\xeb\x81J\x00\x80(\x81$uA\
- .V\x9f\x0b#\x8c\xcd\x19\xc4\x89\x11\xc6\xe0@\xe4\
-\xc4\x22\xe4f\xf599\xf4DQ\xfe\x91\x8aRn\xb5\
-+\xa7\x93\xa2\x1bP~'\x10\xc0\xe7\xbf\x00\x02t\xdf\
-\x8f\xbaw\xef\xdeo\xfe\xfc\xf95_\xf8\xc2\x17\xaaN\
-;\xed46\x07\xa2s\xce9\xc7\xca\xb3 \x00\xa0;\
-2:\x91NZ\xf9\x10\x91\x88\x14\x00\xe0\x95\xae<\xf2\
-A\x95\xd5\x0a\x00@v\x9e\x16D)\x05\x00\xd8\xc30\
-3\x81@\xf78Y}q\x10{\x5c\x08D\x9c.\xc4\
-\x8e\x0c\xb4\x18Y\x84\xdd#(\xff-\xca\x8a\xfev\x07\
-\xa5tTxC\xca\xef\x06\x04[\x05\x08\xechmm\
-\x1d\xf4\xc4\x13O\xd4`\x87\xc0\xa4\xe3\x90\xfd \x9dK\
-\x91\xee5\x03\x00.\xbd\xf4\xd2n\xc8\x83\x88\xc4\xa4\x00\
-\x00S\xd9\xb9=\x0fL\x01\x00\x00H\x99\x05\x000\x99\
-L\xc2\x0f\x04\xf6RV_\xac\x84\x90=\x84E\xa8\xab\
-\xfc\x12\x00nR\xccoW\xe5w\x02\x01\x9b\xf2;\xad\
-\xf8\xefp\xbb\x8f\xee\x94@\x01\x81\x0bf\xcd\x9aU\x0b\
-\x108\xe3\x8c38S\x91\xa5.\xba\xe8\xa2&\x01\x00\
-\xad\x00\x005=9\xeb1x\xf0`\x09\x00m{)\
-\x00\xec\xd5\x8c\xb0=\x81\xd5\xa7Y\x9f\x1c\xe3\xeb\x15\xe5\
-\xd7RX\x01\x00\x9d\xb6\x85\xc1\xed\x89]\xdb{\xf6\xb2\
-\xcd\xb6{\xa0\x03\x0a\xa5s\x09\x00\xb6I\xb0!\x108\
-\x1f\xae\xb7N\x0b\x83\x06\x01 K\x00\xd0JS\x00\x00\
-@\xb7\xd8\x00`\xe8\xd0\xa1eS\x00,H`\x0a`\
-\x22\x9b\xcc\x1e2\x05pd\xf5\xed\xc5S\x80\xeeq\xb2\
-\xfa\x02\xd4'\xc7\xf6\xc7.f\xbf\x97\xf2\x97)>}\
-b\x87`\xbb\xe6\x14\xa03\xe1\xe2?\xe0v>)\xbf\
-\xf4+(\x81@[[\xdb\x0f\xa7O\x9f^\xe0\x00\x01\
-\xe47<\xff\xfc\xf3\xbb)S\x80\xa6X\xa6\x00\xea\x22\
-\xe0%\x97\x5c\xb27.\x02z\xb2\xfa\xf6\xc2E@V\
-\x16a\x84E@\xb9\xcf\x7fI\xa2|\x0b\xceO\xf9;\
-\x15'\x9fN\xe1\x13P\x9a\x0e\xe4r\xb9-T\x96\x91\
-\xc2\xdeE\xdf\x8f\xa62\x5c,*NL\xec\xe4\x06\xbc\
-k\xbb\xdfV\x87)CY\x9d\xc2\xf4/\xed>\xc0\x12\
-\x10\xdf\xfd\xefA\x07\x1dt<)d\xc3\xe1\x87\x1fn\
-L)\xc9\xda\xb6\x92\xbb\xcaE@\x02\x00,\x02&\x09\
-\x00\x8a\xac\x8b\x80r\x1bp\xd8\xb0a{\xeb6\xa0\x16\
-\xabo/\xda\x06de\x11\xfa)\xba\xcd*(:(\
-\xffy\x89r7\xde \xca\xbf]\x98\xfc\xf8\xfe\x7f\xa9\
-\xdc\x9f\xcf\xe7\xcf\xc0\x9e=\xf2#>\xf2\xc8#n\xfd\
-\x09o\xd7c\xa9\x00 \xb6$\xca\xbd\x0a\xbb\x80\x80\x9c\
-\xf7K\xc0\x81%\xa0.\x0c\x12\xd8\xbc\xd9\xbbw\xefC\
-H?Z\x8f9\xe6\x98\xc8\x0e9\xc8Q\x097d\x97\
-m\xc0\xe4\x88\x11#\x8a,\xdb\x80\xe0\x02\xec\xe5\x8e@\
-\x81X}{\x81#\x10+\x8bP\xf3-o\x9d#\x09\
-=\x02\x04\xa4\xf2\xff0\x82\xf2oUL\xfd{\xa9\xf4\
-\x92\xf5\x91\x82T\xa2>p\xfeO8\xe1\x84\x1e\xdd\xbb\
-w\x87Rf\x12]\x19\x848\xbaC\xf4\x15\xe5\xdfj\
-3\xfb\xcb\x16\x19\xf1\xbf\x0d \xac-\xc2B\xa10s\
-\xcc\x981\xc5\x93O>\xb9g\x94EA\xe4\xa6\x04x\
-\x89\xac\xce\x00\x00'G\xa0$\xd5\xd5 R\x85\x9bq\
-\x04\x22$\xc9\xc3\xb3H\xc7\x15\x98\x00\xe0\xe3\xe8\x0a\x1c\
-\x8a\xd5\xf71v\x05fe\x11\xea*\xbfrn\x03\x94\
-\xf2\xa4\x93N:\x00\xbc||\xe5\xf7\xe6\xd5P\xfe\xb7\
-\xa9\x1cg\xb3*,%?\xed\xb4\xd3\xf22\xea\x0f\xd5\
-\xddJJ\x99rX{P\x01\x01\x1e\x87k\xd5)\x81\
-b\xf6\xab\xca\xbf\xc3aw\xc1\x9a\x0e\xb4\xb6\xb6\xf6\x9b\
-8qb}\xdf\xbe}\xf7\x0b\xc3\x22D>C\x99\xd4\
-\xd4\xcf\x15\xf8\xa6\x9bnJ\x12\x00\xd4\x1bq\x05\x9e<\
-yr\x0ed \x01\x00{#\x19(\x12\xab\xefcH\
-\x06be\x11\x06U~y\x1c\x7f\xfc\xf1-\x88AA\
-o\xe4s***\x82*\xff\x0e\x9b\xf2\xaf\xa6\xd2\xac\
-(~X\xeb1)\xac\x03\x1c\x98\xc3\xcf\x17f\xffV\
-E\xf9;m\xcao\xdfj\xdc&\xaey\xed\x9b\xdf\xfc\
-\xe6\x01\xf4\x82l?\xfd\xf4\xd3\xdb\x83\xf8\x06 \x17\xa5\
-\xc8\x0c\x14\x84\x0cde\xf4\x96d\xa0\x993g\x06\xb7\
-<\xe8\xc2\xbd\x9d\x0el\x84\xd5\xf71\xa2\x03\xb3\xb2\x08\
-\xc3*\xbfT\xb2b\xb1x\x86T,\x02\x81\xa0\xca\xff\
-/\xa1\xfcK\x85\xb2&\x14\xe5\x8d*3%k \x95\
-J=(\xc1FQ\xfe\xce\x847\x87@.D^\xb6\
-`\xc1\x82\x1a\xd0\x97\xc5\xee\x92\x0e\x1d\xb8\x94\x1b0(\
-\x1dX\xe4\x06,\x84\xa2\x03\xab\x01A\xc8t\xd9\x1b\x03\
-\x82\x18e\xf5}\x0c\x02\x82\xb0\xb2\x08\xa3*?\x1d\xbd\
-\xa9\xfc\x13o\x7f\xb9\x95F\x7f\x07}\xf3?K\xa5\xc2\
-\xae\xb4\x86d&5o\xde\xbc\x14\xcd\xbd[iN?\
-_\x98\xfd[}@\xaa\xd3\xb6\x86\xf1V\x8f\x1e=j\
-\xc9\x8c\xefFV\x80\xb6\xccD\x09\x08\xe2\x90\x1b\xd0\x7f\
-\xfa!C\x82\x89\xdc\x80{cH0\x16V\xdf\x1e\x1c\
-\x12\x8c\x95Eh@\xf9\xbfL\xe5\xef\xd2d\x16 `\
-m\xab)\xd3\x01?\xe5\x7f:\xb1\x93\x1a\xac\xad\xfcA\
-d\x86\x94/\x83E<R\xde6\xac\xe8\x93%\xb00\
-\xd1\x95\x8b\xe0\xe5($\xcf\xeb\x87\xfbIWa\x1d\x99\
-\x89\x1a\x12\x0c\xb9\x01\x91\xecW+$\xd8\xff\x81\xa0\xa0\
-\xac\xac\xbe=0((+\x8b\xd0\x80\xf2\x7f\x81\xca\x87\
-ve\xc2\xdb_.\xb0\xd9@\xa0S\xf1\xf0\x93\xca\xff\
-\x94r\xbf\xb4i\x99QX}=\xbe\xfd\xedo\xf7\xdc\
-\xb1c\x87\x5c\x13X\xeb\xb0V\xe1\x06\x00\xf2\x9c%\xb8\
-\xb8O\x9f>Y\x19h\xd4Of\x0c\x05\x05\xb5r\x03\
-\xca\xa0\xa0\xaf\xbc\xf2JW=CXp\xe4\x05\xd8\x8b\
-\xc3\x82\xc7\xc2\xea\xdb\x83\xc2\x82\xb3\xb2\x08\x0d(\xff\xa7\
-\xa8\xbc\x9fpa\xf5\x09K@\x05\x01'\xe5\x7fBQ\
-\xfa\x14\x83\xccd\xc5|\xdd\x1aWX\x02J}\x87\xeb\
-.T\xaa[\x83T\x0e\xb5\xe6<\xbd{W\x80,\x14\
-\x97\xcc\x88\xdc\x80U27\xe0\x1f\xff\xf8\xc7\x9d\x1c\x8b\
--[\xb6\xa4^\x7f\xfd\xf5\xf4\x8b/\xbeh%\x06\xa1\
-\x13\xf7\xc6\xc4 \xdd\xe3d\xf5\xed\x01\x89A\xf6T\x17\
-b\xa9\xfc\xd8\x9b\xdf\xe4\xa6\xfc\xb2( \xd0YYY\
-iW\xfe\xc7\x12\xbb\x88B)\x8e\x17\x87m<\xb3\x0e\
-\xed\xb89Q\xee1\xd8\xa91\x0d\xb8L\xde\xc3\x1e3\
-\x80[fH\xbf\x93k\xd6\xac\xb1r\x03n\xd8\xb0\xa1\
-<5\x18\x00`_j0\xe3o\xe6\xdd\x91\x1alO\
-%\x11I\xa5\xf9Db\xe7>\xbd\xa7\xf2+ P\xda\
-rS\x94\x7f\x81\xba@\xb7\x1bdF\x02O[b\x97\
-\xc7\xe0\xf6\x847\xc7@\xb6u\xaez\x8f\xb8\xc7\x10\xc7\
-\xbau\xeb2\xa5\xe4\xa0\xb6\xdc\x80if\x00\x88;\xd1\
-\xe3\xdeN#\xfe\xb8\xd0z\x9d\x94\xff_\x09\xfd\xad>\
-I\xe8\x01\xad\xf71.\xe5w\x19C7\x99\x91\xbar\
-W\xa2+o\xc0\xc9\x0a\x90\x00\x81\xf6W\xef.\x99\xc1\
-\xf1\xdak\xafeK\x00\x80\xf4\xe0\x12\x00\xf6\xb2\xf4\xe0\
-\x8e\xf5\xc5\x95\x1e<\x06\x16\xe1\xee\x0e\xec\xa1;\x86a\
-\x95_\xe5\xf4[[\x83\x85B\xe1\xc9\xb3\xce:\xab\xfd\
-\xfc\xf3\xcf\xaf\xe5V~\x0d\x99\x91\xff\x1f\x1bp\x1d`\
-\xabX\xffH\x1cu\xd4Q\x15q\xca\x0c\xa6\x00\xcf?\
-\xff|EYz\xf0\x0f>\xf8@\xe6\x06\xac\x90\x8b\x80\
-s\xe7\xce\xcd2*\xa3\x5c`\xe1\xcc+\xe7\xc4\xea\x8b\
-%\x94\x98\x13\xab\x8fa\xd1\xd1\x89\xd5\x97\xe5\x04\x01\xfb\
-xin\x11FU\xfeN\x11\xb7\x1f\xfb\xee\xd3/\xbb\
-\xec\xb2\xc2w\xbf\xfb\xdd\xf6SN9e\xff\xef|\xe7\
-;\x0d\xcc\xca\xaf+3p\x92\xdb\xa81\x0dP\xad\x00\
-d\x1fJ\xf4\xed\xdbW\xba$\xb3\xcb\x8c}\x11p\xc3\
-\x86\x0d\xe5m!dH\x92\x05P\x05\x00\x80\xe3\xc0\xb4\
-i\xd3*\xb8\x94\xdfkw\x80C\xf9u\x9e\xc5\xa4\xf2\
-{\x09\x15\x87\xf2\xeb<\x8bI\xe5\xf7\xb0B\x8a\x86\xdf\
-\xfc\x9dJ\xac\xff\x07p3\xb2\x00\x1a\x08\x00\xf6S\x08\
-D,\xca\x1fPf\x1eOt\x0dX\xe2\x16g\x00\xed\
-\xbb\xe4\xe5\x97_\xce\x81\xff\x80vx\xc9\x0c\xbc\x01\xa3\
-\xb6On\x03.Y\xb2$\x8f\xe4\xa0\x04\x00\xce\x0eA\
-\x8b\x17/N\x12\x00\xe4\x14G\xa0\x0a.\xe5\xe7\x00\x01\
-MV\x1fK8q\x1dV\x9f\x01\xc7#\x1dV\x9fQ\
-\x10\xf0\x1b\x1f\xf9L\x92`#\xde\xcc&\x94_\x86\xf1\
-R\xf7\xd1\x1f\xc2M\x07\x0c\x18\x80\xa4\x1c\xfb\x9b\x00\x81\
-\x10!\xe1U\x99\x91\xeb\x00w\xd8\xda\xe8\x06\x00\x16C\
-\xb0\xbe\xbe\xfe\xe67\xdf|3\x7f\xe2\x89'\x1e\x88\x14\
-g^\xcfD\xfd\xd9NVOh\x99y\xe0\x81\x07J\
-\x8e@\x00\x00\xb2\x00\xbc\xef5o\xde\xbc\xe4\x9c9s\
-\xf2\x00\x00\xc1\x05\xa8\xe4R~\x93 \x10\x90\xd5g4\
-\xa1H\x10V_\x04\xd7\xe3 \xac># \xa0;.\
-T\x97|\xb6\x1ex\xab\xd1\xfc\xb2\xc2\xa0\xf2\x97\xbd=\
-\x13;\x13{\x1a\x01\x81\x08Ia\x00x)\x05\xe8F\
-$l!\xca\x9d\x0a)\xff\xbf\xd06\x02\x80Id\x8e\
-\x17z\xf7\xee]\xeb\xf7l\xc2\x13\x10d\xa0\xc02s\
-\xcf=\xf7$\xef\xbb\xef>\xd5\x15XO\x97g\xcd\x9a\
-e\xf9\x10K2\xd0\xcd7\xdf\x1c\x08\x04\xce<\xf3\xcc\
-\xbc$\x03\x05 \xe7D\xc9+\x17\x86\xd5g$\xa5X\
-\x18V_\x08\xf2Q\x18V_$\x10\x08:\x1e\xe7\x9d\
-w^\xb2O\x9f>\xedc\xc7\x8e-~\xf2\x93\x9f\xfc\
-ZEE\xc5;\x11\x95\xdf)\x88\xe7\xbfL\x81@\xd4\
-\xb4p\xa0\x12\x8bx\x028\x86\xf9\x01\x80\x08\x1b\xb6U\
-\x00\xc0\xcfl\x16\x84\xe3\xa1\x92\x81\x04\x1dX[f\xee\
-\xb8\xe3\x8e22\x10\x01@0\xff\x9e\x8e\x8e\x0e\xdc\xa0\
-V\xe6\x06\xbc\xf1\xc6\x1b\xb5n\x00\xbfeI\x07\x0e\xa1\
-Xa\xf2\xcaEa\xf5EJ*\x1a\x85\xd5\x17@\xe8\
-\xa2\xb0\xfaB=k\x14\x0f\xbf^\xbdz}9\x97\xcb\
-m\x14\x1e|[#*\xbf\x13\x08D\xb6\x04L$\x86\
-\xc5t\x07AE\xc4\xd7#\xbd\x00@\x09\x1e\xf2/\xd1\
-/7\xdb\xd6I\xbc^\xa6*\x1d\xb8\x0dQ\x81\xfc\xae\
-\xb1\xd3\x81\xe9\x85\x1e\xce\xb3w\xd2\xa4I\xd6\x8dd@\
-\x90\xeb\xaf\xbf\xde\x13\x04\xc0XR\x02\x82\x845\xad\xc3\
-\xb2\x08M\xa4\xf9\xd6N+n\x82\xd5\xa7\x9b\x22:.\
-\x16aT\xe5\x97f\xbf\x88\xc5\xbfU\x83\xd5\x17$i\
-\x87\x11K\xc0Tjx\x00\xc0\xc9'\x9f\xbc\xff\x83\x0f\
->\x98'\x05\x9f\x9c\xe8\x1a5\xc8\xae\xfc\x96\x05\x80\xf6\
-\x0a\x8bA\x0b\x00\xc4\xc2\xa7\x15\x10\x04\xf1\x00\x08\x00\xba\
-S{]\x9f\xd9\x1e\x10\x04Y\xbe#\xad N\x980\
-!I\x16@\xbd\x0c\x09v\xf5\xd5W;\x82\xc0\xd9g\
-\x9f\x9dSB\x82\xb5\x22\xb51\xd7\xc2\x93)\xe5\x0f\xb8\
-X\xc9\xc2\xea\xf3Xx2\xc9\xea\xd3zv\x13\xca/\
-\xdf\x84\x02\x04\xfcX}N1\xfc\xfc\xf6\xd3\xed \xf0\
-\xa0.\x08\x98\x5c\x90\x95\x91\x85\xf0VF\xa0Q\xa7]\
-\x00{\xcc@\xa4$\x17\xbf\x9d\xab3\x05P\x0f[H\
-0\x04\x05\xed\xf2\xec2$\x98\xcc\x0d\x88\xec\xdeF\xf6\
-\x10\xc7\x8d\x1b\x97DtS%7`\x99I\xd1\xbf\x7f\
-\xff\x9c\x12\x14\xb4\x15)\x8d\xb9\xb6\x9eL+\xbf\xe6v\
-%+\xab\xcfa\xeb\x89\x83\xd5\xe7\xd9\x06\x93\xca/\x95\
-T\x84\xe4vc\xf5\x95Bi+o\xfe\xed\x01A`\
-\xab.\x08pl\xc9\x92>T\x22\xd0(\x01\xc0f\xd1\
-\x86\xed.\xcao\x85*W\x9e\xfd\x9b\xe2\x16\x88\xa3\x86\
-\x0d\x00\x00 \x00IDAT\x81\xf4D\x06\x05EL\
-\xc0\xf3\xce;\x0fa\xf9Km@PP\xb2\xd0\x11\x14\
-\xb4\x09\x00\x80\xac\xde\x09\x93\x07\xd0\xe5\xdak\xaf-\xca\
-\xb0\xe0\x08G\x8c\xef\x07\x0e\x1c\x98S\xc2\x82\xb7\x22\x95\
-\xb1\xa9:5X\x84\xa6\x1dl\x5c\x19a\xdc\xac>\xc5\
-\xf9\x84\x93\xd5\xe7\xd8\x16\x0e\xe5\x97\xc2\xae\xa6\xe6RX\
-}v\xe5_G\xe5\x9f\x5c \xc0\xe4`c\xbd\xbd\xf3\
-\xf9\xfc\x7f\xd8\xad\x18\x1f\xe5\xff\x07\x95\xfd\xc5=\x92A\
-+EXpa\x01 *p+\xe9a\xd6\x1e\x16<\
-h\x04/\xed\x03(s\xd5UW\x15\x95\xc4 \xf52\
-7 R\x17#\x85\xb1\xe9:=X\x84\x5c.\xb6\x8e\
-\x8c\xb08X}\x82\x11\xd6-N\x16\xa1\xda\xa7\xa6\x95\
-_\x16\x05\x04\xc0\xea\xeb\xb4\x85\xf1zN\xdc\xaf\x7f\xc2\
-9\x12p\x10\x10pZ\x13hb\xf2\xae\x93\xe6\xfb4\
-\xb1\x8e\xb1U8.\xd9\x95\xdf\xee\x05\xf8\xaa\xee\xdc\xdf\
-c\xc7\xc5J\x0cr\xe1\x85\x17\x229h\xeb\xd0\xa1C\
-\x1b\x95\xc4 \x85\x04\xe7\x01\xb4\xa1)@\x93-7`\
-\x0b\x99'\x9c$\x9bb\xcc\xac>;iioc\xf5\
-9\xd5\xc7\xa2\xfc\x0a\x08t*\xc14\xa5\xf2c\xee\xac\
-\xae)\x9d\xcb\x04\x02\xa6eF\xca:h\xcd\xff\x9b\xb0\
-\xa5&\xb7)\xbf\x9d\x0d8%\x8c\xf9o?dj0\
-d\x06\xba\xf2\xca+ej\xb0\xdaD\x1c\x07Y\x00y\
-\x15\x00\xfa\xf7\xef_\xc3Y\x9f\x83B61\xd7\xe7\xc4\
-\xb5\xe7\x048'bO\x96\xb9\x8dM!\x00'4\xab\
-/\x93\xc9t\xaa[ad\x09\xacT\x94_\x8d\xde\x1b\
-\x05\x04J\xbb\x03\xeb\xd6\xadKb\xd1L\xb5\x04\x0cv\
-\x9f|\xfbOI\xecJ\x04R\x06\x00\xb6d\xa4\xaa7\
-\xe3\xf7\x83.\x00\xba\x00@)9\xa8\x04\x00\x9a\xa2g\
-\xd8\x95\x9f,\x80j9\x05\x90\x00 \xa6\x00\xb9\x98\x94\
-\x9f\x9bE\xe8\xf4v\xe4d\x11:\xb2\xfa8A\xc0\x81\
-\xd2\xab\x03\x02Q(\xbde\xca_SS\xb3\xfa\xb8\xe3\
-\x8e\xeb5|\xf8\xf0\x1a\x9b\x22\xa4M\x80\x00\xe6\xe0T\
-\xc7B\x92I8\xcf\xb4\x99r\x1b\xb6\xf5\xc3\xf1\x89\xf2\
-\xdc\x80eo\x7f\x9b7\xa3|>\xc4\x0eh\x0d;\xff\
-W\xa6\x00Vzp1\x05(\x01\x00M\x01\x9ai\x0a\
-\xc0\x07\x02\x840Ur\x11\x90\x00\xa0\x89\x00 }\xee\
-\xb9\xe76+\x8b\x80y.\xe5W\x16\xc98Y\x84N\
-\xac>N\x16\xa1'\xab\x8f\x03\x04\x1cX}:\x8b\x9c\
-F\x94_\xb0\xfa\x96\x1d}\xf4\xd1\xfb\x93\xec\xb4\x22C\
-\x8f\x03\xab/\x12\x08\xa8\x1ew\x00\x81M\x9b6%\x0d\
-r\x07\xe4\xb3\xb5\xc8~P\xb2\x02wJ\xb3\xdfFf\
-R\xa7'\x0fD5\xffi\xba\x9d\x82\xcea\x11\x10\x00\
-@\x16@\x1d\xe9d\x86\x00\xa0Y,\x026\x8e\x1f?\
-\xde<\x08\x8c\x1a5\xaaJ\xe6\x06$\xc4i$\xe4\xb1\
-\x1aA\x0f\x93\xa2)@\x8b\xdc\x06<\xeb\xac\xb3\xf2\x5c\
-\xca\x1fq\xcb*\xd4\x0a\xb9\xdb\xee\x00\x87\xf2{\xed\x0e\
-p\xed\xaa\xb8Ly\xf2\x1c\xca\x9f\xd8\x19\xb7\xdfr+\
-?\xe9\xa4\x93\xda\x94\xf9y\xd1\x04\x08(Yz-\x10\
-\x10q\xfb\xb5\xfd\x044\x95\x1f\xcf\xbf*\xb1+IH\
-\x99\xf2'\x1c\xd2\x93S\xdb\xe5\xb3\x1f\x1b\xc5\xfc\xc7:\
-\x1btM\xc9\x0dX\xaf,\xd0g`\x01\x88m\xc0\xe2\
-\x84\x09\x13\xcc\x05\xf7A\xb6Q\x91\x1a\x0c\xb9\x01\x8bC\
-\x86\x0c)3_\xc8\x02Ha\x17@q\x04\xcas)\
-?\x07\x08h\xb2\xfaL\xb2\x08\x03\xb1\xfaL\x80\x80\x06\
-\xabO\x0d\x80\xd9\x93\xc60gX\xf9\xd5\x05\xbf\xf4\xc0\
-\x81\x03\x93\x92E\xe8\xf2L\x81@\xc0\xe6q\xb7C$\
-\xea4E \x92c\x0d\xdf\xffg\x1d\x94\xbf\xd3\xb6\xe0\
-\xa7F3\xda&2\x13\xaf\x8e2~\xd8a\x83\x8e\x11\
-\x08\xc8\xdc\x80\xf5\xf6sF\x8e\x1c\x99\x81\x05 r\x03\
-6L\x9a4):\x08\x10\x92TJW`\xb2\x00\x8a\
-dj8\xce]\xc8\x02H\xc1\x0f@q\x05\xces)\
-\xbfI\x10\x08\xc8\xea3\xc1\x22\x0c\xc5\xea\x8b\x02\x02\x01\
-X}\xa5\x10\xd8`\xf5q)\xbfR\x9f_P\x11-\
-\x10pH\xd4i\x92@\x94R,\xa1%\x09\x85\xd5\xe7\
-\xa5\xfc\xb2\xc0\xfb\x0f\xe7v\xef\xde\xbd\x1f\xb2\x12\x1fp\
-\xc0\x01\x81\xc7\x10\xbe5\xd0-\xe1\x0a\x8c\xdc\x80\xf5n\
-\xe7\x8e\x1d;6C\x00P\x14\xae\xc0\xf5\x1d\x1d\x1d\xe1\
-A\x80\x10\xa4B\xc9\x0d\xd80b\xc4\x08\xcf\x85\x0b\xb2\
-\x00R\xf0\x04Tr\x03\xe6\xb9\x94\xdf\x04\x08\x84d\xf5\
-Ea\x11Fb\xf5\x85\x01\x81\xa0\xfdC\x82\x969\xf1\
-\xc4\x13\xf7\x93\xac\xbeL&\xb3\x81C\xf9=\xfa\xc4\x0d\
-\x04\x068\x81\x80b\xf6\xdb\x13u\x9a\x00\x01\x95\xf7\xbf\
-\xd8\xa6\xfc;\x5c\x94\xbfKZ\xb0l6\xfb\xf8\xe5\x97\
-_\xde|\xea\xa9\xa7\xee\xa7P\x89\xb5\x0ex\xd5B\xa7\
-`]\x8b\xe4\xa0\xbe\x91\x90n\xb9\xe5\x96\x0c,\x00A\
-\x06\xaa\x9b1cFp\x10\x98:uj\x85\x92\x1b\xb0\
-\x9e\x04\x22\xa9\xfb\xc0\x82\x0b\x10\x94\x81\x16\x85\xd5\x17\x86\
-E\x18\x85\xd5\x17\x86Eh\x84\xd5\x17\xa4o\xa2x\xf8\
-\x1dr\xc8!\xff.Y}$\xe4[9\x94?*\x08\
-(Yz;\x1d\xb2\xf4Fe\x11\xa6\x94\xcf'C(\
-\xbf\x04)x\xfe\x1d\x8a\xcc\xc7J}Z2\x03>\x0d\
-tI\xc9\x0d\xa8\x1d\x06m\xe2\xc4\x89iX\x00\x82\x0d\
-X\x987o\x9e>\x08\xcc\x9e=;+\x03\x82\x80\x0d\
-\x08za\x10\xf0\xc0\x83\x07\x11vC\xac\xbe ,B\
-\x13\xac\xbe ,B\xa3\xac>\x9d>\x8a\xea\xdeK\xc2\
-\xfe\xb6\x92\x08\xd3\xee\xcejL\xf9C\x80\xc0\xb9\x8a\xd9\
-\xbf]\xc9\xd2\x1b\xd5Y\xa8\xe8\xa0\xfc\x90\xfb\xc7\x03*\
-\xbf=\x0f\xc0\xa5\xf2\xf9I/rr\xcdCWf\x94\
-\xdc\x80\x81\xa7\xb8w\xdf}w\x1a\x16\x80\x88\x07P\xb3\
-h\xd1\x22\x7f\xcb\x83N\xcc\xe2\x02 \x07\x02\x0a \xb0\
-\x00\xd7B\x97)\xe5\x0f\x22\xf4\x86Y}:,B\x16\
-V\x9fW_\x99\xf2\xed\xd7\x98\xeb\x1aQ\xfe\xa0 @\
-\xd3\x92\xf3\x15e\xdc\xaed\xe9\x0d\x0c\x024\x9f.\x81\
-\x80\xd8\x92T\xc7pa\x08\xe5\xdfa\x9fr$\x94=\
-\x7f\xec\xb0\x04\x91\x19\x01\x00\xa1\x17\xb9\xe9E\x9e&}\
-. \x22\xd0\xe2\xc5\x8bs\xcb\x97/w\x07\x81%K\
-\x96ddn@D\x04BvQ\xae\xad.\xd3\xca\xaf\
-#\xfcL\xac>/\x16!+\xab\xcf\xa9\xcfL\x13{\
-\xecN.6\xe17\xa6\xfc\xba p\xf8\xe1\x87W=\
-\xfe\xf8\xe35MMMC\x14\xb3?\xb4\xc7\xa0b\x09\
-\xec\x87\x22B\x8e[\xefBE\xf9;C(\xff\xaf\xa9\
-\xe4\xec\x00\x10Tfh\x0a\x10y\x9b\x9b\xf49MS\
-\x80\x1a%7\xe0\xae\xe7\xf9\xf0\xc3\x0f\xad\x7f\x9e\x7f\xfe\
-\xf94\xf2\x02\x00\x00\x10\x13\x10YE\x0d\xed=;*\
-\x013\xab\xcf\x89E\xc8\xc9\xeasb\x11\xc6\xc2\xeaS\
-\xfb\x8e\x8b\xd5\xe7\xc0ncQ~?\x10\xa0\xb7a\x06\
-I5\xe1@\x04\x10\x80%\x900\xe06,\x16\xb0\xeb\
-\x11r\x9c>\xdbE\xf2\x91(\xca\xff{*\xed^\xfd\
-\xa0)3\xc6\x1c\xdd\x16.\x5c\x98\xa2\x17|\x0e\x00\xf0\
-\xea\xab\xaffK\xb9\x01\x91\x18\x04\xb9\x01\x91\x18D\xe4\
-\x06\xcc=\xfc\xf0\xc3\xc9\x84\xc1\xc3\xa9a1\xb0\xfaT\
-eh\x8a\x81\xd5gg\x11v\x8b\x93Eh\xf3\xed7\
-N\xec\xb1\x07\xb7PRv\x19U~\x0f\x99\x91c\xd8\
-\x03 \x00K@g\x8bP\x13\x04\xach\xc3W\x5cq\
-E\x81\x8e'd8\xb3\x90\xca\xbfA\xf4\xa7o?\xf8\
-\xc8\x8cqWw\xd2\xef\x94\xcc\x0b\xf0\xce;\xef8\xa6\
-\x06\xabZ\xb4hQ2\xc1p8\xa5\xb1\x8a\x81\xd5W\
-\x8c\x99\xd5\xb7'\xb0\x08\xd9X}\xf6Uw.\xe5\xf7\
-\x93\x19X\x02:[\x84\x01\xd7\x04\xe0\xa6;M$$\
-\x8d\xa2\xfc\x07\xd9\xfa7\x8c\xcc\xb0\xa5\xcc{\xf1\xc5\x17\
-\x93\xb0\x006m\xda\xb4\x0b\x00\xd6\xaf_o\x01\xc0\xf2\
-\xe5\xcbY\xd9D4x\x05\xdb`\xd6q\xd6'\xb8\x03\
-j\xc7\xb60\xd7\x97\xb2e\x22fe\x11\x8a:\xed\xac\
-\xbe,\x87\xf2\xcb\xdf\xb2\xd9l\x19\xb1\x87\xfe_\xc1\xa1\
-\xfc\x8a\xccT\xfa0AM\x80\xc06\x05\xe4\xb6\xa9\xca\
-\x8f\xac\xc4\x5c\xca\xef\x223\xed\xdc2S\x96\x1c\x14S\
-\x00\x09\x00\x98\x02\xc4\x91\x1b0\x8e7\xa4\x1b\xab\x8f\x91\
-E\xe8\x94\xa8\x935!\xa9\x93\x85\xa3aU\x99d\xf5\
-=\x7f\xec\xb1\xc7\xf6\x9a?\x7f~\x96C\xf9\x03\x8c\xa1\
-\x11\x10\xb0+\xbf[83\xc3\xca\x1f\xab\xcc\xacY\xb3\
-&[\x96\x1bp\xf3\xe6\xcdIp\xa7er\xd0\x18r\
-\x03\xc2\xdf\xbc\x92s\x8e\xec\xc2\xea\xe3d\x11:\xb1\xfa\
-\xf2\x9c\x03\xea\xc5\xea\xf3\x00\x01c\xbe\xfd\xf4\xffs\xdf\
-\xf8\xc67>!Y}\x82;\xc0\xb6\xc6\xe1 3F\
-A\xc0\xb6\xdba\x99\xfdb:P\x16\xce\x8cQ\xf9\x8b\
-\xdc2\xb3d\xc9\x92Je\x0d\xa0Kn\xc0\x14Y\x00\
-\xd527\xe0\xcf\x7f\xfes\x8e\xdc\x80\xea\x8a5\xcb*\
-\xb9\x0f\xab\x8f\x83E\xe8\xc5\xeac\x19P\x1dV\x9fP\
-\x9a,\x87\xf2\xabs~$\xb8TX}y\x0e\xe5\xf7\
-\x90\x19# \xe0\xb2\xcba\x15\x05\x04:E\x88s\x16\
-\xe5w\x93\x99(\xd1\xb5\xd5\x83\xac\xb4*\xb9\x0d\xb8v\
-\xed\xda\x8c\x1bB\xa4\x08\x00j\x98r\x03:\xedY\x1b\
-\x05\x01MV\x9fI\x16\xa1\x0e\xab\xcf(\x08\x04d\xf5\
-\xb5\xc3\xb7?\xc1\xc8\xea\xfb\xde\xf7\xbe\x97\x91\xf5\x99\x1e\
-CM\x99\x89\x04\x02^\xca\xaf\x80@\xc9:P\x92\x9d\
-\x18W~'\x99\x11\xae\xc0\x91d\x86\xf4\xb9Z8\x02\
-\xe5W\xae\x5c\xe9m\xdd\xd3\x89\xa99s\xe6\x14\x0c\xe7\
-\x06\xf4\xf2Z3\x02\x02\x01Y}&X\x84AX}\
-F@ \x0c\xab\x0f\xc4\x1e.\xe5w\xa8\xcf\xd8\x18\x06\
-\x94\x99\xa0 \xa0\xad\xfc\xb2\x8f\x94\xdd\x01\x80\xc0F.\
-\xe5w\x90\x99\x1e\x82\x0c\x14JfH\x8fs27\xe0\
-\xa2E\x8b\xb4s\x03\xa6\xe9\xc2:\x85\x0c\x14%7\xa0\
-\x8e\xdfz$\x10\x08\xc9\xea\x8b\xc2\x22\x0c\xc3\xea\x8b\x04\
-\x02QX} \xf6\xc0\xb7?\xc1\xcb\xea\x8b\x9a\x8b0\
-(\xd7!\x0a\x08\x04R~\xd9o\x00\x81\x5c.\xb7\xe9\
-\xd0C\x0f=r\xf3\xe6\xcd\x15\x5c\xca/\x0fP\xea%\
-\x17\x00t\xe0\xa0Q\xb7\xc9\x82\xcf\x85\xce\x0d8u\xea\
-T\x8bM$\x00\xa0i\xcc\x981ar\x03\x06a\xae\
-\x85\x02\x81\x88\xac\xbe0,\xc2(\xac\xbeP `\x8a\
-\xd5\x07\xcf\xb6\x04/\xab/l.\xc2\xb0lG?\xa5\
-\x92\xfd\x8b\x90\xe3\x1f%vQ\x88\x03+\xbf4\xfb{\
-\xf6\xecy\xf8\xb8q\xe3\x1a\x08\x5c\x0fp\x08gfL\
-\xf9\xd5\x97\xa9d\x03\x12\x00\xb4\xeaF\xdf\x9e8qb\
-\xdeDn\xc04x\xc5\xba\xb9\x01\x11\x13P\x06\x04\xa1\
-F\x86\xe1\xae\x07e\x11\x9a`\xf5\x05a\x11\x9a`\xf5\
-\x05\x02\x01\xd3\xac>\xc1\x9a\xe3d\xf5\x05\xcdE\x185\
-\xde\x81=\xa8j\xd1\xc1\x0a@\x7f\xbc&\xde\xfc\xdb\xc3\
-*\xbf4\xfb\x8f?\xfe\xf8\x16\x8fpf\xc6\x94_\x1e\
-\x08\xb3\xa7\xc4\x03h\x190`\x80\xa7\xcc\xdcr\xcb-\
-5&s\x03f\xc6\x8f\x1f_\x94\xb9\x01\x87\x0d\x1b\xe6\
-\x9b\x1b\x10)\x8d\x91\xda\x98snm\x98\xd5\xa7\xc3\x22\
-4\xc9\xea\xd3\x02\x01.V\x9f\x03o\xde4\xabO7\
-\x17\xa1\xa9\x88G)\x19^\x0cE\xbc\x99\xe5\xf3\xe2\xf9\
-\x97&\xca\x03x\x86V~\xd9\xbfP|\x8fpf\xc6\
-\x94_}\xb9\x22\x22\x10\x02\xf0\x8a\xa0\xa0\x8e2s\xe3\
-\x8d7\x16DH0\xe4\x064\xb35K&O\x86\x00\
-\xa0I37`\x1bR\x1as\xae\xae3\xb1\xfa\xbcX\
-\x84\x1c\xac>O\x10\xe0f\xf5\xd9@\x80\x83\xd5\xe7\x97\
-\x8b\xd0h\xccC%\xbcX\x0f\xf8%\xd0\x8b\x0a!\xc7\
-\xb1v\xf5\x8b\x84O\x00\xcfDH'\x9f\x802\x13y\
-\xdb\x19/Y\x01\x00m\x83\x06\x0dBX\xf02\x99!\
-\x0b\xbdV\xa4\x063\x9f\x1bp\xd4\xa8Q\x99k\xaf\xbd\
-\xb6\x19Q\x81=r\x03\xb6!\x95\xb1\x89\xfa<X\x84\
-\x9c\xac>'\x16!'\xab\xcf\x11\x04\xe2b\xf5I\x1e\
-=#\xab\xcf-\x17!K\xd4c\x04\x1aE\xb4az\
-;\xb6\x1ew\xdcq\x07UVV\xaeH\x04\x88k\x90\
-\x08\xe1\xe4\xa3)3\xc6\x1c\xcf\xf0\xb2U\xa2\x02#1\
-\x88%3W_}um\x1c\xb9\x013d\x014\xab\
-\xb9\x01\xf10\x02\x00\x90\x84\xc1\xb4\x07\xa1}~W\x17\
-\x03\xab\xafl@c`\xf5\xd9A\xa0\x18'\xabO\xf5\
-\xedgb\xf5\xd9C\x8e\xd71\xe6=\xb0\x9e\xf7\x98c\
-\x8e\xd9\x0f\xc9G\xc4\x96\x1d\x9b\xf2k\xca\x8cq\xd7s\
-\xbct\x05\x00 1H\xd3\x90!C\xeab\xcb\x0d8\
-t\xe8\xd0\x0cM\x01Zdf \x00\x00\xa1Rw\xa4\
-.\xe6\xa8\xcf\xcd_\x9a\x99e\xb7'\xb0\x08\xf7&V\
-_\x17\x9f~.\xe5\x17f\xffR\x91\xa4\x93]\xf9}\
-d\x86\x8d\xd5G/\xdf\x1c\x00\x00\xa9\xc1\x08\x00ZE\
-j\xb0xr\x03\x0e\x1e<\xb8\xc6\x96\x1b\x90\x15u\x1c\
-\x18aE\xce\xfa\x04\xe8\xb4\xc7\xc5\x22\x14u\xb6\x84`\
-\x84\x19c\xf5\xc1\xb7?\xc1\xc8\xea\xb3\x83\x9ca&h\
-\x99\xf2\xa3\x8d\xa9T\xaaL\xf9cb\xf5\x95\xe5\x93\xe4\
-\x96\x99\x8b.\xba\xa8\xa8\x00\x00\xf2v$\xd9\x95\x7f7\
-\xe4\x06tc\x84\xe5\x19\x95\xbf[\x9ch\xee\xc2\xea\xf3\
-\xdb\x224\xca\xea\x03\xb1\x87Q\xf99\xc7\xb0\x8b\xf2\xdb\
-\xe7\xfc\xbb\x8b\xd5\xc7)3\xa4{\xf527 \x01\x80\
-\xcc\x0dX\x1c=z4\x1f\x08\xa8\xb9\x01/\xb9\xe4\x92\
-V\x98!4\x05\xe8\xc6\x98\x1b\xd0>\x7f,0\xb3\x08\
-\x9dX}E\xce\x01u`\xf5\xe9l\x11\xb2\xb0\xfa@\
-\xec\x81o?\xd7\x18\x8a\xcf\xbc\xc1u\x1c_\xe5\xcfd\
-2;\xc4t@\x87\xd5\xd7\xcb\x80\xf2\x17\xb9ef\xe0\
-\xc0\x81\xf5r\x0d\x00\xb9\x01iZ^-\xd7\x00n\xbc\
-\xf1\xc6\x86q\xe3\xc6\x99\x07\x01\x99\x1bPl\x03\xb6\x10\
-\xf2X\xf37\x02\x80,\x01@w\x86\xdc\x80n+\xc8\
-\x5c,B/V\x1f\xcb\x80z\xb0\xfa\xec\xa1\xa2R\x1c\
-\xca\x9fpf\xf5\xd9Y\x84&\x95?\xeb5\xb6\xa6\x95\
-_\x9d\xf3+ \xe0\xc6\xea3\xa2\xfc\xdc2C\xd3\xed\
-\x06\xa7\xdc\x80\xc3\x87\x0f\xafRv\x01\xeao\xbb\xed6\
-s p\xd3M7U*\x8e@\xcddr\x94u\x12\
-\x01@\x16\xbb\x00\x06s\x03\xfa\xed!\x9bf\x11\xea\xb0\
-\xfa\x8c\x0e\xa8\x06\xab//\x14\xc7\x02\x01\x9aj%\x13\
-1\xb1\xfa\x0c\xe5\x22\xf4c\xf5E\x01\x81@\xca\xaf\x80\
-\x80\x13\xab\xef\x1d\xd3\xca\xcf%34\xcdn\x90~\x00\
-N\xb9\x01G\x8c\x18Q5f\xcc\x98f8\x02!\x9f\
-\xc7\xa4I\x93\xa2\x83\x00!I)7 \xfc\x00\xc8\xd4\
-p\xec$\x02\x80,\xfc\x00\x0c\xe4\x06\xd4\xf5\x223\xc5\
-\x22\x0c\xc2\xea32\xa0\x01X}y\xe1m\xd6\xa3O\
-\x9f>\xed\x5c\xca\xaf\xd4g\xca3O\x97\xd5\x17\x06\x04\
-B)\xbf\xec#a\x09HV\xdf&.\xe57-3\
-\xa4[E\xc5\x13\xd0+7`\x95\xe2\x09X\xdb\xd1\xd1\
-\x11\x1e\x04\xee\xba\xeb\xaeJ%7`\x13\x99\x18\x9e\x9d\
-Do\x91,<\x01#\xe4\x06\x0c\xeaG\x1e\x95E\x18\
-\x86\xd5\x17i@\x83^\x8fH;H\xd4\x09V_\xaf\
-^\xbd\xbe\xcc\xa5\xfcA\x957\xaa\xf2\x87\x1c\xf3H\xca\
-/\xfb\x0d\xfd\x90\xcb\xe5\xde=\xf4\xd0C\x8f\xfa\xf0\xc3\
-\x0f\xd9Y}Qe\x06\x89A\x82\xe4\x06$\x00\xa8T\
-\xb8\x00\x85\x193f\x04\x07\x01[n\xc0\x22\x99\x16\x19\
-\xcd\x87\xcd\x0a.@,\xac\xbe\x08,\xc2(\xac\xbeP\
-\x03\x1a\xc5\xc9\x07\x89:\xc1\xea\x13J\x1c\x1b\xab/ \
-;/\xf2u\x1ecaD\xf9\xa5\xd9\x7f\xd0A\x07}\
-%NV_X\x99Ab\x900\xb9\x01\x11\xc7C\xb2\
-\x01g\xce\x9cY\x13(\xd4\xff\x83\x0f>\x98U\x02\x82\
-4 \xdbh\x10\xf0\x00\x11(,#,\x8e7\xb9!\
-V_1\x86\xb7@i\xce\x8f,\xbd\x92\xd5'\x949\
-6V_\xd07yT\xcbA\xdc#\xcf\xa5\xfc\xd2\xec\
-?\xe1\x84\x13\xda\xe3d\xf5\x85\x91\x99\x88\xb9\x01+\xc8\
-\x02\x90\xf1\x00\xf2O>\xf9\xa4?\x08 7\xa0H\x0d\
-\x86\xdc\x80u\xc82\xca<\x977\x15MF\x97Eh\
-\x92\xd5Wd\x9c\x07vY\xf0C\x96^)\xf4X\xd0\
-\xe2R\xfe(sy\x13k\x07\x92\xd5'\x02\x8d\xb2(\
-?\xfa\x17\xdc\x01\xc9\x22\x8c\x8b\xd5\x17Tf\x0c\xe4\x06\
-\xac\x90\x11\x81\x9e~\xfa\xe9\xea\x15+V\xb8\x83\x80\x9a\
-\x1b\x10\x11\x81\x90]\x94y5\xdf(\xb1G\x83E\xc8\
-\xc1\xea+2\xac\x04\xbb\xae\xf6\x0b\xe5\xb6\x14\x5c(w\
-l\xac>\xbf\xd5|C\xac\xbeR83\xb0\xfa\xe6\xcd\
-\x9b\x975\xa4\xfc\x1b\x9d\x16\xfc\x14\x16al\xac\xbe \
-2C\x00\x10\xb9\xbe9s\xe6d\x05\x00\xe4W\xadZ\
-\xe5\x1c\xe7\xd3\x96\x1b\xb0\xf0\xc0\x03\x0f\x18\xf1\x08\xd3a\
-\x84\xc5\xb1\x9f\xcf\xcc\xea+\x1a\xdc\x0b\xf6\xdd\xea\x83\xd0\
-K\xc7\x16\x05\x04ba\xf5\xb9\xed\xe7\x9b\xf4\xed\xc7\x96\
-$\xfc\x12\x04\xab\xaf\x17M\x7f\x9e\x0b\xa9\xfc[\x15\xe5\
-?\xd8m\xb5\xdfM\xc99Y}\x86e\xc6\xf7 \xbd\
-\xce*Q\x81w\x8d\xd3\xe6\xcd\x9b\x91\x1b0%\x13\x83\
- *\xf0\xdc\xb9s\x8d\xba\x83z1\xc2\xe2\xf0\xe8\xe3\
-\xf6 t\x1a8nV\x9f\x0d\x04\xe0\xf1\x16\x1b\xab\xcf\
-\xee\xd1\xc7E\xec9\xf6\xd8c?!Y}\xd9l\x96\
-E\xf9\xbd@\x80\x9b\xd5gHf\xb4\x8fg\x9ey&\
-#\xf3\x02l\xd8\xb0\xa1\x94\x18\xc4\xca\x0d\xf8\xe2\x8b/\
-\x02\x00\xaa\x9fx\xe2\x09\xae,6{\x8aO\x7f\xdc,\
-B6V\x9f\x00\x81\xbd\x95\xd5W\x95J\xa5\x96\xa9\x9c\
-\x85\x10\xca\xbfIG\xf95d\xa6\xb8\x87\xcaL\xe0\x83\
-^\xf4\xe9\xb2\xe4\xa0*\x00\xacX\xb1\x22\x9d`<\x1c\
-h\xaf\xdc\xac\xbeL\x9c\xf5\x899e\xf7\x10\x8c\xb0\xd0\
-\x1e~j\x96^\x11\xe4#VV\x9fa@\xed\x12\xc6\
-\x8b\x94\xbdL\xf9m\x84\x1ec\xca\xef&3q\xb0\xfa\
-B\xcaL\xe8c\xdd\xbau\xe92\x0b\x80\xa6\x00Y1\
-\x05\xd8g\x01\xc4\x8f\xe6FY}G\x1f}\xf4\xfe\x8c\
-\xca\xcfi\x018\xc5\xf0sd\xf5\xd9,\x00\x93\xca\xbf\
-\xd7[\x00k\xd6\xacI\x97M\x01\x90\x1dX\xae\x01\x88\
-E\xc0}k\x00\xf1\xcd\xe7\x8c\xf9\xf6#K/\x12u\
-\x82\xd5\x87\xb0X\xd8\xe2\xe2\x1aC\x865\x00_\xe5\xa7\
-\xf69\x85\xf2\xe6T\xfe\xbdz\x0d\xa04\x05Pw\x01\
-\xc4\x22\xa0\xb5\x0b0m\xda\xb4}\xbb\x00\xbc+\xba\xc6\
-\x89=X\xe9\xc5\xd6\x99pn\xb1\xb3\x08M*\xbf\xc9\
-]\x00_\xe5\x97o|{83\xf4\x03\x97\xf2\xef\xad\
-\xbb\x00\xa4\xe7\xe5\xbb\x00\xea\xb1\xcf\x0f\xc0\xdc@\xda\x7f\
-\xb7y\x9b\xb1\xb1\xfa\xe0<#\x1di\x0c\xe5\x22\xe4\xf4\
-\x03\xd0V\xfe\x84K838Gq(\xbf\xee\xef\x9c\
-2#r\x03\x1a\xf3\x03 \xfd\x86\x1f\x80w\x96/\xe4\
-z\x97\xc9A\x91\x19h\x9f'`\xf8\x81T\x16yd\
-\x0c\xf9\x1eH*\xc1\xa5\xfcJ}\xa6r\x11rz\x02\
-\x06V\xfe\xc4\xae\xcc>\x9dj\xb2\x93L&\xf3.\x87\
-\xf2s\x80@\xdc\x9e\x80\xf7\xdf\x7f\xbf\xbe'\xa0<\xf6\
-q\x01\xcc\x0d\xa4\xd2'\x0d\x92\xd5\xb7\xdf~\xfb}1\
-\xc1\xcf\xea\x8b\x9a\x8b\x90\x93\x0b\x10Z\xf9e\x1f\xc98\
-\xff\xb9\x5c\xee\xbd\x83\x0f>\xf8\xeb\x5c\xcao\x12\x04v\
-\x07\x17\x00z\x1c\x88\x0b \x8f\x8e\x8e\x0e\x8b\x0d(\xe8\
-\xc0\xfb\xd8\x80\x11\x06R\x0a\xe7\xc6\x8d\x1b+$\xabO\
-lgq\xb3\xfa\xc2\xe6\x22\xe4d\x03FV~9\xe7\
-\xa7\xeb\xde\xed\xd5\xabWozAY\xac>\xc1\x1d0\
-\xae\xfc&@\xe0c\xc5\x06\x94\xc7\xa4I\x93*dr\
-\xd0\x1bn\xb8\xa1q\xc4\x88\x11\xfb\xe2\x01D\xf4\xf0#\
-\xc5\x7fG\x9a\xaf\x0e\xf1\xe98X}As\x11\x1a\x8d\
-\x07`\x0b/fL\xf9\xc5\x9c\xff\x10\xdc\x0cY\x90\x15\
-V_\x9eK\x89\xc3^o*\x1e\x80\x08\x08\x12O<\
-\x00yL\x980a_D C\xca/\xcd~\x84\xa3\
-r\x88O\xc7\xc9\xea\xd3\xcdE\xc8\xc1\xeak\x17\x81F\
-Y\x94\x1f\xfd\xab\x863\x0b(3EC2\xb3\xc7D\
-\x04B\x16o\xe8\xab\x8c\x084e\xca\x94\xe8\xdb\xc1\xe3\
-\xc7\x8f/\xc5\x04Df\xa0!C\x86\x94\x09\xc6\xbe\x98\
-\x80\xfa\xca/\xcd~\xe1\xc1\xd7\xe9\x10\xae\x9a\x8b\xd5\xe7\
-\x97\x8b\x90\x8d\xd5\x07b\x8fA\xe5\x7fWU~\x87\xfa\
-te\xa6hXfb\x89\x09\xd8\xaf_\xbf\xf6\x01\x03\
-\x068\xc6\x04\x1c9rd\x15\x82\x82\x1a\x8d\x09(\x8f\
-}Q\x81\xcd\xfb\xf6C\xf1\x1db\xd6s\xb2\xfa\xdcr\
-\x11\xb2\xb2\xfa\xe0\x9c\x84\xd0\xe3\xa9T**\xab\xef\xbf\
-\xa9\x1c\xea\xb6\xe0\x17@f\x8aL2\x13kT\xe0\x0b\
-/\xbc\xb0\x94\x5cE\x89\x0a\xdcd<*\xb0<\x90\x17\
-@&\x07\xdd\x97\x17 \x9a\xf2KA\xb7\x81\x00\x9b\xf2\
-\xbb\x81\x00\xb2.\xc5\x90\xab\xef \xb8)\x8b}{\x16\
-\xe5\x0f 3Ef\x99\x89-/\x00\x12\x83\xc4\x96\x17\
-@\x1e\xfb2\x03\x99S~\x1b\x08\xc4\xc9\xea\xcb;d\
-\x22\xe2b\xf5U\xd3\x9b\x7fyDV\x1f\x94\xff\x93~\
-\xca\xaf!3\xc5=Tf\x02\x1f\xc8\x0c$s\x03^\
-y\xe5\x95\xa5\xcc@d\xa9\xf3\xa7\x07\xdb\x97\x1b\xd0\x9c\
-\xf2\xcb\xdf*++\xcb\x88=\x5c\xca\xaf\xf4i\x9d\x0d\
-\x00*9\x94\x9f\x8ae\xf6\xdb\xdf\xfc\xf0\xed\xe7P~\
-\x0f\x99i\x89Sfb\xca\x0d\xd8\x88\xd4`\x02\x00b\
-\xcb\x0d\xd8%;0\xd6\x00\xf6e\x076\xcb\xea\xfb\xda\
-\xd7\xbe\xd6\x9dK\xf9]X}\x91\xdd\x86\xdd\x94\xdf\x8d\
-\xd5\x07\xb7^\x0e\xe5\xff\x18\xc6\x82\x08|`\xfa-\xa6\
-\x00%\x0b\xe0\xba\xeb\xae\xe3\xcd\x0e|\xcd5\xd7d\xb0\
-\x0b \xa7\x00\xf4\x10\xf5\x02\x00\xb0\x06\xd0\xf6\x83\x1f\xfc\
- \xcb\xa9\xfc\xdc,B\xa7\xc5\x1b\xcd5\x07c\xbe\xfd\
-d\x09\xac\x94\xac\xbe>}\xfa4q*\xbf\xd8:\xab\
-3\x08\x02\xbe\xcaog\xf5\x09\x10\xe0T\xfe\xa6\xdd,\
-3\x1ck\x009\xb9\x06@\x16@\xd3\x90!C\xea\xe4\
-\x1a\xc0\x0d7\xdc\xc0c\x8d\xd3\xdc\x22\x03?\x00%9\
-h\xb5|\x18e\x11\xb0\xed\xac\xb3\xce\xcar(?7\
-\x8b\xd0m\xe5Vc\xd7\xc18\xb1g\xf8\xf0\xe15\x0a\
-\xab\xaf\xc8\xa5\xfc\x0a\xab\xcf\x04w\xc0W\xf9\xddX}\
-\xf0\xedgR\xfe\xe2\x1e\x223&w\x01rb\x1b\x10\
-\xb9\x01\x9bH\x0f\xad\xb1\x22\x00\xa8Ur\x03\xd6\x18U\
-\xfeq\xe3\xc6eF\x8f\x1e\xdd\xa4l\x03V\xdb\x1fJ\
-n\x03\xc2\x13\xf0\xcc3\xcf\xccr(\xbf\x87\x09\xcb\xca\
-\xeaS\x9f\xc7\xe6m\xc6\xc6\xea\x03w@\xb2\xfa\x0c1\
-\xd0\xfcX}Q@@[\xf9\x13.\xac>\xf8\xf6s\
-(\xff\x9e 3\x06\xfd\x00r27 Y\x88\xcd\x04\
-\x00ecD\x00P\xab\xf8\x01\x98\x01\xb9\x09\x13&\xa4\
-\xc1\x05P\x92\x83V\xb9=\x9ct\x04\x12\x5c\x80,\x87\
-\xf2s\x0c\xa8\xce\xb6\x8d|.\xc9\xea;\xea\xa8\xa3\xea\
-\xb8\x94_Y\xc82\x95\x8bP\x97\xd5\x17\x06\x04\x02+\
-\x7f\xc2\x85\xd5G\xff\xbf\xc7\xa1\xfc\xbb[f\x0cy\x02\
-\xe6\x15O\xc0f\xb2\x00\x1c\xc7\x86\x00\xa0\xa0x\x02F\
-\x03\x81I\x93&\xa5\xc1\x06\x94\xae\xc0\x840U^\xe7\
-\x13\x00\xe4\xa5+056\x8c\x1fyPV_\xe4\x01\
-\x0d\xb2g{\xc6\x19g\xa4\xa8m\xad\x92\xd5\xd7\xdc\xdc\
-\xfc\x99\x04?\xab/j.\xc2\xa0\xac\xbe  \x10Z\
-\xf9\x13]Y}\xef\x1ft\xd0AGs)\xff\xee\x92\
-\x19\x13 \x00\xe7:%7`\x0bM\x01<\x81\xf9\x96\
-[n\xa9Q\xb8\x00\xe1\xb6\xe7\xa7N\x9d\x9aF<\x00\
-\xb0\x01\xc7\x8f\x1f\xdfD\xc8R\xa5s\x1d\x01@^\x92\
-\x81\x022\xc9\xc2\xb2\xfaB\x0fh\x18\xe5jkk\xab\
-\x982eJ\x8dd\xf5\x09\x01\xe7f\xf5\x85\xcdE\x18\
-\x96\xd5\xa7\x03\x02\x91\x95?\xb1\x8b\xd5\xf7\x1e\x94\xff\xb6\
-\xdbnk\xe8\xd3\xa7\xcf\xfe\x82;`\x5c\xf9w\x97\xcc\
-D\x01\x01\xb8\xd5K6 \x01@k\xbf~\xfd\xb4\xa6\
-f\x13'N\xccK6\xe0\xec\xd9\xb3\xab\x03)\xff\xcc\
-\x993\xd3ta\x9dB\x07\x0e\xb4G\x0c\x22\x90\xa4\x03\
-k\xbeu\xa2\xb2\xfa\x02\x0fh\x14\x0f\xbfL&\xd3\x8b\
-\x14x\xa34_\x1d\xe2\xd3q\xb0\xfa\x82r\xc9\xa3\xb2\
-\xfa\xec\x1e\x83)\x0e\xe5\xa7\x02\xb3\xffS\xb8\x19\x94_\
-,|\xdaY\x84\xc6\xdf\xac1\xcaL\xe8\xe7\x85\x1e\xa1\
-?\x04\x00\xb4\x12\x00\x04Z\x9c\xbd\xfb\xee\xbbs\x02\x00\
-j\xe7\xcd\x9b\xa7\xf5\x02Gn\xc0\x14]PP\x02\x82\
-\x84r\x10\xb1\x09\x90\xd7\xbc\xd3\x14\xabO{@M\xb9\
-\xf7\x92\x22ou\x88O\xc7\xc9\xea\xd3\x8d&c\x8a\xd5\
-\x97W\x16>\xbb\x89@\xa3,\xca\x9f\xb0\xb1\xfa\x02\xca\
-Lq\x0f\x95\x99\xd0\xcf-\xfb^\x04\x04i\xa5i@\
-\xa8\xedY\xd2\xe3\x9c\x8c\x08\xb4h\xd1\x22o]~\xfa\
-\xe9\xa7S\xf3\xe7\xcf\xaf\x91!\xc1\x10Q$\xe2*\xa9\
-'\x080\xb0\xfa|\x07\xd4\xb4o?\xb2\xf2(\xf1\xe9\
-\xe2`\xf5\xf9\xc5\x933\xcd\xea\xcb\xcb\x85OD\x1b\xe6\
-R~\xa5>\xbf\xdd\x0a\xd3\xac>.\x99\x09\x0d\x02\xaa\
-\xde\xd0\x14\xa0\x95\x00 \x92\x83\xd6\x9c9s\xaa\x95\xdc\
-\x80\xce\xf2\xf0\xfc\xf3\xcf'\x9f}\xf6\xd9j\x19\x14t\
-\xda\xb4i\x91\x94\xdf\x0f\x04\x18Y}\xae\x03\xcaE\xec\
-\x81b;\xc4\xac\xe7d\xf5\xb9E\x94ea\xf5!\xd2\
-\x0e\xfc\x12.\xb8\xe0\x82\xd6\xde\xbd{\x1f@_-\x8f\
-\xa8\xfc\x7f\xa2\xf2i\xb7\x05?\x0f\x7f\x05.V\x9fi\
-\x99\x09\x0d\x02\xf6\xa9\x17Y\x00F\x22;\x93^W)\
-\xb9\x01w\xf5\xf9\x96-[\x92\xaf\xbf\xfezR\xc9\x0d\
-X\x98;w\xaei\x8f\xbe2\x10\x10\x0c4NV_\
-\x97\x01\xe5f\xf5\xd9@ \x0eV\x9f=\xa6|\x96\x93\
-\xd5\x87\x98\xf2\xc7\x1cs\xcc\xbf\xd5\xd4\xd4\xacA{R\
-\xa9\x14\x8b\xf2\xbb\x81\x80\x83\xcc\x14\xf7P\x99\x09\x0d\x02\
-\x86\x1c\xb2\x5c\x8f%K\x96T\x00\x00^}\xf5\xd5\xec\
-;\xef\xbc\xb3\xf3\xde\x7f\xfe\xf3\x9fS\xeb\xd7\xaf\xcf\x00\
-\x00\x96.]\x9a{\xfc\xf1\xc7\xb9|\xfa\xf3\x0e\xbe\xd2\
-\x9c\xac\xbe\xa8\x8c\xb0\xc0N>\x02\x04\xe2d\xf5\x15\xe3\
-d\xf5e2\x99\x95\x11Y}Z\xcaop\x0c\xe3\x96\
-\x99\xa8 \xc0\xa6\xfc\x8a\xa5\x9f%\x0b`Wb\x10d\
-\x06\x92\xb9\x01\x97/_\x9eI0\x1e\xe0f\xdb\x1aZ\
-\xc7Y\x1f\x064$#,\xb4\x87\x9fX\x13`W~\
-\xa5\x8dM\xb66\xb2(\xbf4\xfb\xedYz\x09\x14X\
-\x94_\x91\x19;\xab\xafi\x0f\x95\x99( \xd0\xdd\x06\
-\xe0)\xce:\xd7\xad[\x97\xd9\xb4iS9\x00\x88)\
-@U\xa0\xd0\xc1\x11\xd1\x8e\xe1m\xe5\xfb\x86\x8c\x9b\xd5\
-w\xd8a\x8752*\xbf\xd3\x1b\xab\xc8\xa5\xfcN\xac\
->\x01r,\xca\xff1\x92\x19\xd3\x961\x1b\x8b\x90^\
-\xf4\xc9\xd7^{-\xbbq\xe3\xc6ti\x0a@\x00\x90\
-\x96k\x00\x0b\x17.\xcc\x85\x0a!\x1c|\xbe\xc3:\xa0\
-\xb6\x81\xd4e\x84\x19\xf3\xed\xcf\xe5r\xab%\xab\xef\x1b\
-\xdf\xf8F-\xa7\xf2\x8b\xcf&\x83\x02\xe4\xab\xfcj$\
-#\x05\x04\xdc\x94\xff3\x06\x94\xbf\x89q\x8d#\x8a\xcc\
-\x98Z\x1b\xeb\xc6\xcd\x22$\xfdN\xc9\xdc\x80%\x00\xf8\
-\xf0\xc3\x0f\x93bn\xa0\xe6\x06\xccO\x9f>=\xc9\xa4\
-\xfcy\xaf\xdd\x01\x86\x81\xd4e\x84\x19%\xf6\xd4\xd7\xd7\
-\xe7.\xb9\xe4\x92\xa2\xc2\xea\xcb3*\x7f\xd6\xe0\x8a\xb5\
-\xaf\xf2\xcb9?>\x15\x10\xe0T\xfe\x22\xe7.G\x04\
-\x991\xa6\xfch3'\x8b\x90^\xec\xa9\xa7\x9f~:\
-\xb7j\xd5*+7\xe0\xdbo\xbf\xddU\xbf\xb1\xd2\xab\
-\xe4\x06,\xdc{\xef\xbdI\x0e\xe5w\xdb\x1d01\xa0\
->\x0c-U\x80\xd8Y}\x07\x1cp\x00\x92\xa4\xb4*\
-\xac\xbe<\x97\xf2\xeb\xb4\xdf\xa4\xf2\xcb\x22@\xc0\xfaM\
-\xb4_*\xff\xfb&\x95_\xb7\xfd\x9c2c\x90E\xe8\
-\xba\xdaoo\xbf\x89\xdc\x80\x0f=\xf4P\xfa\xd1G\x1f\
-\xad\x91\xdb\x80/\xbf\xfc\xb2\xbb^\xd3\x89Y\xe1\x07\x00\
-O\xc0\xc2\x1dw\xdc\x91\xe4P~\x0e\x10\xd0dhe\
-\x95\x18\xf2\xec\xac>\x10\x88\x0c\xe6\x22\xd4e\xf5\x85\x01\
-\x81\xc0\xca\xef\xd0\x0f[E?\xb0(?\x07\x08\x04\x91\
-\x19Cc\xe8\xbb\xd5\xa7\xf6C\xd4\xdc\x80\xf4\x22O\xcf\
-\x9a5\xab \x1d\x81V\xae\x5c\xe9\xbf\xc08{\xf6\xec\
-,|\x88\x05\x17\xa0\xee\xd6[o\x0d\x04\x02p^\x08\
-\xc8\xea\x8b\x0c\x02A\x84\x1e\xdeftN[\x5c\xac>\
-C\xb9\x08\x83\xb2\xfa\x82\x80@h\xe5\x97}\x84,\xbd\
-\x82\xd5\xb7y\xff\xfd\xf7?\x9aK\xf9M\x82@@V\
-\x9f\x09\x16\xa1\xf6>\xbf\xec\x8f\x88\xb9\x01-N\x8f\xe0\
-\x02\xd4,Z\xb4H\x7fwa\xea\xd4\xa9\x15\x82\x0bP\
-\xbc\xf9\xe6\x9b\xeb\xc7\x8c\x19\xa3\x05\x02p[\x84\xfbb\
-\x88\xdc\x80\xa1A \xcc\x1b\xef\xb3\x9f\xfdl5\x01[\
-}\x5c\xac\xbe\x88\xb9\x08\xc3\xb2\xfat\xfa%\xb2\xf2K\
-\xb3\x9f\xce\xfb\xf3A\x07\x1dt\x1cY\x8d\xf5'\x9cp\
-B\x8f\x01\x03\x06$9\x94\xdf\x04\x08\x84d\xf5Ea\
-\x11\x06v\xf2\xc1\x8bT\xb8\x02\x07\xce\x0d\x88\xac\xde`\
-\xf3\x0a2P\x81\x00 \xf8.\x14r\x03J:\xf0\x0d\
-7\xdc\xd00b\xc4\x08\xcf\x01\xa5\x87L\x81\xb8\x10!\
-7``\x10\x88\xe2\xe1G\x8a\x7f0\x94?.V_\
-\xc8\x5c\x84QY}^\xfdcL\xf9U\xb3\xff\xc4\x13\
-O<P,|\xdaY\x84\xc6\x94?J\xffDd\xf5\
-\x85a\x11\x86\xf6\xf0#\x00\xb0t*Hn@d\xf3\
-F\x1c\x0fA\x07\xae\x03\xbb7\xf4\x02\x82\x9a\x1b\xf0\xba\
-\xeb\xae+\x0e\x1f>\xdc\x11\x04\xe8\xe1R\xdf\xff\xfe\xf7\
-[\x0d\xe4\x06\xd4\x06\x01\x13\xee\xbd\x224Ul\xac\xbe\
-\x80\xb9\x08M\xb1\xfa\x8a\xca\xc2g\x91S\xf9\xd1\xbf\xe0\
-\x0e\xc8\x85O\x9f\x5c\x84\xc6Y}L2\x13\x1a\x04L\
-\xb8\xf7\x82\x09\x08\xdd\xd2\xc9\x0dHS\xda\x0cY\xecE\
-\x11\x10\xa4\xbe\xa3\xa3#\xba\xff\x89\x9a\x1bp\xd8\xb0a\
-\xc5!C\x86\x945\x82\x1e*u\xf6\xd9g\xb7\x18\xcc\
-\x0d\xe8\x0b\x02&}\xfb\xed\xf1\xe9\xb8Y}\x9a\xb9\x08\
-M\xb3\xfa\x8ar\xe1\x93\xcc\xf3f.\xe5W\xea\xf3\xcb\
-E\xc8\xc6\xea3,3\xa1A\xc0\xa4o?b\x01\x90\
-\x8e\xb5\x02\x00<r\x03fh\xaa\xde\x88\x98\x80\xb0\x00\
-\x10\xd1\xcb\xd46bYn\xc0\xcb/\xbf\x1c\x09\x09\xac\
-\xc6\x10\x1a\xa5\xfa\xf7\xef\xdf\xc2\x90\x1b\xd0\x15\x048\x88\
-=J|\xbaXX}>\xb9\x08Y\xf6\xbb\x11hT\
-\xb2\xfa\xbe\xf2\x95\xaf\xb4\x1bP\xfe?c9\xc5m\xc1\
-\xcf#\x17!;\xab\xcf\x90\xcc\x84\x06\x01\x0eb\x0f\xa2\
-\x01A\xd7dT`57 B\xf6_\x7f\xfd\xf5\xcd\
-\x22*p\x11\xb1<\x13\xa6\x0f\xe4\x06\x94a\xc1/\xbe\
-\xf8\xe2\xa6A\x83\x06\xa5\x11\xa0\x9017`\x17\x10\xe0\
-d\xf5\xd9\xc2U\xb3\xb3\xfa\x5cr\x11\xb2\xb2\xfaHH\
-j\x04\xab\xef\x05x\xf3ET\xfe\xcf\xf9\xad\xf6;(\
-B&.V_D\x99\x09\x0d\x02\x9c\xac\xbes\xce9\
-'%\x82\x82\xb6\x89\xd4`\xc8\x0d\x98Af \x11\x16\
-\xbc\x91,v>N\xcfUW]\x15wn@7\x16\
-!\x0b\xabO\x01\x81XX}\x0e\xc9O\xda\xb9Y}\
-\x95\x95\x95\xab#\xb2\xfa\xb4\x94\xdf\xe0\x18FU\xca\xdd\
-R\x1f\x17\xab\x8ft.\x85\xb0\xe023\x10M\xc9[\
-Eb\x90f\x9a\xaa\xb3\x12\xfa\xac\x83\x00 o\xcb\x0d\
-X\xc3Y\x9f\x83\x005q(\xbf\x02\x02\xb1Qz=\
-@\x80\x95\xd5Go\xffX\x94_Y\x13(\xc4\x9c\xdf\
-1\x1b7\x8b\xd0\x9e\x1b\x90\x93\xd5G\xd3\xb8\xd4E\x17\
-]\xd4\xa4\x02\x00M\xd1\xf9\x95\x9f\xcc\x8d$\xd6\x00\xd4\
-\xdc\x80d\x96\xb4\xe8F+\x8d\xb2\x8a\x1dPA>\xee\
-\xac\xbe<\x97\xf2;\xb1\xfa0\x1d\xe0R~\x17V_\
-7N\x05\x09)3\xa6-\xd5<#\x00d\x09\x00Z\
-\xd5\xdc\x804Eg\xcf\x0d\x98\xfc\xf1\x8f\x7f\xdc\xa8\xe6\
-\x06T\xa6\x00-A\xa3\x96\x86\x18\xc8\x16\xcd\x01M\x9b\
-P~\xbc\xf9\xf3\xf9|\xac\xac>\xc3\x91\x92d?\xe4\
-\xdc\x94\x9f\xa6\x03\xa55\x0f\x05\x04\x9c\x94\x7f\xb3!\xe5\
-o\xe1\x06\x017V\x1f#\x8b\xd0\xce\xeace\x11\x92\
-\xcee\xcf?\xff\xfcn\x227`+Y\x00\x8dq\xe4\
-\x06L\x12\xc2\x14\x87\x0d\x1bf-\x02\x12\xf28\xe5\x06\
-\x0c\x1d\xbdTc \x8b~\xbb\x03\xe2\x90\xf5\x1f\x980\
-\xe0\xde\xbb\xff\xfe\xfb\x17\xa8\xa3\x9b\xe3b\xf5\x19\x8c\x95\
-\xe8\xab\xfc\xd2\xecW\xa9\xbd\xf47\xe7\x9b\xbf\xc8\xb5B\
-\xee#3\x9c,B'V\x1f\x1b\x8b\x90\xac\xed\xec\x80\
-\x01\x03\xba\x89E@X\x00Yz)'\x09\x00\x8al\
-\xb9\x01o\xba\xe9\xa6\xe4\xe8\xd1\xa3\x1b4s\x03\xb6\xc2\
-{\x89c \xbdv\x07\xc4O\xd2I\x09\x1d\xfe\x9b\x84\
-!\xdf\xfe#\x8e8\xa2\x0a\xdc\x81\xb8X}\x06@@\
-U\xfe\x15\x09\x8d\xad>\x01\x02%\xae?\x97\xf2{)\
-\x0e\xb3\xccp\xb0\x08\xbdX}\xc6A\x80\xa6\xd9Yz\
-\xd9v\xc76 Y\x01\xb0\xc0\xb3\xaauN\x00P\x14\
-\x00`47`r\xfc\xf8\xf1\xf5Ar\x03\x0a.@\
-\x8ac \xdd@\xe0\x8c3\xce\xc8*\x82\x7f\x8d\x10\xde\
-\x7f&\x0c\xf9\xf6\xab\xe1\xaa\xe3`\xf5E\x00\x81\xc0\xca\
-/\xfb\x01o\x7f\xe9\x16-@\x00f\xff\xe7M+?\
-\x07\x08\x04e\xf5\x19`\x11\xea\xb0\xfa\x8c\xc9\x0cM\xaf\
-\xb3\xf4\x92m\x13\x8e@\xb0\x00\xba<\xfb\xc8\x91#\x93\
-c\xc6\x8ci\x10\x8e@Fr\x03&\xc1\x06\x0c\x93\x1b\
-\x90J\xa8\x01\x0d\xc8\xd0*%\xae \x00h\xa7)\x0a\
-\x84\x1f\xe1\xcc\xd7\x0b\xa1\xde\x9e\x91\xfdE\xdf\x00\x00 \
-\x00IDAT0\xcb\xea3\xc1\x08\x0b\xe2\xb6\x1a\x14\
-\x04B+\xbf\xec#R|\xc9\xea\xfb\xa0[\xb7nG\
-q)\xbfI\x10\x08\xcb\xea\x8b\xc0\x22\x0c\xc2\xea\x8b,\
-34\xad\xce\xd2\xf4\xba\x0d\xb9\x01\xc9\x0a\x80\x05\x90\xf5\
-\xb2\xd6A\xde\x8b\x9c\x1b\xb0\xa3\xa3#I\x08R\x8b\x1b\
-\x01\x00\x08Y\xc2\xe4\x06\x0c4\xa0!\x19ZV\xfa$\
-\xcc\xd1\xef\xb9\xe7\x9e\xdal6\xfbm\x0e\xe571\xa0\
-!\x89+\xba \xa0=\xe7\xf7[\xed'\x10\xd8\xf2\x89\
-O|\xe2\x9bw\xdduW\xfdq\xc7\x1d\xd7\xc2\xa5\xfc\
-&@ *\xab/\x04\x8b0\xf0\xb3F\x91\x19\xb2\xa6\
-\xb3\xa4Sm\x82\x0c\xd4\x86i\x80\xdf5\xa0\xef\xe3\xc5\
-\x1d%7`\x92\x90\xa3 \xe9\xc0As\x03\x82\x0b\xa0\
-\xe4\x06\xd4\xed\xa4\xd0\xdeZ\xf4\xf6\xcf\x9f|\xf2\xc9\xfb\
-\x13\xfa\x15\x0b\x85\xc2\x5c8\xf3\x08a\xe6b\xf5\x85a\
-\x84E\x11:?\x100\xa6\xfc\xd2\xec\xdf\xb1cGF\
-a\xf5\x15\xb9\x94?\xa2b\x15cf\x11F\x01\xaa\xc0\
-2C:\x84\x88Rm\xb0\xaaa\x01\x10\x00h\xcb\x0c\
-\x02\xf9\xe0\x05.s\x03>\xfa\xe8\xa3z\xb9\x01\xe7\xcd\
-\x9b\x97\xa4\x0bj\x0c\xe7\x06\xf43\x93\xa2\xbaj&\xa7\
-N\x9d\x9a\xfd\xc2\x17\xbep8\x99\xae\x7f\x11\xb9\xe6]\
-\xdf\xfe\x8a\xf2o\x8b\xc0\xea\x0b\xc2\x083av\x96\x14\
-\xcc\x16\xce\xcc\xb8\xf2K\xb3\x1f\xdc\x01e\xe1\xb3\xc8\xa5\
-\xfc\xbbIf\x82N\xc7LLU\x02\xcb\x8c\x08\x08\x02\
-\x0b \xb0\xcc \xa4\x1f^\xe427\xe0SO=\xe5\
-\xad\xcb\x8b\x17/N.X\xb0 \xc7\x94\x1b\xd0m\xa1\
-\xc4X KR\xe6K\xa5bC\xf0\x05\x08\xf8)\xff\
-\xd2DxV\x9f\x0e#\xcc\xe4\xc2SJ\xec3[\xac\
-\xbec\x8e9\xa6V\xd9\xf5XiR\xf9e\x9dx\xfb\
-\xfb\xe4\xb13\xcd\xea\x8bKf\x82,\xc8\x9a\x5c\xac\x0c\
-$3\x04\x00\xed\x04\x00\xa1e\xe6\x81\x07\x1e\xb0^\xe8\
-\xbe\xb9\x01W\xaf^\x8d\xdc\x80U\x22*0Wn@\
-\xfbV\x89i\x92\xc6R\x11\xa4r\x9b\xdc\xd7\x16\xd3\x01\
-\xb7\x00\x96\x1fPi\x09\xa3\xfc:\x03\xca\xb1\xf5\x84\x18\
-\x83\x084\x8a5\x8f\x1f\xfd\xe8G-\x9f\xfe\xf4\xa7\x9b\
-\x0d(\xff\x16*_p[\xf0\xf3\xc8E\xc8\xc5\xea\x8b\
-Sf\xfc\xb6d9\xb6+\xb5e\x06\xd3\x80\xa8\xf5=\
-\xf4\xd0C\xc9\xf9\xf3\xe7\xe7\x5cs\x03\xe2\xf3\x85\x17^\
-\xa8\x90a\xc1\xe9\x02\xce\xdc\x80\xd2Y\xc2\xd4@\xca\x01\
-\xf9BbW|:\xd5\x97\xdf\x02\x01%\x845\x94_\
-\x0a~G\xd0Un\xdd\x01\xe5t>A\xb4\xe1\xcb/\
-\xbf\xbc\xe1\xeb_\xff\xfa\xc1555\xbfD\xdb\x22*\
-\xffa~\xfd\xe0\x90\x8b0\xc5\xcc\xea\xe3\x94\x19-\x10\
-`vX\x8aUf\x1e{\xec\xb1\xe4\x92%K\xaa\x9f\
-\x7f\xfey+/@Yn@\x99\x1a\x0c\x00\x10Gn\
-@[\xc3M%\xb1\x18\xab\x08\xb6\xba\xc8\xa7\x96N\x11\
-\xbf~\xbb8\xf7\xf8(o\x7f\xaf\x01\xe5f\xf5\x91\xe2\
-\x17\xa8=/Fd\xf5i)\xbf\x13\x08\x18\x1e\xc3\xb8\
-eF\x17\x04\xb8]\x96\xe3\x92\x19\xebX\xb6lYr\
-\xcd\x9a5\x95\x02\x00\xd2]\x00\x80NH'\x18\x0f\x07\
-\xc2\x84\xa9\x81\xc4\x1c\xfe\xcd\xc4\xae\xed\xbf.\x89+\x94\
-\x0c6\xdb\xc4\xef\xafF}\xf3k\x0e(\x07\xab\xaf4\
-\xe7\xa76\x85U\xfe\x0f\x82(\xbf\x8b%\x10\x07\xab/\
-\x1f7\x8b0\x0e\xe5\x8fQf\xba\x1cH\x0d\xb6a\xc3\
-\x86\x9d\xb2\xb4y\xf3\xe6Rn\xc0\xa5K\x97V0w\
-n\xd10#L*\x84\xe3\xde\xbf\x0d\x00:\xc5\xc2\xa0\
-T\x80\xebM\xbd\xfd=\xcc:\x0eV\x9f\xeb\x82\x9f[\
-83\x83\xca\xef\x94\xcd\xb6\xf81\x93\x99@\x80\x13\x03\
-\x8b\x90Sf\xf4\x00\xe0\xf5\xd7_/\xe5\x06\xa4\xb9B\
-U\x0c\x03i\x8a\x11&\xaf\x9b\xa9\x9a\xff\x89\xaei\xab\
-\xca\x94\x04\x8aC\xe7|\xcav\x0f\xa3\xe6\xa3a?p\
-_\xe5\x17m\xec\x12\xce\x8cK\xf9\xd5\x8c\xb6\x8c&y\
-1f\x16\xa1#\xab\x8f\x91E\xc8)3\x8eS\x80\xd5\
-\xabW[S\x80\xb7\xdf~\xbb\xfc\xc5G\x00\x90U\x16\
-\x01\xab\x19\x07\xd2\x14#L\x12\x7f\x10\xdb\xee/\xaa\xc0\
-\xdb\x95_\x01\x04kw \x9f\xcf/\xb5\xdd\x83c\x01\
-\xc9\x94\x1f\xb8\xaf\xf2K\x85\xb7\x81\x00\xe7\x9b\xbf\xc8\xb5\
-\x22\xcf,3A\x17\x1d9Y\x84\x9c2\xe3\xb8\x08\xf8\
-\xcc3\xcf\x94\x16\x01\x1ds\x03.Y\xb2\xa4B\xe6\x06\
-\x9c6mZ\x8ek \xbd:=\x84b\x5c\xe4\xb6\xf8\
-g\xcfZK\xbfY\x00\xd0\xdc\xdc|9uH\xcda\
-\x87\x1dV\xc51\x90^+\xbd\x5c\xca/\x8bj\xed\x88\
-\xdfX\x94_g|\xf7@\x99\xd1V~\x9d\xf1\xe5\x96\
-\x19x\xd3\x86\x0d\xaf\xaf\x1es\xe7\xce\xb5\xb6\x01I\xbf\
-\xf3\x00\x80\xb5k\xd7\xba\xf7\x19\x01@\x95\xe2\x08\x94\xe3\
-\x1aH\x83\x03\xba\x5c\x08\xf86\xa77\xbf\x02\x00\xdb\x85\
-%\xf0\xa7#\x8e8\xe2s\xe7\x9csN\xf7\xd3N;\
-\x0dn\xaeY\x8e\x814\x00\x02\x81\x95_\xb6\x15;\x1d\
-\xb6d'P\xfe/\x9aV~\x0e\x10\x88If\x02\xdd\
-\xcb\xb03\x97\xb6\xcc\x08\x00\x80'`h\x10\xb0;\x02\
-\xadX\xb1\xc2\x7f\xcd\x0b\xe4\x01\x99\x1b\xf0\xf6\xdbo\xcf\
-s\x0dd\x84\x01\x95\xbf\x1f\x9e(\xf7\xf0\xebtP~\
-\x09\x00\xf2Mx\x0f.\x04w@\xb8\xb9\x86u\xcd\x0d\
-\xe2F\x1a\x14\x04B+\xbf4\xfb\xe1\xeb X}\x1f\
-\xd6\xd5\xd5}\x95K\xf9M\x82\x00\xb3\xccD\xba\x87!\
-w\xee@2C\xa5]\xc9\x0d\x18X\x0f\xed\xae\xc0\x8b\
-\x16-\xd2\xdf\xf5\x22\x00\xc8)d\xa0@\x11F\x90\xd2\
-X\xc9\x0d\xc8\xc1\x08\x93\x0a\xf2\x93\xc4\xae\xc4\x94\xaa\x87\
-\x9f\x93R\xc8\xed\xc1o\xe0\xc2c\x8f=\x16A*{\
-\x84$\xe7\x84!\x92\xe8\x82\x80\xaa\xfc\xab\x12\x11<\xfc\
-\xa8/><\xf0\xc0\x03\xfb\x90%Ww\xe4\x91G\xd6\
-q)\xbf\x09\x10\x88\xc0\x04\x0dK\xce\x89\xc4\xea\x8bC\
-fT2\x90`\x03j\x83\x80\x9d\x0c\xf4\xc8#\x8f\x04\
-\xb7Z\x10P@\xd2\x81uc\x8d!\x95\xb1\x92\x1b\x90\
-\x93\x11\x86\xe9\xc9\xef\x84\xd9\xbf\xdd\xe5\xcd/\x8b\xdc\xfb\
-_\xab(\x98={M`E\x8e\x22\x04>\xac\xbe\xc8\
-\xca\x0f\xb3\x9f\xce=\xe2\xd9g\x9f\xcd)\xac\xbe<\x97\
-\xf2GT\xe4b\xcc,B#\xac\xbe8d\xc6F\x07\
-Fj0\xdfi\xb9\x9d\x0e<k\xd6\xac\xf0\xeb\x16\xb7\
-\xddv[^\x06\x04\xf1\x8b:\x8a\x14\xc6J@\x10.\
-F\x98T\x92S\x15\xe5\x97\x1e~n\x8a!\x95\xe2\x1a\
-\xdb=\x82\xe6\x224m\x06:\xb1\xfa\x8c(\xbf\x9c\xf3\
-w\xef\xde\xbd\x82\xeaj\xd5\x09gf\x90\xd5W\x8cy\
-\xea\x10\xc4\x947\xca\xea\x8bCfd@\x10\x00@\xbf\
-~\xfd\x90\x1b\xd0\x15\x04\xec\x01A:::\xa2\xfb\xf6\
-\x8c\x1b7\xaeF\x86\x04\xbb\xea\xaa\xab\x1cA\xe0\xec\xb3\
-\xcfnPB\x82q2\xc2\xac\xbf\xb3\xd9\xec\xc3r\xa1\
-\xcbE\xf9\xed\xca\x81\xf0`\x87\x88{$=\xea\xf3]\
-\xcc3\xb5\x10\xe4\xc2\xea3\xa6\xfcr\xce\x8f\x0c\xbd\x1a\
-\xb9\x08M\xb3\xfa\x8a1/\x1e\xea,\xe6\xb1\xb0\xfa\xe2\
-\x90\x195$\x18B\xf1\x0f\x1a4\xa8\x0b\x08\xc8\x90`\
-xa\x03\x00\x90\xdd;a\xea\x185jTA\x09\x0a\
-Z6\x9fD\xcab%((\x17#,)\x15\xb7\xb5\
-\xb5\xf5\x90\x5c.\xf77a\xf6{E\xfdQ\x15\xe3\x09\
-'\xe5\xd7\x01\x01\x8e\xad \xec> \xd0\xa8d\xf5}\
-\xeaS\x9fj6\xa0\xfc\x7f\x11\x0b\xa3]\x16\xfc|r\
-\x11r\xb1\xfa\x8a1o\x1fzm\xe7\xb1\xb2\xfa\xe2\x90\
-\x19\x19\x14\x14\x00 \xa2\x02\x97\xfcu\xecAA\x91\xd5\
-;a\xfa\xa0Jj\x95\xdc\x80\x16\x08\x0c\x1c8\xb0^\
-\x09\x0b\xce\xc2\x08\x93i\xa6{\xf6\xeciubcc\
-\xe3\xf5B\xf9\xb7&\xdc\xc3~\xc9\xef\xe5\xfc\xff\x87v\
-\xf3_\x07\x048\x9dA\x0e?\xfc\xf0*\xe4X\xec\xdd\
-\xbb\xf7!\xf9|>*\xab\xefC*Gx\xad\xf6\xbb\
-\xe4\x22\xe4f\xf5\x15cv rr\xe8\x89\x85\xd5\x17\
-\x87\xcc ,8\x01\x80\x0c\x0b\x8e\xbc\x00\xd5\xf6\xb0\xe0\
-\xc8\xe6\x9d\xe0:\xa8\xb2Z%1H\x8bL\x0cB\xe8\
-\xd4\xc0Q\x1f\x06O\x04\xfd\xb4\xdcO\xc9\xcah\x87\xb2\
-\xd8\x88=nJ\x22W\xfe\xdf\xa5R\xf4\xb2\x00\xdc@\
-\x80\x9b\xd5\xd7\xd6\xd6VO\xed\x89\xca\xea\xf3U~7\
-\x10\x88\xdb\xa57\xa6\xfa\xf2N\xf5\xc5\xc1\xeac\x96\x19\
-\xeb@b\x10\x9a\x02t\x13\x00\x80\xd4`MJb\x90\
-\xaa\x04\xf71x\xf0\xe0:57 \xa1R\x03g}\
-\xd4\x899\xec\xdb\x8f\x181\xa2q\xff\xfd\xf7\xff\xb6P\
-\xfe\xce\x84O\xd0OEA~\xe6\xf7\xf6w\x13\xa0\x18\
-X}\xabDBRv\xe5\xf7\xb0\x04b'\xf5\xc4\xcd\
-\x22\xdc\xdbX}N\xa9\xc1h\x8a\xce\xaf\xfc6\x00h\
-\xc3|\xa4\x7f\xff\xfe\xac\x00\x80\x95r\xcc\x95;::\
-\xea\xe8\xb8G\x00\x80\x8e\xf9/\x7f;Z]@\xdc\xcd\
-\x83\xe9\xbb\xda\x1f\x80\xd5\x17X\xf9=\x00 \xbf\x0f\x00\
->V\x00\xe0\x94\x1c\x94\x1f\x00\x86\x0e\x1djM\x01\xa8\
-\xf2\xb2)\x00v\x01\xb8\x94\xff\xf4\xd3O\xef\x89\x15\xd0\
-\xaf}\xedk\x07\xe5r\xb9w\xc4\xfc\x7f\xbb\x87\xf9\xaf\
-N\x0f~\x9d\x08@\xfa\xf1\x08\x0aab@\xb5\x94_\
-\x93\xd5gD\xf9\xb9\x19h\xfb\xa6\x00,S\x00+=\
-\xb8\x9c\x02\x90N\xb6\x0c\x1f>\xbc\x85,d\xde)\xc0\
-\xeeX\x04\xc4\xfc\xbfo\xdf\xbe\x07,[\xb6,G\xca\
-\xf2\x9f!\xf6\xfe\xaf\xd65\xff5\xc2BE\x19P\xad\
-}~1\x1d\xf0c\xf5\x99z\xf3\x17\x0d\xe6\x22\xdc\xb7\
-\x08\x18\xcf\x22`\x8a\xac\xeef\xdb\x22`\x86,\x80f\
-\xd6E@\xafm@L\x018\xb6\x01\xa5\xf3\xca)\xa7\
-\x9c\xd2]|=7Q\xee\xfa\xbb\xc3\xc3\xf5\x17\x7f\xff\
-\x83\xca\xbfi.\xfe\xe9\x06\x86\x0c3\xa0\x81\x9c|\x14\
-\x10pb\xf5\x19S~\xaf\xdd\x01.\xe5\xd7\xf9\xcd\xa4\
-\xf2\xeb\xfcfR\xf9u~\x0b{\xf4\xeb\xd7/E\xba\
-\xd6\xe2\xb2\x0d\x98!\x00hf\xd9\x06\xdc\x8d\x8e@=\
-N=\xf5T\xa9\xfc\x07P\xf9[\xa2kb\x0f'\x10\
-\x90\xca\xb20\xaa\xf2\x1b\x00\x81P\x1e~\x08i\xaeL\
-\x09$\xab\xcf\xb8\xf2s\x81\xc0>G \xe3\x8e@)\
-\xd2\xb1V\xe9\x08D\x00\xe0\xe4\x08\x94!\x00h\x94\xb9\
-\x01\x8d8\x02\xc1\x15\x98L\x0a-W`L\x01L\xb9\
-\x02\xdb\xf7\xfe\xe9\xb8\x22Q\x1e\xf5\xc7)\xf0\x87}\xef\
-\xff\xfb~\xe6\x7f\x84\xe4\x10~\x03\x9aR\x94\xb4&\x11\
-\xc2\xc9GX\x02\x92\xd5\xf7?uuu\xac\xb9\xfaL\
-\x81\xc0>W`\xb3 p\xd6Yg\xa5H\xb7Z\x05\
-\x17\xc0\xd3\x15x\xec\xd8\xb1\x19\x02\x80\xa2\x11W`\x90\
-\x81~\xfa\xd3\x9f\x16\x05\x00\xc4N\x06:\xfe\xf8\xe3\xd5\
-\xc1Yc[\xdc\xeb\x12\xf8\xd3\x16\xf1w#\x95z/\
-\x0b\xc0@z\xa8v[<\x81\xa4\x03\xd8\xb4&\x22\xc4\
-\xed\x17 \xf0\xd7\x03\x0e8\xa0\xef\x94)S\xd8Y}\
-QA`\x1f\x19\xc8,\x08\x905\x9d\x22\x9dj\x85u\
-\x8d\xe4\xa0\x9ad\xa0\x0c\x01@\x83$\x03\xcd\x9c93\
-\xb8\xe5\x81\xac\xa2\xb8\x01\x00`7\xd1\x81\x93\x89]\xdb\
-v_M8o\xef\xd9A@\x8d\xf9?\xc9\xeb\xed\x1f\
-eP\x04\x8b\x10\xec\xba\x9e\xa7\x9dvZ\xbb\x88,\x94\
-\xb4\x99\xfd\xa0\x1d\xdf\x9d\xd8\x99q\x07\xca\xbf5\xec>\
-\x7fee\xe5\xbf\xcf\x9e=\xbb\x10\x17\xab/,\x08\xec\
-\xa3\x03\x9b\xbd\x96t(E\xba\xd4\x1a\x86\x0e<q\xe2\
-\xc44\xe9o}(:0\x02\x82\xc8\xdc\x80t\xa3\xd8\
-\x03\x82\x80\xbcbS\xde\xdb\xed\xe6\x7f\xc29\xe5W)\
-&@*\x95\xfa\xbab\x8a\x1b7\xcb\x10O\x00\xceI\
-\xfd\xfb\xf7\xef\x8e\xf0b\xe2\xebC\xa9\x5c\x9b\xd8I;\
-V\xe7\xf3\xdb\x228\xf9|\x097\xfe\xccg>S\x0d\
-\xee@\x5c\xac\xbe\xa0 \xb0/ \x88\xf1\xa9\x83\xd5\xff\
-Q\x02\x82\xdc}\xf7\xddi\x02\x80\xba@\x01A\xe6\xcf\
-\x9f\xbf\xa7\x85\x04\xc3\xba\xc3\x86\x84-\xe6\x7f\xc29\xe9\
-\xa7\x0c\xfa\xb9\xf6\xf4\xd3O\xc7Ve\xd2\xf0@v1\
-\xf1\xbf\xf4\xa5/}\x0e1\x06\xa9\xce_\x88h\xc3;\
-\x94g\x85\x09\xbf=\xaa\xf2'v\xb1\xfat\xf2\xca\x19\
-\xf3\xed\xd7\x05\x81}!\xc1\x8c/\x1e\xaa\xfd\x1e)$\
-\xd8\xb4i\xd3\xd2\xb0\x1eeH\xb0\x95+W\xbao\x87\
-\xabAA\x1fx\xe0\x81\xdd\x1d\x14T>\xe8\x99\xca\xdc\
-\xdf\xcf\xf3\xcfZ-/\x16\x8bc\x90\xdf\x90L\xe6v\
-\x02\x82\xa8\x01\x1e\xa5\xd2;\x99\xf8\xf7 \xc6\xa0\xbao\
-/\xf2\x0el\x13\x8bx\x9d>\xde}n\xca\xffW\xbb\
-\xf2;\xb5!\x0eV\x9f\x1f\x08\xec\x0b\x0aj|\xfb\xb0\
-\xac\xbfM\x04\x05}\xe8\xa1\x87\xd2\x04\x005\x00\x00\xd7\
-\xa0\xa0{`Xp\xa9p\x8f\xda\x94\xc3O\x89\xfe\xb7\
-\xa9\xa9\xe93\xf4\xf6o9\xf5\xd4S\xf7C0\x8c\x90\
-!\x9eS\x0e\xd3\x07G\x13_X\x1e\xdb\x94\xe4#r\
-\x1b\xcf\xc9\xabOG\xf9\xbf\xec\xb5\xda\xef\xe0vZ\xc9\
-\xc9\xeas\x03\x81}a\xc1\xcd\x82\x00\xa7S\xd6\xc2\x85\
-\x0bS\x88\x0a\x8c\xe4\xa0\x08\x0b\xbea\xc3\x86\x9d\xfa%\
-S\x83\xeda\x89A\xa4\xf2\x7f\x02\x0a\xed\xa0,^\xbc\
-\x7f\x00F\xa2O\x9f>5r\xbe\x1c \xc9\x83\xd3*\
-~#\x95~T\x9e\xa4\xd2\xc5\xc4\x17\x9f\x9dj\xe6a\
-{N\xc2\x00\xca\xff?~\xca\xef&@\x9c\x94^\x17\
-\x10h\xd9\x97\x18\xc4,\x08pzd\xe2 \xfdN\xad\
-Z\xb5\xaa\xf2\xd5W_\xcdn\xdc\xb8qWf\xa0\xf5\
-\xeb\xd7\xefi\xa9\xc1\xa4\x12\x0e\xf5[\xfcKt\xdd\xfb\
-\xff\xae\xbc\x87\x1a\xf3\xcfe\xdb\xce\xcb\xc4?6\xb13\
-\x82\xf0{\x0e@\xb3\xcd\xb6#\xe1\x94\x8a\x8cM\xf9=\
-\xa6\x03\xac$\x9b}\xa9\xc1X\xea\x8b55\x18\xe9y\
-\x12\x00PJ\x0e*\x01\x00\xc9A\x9f{\xee\xb9=-\
-9\xe8/\x13\x0e{\xff\x09w\xde\xff\x06\xb1h\x98\xb0\
-/\x9a\x89\x95\xf3\xd6\xd3N;M\xddap2\xf1\xaf\
-\xb3\x9b\xf8\xa2~;\x08u\x01#\xbb\x1f\xbfLM\xce\
-\xa1\xfc\x1e\x0a\x99\x8dS!c`\x11\xee\xed\xc9A\x9d\
-\xc8Y\xacc\xb8n\xdd\xbaL\x97\xec\xc0\xb0\x00\x10A\
-v\x0fH\x0f.;\xfb\xa8\x84\xc7\xde\x7f\xc2\x99\xf83\
-Q*\xf7\xe9\xa7\x9f^\x8a\xbb'?\xb1&\x80\x85\xc1\
-\xdf\xff\xfe\xf7v\x13\xff\xbf\xfcL|\xbfi\x88\x93\xf2\
-+ `\x07\x0e\xdc\xf3\x9f\x0c\xca\xcf*@\x1e\xe9\xc1\
-\xf3\xbbYf\xb8\xe6\xe5\xdcS\x0eGf&\xe7\x18\xae\
-Y\xb3&[f\x01l\xd9\xb2%)~\xa8\x90\x8b\x80\
-s\xe7\xce\xcd2\x0e\xa4\x5c`q[@\x92V\xc8\x9d\
-\x01\xcc\x7f\xf9\x9b\x95\x00\xe3\xcb_\xfer\xa5\xdc3G\
-\xf6\x1f8\xea\xf4\xed\xdb\xb7\xe6\x8a+\xaeh\xc6\x9e\xe8\
-\x09'\x9c\xd0#\x95J\x1dO\xa7\xde\x1b\xc4\xc4w+\
-\x0e\x0c\xbe\x1d\xca\x9a\xc0\x0e\xb10\xd8\xa9\xdc[^\xbb\
-\xc9m\xb5?\xa0\xf2\x179\x17\xac\x9c\x16\xe5b`\x11\
-\x06\x91\x19\xaeE9\xceEG\xa7\xf0l\xacc\xb8d\
-\xc9\x92J\xb9\x08\xb8q\xe3\xc6\xf2\xb6\xd0\x0fI\xb2\x00\
-\xaa\x94\xdc\x80\x15\x5c\x03\xe9\xf2F)*\xf3p\xb8\xf0\
-nL\x94\xa7\xfc\xf6\xe3\xfd\xbf\x80\x0b\xcf<\xf3\xcc\x0c\
-\xbd\xfd\xdb\x11@\x84J\xcf\x1d;v\x94\x9e\xa5X,\
-~\xb1\xa1\xa1\xe1\xd6|>\xff\x86\x8d@\xa4e\xe2k\
-*\x7f\x094\x84s\xd26\xe9\xcf\xafL\x07\x10\xa2l\
-Bb\xa7\x9bp\x22\x11 E\xb9\x0f\xab\x8fE\x80\xdc\
-\x14\x8f\x91E\xa8%3\x06\xb7\x1du\x99\xa0\xa6\xb6\x1d\
-\xbd\x02\xb4\x96=\x0b\x92\x83\x98h#R\xfea\x1bp\
-\xd5\xaaU\xd8\x06t~\xd9\xd0\x09I:1\xa78\x02\
-Up\x0d\xa4}@\xf1\xb6\xfe\xd6\xb7\xbe\xd5,\xbe\xfe\
-^\x22\xc0\xde\xbf\xf8\xffJ\x5cx\xec\xb1\xc7\x1eH \
-\xd0c\xe2\xc4\x89u6\x13\x7f\x11L|\x07\xb7a-\
-\x13\xdfG\xf9U'\x9fNe\xfa\xa0\x12\x96>\xaa\xa9\
-\xa9y:\x93\xc9\x9c\x9d\xd8\xc5Q0\xa6\xfc\x5c \xe0\
-\xa7p\x0c,Bm\x991\xe4x\x14\x94\x09\x1a\xd5\xf1\
-H'D\xbb\x9a \xb4\xfd\xbb\xdf\xfdn\xa41$}\
-\xaeV\x1c\x81\xbc\xef5o\xde<+\x99 Y\x002\
-7`%\xd7@*\x8buEa\xae\xefw\xe7\x9dw\
-\xc2\x01ia\xc2\x7f\xef_}K\x7f\x94\xcb\xe5\x0e\xa6\
-g/ \x0d\xd6I'\x9d\xb4_6\x9b\xfd\x96\x9b\x89\
-OJ\xb9]q\x1b\x0e\xa4\xf46\xe5/\x99\xf8\xe2\xcd\
-\xbf\xd5a\xc1\xf2\xa5\xca\xca\xca\xeb\x0f9\xe4\x90\xde\x83\
-\x07\x0fn\xa6g\xac!\xab\xc4i\xe7!\xb2\xf2\x9b\x06\
-\x01]E3\xc8\x22\x0c\xe2\x9ak\xc2\xf58,\x134\
-\xac\xeb\xb1v?)\x09B{\x88\xcc@\xa1\xc6\x90^\
-\xe49\xe9\x0a\xfc\xd4SO\xe9\xe9\xf2\xcc\x993\xad\xa4\
-\x8227\xe0\xcd7\xdf\x1c\x08\x04\xe8\x0d\x9c\x97d \
-\xdd\xce\x22s\xbd\xf1\xd2K/m\x81\xa2TTT|\
-\xa4\xf1F.\xbd\xfdi>?m\xf9\xf2\xe5\xf9^\xbd\
-z\x1d[__\x7f3)\xe7\xab~\xab\xf8>\xf1\x04\
-<A\xc7\xe6\xe1\x87\xac\xc4v\xa0\xc2\xdc\xfe.*_\
-\x97JNJ\x9f\x06\xc0!\xba\x11\xa6(X\xa4\xe4P\
-~S \x10T\xc1\x0c\xb0\x08\xc3\x90s\xa2\x90\x8f\xa2\
-2A\x83\x92\x8f\x02\xf7\x8f\x9a\x1b\x10\x99\x81\x90\x1c$\
-H\x1b\xe1\xca/\xc9@\x04\x00\xc1\xfc{:::\xac\
-\xe4\x82\x82\x0d\xd8t\xe3\x8d7j\xdd\x00~\xcb\x92\x0e\
-\x1c\xb0\x93\xd2\xa4$)\x9a\xa3\x8f\x83R\x12\x08l\xd5\
-\x00\x80\xedx\x13\x93i\xfdh\xa1Px\x1c\xa1\xc2\x94\
-y\xb6\xef*\xbeG:q\xd7\xad;\xa1\xfc\xdb\xc5\xbc\
-^\xf5\xedG\xf4\xa1\x05\x89\x9d1\x08\xea\xedm\x03\x10\
-\x90\xd2\xe7\x15\xe7$]\xa1\x8b\xc2\xea\x0b\x05\x02a\x15\
-+\x02\x8b0\x8ab\x85a\x11Fa\xf5\x85\x01\xaa\xd0\
-\xe0\xa8\xe6\x06$\x00hCr\x10\x9d\xeb@\xe2\x93t\
-`\x90\xfbB\xcd\x1d&M\x9ad%\x19\x94\xb9\x01\xaf\
-\xbf\xfezO\x10\x00cI\x09\x08\x12\xc6LJ\x92\xb9\
-\xbcV(\xe5v\x02\x01\xbf7q)1\xa8\xb2\xc8\x16\
-h\x15\xdf\x07\x04\xca\x80CPz\xb7\xd9\x9c|^\xa2\
-2,\xb1+\xf4\x98\xaa\xf4~Qi\xb4\x18a\x11Y\
-}\x81\x84=\xaai\x1d\x82Eh\xc2\xb4\x0e\xc2\x224\
-\xc1\xea\x0b2U\x89<=\xb2\xe5\x06\xec>`\xc0\x00\
-\xcfg\x06}_\x06\x04\x01\xad?\xd2\xea\xe1\x84\x09\x13\
-\x92\xe3\xc7\x8f\xaf\x97!\xc1\xae\xbe\xfajG\x108\xfb\
-\xec\xb3sJH\xb0Vp\x99\x03T#\xcf=\x1a\x0a\
-G\x8a_2\xb1\xdd@\xc06\x07\xdf.H8\x81W\
-\xf1]@@\xbd\x0f,\x88m\xeaj\x7f.\x97\xfbS\
-6\x9b\xbdW<\xaf=oaF\x98\xfd\xae\xf3\xfb\x93\
-O>\xd9\x8at,J\xfb\xb7\xbe\xf5\xad.\x03\xfa\xef\
-\xff\xfe\xef)0\x1a\xe5y4}\x08\xbd\xd8\x85\xfb\x8b\
-i\x87k}8P\x87G}I\xd16\xdf\xb5\x0b]\
-\xa1\xb7\xf5C7\xb49l\x1b\xd5g\xa7R\xe4\x5c\x1b\
-\xb1?\xfb\x19g\x9c\xd1Mq0cY Us\x03\
-\x12\x00 3\x90\xe3\xb3\x93\xa5^\x90!\xc1\xc8\x827\
-B\xe8CL\xc0$\x01@\x83\x12\x14\xb4\xcc\xa4\xe8\xdf\
-\xbf\x7fN\x09\x0a\xda\x8a(&\x01\xab\x90+\xe1?\x93\
-\x0bu\x02\x04v\x88\xe9\x80\xe7\x02\x9c\x83\xa3\xcd\x8e\xa0\
-\xc5\xc5\x12\xe8T\xea\xfb;M3\x16\xb5\xb6\xb6^x\
-\xe8\xa1\x87\xb6F\xed\xd3\x11#FT\x22\xcf\x1b\x0a\xf5\
-_\xabX\x18,\x1d4\xc8M\xf2\xf7\x0b/\xbc\xb06\
-j}\xb8?\xeaq\xab\x0fu\x04\xac/\xa5\x0b\x02\xb6\
-,\xc8\x16\xc9j\xd0\xa0AU\xb2>\xb4\xd5\x84\x9c\xe2\
-\xb9\xf1\x86\x04\x85V\xd9Q\x92\x0b\xcdA\x95\xdf\x17\xe8\
-0\x86\xa8\x0f\xbbN'\x9dtR\xfb\xe1\x87\x1f\xae\xa6\
-\x9e7\xbeE*s\x03R\x7f\xb5\x9dw\xdey\x08\xcb\
-_\xd6\x06\xb2\xd0k\x11\x14\x14\x00@\x96\xbbY\xe7,\
-d\x1e\xbd\xf6\xdak\x8b2,\xf8\xa5\x97^j\x81\xc0\
-\xc0\x81\x03sJX\xf0V\xc4/\x0bj\xf6\x8bO\xa0\
-\xf6\x7f+o]\xeb\xedo\x07\x01\xfb\xbe\xbb\x83\xabm\
-\xe8b\xdb\x22\x94\xca\xffV]]\xdd\xed\x07\x1ex\xe0\
-\x89'\x9cp\xc2\x81\xd4\xf1hw\xb5\x98\xe7\xa3@Y\
-\x0aa\xca\xc1\x07\x1f\xdc\xedk_\xfb\xda'Q\xbe\xfa\
-\xd5\xaf\x1eB\xe0R$\xeb\xa2\xee+_\xf9J/\xf9\
-\xfda\x87\x1d\xb6_\xd8\xfb\xdb\x0b\xee\x8fz\xd4\xfa\xf0\
-=\xea\xf0\xa8\x0f\xed\x830AIGP9G\xfc\x9d\
-\x08`\x09X\xd1\x93\x10DE\xfe\xf6\xcdo~\xf3\x13\
-G\x1ey\xe4\xa1h+\xdal\xaa\x8dG\x1cqDO\
-(\xe4\x8c\x193\x00\x06\x18\x9f\x14\xbd\x982\xaaW\xa8\
-\x86\xf2\xab\xed\xaa\xf6\xaa\x0f/\x03x\x98N\x9b6\xad\
-\x8et\xa1\xa9W\xaf^\x19\xfaL\x0a2\x91q')\
-\xe4\x06\x14\x16@\x9b\xc8\x0cd\xb5\x85,\xf3Z\x19\x16\
-<h\x04/\xed\x03\x19H\x09\x00\x1a\x95\xdc\x80\xf5J\
-b\x90\x16D.\x0dq[\x89\x9ag'\x1c\xf6\xfe\xed\
- \xc0\xa5\xfc6\x10(E\x16\xa2\xcf\xbf\x91\x80n\xa0\
-\xf2>\xfd\x06\xb7]D&\x06e\xf7C\x13\x85\xee\xf9\
-!\xdd\xfb\xaf(\x88\xfdGu\xfeU\xfeO\xed5V\
-\x8f,\xd4g\x1f\xa2\x1eY_ee\xa5N}\x7f\x11\
-m\x96\xfd\xf4g*\x17h\xce\x97-e8\xe5\x94S\
-\xf6\xa37SC[[\xdbWkkkg\xe4\xf3\xf9\
-\xb7\xa8\xad\x1f\x9an\x1f\x95\xf7\xa9Mk\x8a\xc5\xe2H\
-\xb2\x02>A/.Dn\xea)@\xc8O\xf9U\xc5\
-\xef\x9b\xd8\xc9,\xdd\xe0S\xdf\xe6L&\xf3RCC\
-\xc3-\x04f\x9f&k\xb9\xb6o\xdf\xbem\x12\xf4t\
-\xc2\xb7\x05=dn@\xb2x\x90\x17\xa0u\xe8\xd0\xa1\
-\xf5Jn\xc0B\x82\xf3@&R\x9a\x024\xd9r\x03\
-\xb6 fy\xc8[\xcaN\x7f\x22\xe1\xb2\xf7oW|\
-.\xe5w\xb2\x04|X}\xa6\xeb\xdb\xe16\xed1Y\
-\x9cx\x0b\x9a\xf5\xfd\xcb6>\xd7\xeaL\x07\xfe\xed\xdf\
-\xfe-s\xcf=\xf7\x14\x9a\x9b\x9b/\x93\x8b\xa8\x01\xb7\
-^\x03\x17\xb4\x87@\xe6\x95\xcf~\xf6\xb3_Bl\x08\
-\x02 ,L\xeb\xba[\xdf\x19f\x0c\x09D\xffx\xd0\
-A\x07\x1dO/\xcaF\x84\x8b\xa3\xfar\x5cz(s\
-\x03\x8a\xe4\xa025Xm\x22\x8e\x83,\x80\xbc\x0a\x00\
-4\xa7\xac\x89\xa8\xfc\x87$v\x91c\xba\xac\xda\xdb\x05\
-\x96S9\x12]c\xf2\xab\xceBl\x05u(\xbe\x05\
-\xea\xba\x06KQ\x17ZC\xd4\xb7M\x19\xa3\xa3|@\
-\xc0\xfa\xbeP(\x9c\xa2\x8c\xe1\xbf\xe8\xad\xb9\x9d\xa9m\
-r\xd1\xf6\x9f\x22<\xdc+\xb0\x04h\x8a\xea\xb7\x88*\
-\x9f\x7fL\xa2\xdcwd\xbbN}\x90_\x80\x1a\x81\xc0\
-\xa6\xc3\x0f?\xfc\x0b\xf4vn\xfa\xfc\xe7?\xcf\xca\xae\
-%\x00hPs\x03\xd2\x14=\xc3\xae\xfcd\x01T\xcb\
-)\x80\x04\x00\x91\x1e<\x0c\xda\xc9\x0e\xba.\xe1B\xfc\
-qc\xd9q\x81\x80[}\x9co,1\xd5\x88\xcd\xca\
-q\xb2\xa84\xebS\xc7F2'g\xfaY\x01X1\
-\xa7\xe35\x99\xe4\xc4\xe6=i\xb2mj>\x05\x00\x9b\
-\x05\x02\x8d\x8d\x8d#\xa7O\x9f^k_\x18tP\xfe\
-O%vyrnO\xe8\xb9\x87K\x00\xdf!\xebC\
-\x02\xdb\x89\x13'\xd6c*@mO1Y\x00\xf5H\
-\x0d\xa6f\x07Ff\xa0\xd1\xa3G\xf3\x81\x00!L\x95\
-\x92\x1b\xb0\x89\x00 \x8d<e\xca\x22`\xd8\xf9\xce\xea\
-\x84\x03\xef\xdfi\xc1\xcfia\x90K\xf9\x15V\x1f\x1b\
-\x08\xa8\xca\x8f\xf6\xd8\xa7\x03\xa6A\xc0\xde\x7f!\x17U\
-\xd5\x18\x0c\xe0V\xbb\xf9\x87\xa4@\xc6\xdao\xbf\xfdN\
-\x93y\x1b`i(\xd6\x8e\xf1\xa9\x95m\x87\xc8\xda\xbe\
-\xad\xac\xac|\x1e\x0b\x83\x98\x97\xbbl\x11J\xa5\xb9\xd6\
-\x06n\x9d\x9ac(\xdb\xb3\x1d\xed!\xeb\xe6\x8f\xc7\x1e\
-{l/8\xee`{\xd34\x95\x18\xf98\xb1\x08\x88\
-5\x00\x02\x80:[n\xc0\xc6\xf1\xe3\xc7\x9b\x07\x81Q\
-\xa3FUa\x1bp\xd8\xb0a\xad\x848\x8d4\xf7\xb0\
-\x1aE\x00`\xe5+\x93\xdb\x80g\x9duVP\x10\x80\
-\xe5\xf0n\xc2\xc6\xfc\xf3\x12L\x0e\x10pR\xfeDp\
-\x8f\xc1H\xca\xef\xb6&`\x0a\x04\xdc\xfa-\x04\x08\xa8\
-o\xc5\x0f\xc4\x8ax\x97\xe3\xeb_\xffz\xed\xdc\xb9s\
-ki\xee?D\xf4\xdb6\xdb\x1b\xd3\xe8\xfa\x8a\xad\x1d\
-\x00\x1b\x09R\x7f\xc2\xee\x00\xb6\xec\xb0o\xef\x11\x83\xe2\
-\xe76K4\xc8\x18\xaa\x16\xcdG\xd4\xe6O\x93\x89n\
-\xc5\xa54I%F\x1eNl\x03\x0a\x00\xa8S\x16\xe8\
-K\xb9\x01\x91\x19h\xc2\x84\x09\xe6\xa6\x1f\xc86\xaa\xe4\
-\x06,\xd2\x9c\xa3l\xfb\x87,\x00\xe4-kQ\x1c\x81\
-\x82\x80\x00\xd6\x0f\xb6\xa8\x00\xa0#\x90&A\xc0K\xf9\
-\xb9@\xc0M\xf9\xb9@\xc0\xaf\xbf\x02\x80@\xa7\xcd\x02\
-XO\xa5\xc2a\xf5?\x0f\xde\x03\x00\xa0\xa1\xa1\xe1r\
-\xa7\x1d\x1e\x93 \xe0\xf0\xfc\xea3\xfe\x09rFJS\
-+\x00\xc0\x0e\x02\xa1\x00\xc0\xf6\xfc*(\x82\xcb\xf2\x09\
-\x04\xda\x11\x81i\x8dP\x89\x91\x7fS8\x02\x01\x00\xea\
-\x1d\xb6\xea\xad\xdc\x80\xf0\xdcEf\xa0I\x93&E\x07\
-\x01d\x19\x95\xb9\x01\x09\x00\x8adj8\xee\xfd\x92\x05\
-`\xe5/S\x5c\x81uA\x00\xe6\xcao$\x00\xd8\x16\
-\xe0<\x05\xdf\x04\x08\xe8(\xbfi\x10\xf0S~\xd3 \
-\xa0\xdbO\x1a \xe0\xb4\x060\xc5\xbe\x06 ]eO\
-9\xe5\x94\xfdo\xbb\xed\xb6\xdaT*ud\xa2k\x00\
-\x17c \xe0\xa2\xfc\xea\x94r\x85|6L\x01\x1c\xdc\
-\x86\xa5\xc9|\x8d\xee\x14\xc0E\xf9%\xe0\xfcAN\x8b\
-\xa8\x0f\x8cP\x89\x91wS\xc9\x0dX\xefv\x1er\x03\
-\x12\x00\xc8\xdc\x80\xf5\x1d\x1d\x1d\xe1A\x00\xd9E%\x19\
-\x08\x9e\x80#F\x8c\xf0t\xfc \x0b\xc0\xcac\xa6\xe4\
-\x06\xf4\x03\x01\xf9p?\x11\x03\xf9Q\xd0\x95i\x9b\xdb\
-p\xa0\x15c\x1b\xab\xafS\x0d\xe6\xe1Vl\x19\x88\x22\
-\xad\xf6\xeb<\xafZ_\x98\xdd\x81\xa0\xfdc\xef\x13\x97\
-\xfa\xb6*\x0a\xf2y\x15\x00T?y\xb8\xc8\x92@J\
-\x99\xf9\xb5\x83rE\x06\x01\x07\xb3_\xf5\x08\x95;K\
-\x83Uy\xb3q\x07\x1a\x82.\x02\xfa\xbc\xf9\xf1y\xab\
-[\x9f\x84\x01\x01\xe4\xdb\x14\xa9\xc1\x00\x00\x0d~\xe7\xdb\
-r\x03\xd6\xcd\x981#8\x08L\x9d:\xb5B\xd2\x81\
-\x09\x00\xea\x95\x81\xf4{\xd8\x94\xe0\x02\xe8xA\x95\xc2\
-\x7f\xd3\xc0m\x91~\xfdb\xf1f\xab\x104\xdf\x02\xe6\
-\xa0X]\xde*X\x84\xbeE\x10{JEPz\xb5\
-\x0a\xce\x95\xd7\x89\xa0\x22Z\x05\xe7\x06}N{}(\
-\xba}\x13\xa6_\x9c\xfa\xc6V\x9f\x9a\x9di\xa0*\xe8\
-j\x14f%\xc5\x9b\x14\xf6\xe3\x95\xeb\xfei\xdf^S\
-\x81Q\x07\x88=\xc0\xaa\xb4-'\xeaz\xd1e\x8aR\
-T\xdc\x94\x8b\xba\xdb\x80\x0e\xcfi\xaf\xefm*\xcdv\
-\xc7\xa2\xb0 \x80<\x9bJn\xc0\x06]\xfdUs\x03\
-\xce\x9a5\xab\xf0\xf0\xc3\x0f\xeb\x83\xc0\xec\xd9\xb3\xb32\
-7 \xd8\x80\x84(\xc9 \xe0\x01\x22P\x00?h\xab\
-#z\xf6\xec\xd9\x17\xa1\xba\xc2\x9a\xbaA\xa6\x03A\xcc\
-~S\xd3\x01]\xb3\xdf\xd4t \xea\xf4\xc8g:\xf0\
-:\x95o\xabB\x0e\xe5\x97\xae\xaf\x0e\x02\x9eR\xbc=\
-\xb7j\x9a\xd5Q\x9eo\x87\xa2\xfc\xedn\xdb\x94\x8a%\
-\xd0\xc3F~\xba#\xe4\xf3\xbdE\xe53\x1e\xf5\x05\x02\
-\x01<\x9f\x92\x1b00\x19\x8c\xf4\xb7\x94\x1b\x10\x81h\
-\x9e|\xf2I\x7f\xd0y\xf4\xd1G\xb3\xb8\x00\xc81y\
-\xf2\xe4\xc2\x9dw\xde\x99L\x848t\x99P4\xb7\xc9\
-\xd0<\xa9\xe7\x95W^\xd9\x0c\x97M\x12\xd6\xde\xf4\xf5\
- a\xb6]J\xe52\xddRSSsucc\xe3\
-\x08\x14\xfc\xedt\x0e\x0d\xdc\x15\xc5b\xf1zy^e\
-e\xe5\xd0 u\xa8\x05\xd7\xca\xfb\xd4\xd7\xd7_KB\
-8\xd8~\x0e\xbe\xc3o~\xcf\x15\xb4>\xb4\x01m\x09\
-\xdb\x0f:E\xed\xab\x86\x86\x06\xd4w\x09}\x7f\x9c2\
-g\x96&n\xceC\xf9\xed \xf0\xe9\xc4\xce\xac\xc9o\
-\x88\x1d\x842\xd7Z\xd5\x15\x1an\xd2:\xee\xcc\xf8_\
-\xf9\xfdOb\xce?Xy\xf3{F\x16\x12\xcf\xde\x83\
-\xe4\xb0Q\xf9\xe9$\xd5\x15\xd8\xe3\xb9\xfe,\x80\x06\xbe\
-,u\x1a\xf5i\x81\x80\x04'\x01\x00\xa1\x99\xa0\xc8\x0d\
-\x08\x0b@\x84\x04\xcb\xad\x5c\xb9\xd2\x1d\x04\x96,Y\x92\
-\x91AA\x09\x00\x0a\xf7\xde{o2\x11\xe1\xf0\x03\x01\
-\x85\xa1\x85\xce\xefy\xd1E\x17E^\xb5\xc4\xbe\xf3\x8a\
-\x15+jP\xd4\x80\xa0\xf2x\xeb\xad\xb7r\xf2wS\
-\xbb$J}\x95\x0e\xcfS\xe9\xf5<Q\xeaC[\x82\
-\xb6?\xcc!\xfb\xec\xe5\x97_\xce\xd9\x15ZS\xf9\x13\
-\x0e\x8aQ\x91p \xd7\xd8\xc9P L%4\x08M\
-J\xa9\xf1\xa8\xd3\xf1\x90!\xe9\x14K\xa0$\xf7\xb5\xb5\
-\xb5y<\xcf\x91G\x1e\xe9\xf8<\xa2\xbed\x90\xfa\xfc\
-@@]\xa3\xc0\x14 \xea\xf8\x91>\xa7a\x01 5\
-\x18r\x03\xbe\xf2\xca+]\xf5z\xcd\x9a5i%7\
-`~\xfa\xf4\xe9I\x13\xc2\xe3\x91W\xce\x1e\xb7?\xab\
-t`&J9\xfe\xf8\xe3\x9bO:\xe9\xa4\x03P\xf0\
-7\xbe\xfb\xdc\xe7>W}\xe2\x89'\xee'\xbf?\xea\
-\xa8\xa3\xea\xa2\xd6#\x0b\xee%\xef\xdb\xa7O\x9fv:\
-*P\xf0\xb7\xfd9L\xd7\x876\xa1mn\xed6Q\
-\xd4\xbeC\xa4e\xfa;\xaba\xf6{\x81\x80\xefy*\
-\x1d\x1a\xb4[\x01n\x9e\x94f\x97\x05f\xadC\x05\x01\
-\xb1&\x90>\xec\xb0\xc3\xd2\xfd\xfa\xf5k\xb6?\x87G\
-}Ab<:\x82\x00W\xe8s\x91\x1b0\x07\x00@\
-^\x80?\xfc\xe1\x0f;\x9f\x15\x99\x81^\x7f\xfd\xf5\x94\
-L\x0c\xf2\xd8c\x8f\xe5\x1ey\xe4\x91d\xc2\xe0\xe1\x90\
-\x00\xa1.\x86\xbckjG6q'\xb2p\xc8+\xc7\
-\x9d\xab\xcf\x1eY\xa8\x89\xb9>{\x1e\xbb:\xce\xc4\x19\
-\xf6\x80(\xa7\x9ezj\x9dNP\x93\xa82#C\xb6\
-aw\x00\xbb\x18\xb2~\xb83s\xcb\x0cg\xde\x03\x1c\
-\xc8\x0d\xb8z\xf5\xeaJ\xe4\x05x\xfb\xed\xb7\xd3*\x00\
-dEr\xd0\xaa'\x9f|2\x99`8\x9c2\xd9\xc4\
-\x90w\xcd\x9e\xc6\x8a5\x95\x95C\x1a+\xee\x5c}q\
-\xd7\xd7%\x8f\x1dg\xea\xac}2c\xfex\xf1\xc5\x17\
-\xad\xdc\x80%\x00\x90\xa9\xc1\x90\x1bp\xf9\xf2\xe5l9\
-\xd0\x84\x99Ui\x1b\xcc:\xce\xfaDv\x17\xb5c[\
-\x98\xeb\x83\xc0v\xb7\x09k\x8a\xb9\xce\x968s\x03\xaa\
-o~\x99\x9a|/\x93\x99\x94\x0d\xe4Xe\xc6>\x86\
-q\xc8\x0cr\x03n\xd8\xb0a'\x00\xbc\xff\xfe\xfb%\
-\x00 \x0b\xa0\xfa\x89'\x9e\xe0Bs\xa7,\xa8\x9cy\
-\xe5\xdc\xea+2\x0a\x8eS\xae>\xce7d1\xe6\xdc\
-\x80\xf9\x98\xeb\x8b[f\x1c\xc7\x90\xd9\xaa*\xc6)3\
-d\xe9gEj\xb0\x92\x05\x90$DH\x0a\x00\xc0\x22\
-`\xcd\xdc\xb9s\xd3\x5c\x03)\xe6\x8f\x95\xccy\xe5\xec\
-\x82\x93g\xce+\xe7\x94\xab/\xcf9\xa0\x0e\xb9\xfa\xf2\
-\x9cJ\xe9\xb0\xc6Q\xc9\x9c\x8b0n\x99q\xca\xd5W\
-d^W)\xc6)3\xc8\x0d\x88E@\x00@\xc9\x02\
-\x90\x87\xc8\x0dX\x8d]\x809s\xe6\x14\xb0\x7f\xc81\
-\x90RP\x18\xf3\xcae\xdd\x16\xfc\x98\xf2\xcay\xe5\xea\
-c\x19P\x8f\x5c}, \xe0\xb1b\xcd\x95\x8b0n\
-\x99\xf1\xca\xd5\xc7\x02\x02\x9ac\xd8-`tm\xd7C\
-\xe6\x06Dr\xd0\xb5k\xd7:\x8f\x13\x9d\x90\x9a?\x7f\
-~\x8d\xc8\x0dXw\xf7\xddw\xa79\x06R\xa7\xe3M\
-+?\xc7\x80j\xe6\xea3\x0a\x02\x1a\xb9\xfa\x8c\x82\x80\
-\xc6\x9e\xb5\xe9\x5c\x84q\xcb\x8cN\xae>\xa3 \xa0;\
-\x86p\xa7\x87[=\xdc\xeb\xa3\xd4's\x03.^\xbc\
-\x18\xb9\x01\xbd\xd7l\x08\x00R\xb0\x00\xe0\x0a<y\xf2\
-\xe4:\xf8\x14s\x0c\xa4\xe9\x01\xd5Q~\x93\x03\x1a0\
-W\x9f\x11\x10\x08\x90\xab\xcf\x08\x08\x04\xf0Z3\x95\x8b\
-0n\x99\x09\x92\xab\xcf\x08\x08\x04\x19C\x00\x80\xf0\x04\
-l\x05\xd1.L}\xf7\xdf\x7f\x7f)7 \xbd\xe0\xab\
-W\xacX\xe1\xbf\xcb7k\xd6\xac4,\x00A\x06j\
-\xb8\xe5\x96[\x02E\x18AN\xb3\x80\xd9h\xa2\xe6\x95\
-\xcb\x06\xdd\xe7\x8f\x98W.L\xae\xbeH \x10\x22W\
-_$\x10\x08\xe1\xb7\x1e5\x17a\xdc2\x13\xf8z\x03\
-Y\x93\x02]\x0fJ\xbd\xe4\x02\x80j\x0f\xca}\x90\xfa\
-l\xb9\x01\xf3\x8b\x16-\xd2\xdf\xe2\x9f:uj\x9a,\
-\x80zA\x07.\x8e\x193F\x0b\x04\x90\xca\x18\x09\x0d\
-En\xc0 \xf9\xe8\xc2\xe6\x95\xcb\x86u\xf2\x09\x99W\
-.J\xae\xbeP \x10!W_(\x10\x88\xf0\x9ca\
-s\x11\x86\xbd.\xac\xcc\x84\x06\x8f\x08c\x11\xea:\x04\
-\xd7\x91l\xc0\x1f\xfc\xe0\x07\xad\xba\xd1\xb7\xd5\xdc\x803\
-g\xce\xacy\xf8\xe1\x87\x83\xfb\xf7\xdcy\xe7\x9di\x02\
-\x80\x06\x11\x0f\xa0i\xc4\x88\x11\x9e \x80\x14\xc6Hd\
-\x08\xd4\xa2F\x86y\x0b\x94\x0d\x8c_P\x11\xd5\xd2\x08\
-k\x0a\x06\x19\x18\x07\x96c\x98\xb7@\xa0E\x1e\x03o\
-\x9d2\x10@\x9f\xf9\xbdu\x22Z*e\xca\xacQ_\
-T\xcb!\xa8\xccD\x9e>\x84\xb0\xc6\x22\x8d!\xc2\xec\
-)\xf1\x00Z\x06\x0c\x18\xe09&\xb6\xdc\x80\x85\x193\
-f\x84w\xeeCl1\xc4\x18#\x0b\xa0\xe9\xfa\xeb\xaf\
-oB\xec1\xa7\xf3\x90\xb6\x08A\x10\xe9a\xad|\xe6\
-\xc8j\x1a\xa6>\x0c\x90\x88'\xd0C\x98?y\x1fK\
-#h\x04\x22'\x94-\xca\xfb\xb8\x91/\x948\x07\x9e\
-\xe7i\xb6\xb1V\x03g\xcd\x9d\x00\x00\x0b\xbaIDA\
-T\xb9\x8f\xeb\x22\x8f\xces\xe9\xbeE\x94~B\xba\xe9\
-\xac\xdfy!\xf2;\x96)5\x95v\xbf\xfalc\xe8\
-\x0b\x16\xba2\xe3\x16\x92\x0e)\xeb\xd4\xf3\xb8e\xc6\xe4\
-\x18\x92n\xe5\xce>\xfb\xec\xf6\xfe\xfd\xfb#-X\xf3\
-\x05\x17\x5c\xe086c\xc7\x8e-\xd0\x94\xbd\xf1\x8e;\
-\xee\x00\x00\x14\xc8\x92\x8f\xee\xd9K\x00\x90\xa1\x1b7\x8e\
-\x1c9\xb2\x99\x00\xa0y\xd8\xb0ae 0p\xe0@\
-+g\x19!T;\xb2\x98\xc2\x12\x88R\x1f\x14\x02\x0b\
-\x1f0}P\xec\x81F\x91-\x15 #\x7fw\x03\x89\
-\x80u\x16\x95\xfa\x8a6\xcb&E\xdf\xb5*\xf5\x15\x0d\
-\xd7\xd7%\xa5\x1a\x9e\xc1p}y\xe5~]\xc6\x08}\
-\xac\xfc\x1ey\xe5\x19\xca\xad\x8c\x11^\x0cY\x8f1t\
-\x05\x09\x832c\x1fCV\x99\xe1\x18C\xe4\xe0\x14y\
-\x01\xdb~\xf4\xa3\x1f5\xc9\xc0\xbc\xf2@V\xa0q\xe3\
-\xc65\xd1K\xbbH\x00PK\x00`\xce\xad\x9fn\x9c\
-\xa1\x0a\x1a\x11z\x18!\x88\xaf\xba\xea*\x0b\x04.\xba\
-\xe8\xa2\xec\xf9\xe7\x9f\xdf\xed\xdcs\xcfE\x82\x90\xee\x84\
-RF\xf6\x82\xa1tX\xf8\x80\xe9#\xe6?y\x81\x84\
-Y\x012\xd6\xf7\x11B\x91;\xa1l\x91J\x0fQ\xac\
-\x01\xc3\xc2\x0b\xe6^\xf6\xefM\x1c\x88\xf3\xa6\xdc\xb7\xb4\
-\xc8\xa3>\x07\xce1\xd8\xbe\xbcr\xdf6\xf4\xa5\xfc^\
-\xe9\xcf\xd0+\xceNSBQO\x0f\x91\xde:+\xfa\
-\xb4\xec{*\xdc2S\xf6\xbdI\x99\xb1\x8da\xd1K\
-\x96L\x1c\xa4k9\x84\x03\xbf\xe4\x92K\xba]~\xf9\
-\xe5\x8dC\x87\x0e\xb5\x94|\xd4\xa8Q\x05X\xe9\xf4\xb2\
-nD\x10\x9f\xb0q<<\x8f\x1bo\xbc13z\xf4\
-\xe8&\x11\x1e\xbcy\xc8\x90!\xd5\xc8M\x86\x04\x05\x00\
-\x01X\x02&\xeb\x83B \xda0L\x1f\x14\x9af\xd4\
-\xd2g\x9b\xf2\xbf\xf1\xd4Kt\xcf\x06y\x7f\xc4_\xb3\
-\xd5\xdf\xc0Y\x1f\xea\x12ur\xd6\x97S\xeaC_\xd6\
-bnI\x9f(-AW\x9a\xfd\x0e\xbc\x10\x941C\
-\x12\x99\x9c\xfa\xbf\xa9\x17\x86]f\xd0&\xd1\xae\x1au\
-\x0c\x91\xc6\x9e[f\xb8\xc7\x10\x89y\x91\x9b\x039:\
-\xe8e\x5cD\xfeC\xd2\xcd&\x04\xef\xa5\xb7?\xb6\xee\
-Y\x08}\xd2\xcc\xc8P\x85M\xc3\x87\x0fo\x91IB\
-\x08\x8d\x00\x02,\xfe\xe0\x089\x8e\xdc\x83d]\xb4\xdb\
-\x0a[\xde5\xaa\xaf\x81J;\x956Y\xc8\xf4j\xe0\
-\xaa\x0f\xb1\xde\x1d\xda\xd7\xc0\xd8\xbe\x1c\xda\xa4\xd6\x87>\
-F_3\x8da\x16\xd6\xa1\xad}\xe0\xd8\xef52\x13\
-\xf7\x18\xe2\xe5+\xf2\x01\xb6\xd0K\xb9\xf9\xa6\x9bnj\
-\xa2\xb9\x7f\xfdm\xb7\xdd\xc6\xa7\xfc\x0a\x08Ta=@\
-\x82\x00\x99!\xd5\x9c\xf5\x91uQ\x89y\x8f,N1\
-\xd1M\x1eX`\x81E\xa3\xd4\xd7\xca\xdd\xa7\xa8Ci\
-c7\xb7E\x1e\x83\xf5\xd5\xab}J\xa5\x92\xb9\xbe\x9c\
-\xe8K\xab\x0c\x1a4(\xc7Y\x1f\xd5\x95\x8eSfp\
-P\x9bZ\x95\xf6\xb1\xcb\xcc\x88\x11#\xea\x15\xe5\x87\xe9\
-\x9fbW~B\x98\x0c\xe6\x19\x98o\x00\x04\xae\xbd\xf6\
-Zk:\x80\xf4D\x1c\xf5]|\xf1\xc5V\x16TL\
-3\xd4B\xdfU3\xd5\x97\xa2{7a\x9e\xa5\x16\xaa\
-\x93\x8d\x86J\xf5\xd5;\xb4\x0f\x19\x98SL\xf5U;\
-\xb4\xaf\x15\xeb9\x9cc\xa8\xd6\x87\xff\xf1=\xd7\x18b\
-\x91\xcc\xdeF.\x99\xc1\x01\xf9\x88Sf`\xf6#W\
-\x87T~2\xfb\x8b\x93'O\xae\x8d\x1a\xc6\xcf\xf3@\
-\x94\xd1;\xef\xbc\x13\x91\x82\x91}\xa4(,\x81\xd2\x9a\
-\x80\x5c\x184u\x0c\x1e<8\x8b\xe9\x05\x16<D\xc9\
-\xd3\xfc\xa7I\xfe\x7f\xd9e\x97\x19\x1d\xd0+\xae\xb8\x22\
-E\xf7lB\xc2E\x14\xaa\xa3\x0e\xb9\xd7\x90\x82Y\x14\
-\xe3\x03\x8a\xfb+\xed\xab\x13E\xb6\xaf\x89\xfa\xc0(\x08\
-\xd0\x94\xadZ\xb6O\xf4e^\xa9\xbf\x15}\xce8\x86\
-\xf8\xacV\xffg\xa8\xcf\x1a\xc3\xb8d\xc6k\x0c\xd1\xc7\
-\x1c2\x03\xe5\xc7Z\x9c4\xfbo\xbf\xfd\xf6*R\xfe\
-\x22)\xbf\xb5\xef?s\xe6L\xf3 \xf0\xc0\x03\x0f\xa4\
-\xa7N\x9d\x0a\x82\x10R\x0e5\x90%\x90V\x17\x06\xb1\
-;@\xd6\x00\xa6\x05F@\x00\x16\x05\xcdsZ\x90\xfa\
-\x18\x85\x94\xb3Z*)\xfd\xdf(\xbfG\xb6b\x13\xf5\
-\x11x%\xe9^XU\xc5\x94\x06\xf7\xaeS\xe6[u\
-\xf2{*\xc6r\xb0\xd3}k\x95\xf6\x95\xea\xbb\xf2\xca\
-+\xeb\xe4\xf7T_#\x9e\xcdP\x9fV+\xedhD\
-_\x8a>\xadF\x86Y\x14\xf4\xb9)k\x0e/\x04\xaa\
-\xa7E\xb4\xa3\x85\xee\x9f\x11\xed\xb3\xbe\x17\xcf\xd1b\xea\
-\xc5A\xcf\x9d\x84l\xc8\xb6\xd8eF~or\xca\x0a\
-y\x90}\x8aqS\xc7\x90Cf\xb0\xda/\x17\xfcn\
-\xbd\xf5\xd6\xba\x09\x13&X\xb2A\xca_\x01\xaf\xbf\xe9\
-\xd3\xa7\xd7\xcd\x9d;7\xbf`\xc1\x02s 0o\xde\
-\xbc\xf4\xec\xd9\xb3\x0b\x04\x02\xf5\x840]X\x82p\x13\
-FN2z8L\x09|=\x06\xfd\x0e\xb2(\xacl\
-\xa7Xc@\xa1\xbf\xcb\xb2\xcf\x22=\x19}_\x94\xbf\
-#kq\xc4\xfa\xca\xeeG\xf7\xef2`\xf8\xce\xeb\xf7\
-\xa0\xc75\xd7\x5cS\xab[\x1f\x9e\x0d\xcf\x18\xa5>\xf4\
-\x91z?{\x8a7\xb2\xe0\xaa\x94\xe7i\x8e\x9ak\x1e\
-c\x08\x9f\x11\xdc\x0f\x9ft\xcf\x8c\xad}e\xbf\xe3\xfc\
-\x88\xedKbE\x1c\x0bc(h\x8f\x1d\xe0\xf1\xbbl\
-#\xd5Y\x15\xe7\x18\xe2\xdc\xa8\xf5\x91\x8e\x15\xc6\x8e\x1d\
-\xdb\x04\xcf\x5c\xac\xf6\xdb\x17\xfcH?+\xc0\xe4\x05\xf1\
-\xe7\xc9'\x9f\xcc=\xfd\xf4\xd3\xd1A`\xf1\xe2\xc5\xa9\
-\x85\x0b\x17\xc2\x97\xb8\x16\xa4\x02\xb78\x01d\x8eX\xce\
-B\x98\x97\x10\x10\xc0u8\x13\x12\xe1\xac]\x06*-\
-(\x04&\x8e\x03E\x16G\x92~+\xca\xf3\x90\xbd8\
-L}d\xbd$\xe9\xfa\xd2}\xe8\xbe\xb5\x1e\xa6W\xad\
-x&\x9c\x1bz@\xe5}\xfc\xea\xc3o\xf2<<#\
-\x9e5d\x1b\xab\xa8\x7f\xd0G\xd6}\xd0w.\xf5U\
-)\xf55a,\x0c\x8c!\xac\xc3\x8cK}e\xe7\x85\
-\xad\xcf>\x86\xdc2\x13a\x0cC\xcb\x0c<\xfc\xf0\xd6\
-\xc7|\x9f\x14\xbf\x8e\xcc\xfe\xa4\xcb\xcb:\xfb\xd8c\x8f\
-\xd5\x80\xfb\xbft\xe9\xd2\xaa\x95+W\x86\x07\x01$\x11\
-@\x98\xb0\xa7\x9ez*O7\xcd\xfbE\x0a\x82\xc7 \
-=d\x11\xdeHT\x1a\xe1<\x14\xa4>\x9c\x0f\x10\x01\
-\xca\xa1\x90eQ\xe5\x83\x88I:\xafA\x9eO\xd7\x07\
-\x1aPz\xde$]S/\x9e\x17\xf7(\xf8]C\xcf\
-T\x90\xf5\xe9\x9c\xef4\x90\xf2z \xba\x0e\xeac\xae\
-\x87\x82g\xc53\x07\xa9\x0f\x99\x9de\xfb\xe8\x1e\xf5\xf4\
-\xfcI\x9f\xf6U)\xed\x8b:\x86\x8d\x98\x22\xfa\xd4\x97\
-\xa1\xe7j\x942Co\xb7L\xd01D\xbb\xe2\x92\x19\
-\xd1\xc6\xd2\x98@\x1et\xc6\x5c\x8e\x01\x95\xc0\xf9(\xe0\
-\xdb\x0f\xc5\x87\x7f\xff\xc4\x89\x13\xeb\xee\xb8\xe3\x8e\xa4\xcf\
-K;C\xca_M\xfa[\xfd\xc2\x0b/T\x84R\xfe\
-_\xff\xfa\xd7\xc95k\xd6T\xe2&\x02\x04\xb4\x16\xa3\
-\xc0\x1d\x00\x81\x08\xee\x884Gi\xd0\xcdSN\xd7\xa4\
-\xe9\x5c\x9c\xdf\x88B\x03\xab\xb5-E\x1d\x93\x14\xe6\x10\
-\x90\x11[!Z\xd7\xc1Y\x02\x1eStM\x11\x85\xee\
-\xa1=0Tg\x0d\xb5\xad\x11\x85\xae\xd3\xf6*\xa3z\
-\xf2\xb2}\xb8\x87\xeeux6\xd9>\xa0\xbf\xae\xa3\x07\
-\xfaBi_\x1d\xfaJS\xa9*e\xfb0\x86\x18\x1b\
-\xdd1\xa4\xba\x1a\xc4sj\xd3\xc8\x91\xccR\x5c\x87g\
-\xd5\xaeO\x8e\xa1|V]\x99\x01h`\xfe,\xc6\x0f\
-\xcf\xaa\xbd\x05J\xf5\xe5\xe5X\x04\x91\x191\x86\xd6X\
-\xe0\x1e\xba\xd7\x81\xd5\x07\xc5\xbf\xf3\xce;\xadU~*\
-Zc\xb8b\xc5\x8a4\xf4\xf7\xa5\x97^B\x18\xf0`\
-\x96\xd5\x1bo\xbca\x85\x0e\xc6\xc5\x02\x04\x02\xadD\x83\
-E8i\xd2\xa4z<4>\xfd\xf2\x94\xdfu\xd7]\
-i*\xf5T\x8a(t~e\xc0\xfa\x92tM-]\
-\xdb \x8a'\xea\xa1\x13\xe9\x9c\xd2\xf9tm`\xd7P\
-\xaa3O\xd7\xe1Y\xf1\xcc\xbe\xd7\xe3\x1c\xa5}\x81\xeb\
-\xc35J\xfb|\x05\x01}\xa0\x9e\x1f\xd45\x14c \
-\x9fW\x8c\x8d\xee\x18\xa2\xbezzK\x05\x0a$\x83\xf3\
-\xd5\xeb\xfd\xea\xbb\xe7\x9e{\x92P\x081~x3\x86\
-\x95\x19\xd9\xc6\x0a\xcd1\x0c-3\xb61\xf4\xf5\x83\xa0\
-\xf6\xe5\xa94\xdc}\xf7\xdd\xf5\xd4\xde\xc0\x99\xba~\xf5\
-\xab_\xa5\xd7\xae][\x81\xb0\xff\xbf\xfd\xedo\xf5\xc6\
-\xe3\xed\xb7\xdfN\xfe\xeew\xbf\xcb\xe0\x22\x80\x00,\x81\
-0\x16\x04=p\xba\xa3\xa3\xa3\x8e\x0ar\x94\xd7\xddw\
-\xdf}\x8e\x0f\x80\xef\x95\xf3\xd0\xd0\x8a\x90\xf5%\xa7L\
-\x99R\xc0=\xa6N\x9d\x8a\xc5\xca\x0a\x97\xdd\x8c$\xb6\
-J\xa8\xe0\x1c\xd4\x19\xda!\x85\xea\xcb\xc9\xe7\xa6:]\
-\xef\x83\xdf\xe4y\xb8&j}\xa2}X\x94u\x1c\x9b\
-\xfb\xef\xbf\xbfBi_\x01}\x13\xb2O+\xe4s\x07\
-\x18\xc3:\x8c}X\x99\xc1\x22\xb3x\xf6\xba\x9f\xff\xfc\
-\xe7i\x9d14!3\xa2_+\xb8\xc7\x10\xf2&\x9f\
-\x1b\xd1z\xdc\xce\xa3\xb6\xe7\xc48\xe3\xbc\x9a\xb0\xac\xbe\
-\xf5\xeb\xd7\xa7\xdez\xeb\xad\xcc\x1f\xff\xf8\xc7\xf4\xbb\xef\
-\xbe\xeb\xff\x22G\xb8`\x9c\x0c\x10\xa0\x8b#\xad\x22b\
-\xebp\xe6\xcc\x99\xb5T\xeaf\xcd\x9a\x85E\xc4\xb2\x01\
-\xc5\xff\xf8\x1e\xbf\xa3L\x9f>\xbd\x22b}I\xba_\
-\x0d\x16+Q\x1ez\xe8\xa1\xb2=f\x04Ex\xf0\xc1\
-\x07K\xbfS\x89\xbc\x1dD\xcf]-\x9f\xdf\xe9~\xf8\
-\x0em\x14\xed\x8c\x5c\x1f\xee'\x9f\x1fm\xb1\x07z@\
-\x9b\x95\xf6\xd5D\xdd\x13\x9e1cFVy\xfe\x82}\
-\x0c\xa9>+\xf9\xa48\xa7@c\x98\x8e\xd8\x9f\xd6\x8e\
-\x93x~\xa4\xa9K{\x8d!\xd5\x99\x8d*3\x08\x98\
-\xe1&38\xe6\xcc\x99SmRf\xd41\xc4\xbd}\
-\xea\xc3\xb3E\x1aC\xd2\xe7\xe4;\xef\xbc\x93\xfe\xd3\x9f\
-\xfe\x94\xda\xb2e\x8b\xfb\xbd>\xf8\xe0\x83\xd4{\xef\xbd\
-\x97\xde\xb4iS\x1a\x96@\xc2\xc0\x81\xbc\xe4HL\x88\
-\xad\x09\x04\x1c}\xec\xb1\xc7,\x14\xc2'\xfe\xa7\x82\xef\
-\x91\xbd\xd4\x88C\x08\xd5\x95\xa4\xfb\xe5\xe4}\x17.\x5c\
-\x98\x15\xf5%\x17,XP\xfa\x9eJU\xc2\xd0A\xcf\
-^\x85\xf6\xa1P}\xa5\xfb\xe2o\xd1n\xa3\xf5\xe1^\
-\xb2\x1dh\x13\xda&\xea\xcb*\xed\xcb\xa1/\x0c\xb5O\
-\xbd\xaf\xdb\x18b\x8cS\x86\xea+\xbb\xafR_\x92\xda\
-h\xe5\xafD\xe1\x96\x199\x86\x1c2\xa3\x8e\xa1*3\
-\xd4\xc6*\xd9>\x8c-\xb5\xd1\xc8\x18\x92\xf2'\x91\x05\
-\xec\xaf\x7f\xfdk\xf2\xef\x7f\xff{\xd7{\xe2K\xfcH\
-\x08a\xdc\xfdt\xd1\xa2E)\xa4&FvR$(\
-\x5c\xbati\x06\x9f\xe2\xff\xfcSO=e\xd4\x83\x10\
-\xe9\xcd\x10\x00Q\xde\x7f\xd9\xb2e\x99g\x9f}\xb6J\
-\xfeO\xbf\x19\xf7{\xa76T\xca\xfbS\xa9\x10E\xb6\
-\x8f\xad>jW\x1e)\xdd\x9e{\xee9\xb4\xd1\xfa\xff\
-\x99g\x9e\xa96\x9d\xe2\x0dc\xa4\xb4\xafl\x0c1\xb6\
-\x18c\xd32\x83\x5c\x95\xc8U\x81\x82\xacU\xd8\xd6\x92\
-\xff#\x935\xa7\xccP\x1d\x19\xee1D\x9c~\xd9\x1e\
-j[\x05\x8a\xfc\x1f\xf2\xbax\xf1b\xe3\x1e}\x7f\xfb\
-\xdb\xdf\x92\xff\xf8\xc7?\xba\xde\xf7\xa3\x8f>rF\x06\
-C\x07\x16\x12\xb1\xa0H\xa5\xea\x85\x17^(\x15\xfa>\
-\xcdQ\xdf\xf3\xcf?\x9f\xc4\x16\xc8/\x7f\xf9\xcb*\x14\
-$>\x11\x85-u\xd6\xea\xd5\xab\xb3h\x9fZ\xe89\
-\xd8\xeaC[\x94vY\x85\xdaZ\x81\xb63\x8daZ\
-\x1d;\xaa\x0f\x9f\x95\xabV\xadb\xe1,P\xff%\xed\
-\xedCA&k\x8e\xfa\x101\x97\xee]\x81v\xa1(\
-\xb2\xb3\xd7\x8c\xe1n=\x90\x85\x18\x8b\x8b(\xeb\xd7\xaf\
-\xc7g\x9a\xb3>\xacaP\xc9\xc8\xf2\xc6\x1bo\xa4\xb9\
-\xdb(\xea\xca\x8a\x92\xe1\xae\x0fmR\xdb\xf8\xdb\xdf\xfe\
-6\xc9<\x86i1vV\xa1\xfaS\xcc\xedK\xbe\xf9\
-\xe6\x9b\x19Y\xb0\xa8\x15C\x9ff\x94\xf6\xb1\x8f\xa1\xda\
->\x94\xc4\xdez\xbc\xff\xfe\xfb\xc9\xf7\xde{/%\x0b\
-\xe6%\x9c\xf5}\xf0\xc1\x07\x98\xf7$\xf1)K\x9c\xed\
-\xa3b\xd5\xcf\xddF\xb5\xfc\xe5/\x7fa\xad\x0fc\xa6\
-\x16\xb4\x99\xb3>\xb4'\xce\xf6\xe1\xc0\x98\xa9\x85\xbb>\
-\xfb\x18\xc6\xa5\x8f\xff\x1f=\xc37\x04\x92\x8e\xcd\xb5\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x08\
-\x0aaZ\xa7\
-\x00i\
-\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01y\xbd\x8a\x90\x8c\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
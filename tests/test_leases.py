@@ -0,0 +1,25 @@
+import os
+
+from core.leases import LeasedLabelSession
+
+
+def test_load_more_leases_one_batch_at_a_time(tmp_path):
+    img_paths = []
+    for i in range(100):
+        img_path = os.path.join(tmp_path, f'{i:03}.jpg')
+        with open(img_path, 'wb') as f:
+            f.write(b'x')
+        img_paths.append(img_path)
+
+    session = LeasedLabelSession(['x', 'y'], str(tmp_path), img_paths, annotator='alice', batch_size=10)
+    other = LeasedLabelSession(['x', 'y'], str(tmp_path), img_paths, annotator='bob', batch_size=10)
+
+    for _ in range(4):
+        for img_name in session.img_names():
+            if not session.labels_of(img_name):
+                session.set_label(img_name, 'x')
+        session.load_more()
+
+    assert len(session.img_paths) == 50
+    assert other.load_more()
+    assert len(other.img_paths) == 20
@@ -0,0 +1,13 @@
+from core.server import Work_Queue
+
+
+def test_skipped_images_dont_block_new_work():
+    labeled = set()
+    queue = Work_Queue([f'{i}.jpg' for i in range(10)], labeled.__contains__)
+
+    assert queue.next_batch('alice', 3) == ['0.jpg', '1.jpg', '2.jpg']
+    # alice skipped the whole batch, she still gets new images and keeps the skipped ones
+    assert queue.next_batch('alice', 3) == ['0.jpg', '1.jpg', '2.jpg', '3.jpg', '4.jpg', '5.jpg']
+
+    labeled.update(['0.jpg', '1.jpg'])
+    assert queue.next_batch('bob', 3) == ['6.jpg', '7.jpg', '8.jpg']
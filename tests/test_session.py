@@ -0,0 +1,63 @@
+import csv
+import os
+
+from core.session import LabelSession
+
+
+def make_session(tmp_path, names='abcd'):
+    img_paths = []
+    for name in names:
+        img_path = os.path.join(tmp_path, name + '.jpg')
+        with open(img_path, 'wb') as f:
+            f.write(b'x')
+        img_paths.append(img_path)
+    return LabelSession(['x', 'y'], str(tmp_path), img_paths)
+
+
+def read_rows(session, out_filename):
+    with open(os.path.join(session.output_folder(), out_filename + '.csv'), newline='') as f:
+        return {row[0]: row[1:] for row in list(csv.reader(f))[1:]}
+
+
+def test_export_after_reorder_keeps_labels_of_every_image(tmp_path):
+    session = make_session(tmp_path)
+    session.set_label('a.jpg', 'x')
+    session.export('out')
+
+    session.reorder(1, [session.img_paths[3], session.img_paths[2], session.img_paths[1]])
+    session.set_label('b.jpg', 'y')
+    session.export('out')
+
+    assert session.img_names() == ['a.jpg', 'd.jpg', 'c.jpg', 'b.jpg']
+    assert read_rows(session, 'out') == {'a.jpg': ['1', '0'], 'b.jpg': ['0', '1'], 'c.jpg': ['0', '0'],
+                                         'd.jpg': ['0', '0']}
+
+
+def test_export_after_reordering_img_paths_directly_keeps_labels(tmp_path):
+    session = make_session(tmp_path)
+    session.set_label('a.jpg', 'x')
+    session.export('out')
+
+    # csv writer notices the new order even if img_paths are reordered behind its back
+    session.img_paths[1:] = [session.img_paths[3], session.img_paths[2], session.img_paths[1]]
+    session.set_label('b.jpg', 'y')
+    session.export('out')
+
+    assert read_rows(session, 'out')['b.jpg'] == ['0', '1']
+    assert read_rows(session, 'out')['d.jpg'] == ['0', '0']
+
+
+def test_second_move_run_keeps_images_in_label_folders(tmp_path):
+    session = LabelSession(['x', 'y'], str(tmp_path), make_session(tmp_path).img_paths, mode='move')
+    session.assign_many(['a.jpg', 'b.jpg'], 'x')
+    session.assign_many(['a.jpg'], 'y')
+
+    # images moved by the first run aren't in input folder anymore
+    rerun = LabelSession(['x', 'y'], str(tmp_path), sorted(str(p) for p in tmp_path.glob('*.jpg')), mode='move')
+    assert rerun.load_label_folders() == 2
+    assert rerun.assign_many(['a.jpg', 'b.jpg', 'c.jpg'], 'x') == 1
+
+    assert sorted(rerun.img_names()) == ['a.jpg', 'b.jpg', 'c.jpg', 'd.jpg']
+    assert rerun.labels_of('a.jpg') == ['x', 'y']
+    assert rerun.image_path(rerun.img_names().index('b.jpg')) == os.path.join(str(tmp_path), 'x', 'b.jpg')
+    assert sorted(os.listdir(tmp_path / 'x')) == ['a.jpg', 'b.jpg', 'c.jpg']
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'grid_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 5.15.2
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide2.QtCore import *
+from PySide2.QtGui import *
+from PySide2.QtWidgets import *
+
+
+class Ui_grid_dialog(object):
+    def setupUi(self, grid_dialog):
+        if not grid_dialog.objectName():
+            grid_dialog.setObjectName(u"grid_dialog")
+        grid_dialog.resize(900, 660)
+        self.grid_list = QListWidget(grid_dialog)
+        self.grid_list.setObjectName(u"grid_list")
+        self.grid_list.setGeometry(QRect(10, 10, 880, 560))
+        self.grid_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.grid_list.setIconSize(QSize(128, 128))
+        self.grid_list.setMovement(QListView.Static)
+        self.grid_list.setResizeMode(QListView.Adjust)
+        self.grid_list.setViewMode(QListView.IconMode)
+        self.grid_list.setUniformItemSizes(True)
+        self.grid_list.setWordWrap(True)
+        self.grid_list.setSelectionRectVisible(True)
+        self.label_combo = QComboBox(grid_dialog)
+        self.label_combo.setObjectName(u"label_combo")
+        self.label_combo.setGeometry(QRect(10, 580, 200, 30))
+        self.assign_btn = QPushButton(grid_dialog)
+        self.assign_btn.setObjectName(u"assign_btn")
+        self.assign_btn.setGeometry(QRect(220, 580, 100, 30))
+        self.remove_btn = QPushButton(grid_dialog)
+        self.remove_btn.setObjectName(u"remove_btn")
+        self.remove_btn.setGeometry(QRect(330, 580, 100, 30))
+        self.prev_page_btn = QPushButton(grid_dialog)
+        self.prev_page_btn.setObjectName(u"prev_page_btn")
+        self.prev_page_btn.setGeometry(QRect(540, 580, 80, 30))
+        self.page_label = QLabel(grid_dialog)
+        self.page_label.setObjectName(u"page_label")
+        self.page_label.setGeometry(QRect(630, 580, 170, 30))
+        self.page_label.setAlignment(Qt.AlignCenter)
+        self.next_page_btn = QPushButton(grid_dialog)
+        self.next_page_btn.setObjectName(u"next_page_btn")
+        self.next_page_btn.setGeometry(QRect(810, 580, 80, 30))
+        self.hint_label = QLabel(grid_dialog)
+        self.hint_label.setObjectName(u"hint_label")
+        self.hint_label.setGeometry(QRect(10, 620, 880, 30))
+
+        self.retranslateUi(grid_dialog)
+
+        QMetaObject.connectSlotsByName(grid_dialog)
+    # setupUi
+
+    def retranslateUi(self, grid_dialog):
+        grid_dialog.setWindowTitle(QCoreApplication.translate("grid_dialog", u"Label images in grid", None))
+        self.assign_btn.setText(QCoreApplication.translate("grid_dialog", u"Assign", None))
+        self.remove_btn.setText(QCoreApplication.translate("grid_dialog", u"Remove", None))
+        self.prev_page_btn.setText(QCoreApplication.translate("grid_dialog", u"Prev page", None))
+        self.page_label.setText("")
+        self.next_page_btn.setText(QCoreApplication.translate("grid_dialog", u"Next page", None))
+        self.hint_label.setText(QCoreApplication.translate("grid_dialog", u"Drag over images to select them, Ctrl/Shift+click adds to selection, Ctrl+A selects the whole page", None))
+    # retranslateUi
+
@@ -17,7 +17,7 @@ class Ui_labeler_widget(object):
     def setupUi(self, labeler_widget):
         if not labeler_widget.objectName():
             labeler_widget.setObjectName(u"labeler_widget")
-        labeler_widget.resize(800, 570)
+        labeler_widget.resize(800, 630)
         self.progress_bar = QLabel(labeler_widget)
         self.progress_bar.setObjectName(u"progress_bar")
         self.progress_bar.setGeometry(QRect(10, 90, 421, 30))
@@ -25,9 +25,48 @@ class Ui_labeler_widget(object):
         self.next_im_btn = QPushButton(labeler_widget)
         self.next_im_btn.setObjectName(u"next_im_btn")
         self.next_im_btn.setGeometry(QRect(540, 50, 80, 30))
+        self.prelabel_btn = QPushButton(labeler_widget)
+        self.prelabel_btn.setObjectName(u"prelabel_btn")
+        self.prelabel_btn.setGeometry(QRect(630, 50, 100, 30))
+        self.grid_btn = QPushButton(labeler_widget)
+        self.grid_btn.setObjectName(u"grid_btn")
+        self.grid_btn.setGeometry(QRect(740, 50, 50, 30))
+        self.uncertain_first_checkbox = QCheckBox(labeler_widget)
+        self.uncertain_first_checkbox.setObjectName(u"uncertain_first_checkbox")
+        self.uncertain_first_checkbox.setGeometry(QRect(450, 90, 341, 30))
+        self.latency_hud_checkbox = QCheckBox(labeler_widget)
+        self.latency_hud_checkbox.setObjectName(u"latency_hud_checkbox")
+        self.latency_hud_checkbox.setGeometry(QRect(10, 555, 100, 30))
+        self.duplicates_btn = QPushButton(labeler_widget)
+        self.duplicates_btn.setObjectName(u"duplicates_btn")
+        self.duplicates_btn.setGeometry(QRect(10, 590, 100, 30))
+        self.duplicates_combo = QComboBox(labeler_widget)
+        self.duplicates_combo.addItem("")
+        self.duplicates_combo.addItem("")
+        self.duplicates_combo.addItem("")
+        self.duplicates_combo.setObjectName(u"duplicates_combo")
+        self.duplicates_combo.setGeometry(QRect(500, 555, 291, 30))
+        self.similarity_btn = QPushButton(labeler_widget)
+        self.similarity_btn.setObjectName(u"similarity_btn")
+        self.similarity_btn.setGeometry(QRect(690, 590, 100, 30))
         self.generate_xlsx_checkbox = QCheckBox(labeler_widget)
         self.generate_xlsx_checkbox.setObjectName(u"generate_xlsx_checkbox")
         self.generate_xlsx_checkbox.setGeometry(QRect(120, 520, 181, 30))
+        self.generate_npy_checkbox = QCheckBox(labeler_widget)
+        self.generate_npy_checkbox.setObjectName(u"generate_npy_checkbox")
+        self.generate_npy_checkbox.setGeometry(QRect(120, 555, 181, 30))
+        self.pack_npy_checkbox = QCheckBox(labeler_widget)
+        self.pack_npy_checkbox.setObjectName(u"pack_npy_checkbox")
+        self.pack_npy_checkbox.setGeometry(QRect(310, 555, 181, 30))
+        self.generate_jsonl_checkbox = QCheckBox(labeler_widget)
+        self.generate_jsonl_checkbox.setObjectName(u"generate_jsonl_checkbox")
+        self.generate_jsonl_checkbox.setGeometry(QRect(120, 590, 181, 30))
+        self.generate_lists_checkbox = QCheckBox(labeler_widget)
+        self.generate_lists_checkbox.setObjectName(u"generate_lists_checkbox")
+        self.generate_lists_checkbox.setGeometry(QRect(310, 590, 181, 30))
+        self.compress_checkbox = QCheckBox(labeler_widget)
+        self.compress_checkbox.setObjectName(u"compress_checkbox")
+        self.compress_checkbox.setGeometry(QRect(500, 590, 181, 30))
         self.prev_im_btn = QPushButton(labeler_widget)
         self.prev_im_btn.setObjectName(u"prev_im_btn")
         self.prev_im_btn.setGeometry(QRect(450, 50, 80, 30))
@@ -38,7 +77,7 @@ class Ui_labeler_widget(object):
         self.image_box.setObjectName(u"image_box")
         self.image_box.setGeometry(QRect(10, 140, 521, 371))
         self.image_box.setFrameShape(QFrame.Box)
-        self.image_box.setScaledContents(True)
+        self.image_box.setAlignment(Qt.AlignCenter)
         self.show_next_checkbox = QCheckBox(labeler_widget)
         self.show_next_checkbox.setObjectName(u"show_next_checkbox")
         self.show_next_checkbox.setGeometry(QRect(450, 10, 341, 30))
@@ -60,7 +99,21 @@ class Ui_labeler_widget(object):
         labeler_widget.setWindowTitle(QCoreApplication.translate("labeler_widget", u"Labeler", None))
         self.progress_bar.setText("")
         self.next_im_btn.setText(QCoreApplication.translate("labeler_widget", u"Next", None))
+        self.prelabel_btn.setText(QCoreApplication.translate("labeler_widget", u"Pre-label", None))
+        self.grid_btn.setText(QCoreApplication.translate("labeler_widget", u"Grid", None))
+        self.uncertain_first_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Most uncertain images first (after pre-labeling)", None))
+        self.latency_hud_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Latency HUD", None))
+        self.duplicates_btn.setText(QCoreApplication.translate("labeler_widget", u"Duplicates", None))
+        self.duplicates_combo.setItemText(0, QCoreApplication.translate("labeler_widget", u"Show near duplicates", None))
+        self.duplicates_combo.setItemText(1, QCoreApplication.translate("labeler_widget", u"Skip duplicates of labeled images", None))
+        self.duplicates_combo.setItemText(2, QCoreApplication.translate("labeler_widget", u"Copy labels to near duplicates", None))
+        self.similarity_btn.setText(QCoreApplication.translate("labeler_widget", u"Group similar", None))
         self.generate_xlsx_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Also generate .xlsx file", None))
+        self.generate_npy_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Also generate .npy file", None))
+        self.pack_npy_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Bit-packed .npy", None))
+        self.generate_jsonl_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Also generate .jsonl file", None))
+        self.generate_lists_checkbox.setText(QCoreApplication.translate("labeler_widget", u"Also generate label lists", None))
+        self.compress_checkbox.setText(QCoreApplication.translate("labeler_widget", u"gzip .jsonl and lists", None))
         self.prev_im_btn.setText(QCoreApplication.translate("labeler_widget", u"Prev", None))
         self.generate_csv_btn.setText(QCoreApplication.translate("labeler_widget", u"Generate csv", None))
         self.image_box.setText("")
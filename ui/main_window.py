@@ -17,11 +17,15 @@ class Ui_main_window(object):
     def setupUi(self, main_window):
         if not main_window.objectName():
             main_window.setObjectName(u"main_window")
-        main_window.resize(800, 650)
+        main_window.resize(800, 700)
         self.action_new = QAction(main_window)
         self.action_new.setObjectName(u"action_new")
         self.action_open = QAction(main_window)
         self.action_open.setObjectName(u"action_open")
+        self.action_connect = QAction(main_window)
+        self.action_connect.setObjectName(u"action_connect")
+        self.action_save_trace = QAction(main_window)
+        self.action_save_trace.setObjectName(u"action_save_trace")
         self.action_about = QAction(main_window)
         self.action_about.setObjectName(u"action_about")
         self.action_quit = QAction(main_window)
@@ -48,8 +52,10 @@ class Ui_main_window(object):
         self.menubar.addAction(self.menuHelp.menuAction())
         self.menuFile.addAction(self.action_new)
         self.menuFile.addAction(self.action_open)
+        self.menuFile.addAction(self.action_connect)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.action_quit)
+        self.menuHelp.addAction(self.action_save_trace)
         self.menuHelp.addAction(self.action_about)
         self.toolBar.addAction(self.action_new)
         self.toolBar.addAction(self.action_open)
@@ -63,6 +69,8 @@ class Ui_main_window(object):
         main_window.setWindowTitle(QCoreApplication.translate("main_window", u"Annotation tool", None))
         self.action_new.setText(QCoreApplication.translate("main_window", u"&New", None))
         self.action_open.setText(QCoreApplication.translate("main_window", u"&Open", None))
+        self.action_connect.setText(QCoreApplication.translate("main_window", u"&Connect to server", None))
+        self.action_save_trace.setText(QCoreApplication.translate("main_window", u"Save &timing report", None))
         self.action_about.setText(QCoreApplication.translate("main_window", u"&About", None))
         self.action_quit.setText(QCoreApplication.translate("main_window", u"&Quit", None))
         self.menuFile.setTitle(QCoreApplication.translate("main_window", u"Fi&le", None))
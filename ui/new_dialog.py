@@ -67,6 +67,12 @@ class Ui_new_dialog(object):
         self.scroll_area_widget.setObjectName(u"scroll_area_widget")
         self.scroll_area_widget.setGeometry(QRect(0, 0, 249, 279))
         self.scroll_area.setWidget(self.scroll_area_widget)
+        self.shared_checkbox = QCheckBox(new_dialog)
+        self.shared_checkbox.setObjectName(u"shared_checkbox")
+        self.shared_checkbox.setGeometry(QRect(430, 330, 311, 30))
+        self.annotator_input = QLineEdit(new_dialog)
+        self.annotator_input.setObjectName(u"annotator_input")
+        self.annotator_input.setGeometry(QRect(430, 365, 311, 30))
 
         self.retranslateUi(new_dialog)
         self.buttonBox.rejected.connect(new_dialog.reject)
@@ -86,5 +92,7 @@ class Ui_new_dialog(object):
         self.csv_radioButton.setText(QCoreApplication.translate("new_dialog", u"csv (Images in selected folder are labeled and then csv file with assigned labels is &generated.)", None))
         self.copy_radioButton.setText(QCoreApplication.translate("new_dialog", u"cop&y (Creates folder for each label. Labeled images are copied to these folders. Csv is also generated)", None))
         self.move_radioButton.setText(QCoreApplication.translate("new_dialog", u"move (Creates folder for each &label. Labeled images are moved to these folders. Csv is also generated)", None))
+        self.shared_checkbox.setText(QCoreApplication.translate("new_dialog", u"Share the folder with other annotators", None))
+        self.annotator_input.setPlaceholderText(QCoreApplication.translate("new_dialog", u"your name", None))
     # retranslateUi
 
@@ -59,6 +59,6 @@ class Ui_open_dialog(object):
         self.selected_folder_label.setText("")
         self.openfolder_button.setText(QCoreApplication.translate("open_dialog", u"...", None))
         self.opencsv_button.setText(QCoreApplication.translate("open_dialog", u"...", None))
-        self.label_csvfile.setText(QCoreApplication.translate("open_dialog", u"Select csv file", None))
+        self.label_csvfile.setText(QCoreApplication.translate("open_dialog", u"Select csv or npy file", None))
     # retranslateUi
 